@@ -4,50 +4,70 @@
 
 import streamlit as st
 import math
-import pandas as pd
 import io
 import re
 import os
+import logging
+import threading
+import hashlib
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.platypus import Table, TableStyle, Paragraph, Spacer, SimpleDocTemplate, Image, PageBreak, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-import requests
-from PIL import Image as PILImage
+from types import MappingProxyType, SimpleNamespace
 import base64
 
+# pandas, ReportLab, PIL ve requests modül yüklenirken içe aktarılmaz: formun ilk
+# çizimi bunlara ihtiyaç duymaz. pandas/PIL/requests kullanıldıkları fonksiyonlarda,
+# ReportLab ise ilk PDF üretiminde load_pdf_support() ile yüklenir.
+logger = logging.getLogger("premium_home")
+
 # --- Görünmez Karakter Temizleme Fonksiyonu ---
+# Sabit PDF metinleri kaynakta zaten temizdir; kullanıcı girdileri normalize_inputs() ile
+# form sınırında bir kez temizlenir. Kalan kısa çağrılar (etiketler, f-string'ler) için
+# sonuçlar önbelleğe alınır; uzun serbest metinler (notlar, adresler) önbelleği doldurmasın
+# diye doğrudan temizlenir.
+_INVISIBLE_CHARS_RE = re.compile(r'[\u00A0\u200B\s]+')
+CLEAN_CACHE_MAX_CHARS = 200 # Bundan uzun metinler önbelleğe alınmaz
+
+@functools.lru_cache(maxsize=1024)
+def _clean_short_text(text):
+    return _INVISIBLE_CHARS_RE.sub(' ', text).strip()
+
 def clean_invisible_chars(text):
     """Metindeki görünmez karakterleri temizler (U+00A0, U+200B vb. dahil)."""
     # U+00A0 (non-breaking space) ve U+200B (zero width space) gibi karakterleri temizler
-    return re.sub(r'[\u00A0\u200B\s\xA0]+', ' ', text).strip()
-
-# --- Font Kaydı (Türkçe karakter desteği) ---
-# Programın çalıştığı klasörde 'fonts' dizini altında 'FreeSans.ttf' ve 'FreeSansBold.ttf' olmalıdır.
-try:
-    # 'fonts' klasörünün varlığını kontrol et
-    if not os.path.exists("fonts"):
-        os.makedirs("fonts") # Yoksa oluştur
-    
-    # Gerekli font dosyalarının varlığını kontrol et
-    if not (os.path.exists("fonts/FreeSans.ttf") and os.path.exists("fonts/FreeSansBold.ttf")):
-        st.warning("Gerekli 'FreeSans.ttf' veya 'FreeSansBold.ttf' font dosyaları 'fonts/' klasöründe bulunamadı. Lütfen bu dosyaları manuel olarak ekleyin. Aksi takdirde PDF'lerde Türkçe karakterler düzgün görünmeyebilir ve Helvetica kullanılacaktır.")
-        raise FileNotFoundError # Fontlar bulunamazsa istisna fırlat
-    
-    pdfmetrics.registerFont(TTFont("FreeSans", "fonts/FreeSans.ttf"))
-    pdfmetrics.registerFont(TTFont("FreeSans-Bold", "fonts/FreeSansBold.ttf"))
-    pdfmetrics.registerFontFamily('FreeSans', normal='FreeSans', bold='FreeSans-Bold')
-    MAIN_FONT = "FreeSans"
-except Exception as e:
-    # Fontlar bulunamazsa veya kaydedilemezse Helvetica'ya geri dön
-    st.warning(f"Font yükleme hatası: {e}. PDF'lerde 'Helvetica' fontu kullanılacak.")
-    MAIN_FONT = "Helvetica"
+    if len(text) > CLEAN_CACHE_MAX_CHARS:
+        return _INVISIBLE_CHARS_RE.sub(' ', text).strip()
+    return _clean_short_text(text)
+
+# --- PDF Desteği ve Font Kaydı (Türkçe karakter desteği) ---
+# FreeSans fontları font_manager.py tarafından süreç başına bir kez 'fonts/' klasöründeki
+# TTF dosyalarından yüklenir.
+MAIN_FONT = "Helvetica" # Fontlar kaydedilince "FreeSans" olur
+_PDF_SUPPORT_LOCK = threading.Lock()
+_pdf_support_loaded = False
+
+def load_pdf_support():
+    """ReportLab modüllerini ilk PDF üretiminde bir kez içe aktarır ve fontları kaydeder."""
+    global _pdf_support_loaded, MAIN_FONT, A4, canvas, colors, Table, TableStyle, Paragraph, Spacer, SimpleDocTemplate
+    global Image, PageBreak, KeepTogether, getSampleStyleSheet, ParagraphStyle, TA_CENTER, TA_LEFT, TA_RIGHT
+    global mm, ImageReader, LongTable, simpleSplit
+    if _pdf_support_loaded:
+        return
+    with _PDF_SUPPORT_LOCK:
+        if _pdf_support_loaded:
+            return
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
+        from reportlab.lib import colors
+        from reportlab.platypus import Table, TableStyle, Paragraph, Spacer, SimpleDocTemplate, Image, PageBreak, KeepTogether, LongTable
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.lib.units import mm
+        from reportlab.lib.utils import ImageReader, simpleSplit
+        MAIN_FONT = font_manager.register_fonts()
+        _pdf_support_loaded = True
+
 # ==============================================================================
 # BÖLÜM 1.2: Şirket Bilgileri ve Fiyat Tanımları
 # ==============================================================================
@@ -74,162 +94,232 @@ COMPANY_INFO = {
     "swift_bic": "BCYPCY2N"
 }
 
-# --- Güncel Fiyat Tanımları ---
-# Tüm fiyatlar KDV hariç maliyet fiyatlarıdır.
-FIYATLAR = {
-    # Çelik Profil Fiyatları (6m parça başı)
-    "steel_profile_100x100x3": 45.00,
-    "steel_profile_100x50x3": 33.00,
-    "steel_profile_40x60x2": 14.00,
-    "steel_profile_120x60x5mm": 60.00,
-    "steel_profile_50x50x2": 11.00,
-    "steel_profile_HEA160": 155.00,
-    
-    # Temel Malzeme Fiyatları
-    "heavy_steel_m2": 400.00, # Ağır çelik m2 fiyatı
-    "sandwich_panel_m2": 22.00, # Standart 60mm EPS paneli için
-    "plywood_piece": 44.44, # Kontraplak/OSB levha fiyatı (yaklaşık 1.22x2.44m)
-    "aluminum_window_piece": 250.00, # Alüminyum pencere adet fiyatı
-    "sliding_glass_door_piece": 300.00, # Sürgülü cam kapı adet fiyatı
-    "wc_window_piece": 120.00, # WC pencere adet fiyatı
-    "wc_sliding_door_piece": 150.00, # WC sürgülü kapı adet fiyatı
-    "door_piece": 280.00, # Genel kapı adet fiyatı
-    
-    # Kurulum/İşçilik Fiyatları
-    "kitchen_installation_standard_piece": 550.00, # Standart mutfak kurulumu
-    "kitchen_installation_special_piece": 1000.00, # Özel tasarım mutfak kurulumu
-    "shower_wc_installation_piece": 1000.00, # Duş/WC kurulumu
-    "connection_element_m2": 1.50, # Bağlantı elemanları için m2 fiyatı
-    "transportation": 350.00, # Nakliye fiyatı
-    "floor_heating_m2": 50.00, # Yerden ısıtma m2 fiyatı
-    "wc_ceramic_m2_material": 20.00, # WC Seramik malzeme m2 fiyatı
-    "wc_ceramic_m2_labor": 20.00,     # WC Seramik işçilik m2 fiyatı
-    "electrical_per_m2": 25.00, # Elektrik tesisatı m2 fiyatı
-    "plumbing_per_m2": 25.00, # Sıhhi tesisat m2 fiyatı
-    "osb_piece": 12.00, # OSB levha fiyatı
-    "insulation_per_m2": 5.25, # Genel yalıtım m2 fiyatı (5cm EPS gibi)
-    
-    # İşçilik Fiyatları
-    "welding_labor_m2_standard": 160.00, # Standart kaynak işçiliği m2 fiyatı
-    "welding_labor_m2_trmontaj": 20.00, # TR montaj kaynak işçiliği m2 fiyatı
-    "panel_assembly_labor_m2": 5.00, # Panel montaj işçiliği m2 fiyatı
-    "plasterboard_material_m2": 20.00, # Alçıpan malzeme m2
-    "plasterboard_labor_m2_avg": 80.00, # Alçıpan işçilik m2
-    "plywood_flooring_labor_m2": 11.11, # Kontraplak döşeme işçiliği m2 fiyatı
-    "door_window_assembly_labor_piece": 10.00, # Kapı/pencere montaj işçiliği adet fiyatı
-    "solar_per_kw": 1250.00, # Solar enerji kW başına fiyat
-
-    # Yeni Zemin Sistemi Malzemeleri Fiyatları
-    "skirting_meter_price": 2.00, # Süpürgelik metre fiyatı
-    "laminate_flooring_m2_price": 15.00, # Laminat parke m2 fiyatı
-    "under_parquet_mat_m2_price": 3.00, # Parke altı şilte m2 fiyatı
-    "osb2_18mm_piece_price": 30.00, # OSB2 18mm veya Beton Panel için parça fiyatı
-    "galvanized_sheet_m2_price": 10.00, # Galvanizli sac m2 fiyatı
-
-    # Yeni Ürün Malzeme Fiyatları ve Bilgi Kalemleri (Aether Living Paketleri için)
-    "smart_home_systems_total_price": 350.00,
-    "white_goods_total_price": 800.00,
-    "sofa_total_price": 400.00,
-    "security_camera_total_price": 650.00,
-    "exterior_cladding_labor_price_per_m2": 150.00, # Knauf Aquapanel gibi dış cephe işçiliği M2 bazlı
-    "bedroom_set_total_price": 800.00,
-    "terrace_laminated_wood_flooring_price_per_m2": 40.00,
-    "porcelain_tile_m2_price": 25.00, # Porselen fayans (zemin için, wc_ceramic fiyatı kullanılacak ama burada da bilgi olarak tutuldu)
-    "concrete_panel_floor_price_per_m2": 50.00,
-    "premium_faucets_total_price": 200.00,
-    "designer_furniture_total_price": 1000.00,
-    "italian_sofa_total_price": 800.00,
-    "inclass_chairs_unit_price": 150.00,
-    "exterior_wood_cladding_m2_price": 150.00, # Lambiri
-    "brushed_grey_granite_countertops_price_m2_avg": 425.00,
-
-    # Detaylı Malzeme Fiyatları (Yeni eklenenler)
-    "100mm_eps_isothermal_panel_unit_price": 27.00, # Poliüretan İzotermik Panel m2
-    "gypsum_board_white_per_unit_price": 8.65, # Beyaz alçıpan (birim başına fiyat)
-    "gypsum_board_green_per_unit_price": 11.95, # Yeşil (suya dayanıklı) alçıpan (birim başına fiyat)
-    "gypsum_board_blue_per_unit_price": 22.00, # Mavi (yangına dayanıklı) alçıpan (birim başına fiyat)
-    "otb_stone_wool_price": 19.80, # Taş yünü yalıtım m2 fiyatı
-    "glass_wool_5cm_packet_price": 19.68, # Cam yünü 5cm (paket fiyatı)
-    "tn25_screws_price_per_unit": 5.58, # Vida birim fiyatı
-    "cdx400_material_price": 3.40, # Profil
-    "ud_material_price": 1.59, # Profil
-    "oc50_material_price": 2.20, # Profil
-    "oc100_material_price": 3.96, # Profil
-    "ch100_material_price": 3.55 # Profil
+# --- Fiyat Kataloğu ---
+# Fiyatlar, bilgi kalemleri ve sabit oranlar price_catalog.json dosyasından yüklenir;
+# dosya değiştiğinde get_catalog() yeni fiyatları yeniden başlatmadan döndürür.
+from price_catalog import get_catalog
+import pdf_cache
+import pdf_workers
+import quote_store
+import stage_timing
+import font_manager
+import cost_graph
+import cost_items
+import money
+import logo_asset
+
+# --- Çok Dilli Metinler ---
+# Malzeme listeleri ve tablo etiketlerinin EN/GR/TR karşılıkları message_catalog.py içindedir.
+from message_catalog import get_message, bilingual, bullet_list, FLOOR_HEATING_COMPONENTS
+
+# --- Varsayılan Proje Girdileri ---
+# Streamlit oturumu ve başsız (CLI) teklif üretimi aynı varsayılanları kullanır.
+SESSION_STATE_DEFAULTS = {
+    'customer_name': 'GENEL',
+    'customer_company': '',
+    'customer_address': '',
+    'customer_city': '',
+    'customer_phone': '',
+    'customer_email': '',
+    'customer_id_no': '',
+    'aether_package_choice': 'None',
+    'width_val': 10.0,
+    'length_val': 8.0,
+    'height_val': 2.6,
+    'structure_type': 'Light Steel',
+    'welding_type': 'Standard Welding (160€/m²)',
+    'room_config': 'Empty Model',
+    'profile_100x100_count': 0,
+    'profile_100x50_count': 0,
+    'profile_40x60_count': 0,
+    'profile_50x50_count': 0,
+    'profile_120x60x5mm_count': 0,
+    'profile_HEA160_count': 0,
+    'plasterboard_interior_option': False,
+    'plasterboard_all_option': False,
+    'osb_inner_wall_option': False,
+    'facade_sandwich_panel_option': False,
+    'window_count': 4,
+    'window_size_val': "100x100 cm",
+    'sliding_door_count': 0,
+    'sliding_door_size_val': "200x200 cm",
+    'wc_window_count': 1,
+    'wc_window_size_val': "60x50 cm",
+    'wc_sliding_door_count': 0,
+    'wc_sliding_door_size_val': "140x70 cm",
+    'door_count': 2,
+    'door_size_val': "90x210 cm",
+    'window_door_color_val': 'White',
+    'kitchen_choice': 'No Kitchen',
+    'shower_wc': False,
+    'wc_ceramic': False,
+    'wc_ceramic_area': 0.0,
+    'electrical': False,
+    'plumbing': False,
+    'insulation_floor': False,
+    'floor_covering': 'Laminate Parquet',
+    'skirting_length_val': 0.0,
+    'laminate_flooring_m2_val': 0.0,
+    'under_parquet_mat_m2_val': 0.0,
+    'osb2_18mm_count_val': 0,
+    'galvanized_sheet_m2_val': 0.0,
+    'insulation_material_type': 'Stone Wool', # Yeni yalıtım tipi
+    'insulation_wall': False,
+    'transportation': False,
+    'heating': False,
+    'solar': False,
+    'solar_kw': 5,
+    'wheeled_trailer': False,
+    'wheeled_trailer_price': 0.0,
+    'profit_rate': ('20%', 0.20), # Tuple olarak tanımlandı
+    'customer_notes': "",
+    'pdf_language': ('Turkish', 'tr'), # Varsayılan Türkçe (seçenekler: PDF_LANGUAGE_OPTIONS)
+
+    # Aether Living seçenekleri (varsayılanlar UI'dan kaldırıldı, kodda yönetilecek)
+    'exterior_cladding_m2_option': False,
+    'exterior_cladding_m2_val': 0.0,
+    'exterior_wood_cladding_m2_option': False,
+    'exterior_wood_cladding_m2_val': 0.0,
+    'porcelain_tiles_option': False,
+    'porcelain_tiles_m2_val': 0.0,
+    'concrete_panel_floor_option': False,
+    'concrete_panel_floor_m2_val': 0.0,
+    'bedroom_set_option': False,
+    'sofa_option': False,
+    'smart_home_systems_option': False,
+    'security_camera_option': False,
+    'security_camera_count': 1, # Default 1 adet kamera için
+    'white_goods_fridge_tv_option': False,
+    'premium_faucets_option': False,
+    'integrated_fridge_option': False,
+    'designer_furniture_option': False,
+    'italian_sofa_option': False,
+    'inclass_chairs_option': False,
+    'inclass_chairs_count': 0,
+    'brushed_granite_countertops_option': False,
+    'brushed_granite_countertops_m2_val': 0.0,
+    'terrace_laminated_wood_flooring_option': False,
+    'terrace_laminated_wood_flooring_m2_val': 0.0,
+
+    # Logo verisini bir kez çekip session state'te tut
+    'logo_data_b64_global': None, 
 }
 
-# Malzeme Bilgi Kalemleri (Fiyatı olmayanlar veya başka bir yerde fiyatı olanlar - Sadece listeleme ve PDF'e detay ekleme için)
-MATERIAL_INFO_ITEMS = {
-    "steel_skeleton_info": "Metal iskelet",
-    "protective_automotive_paint_info": "Koruyucu otomotiv boyası",
-    "insulation_info": "Yalıtım",
-    "60mm_eps_sandwich_panel_info": "Standart 60mm EPS veya Poliüretan Sandviç Paneller (beyaz)",
-    "100mm_eps_isothermal_panel_info": "Yüksek performanslı 100mm EPS veya Poliüretan İzotermik Paneller",
-    "galvanized_sheet_info": "Galvanizli sac",
-    "plywood_osb_floor_panel_info": "Kontraplak/OSB zemin paneli",
-    "12mm_laminate_parquet_info": "12mm Laminat Parke",
-    "induction_hob_info": "İndüksiyonlu ocak",
-    "electric_faucet_info": "Elektrikli batarya",
-    "kitchen_sink_info": "Mutfak evyesi",
-    "fully_functional_bathroom_fixtures_info": "Tam fonksiyonel banyo armutürleri (klozet, lavabo, elektrikli duş)",
-    "kitchen_bathroom_countertops_info": "Mutfak ve banyo tezgahları",
-    "treated_pine_floor_info": "İşlenmiş Çam Zemin Kaplaması (Teras Seçeneği ile)",
-    "porcelain_tiles_info": "Porselen Fayans",
-    "concrete_panel_floor_info": "Beton Panel Zemin",
-    "premium_faucets_info": "Premium Bataryalar (örn. Hansgrohe)",
-    "integrated_refrigerator_info": "Entegre Buzdolabı",
-    "integrated_custom_furniture_info": "Entegre Özel Tasarım Mobilyalar (yüksek kaliteli MDF/lake)",
-    "italian_sofa_info": "İtalyan Kanepe",
-    "inclass_chairs_info": "Inclass Sandalyeler",
-    "smart_home_systems_info": "Akıllı Ev Sistemleri",
-    "advanced_security_camera_pre_installation_info": "Gelişmiş güvenlik kamerası ön kurulumu",
-    "exterior_wood_cladding_lambiri_info": "Dış cephe ahşap kaplama - Lambiri",
-    "brushed_grey_granite_countertops_info": "Fırçalanmış Gri Kale Granit Mutfak/Banyo Tezgahları",
-    "knauf_aquapanel_gypsum_board_info": "Knauf Aquapanel Alçıpan",
-    "eps_styrofoam_info": "EPS STYROFOAM",
-    "knauf_mineralplus_insulation_info": "Knauf MineralPlus İzolasyon",
-    "knauf_guardex_gypsum_board_info": "Knauf Guardex Alçıpan",
-    "satin_plaster_paint_info": "Saten sıva ve boya",
-    "supportive_headboard_furniture_info": "Destekleyici Mobilyalı Yatak Başlığı",
-
-    "electrical_cable_info": "Elektrik Kabloları (3x2.5 mm², 3x1.5 mm²)",
-    "electrical_conduits_info": "Kablolama için Spiral Borular ve Kanallar",
-    "electrical_junction_boxes_info": "Buatlar",
-    "electrical_distribution_board_info": "Sigorta Kutusu (Dağıtım Panosu)",
-    "electrical_circuit_breakers_info": "Sigortalar & Kaçak Akım Rölesi",
-    "electrical_sockets_switches_info": "Prizler ve Anahtarlar",
-    "electrical_lighting_fixtures_info": "İç Aydınlatma Armatürleri (LED Spot / Tavan Lambası)",
-    "electrical_grounding_info": "Topraklama Sistemi Bileşenleri",
-
-    "plumbing_pprc_pipes_info": "Sıcak/Soğuk Su için PPRC Borular",
-    "plumbing_faucets_info": "Mutfak ve Banyo Bataryaları",
-    "plumbing_shower_mixer_info": "Duş Başlığı ve Bataryası",
-    "plumbing_valves_info": "Ana ve ara kesme vanaları",
-    "plumbing_pvc_pipes_info": "PVC Gider Boruları (50mm / 100mm)",
-    "plumbing_siphons_info": "Sifonlar ve yer süzgeçleri",
-
-    "wc_toilet_bowl_info": "Klozet & Rezervuar",
-    "wc_washbasin_info": "El Yıkama Lavabosu & Batarya",
-    "wc_towel_rail_info": "Havluluk",
-    "wc_mirror_info": "Ayna",
-    "wc_accessories_info": "Banyo Aksesuarları",
-    "wc_shower_unit_info": "Duş Ünitesi (Duş Başlığı ve Batarya)",
-
-    "kitchen_mdf_info": "Parlak Beyaz Renk MDF Malzeme",
-    "kitchen_cabinets_info": "Özel Üretim Mutfak Dolapları (özel ölçülerde)",
-    "kitchen_countertop_info": "Tezgah (Laminat veya belirtilen eşdeğeri)",
-    "kitchen_sink_faucet_info": "Evye ve Batarya",
+# Aether Living paketlerinin form varsayılanları (paket seçildiğinde session_state'e yazılır)
+AETHER_PACKAGE_PRESETS = {
+    'Aether Living | Loft Standard (BASICS)': {
+        'kitchen_choice': 'Standard Kitchen',
+        'shower_wc': True,
+        'electrical': True,
+        'plumbing': True,
+        'insulation_floor': True,
+        'insulation_wall': True,
+        'floor_covering': 'Laminate Parquet',
+        'heating': False,
+        'solar': False,
+        'bedroom_set_option': False,
+        'brushed_granite_countertops_option': False,
+        'terrace_laminated_wood_flooring_option': False,
+        'exterior_cladding_m2_option': False,
+        'concrete_panel_floor_option': False,
+        'premium_faucets_option': False,
+        'integrated_fridge_option': False,
+        'designer_furniture_option': False,
+        'italian_sofa_option': False,
+        'inclass_chairs_option': False,
+        'inclass_chairs_count': 0,
+        'smart_home_systems_option': False,
+        'security_camera_option': False,
+        'white_goods_fridge_tv_option': False,
+        'exterior_wood_cladding_m2_option': False,
+        'porcelain_tiles_option': False,
+        'plasterboard_interior_option': True,
+        'plasterboard_all_option': False,
+        'osb_inner_wall_option': True,
+        'facade_sandwich_panel_option': False,
+    },
+    'Aether Living | Loft Premium (ESSENTIAL)': {
+        'kitchen_choice': 'Standard Kitchen',
+        'shower_wc': True,
+        'electrical': True,
+        'plumbing': True,
+        'insulation_floor': True,
+        'insulation_wall': True,
+        'floor_covering': 'Laminate Parquet',
+        'heating': False,
+        'solar': False,
+        'bedroom_set_option': True,
+        'brushed_granite_countertops_option': True,
+        'terrace_laminated_wood_flooring_option': True,
+        'exterior_cladding_m2_option': False,
+        'concrete_panel_floor_option': False,
+        'premium_faucets_option': False,
+        'integrated_fridge_option': False,
+        'designer_furniture_option': False,
+        'italian_sofa_option': False,
+        'inclass_chairs_option': False,
+        'inclass_chairs_count': 0,
+        'smart_home_systems_option': False,
+        'security_camera_option': False,
+        'white_goods_fridge_tv_option': False,
+        'exterior_wood_cladding_m2_option': False,
+        'porcelain_tiles_option': False,
+        'plasterboard_interior_option': True,
+        'plasterboard_all_option': False,
+        'osb_inner_wall_option': True,
+        'facade_sandwich_panel_option': False,
+    },
+    'Aether Living | Loft Elite (LUXURY)': {
+        'kitchen_choice': 'Special Design Kitchen',
+        'shower_wc': True,
+        'electrical': True,
+        'plumbing': True,
+        'insulation_floor': True,
+        'insulation_wall': True,
+        'floor_covering': 'Ceramic',
+        'heating': True,
+        'solar': True,
+        'bedroom_set_option': True,
+        'brushed_granite_countertops_option': True,
+        'terrace_laminated_wood_flooring_option': True,
+        'exterior_cladding_m2_option': True,
+        'concrete_panel_floor_option': True,
+        'premium_faucets_option': True,
+        'integrated_fridge_option': True,
+        'designer_furniture_option': True,
+        'italian_sofa_option': True,
+        'inclass_chairs_option': True,
+        'inclass_chairs_count': 1,
+        'smart_home_systems_option': True,
+        'security_camera_option': True,
+        'white_goods_fridge_tv_option': True,
+        'exterior_wood_cladding_m2_option': False,
+        'porcelain_tiles_option': True,
+        'plasterboard_all_option': True,
+        'osb_inner_wall_option': True,
+        'facade_sandwich_panel_option': True,
+    },
 }
 
-# Sabit oranlar ve alanlar
-FIRE_RATE = 0.05
-VAT_RATE = 0.19
-MONTHLY_ACCOUNTING_EXPENSES = 180.00
-MONTHLY_OFFICE_RENT = 280.00
-ANNUAL_INCOME_TAX_RATE = 0.235
-OSB_PANEL_AREA_M2 = 1.22 * 2.44 # Bir OSB panelinin alanı
-GYPSUM_BOARD_UNIT_AREA_M2 = 2.88 # Bir alçıpan panelinin alanı (1.2m x 2.4m)
-GLASS_WOOL_M2_PER_PACKET = 10.0 # Bir paket cam yününün kapsadığı alan
+# Paket seçenekleri ('None' = paketsiz) ve paketsize dönülürken sıfırlanmayan, elle girilen alanlar
+PACKAGE_CHOICES = ['None', *AETHER_PACKAGE_PRESETS]
+PACKAGE_RESET_PRESERVED_KEYS = frozenset([
+    'customer_name', 'customer_company', 'customer_address', 'customer_city', 'customer_phone', 'customer_email',
+    'customer_id_no', 'aether_package_choice', 'width_val', 'length_val', 'height_val', 'structure_type',
+    'welding_type', 'room_config', 'profit_rate', 'customer_notes', 'pdf_language', 'logo_data_b64_global',
+])
+
+def package_updates(package):
+    """Paket seçildiğinde değişecek girdileri döndürür ('None' tüm paket alanlarını varsayılana döndürür)."""
+    if package == 'None':
+        return {key: value for key, value in SESSION_STATE_DEFAULTS.items() if key not in PACKAGE_RESET_PRESERVED_KEYS}
+    return dict(AETHER_PACKAGE_PRESETS.get(package, {}))
+
+def package_short_label(package):
+    """'Aether Living | Loft Elite (LUXURY)' -> 'LUXURY'; paketsiz seçim için 'Paketsiz'."""
+    if package == 'None':
+        return 'Paketsiz'
+    return package[package.rfind('(') + 1:-1] if package.endswith(')') else package
 
 # ====================== YARDIMCI FONKSİYONLAR ======================
 def calculate_area(width, length, height):
@@ -240,12 +330,12 @@ def calculate_area(width, length, height):
     return {"floor": floor_area, "wall": wall_area, "roof": roof_area}
 
 def format_currency(value):
-    """Parasal değeri Euro para birimi olarak biçimlendirir."""
-    return f"€{value:,.2f}"
+    """Parasal değeri Euro para birimi olarak biçimlendirir (binlik ayıracı nokta, ondalık ayıracı virgül)."""
+    return money.format_euros(value)
 
 def calculate_rounded_up_cost(value):
-    """Parasal değeri iki ondalık basamağa yuvarlar."""
-    return math.ceil(value * 100) / 100.0
+    """Parasal değeri kuruşa yukarı yuvarlar (kayan nokta gürültüsü yukarı yuvarlanmaz, bkz. money.py)."""
+    return money.round_euros(value)
 
 def calculate_recommended_profiles(floor_area):
     """Proje alanına göre önerilen çelik profil adetlerini hesaplar (kaba tahmin)."""
@@ -259,373 +349,683 @@ def calculate_recommended_profiles(floor_area):
         "HEA160": int(base_factor * 0.5)
     }
 
-def calculate_costs_detailed(project_inputs, areas):
-    """
-    Proje girdilerine ve alanlara göre detaylı maliyet hesaplamalarını yapar.
-    Maliyet dökümü listesini ve diğer hesaplanan değerleri döndürür.
-    """
-    floor_area = areas["floor"]
-    wall_area = areas["wall"]
-    roof_area = areas["roof"]
+# --- Maliyet Bağımlılık Grafiği ---
+# Girdiler -> alanlar -> maliyet kalemleri -> toplamlar. Bir hesaplamada yalnızca
+# değişen girdilerden etkilenen düğümler yeniden hesaplanır (bkz. cost_graph.py);
+# örneğin sadece kar oranı değiştiğinde kalemler ve maliyet tablosu yeniden kullanılır.
+PROFILE_COUNT_INPUTS = {
+    "100x100x3": 'profile_100x100_count',
+    "100x50x3": 'profile_100x50_count',
+    "40x60x2": 'profile_40x60_count',
+    "50x50x2": 'profile_50x50_count',
+    "120x60x5mm": 'profile_120x60x5mm_count',
+    "HEA160": 'profile_HEA160_count',
+}
+
+# Seçenek kalemlerinin girdileri (iç duvar, yalıtım, kaplama, zemin, doğrama, mutfak/banyo, tesisat, donanım)
+OPTION_COST_INPUTS = tuple(cost_items.OPTION_INPUT_DEFAULTS)
+
+COST_GRAPH = cost_graph.new_graph([
+    'width_val', 'length_val', 'height_val', 'structure_type', 'welding_type',
+    'facade_sandwich_panel_option', 'profit_rate', 'catalog', *PROFILE_COUNT_INPUTS.values(), *OPTION_COST_INPUTS,
+])
+
+def _cost_line(item, quantity, unit_price, amount):
+    """Maliyet kalemi satırı; tutar kuruşa yukarı yuvarlanır."""
+    return {'Item': item, 'Quantity': quantity, 'Unit Price (€)': unit_price, 'Total (€)': calculate_rounded_up_cost(amount)}
+
+def _info_line(item):
+    """Fiyatı üst kaleme dahil olan bilgi satırı (malzeme açıklaması)."""
+    return {'Item': item, 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0}
+
+@cost_graph.node(COST_GRAPH, 'areas', 'width_val', 'length_val', 'height_val')
+def _areas_node(width_val, length_val, height_val):
+    return calculate_area(width_val, length_val, height_val)
 
+@cost_graph.node(COST_GRAPH, 'floor_area', 'areas')
+def _floor_area_node(areas):
+    return areas["floor"]
+
+@cost_graph.node(COST_GRAPH, 'envelope_area', 'areas')
+def _envelope_area_node(areas):
+    return areas["wall"] + areas["roof"]
+
+@cost_graph.node(COST_GRAPH, 'structure_lines', 'structure_type', 'floor_area', 'catalog', *PROFILE_COUNT_INPUTS.values())
+def _structure_lines_node(structure_type, floor_area, catalog, **profile_counts):
+    """Yapısal maliyet kalemleri (hafif çelik profiller veya ağır çelik)."""
     costs = []
-    profile_analysis_details = []
-    
-    # --- Yapısal Maliyetler ---
-    if project_inputs['structure_type'] == 'Light Steel':
-        profile_types_and_counts = {
-            "100x100x3": project_inputs['profile_100x100_count'],
-            "100x50x3": project_inputs['profile_100x50_count'],
-            "40x60x2": project_inputs['profile_40x60_count'],
-            "50x50x2": project_inputs['profile_50x50_count'],
-            "120x60x5mm": project_inputs['profile_120x60x5mm_count'],
-            "HEA160": project_inputs['profile_HEA160_count'],
-        }
-        
+    if structure_type == 'Light Steel':
+        profile_types_and_counts = {p_type: profile_counts[key] for p_type, key in PROFILE_COUNT_INPUTS.items()}
         has_manual_steel_profiles = any(profile_types_and_counts.values())
-        
+
         if has_manual_steel_profiles:
             for p_type, p_count in profile_types_and_counts.items():
                 if p_count > 0:
-                    fiytlar_key = f"steel_profile_{p_type.replace('x', '_').lower()}" 
-                    cost_per_piece = FIYATLAR.get(fiytlar_key, 0.0)
+                    cost_per_piece = catalog.steel_profiles.get(p_type, 0.0)
                     total_profile_cost = p_count * cost_per_piece
                     costs.append({
-                        'Item': clean_invisible_chars(f"{MATERIAL_INFO_ITEMS['steel_skeleton_info']} ({p_type})"),
+                        'Item': clean_invisible_chars(f"{catalog.material_info['steel_skeleton_info']} ({p_type})"),
                         'Quantity': f"{p_count} adet",
                         'Unit Price (€)': cost_per_piece,
                         'Total (€)': calculate_rounded_up_cost(total_profile_cost)
                     })
         else:
-            auto_100x100_count = math.ceil(floor_area * (12 / 27.0))
-            auto_50x50_count = math.ceil(floor_area * (6 / 27.0))
-            
-            if auto_100x100_count > 0:
-                cost_per_piece = FIYATLAR['steel_profile_100x100x3']
-                total_cost = auto_100x100_count * cost_per_piece
-                costs.append({
-                    'Item': clean_invisible_chars(f"{MATERIAL_INFO_ITEMS['steel_skeleton_info']} (100x100x3) (Auto)"),
-                    'Quantity': f"{auto_100x100_count} adet",
-                    'Unit Price (€)': cost_per_piece,
-                    'Total (€)': calculate_rounded_up_cost(total_cost)
-                })
-            
-            if auto_50x50_count > 0:
-                cost_per_piece = FIYATLAR['steel_profile_50x50x2']
-                total_cost = auto_50x50_count * cost_per_piece
-                costs.append({
-                    'Item': clean_invisible_chars(f"{MATERIAL_INFO_ITEMS['steel_skeleton_info']} (50x50x2) (Auto)"),
-                    'Quantity': f"{auto_50x50_count} adet",
-                    'Unit Price (€)': cost_per_piece,
-                    'Total (€)': calculate_rounded_up_cost(total_cost)
-                })
+            auto_counts = {
+                "100x100x3": math.ceil(floor_area * (12 / 27.0)),
+                "50x50x2": math.ceil(floor_area * (6 / 27.0)),
+            }
+            for p_type, auto_count in auto_counts.items():
+                if auto_count > 0:
+                    cost_per_piece = catalog.steel_profiles[p_type]
+                    total_cost = auto_count * cost_per_piece
+                    costs.append({
+                        'Item': clean_invisible_chars(f"{catalog.material_info['steel_skeleton_info']} ({p_type}) (Auto)"),
+                        'Quantity': f"{auto_count} adet",
+                        'Unit Price (€)': cost_per_piece,
+                        'Total (€)': calculate_rounded_up_cost(total_cost)
+                    })
 
     else:  # Heavy Steel
-        cost_per_m2 = FIYATLAR['heavy_steel_m2']
+        cost_per_m2 = catalog.prices['heavy_steel_m2']
         heavy_steel_cost = floor_area * cost_per_m2
         costs.append({
-            'Item': clean_invisible_chars('Heavy Steel Structure'),
+            'Item': 'Heavy Steel Structure',
             'Quantity': f"{floor_area:.2f} m²",
             'Unit Price (€)': cost_per_m2,
             'Total (€)': calculate_rounded_up_cost(heavy_steel_cost)
         })
-    
-    # Koruyucu boya (her zaman dahil)
-    costs.append({
-        'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['protective_automotive_paint_info']),
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'paint_lines', 'catalog')
+def _paint_lines_node(catalog):
+    """Koruyucu boya (her zaman dahil)."""
+    return [{
+        'Item': clean_invisible_chars(catalog.material_info['protective_automotive_paint_info']),
         'Quantity': 'N/A',
         'Unit Price (€)': 0.0,
         'Total (€)': 0.0
-    })
+    }]
 
-    # Kaynak işçiliği
-    welding_key = 'welding_labor_m2_standard' if project_inputs['welding_type'] == 'Standard Welding (160€/m²)' else 'welding_labor_m2_trmontaj'
-    welding_labor_price = FIYATLAR[welding_key]
+@cost_graph.node(COST_GRAPH, 'welding_lines', 'welding_type', 'floor_area', 'catalog')
+def _welding_lines_node(welding_type, floor_area, catalog):
+    """Kaynak işçiliği."""
+    welding_key = 'welding_labor_m2_standard' if welding_type == 'Standard Welding (160€/m²)' else 'welding_labor_m2_trmontaj'
+    welding_labor_price = catalog.prices[welding_key]
     welding_cost = floor_area * welding_labor_price
-    costs.append({
-        'Item': clean_invisible_chars(f"Steel Welding Labor ({project_inputs['welding_type'].split(' ')[0]})"),
+    return [{
+        'Item': clean_invisible_chars(f"Steel Welding Labor ({welding_type.split(' ')[0]})"),
         'Quantity': f"{floor_area:.2f} m²",
         'Unit Price (€)': welding_labor_price,
         'Total (€)': calculate_rounded_up_cost(welding_cost)
-    })
+    }]
 
-    # Bağlantı elemanları
-    connection_elements_cost = floor_area * FIYATLAR['connection_element_m2']
-    costs.append({
+@cost_graph.node(COST_GRAPH, 'connection_lines', 'floor_area', 'catalog')
+def _connection_lines_node(floor_area, catalog):
+    """Bağlantı elemanları."""
+    connection_elements_cost = floor_area * catalog.prices['connection_element_m2']
+    return [{
         'Item': 'Connection Elements',
         'Quantity': f"{floor_area:.2f} m²",
-        'Unit Price (€)': FIYATLAR['connection_element_m2'],
+        'Unit Price (€)': catalog.prices['connection_element_m2'],
         'Total (€)': calculate_rounded_up_cost(connection_elements_cost)
-    })
+    }]
+
+@cost_graph.node(COST_GRAPH, 'envelope_lines', 'facade_sandwich_panel_option', 'envelope_area', 'catalog')
+def _envelope_lines_node(facade_sandwich_panel_option, envelope_area, catalog):
+    """Duvarlar ve çatı: sandviç panel ve panel montaj işçiliği."""
+    if not facade_sandwich_panel_option:
+        return []
+    sandwich_panel_cost = envelope_area * catalog.prices["sandwich_panel_m2"]
+    panel_assembly_cost = envelope_area * catalog.prices['panel_assembly_labor_m2']
+    return [{
+        'Item': clean_invisible_chars(catalog.material_info['60mm_eps_sandwich_panel_info']),
+        'Quantity': f"{envelope_area:.2f} m²",
+        'Unit Price (€)': catalog.prices["sandwich_panel_m2"],
+        'Total (€)': calculate_rounded_up_cost(sandwich_panel_cost)
+    }, {
+        'Item': 'Panel Assembly Labor',
+        'Quantity': f"{envelope_area:.2f} m²",
+        'Unit Price (€)': catalog.prices['panel_assembly_labor_m2'],
+        'Total (€)': calculate_rounded_up_cost(panel_assembly_cost)
+    }]
+
+@cost_graph.node(COST_GRAPH, 'interior_lines', 'plasterboard_interior_option', 'plasterboard_all_option', 'osb_inner_wall_option', 'areas', 'catalog')
+def _interior_lines_node(plasterboard_interior_option, plasterboard_all_option, osb_inner_wall_option, areas, catalog):
+    """İç duvarlar: alçıpan (malzeme, işçilik, saten boya) ve OSB."""
+    costs = []
+    board_m2_price = catalog.prices['gypsum_board_white_per_unit_price'] / catalog.gypsum_board_unit_area_m2
+    labor_m2_price = catalog.prices['plasterboard_labor_m2_avg']
+    for selected, item, board_area in (
+        (plasterboard_interior_option, 'Interior Plasterboard (White)', areas['wall']),
+        (plasterboard_all_option, 'Interior & Exterior Plasterboard (White)', areas['wall'] * 2),
+    ):
+        if selected:
+            costs.append(_cost_line(item, f"{board_area:.2f} m²", board_m2_price, board_area * board_m2_price))
+            costs.append(_cost_line('Plasterboard Labor', f"{board_area:.2f} m²", labor_m2_price, board_area * labor_m2_price))
+            costs.append(_info_line(clean_invisible_chars(catalog.material_info['satin_plaster_paint_info'])))
+    if osb_inner_wall_option:
+        osb_pieces = math.ceil(areas['wall'] / catalog.osb_panel_area_m2)
+        costs.append(_cost_line('OSB Inner Wall Material', f"{osb_pieces} adet", catalog.prices['osb_piece'], osb_pieces * catalog.prices['osb_piece']))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'insulation_lines', 'insulation_wall', 'insulation_material_type', 'insulation_floor', 'areas', 'catalog')
+def _insulation_lines_node(insulation_wall, insulation_material_type, insulation_floor, areas, catalog):
+    """Duvar yalıtımı (taş yünü m², cam yünü paket) ve zemin yalıtımı."""
+    costs = []
+    wall_area = areas['wall']
+    if insulation_wall and insulation_material_type == 'Stone Wool':
+        unit_price = catalog.prices['otb_stone_wool_price']
+        costs.append(_cost_line("Wall Insulation (Stone Wool)", f"{wall_area:.2f} m²", unit_price, wall_area * unit_price))
+    elif insulation_wall and insulation_material_type == 'Glass Wool':
+        packets = math.ceil(wall_area / catalog.glass_wool_m2_per_packet)
+        unit_price = catalog.prices['glass_wool_5cm_packet_price']
+        costs.append(_cost_line("Wall Insulation (Glass Wool)", f"{packets} paket", unit_price, packets * unit_price))
+    if insulation_floor:
+        floor_area = areas['floor']
+        costs.append(_cost_line('Floor Insulation', f"{floor_area:.2f} m²", catalog.prices['insulation_per_m2'], floor_area * catalog.prices['insulation_per_m2']))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'cladding_lines', 'exterior_cladding_m2_option', 'exterior_cladding_m2_val',
+                 'exterior_wood_cladding_m2_option', 'exterior_wood_cladding_m2_val', 'catalog')
+def _cladding_lines_node(exterior_cladding_m2_option, exterior_cladding_m2_val, exterior_wood_cladding_m2_option, exterior_wood_cladding_m2_val, catalog):
+    """Dış cephe: Knauf Aquapanel kaplama (malzeme ve işçilik) ve ahşap lambiri."""
+    costs = []
+    if exterior_cladding_m2_option and exterior_cladding_m2_val > 0:
+        board_m2_price = catalog.prices['gypsum_board_green_per_unit_price'] / catalog.gypsum_board_unit_area_m2
+        labor_m2_price = catalog.prices['exterior_cladding_labor_price_per_m2']
+        quantity = f"{exterior_cladding_m2_val:.2f} m²"
+        costs.append(_cost_line(clean_invisible_chars(catalog.material_info['knauf_aquapanel_gypsum_board_info']) + ' (Cladding)', quantity, board_m2_price, exterior_cladding_m2_val * board_m2_price))
+        costs.append(_cost_line('Exterior Cladding Labor', quantity, labor_m2_price, exterior_cladding_m2_val * labor_m2_price))
+        costs.append(_info_line(clean_invisible_chars(catalog.material_info['eps_styrofoam_info'])))
+        costs.append(_info_line(clean_invisible_chars(catalog.material_info['knauf_mineralplus_insulation_info'])))
+    if exterior_wood_cladding_m2_option and exterior_wood_cladding_m2_val > 0:
+        unit_price = catalog.prices['exterior_wood_cladding_m2_price']
+        costs.append(_cost_line(clean_invisible_chars(catalog.material_info['exterior_wood_cladding_lambiri_info']), f"{exterior_wood_cladding_m2_val:.2f} m²", unit_price, exterior_wood_cladding_m2_val * unit_price))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'floor_lines', 'insulation_floor', 'catalog',
+                 *(line[0] for line in cost_items.FLOOR_MATERIAL_LINES), *(key for line in cost_items.FLOOR_OPTION_LINES for key in line[:2]))
+def _floor_lines_node(insulation_floor, catalog, **floor_inputs):
+    """Zemin kaplamaları (süpürgelik, laminat, şilte, OSB2, sac) ve paket zemin seçenekleri."""
+    costs = []
+    if insulation_floor:
+        for input_name, item, price_key, quantity_format in cost_items.FLOOR_MATERIAL_LINES:
+            quantity = floor_inputs[input_name]
+            if quantity > 0:
+                costs.append(_cost_line(item, quantity_format % quantity, catalog.prices[price_key], quantity * catalog.prices[price_key]))
+    for option, input_name, info_key, price_key in cost_items.FLOOR_OPTION_LINES:
+        area = floor_inputs[input_name]
+        if floor_inputs[option] and area > 0:
+            costs.append(_cost_line(clean_invisible_chars(catalog.material_info[info_key]), f"{area:.2f} m²", catalog.prices[price_key], area * catalog.prices[price_key]))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'opening_lines', 'catalog', *(key for line in cost_items.OPENING_LINES for key in line[:2]))
+def _opening_lines_node(catalog, **openings):
+    """Pencere ve kapılar ile montaj işçiliği."""
+    costs = []
+    total_pieces = 0
+    for count_input, size_input, item, price_key, always_listed in cost_items.OPENING_LINES:
+        count = openings[count_input]
+        total_pieces += count
+        if count > 0 or always_listed:
+            costs.append(_cost_line(f"{item} ({openings[size_input]})", f"{count} adet", catalog.prices[price_key], count * catalog.prices[price_key]))
+    assembly_price = catalog.prices['door_window_assembly_labor_piece']
+    costs.append(_cost_line('Door/Window Assembly Labor', f"{total_pieces} adet", assembly_price, total_pieces * assembly_price))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'kitchen_bath_lines', 'kitchen_choice', 'shower_wc', 'wc_ceramic', 'wc_ceramic_area', 'catalog')
+def _kitchen_bath_lines_node(kitchen_choice, shower_wc, wc_ceramic, wc_ceramic_area, catalog):
+    """Mutfak kurulumu, duş/WC kurulumu ve WC seramiği (malzeme + işçilik)."""
+    costs = []
+    if kitchen_choice in cost_items.KITCHEN_LINES:
+        item, price_key = cost_items.KITCHEN_LINES[kitchen_choice]
+        costs.append(_cost_line(item, '1 adet', catalog.prices[price_key], catalog.prices[price_key]))
+        costs.extend(_info_line(clean_invisible_chars(catalog.material_info[key])) for key in cost_items.KITCHEN_INFO_KEYS)
+    if shower_wc:
+        costs.append(_cost_line('Shower/WC Installation', '1 adet', catalog.prices['shower_wc_installation_piece'], catalog.prices['shower_wc_installation_piece']))
+        costs.append(_info_line(clean_invisible_chars(catalog.material_info['fully_functional_bathroom_fixtures_info'])))
+        if wc_ceramic and wc_ceramic_area > 0:
+            unit_price = catalog.prices['wc_ceramic_m2_material'] + catalog.prices['wc_ceramic_m2_labor']
+            costs.append(_cost_line('WC Ceramic Material & Labor', f"{wc_ceramic_area:.2f} m²", unit_price, wc_ceramic_area * unit_price))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'installation_lines', 'floor_area', 'catalog', *(line[0] for line in cost_items.INSTALLATION_LINES))
+def _installation_lines_node(floor_area, catalog, **options):
+    """Elektrik, sıhhi tesisat ve yerden ısıtma (m² başına)."""
+    return [
+        _cost_line(item, f"{floor_area:.2f} m²", catalog.prices[price_key], floor_area * catalog.prices[price_key])
+        for option, item, price_key in cost_items.INSTALLATION_LINES if options[option]
+    ]
 
-    # --- Duvarlar ve Çatı ---
-    if project_inputs['facade_sandwich_panel_option']:
-        sandwich_panel_total_area = wall_area + roof_area
-        sandwich_panel_cost = sandwich_panel_total_area * FIYATLAR["sandwich_panel_m2"]
-        costs.append({
-            'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['60mm_eps_sandwich_panel_info']),
-            'Quantity': f"{sandwich_panel_total_area:.2f} m²",
-            'Unit Price (€)': FIYATLAR["sandwich_panel_m2"],
-            'Total (€)': calculate_rounded_up_cost(sandwich_panel_cost)
-        })
-        
-        # Panel montaj işçiliği
-        panel_assembly_cost = sandwich_panel_total_area * FIYATLAR['panel_assembly_labor_m2']
-        costs.append({
-            'Item': 'Panel Assembly Labor',
-            'Quantity': f"{sandwich_panel_total_area:.2f} m²",
-            'Unit Price (€)': FIYATLAR['panel_assembly_labor_m2'],
-            'Total (€)': calculate_rounded_up_cost(panel_assembly_cost)
-        })
+@cost_graph.node(COST_GRAPH, 'delivery_lines', 'transportation', 'wheeled_trailer', 'wheeled_trailer_price', 'catalog')
+def _delivery_lines_node(transportation, wheeled_trailer, wheeled_trailer_price, catalog):
+    """Nakliye ve tekerlekli römork (römork fiyatı formdan girilir)."""
+    costs = []
+    if transportation:
+        costs.append(_cost_line('Transportation', '1 adet', catalog.prices['transportation'], catalog.prices['transportation']))
+    if wheeled_trailer:
+        costs.append(_cost_line('Wheeled Trailer', '1 adet', wheeled_trailer_price, wheeled_trailer_price))
+    return costs
+
+@cost_graph.node(COST_GRAPH, 'furnishing_lines', 'catalog',
+                 *(line[0] for line in cost_items.FURNISHING_LINES), *(line[3] for line in cost_items.FURNISHING_LINES if line[3]))
+def _furnishing_lines_node(catalog, **options):
+    """Aether Living paket donanımları (mobilya, beyaz eşya, akıllı ev, kamera...)."""
+    costs = []
+    for option, item, price_key, quantity_input, quantity_format in cost_items.FURNISHING_LINES:
+        if not options[option]:
+            continue
+        unit_price = catalog.prices.get(price_key, 0.0)
+        if quantity_input is None:
+            costs.append(_cost_line(item, '1 adet', unit_price, unit_price))
+        elif options[quantity_input] > 0:
+            quantity = options[quantity_input]
+            costs.append(_cost_line(item, quantity_format % quantity, unit_price, quantity * unit_price))
+    return costs
+
+# --- Yeni maliyet kalemleri bir *_lines düğümü olarak eklenip COST_LINE_NODES'a yazılır ---
+COST_LINE_NODES = (
+    'structure_lines', 'paint_lines', 'welding_lines', 'connection_lines', 'envelope_lines', 'interior_lines',
+    'insulation_lines', 'cladding_lines', 'floor_lines', 'opening_lines', 'kitchen_bath_lines', 'installation_lines',
+    'delivery_lines', 'furnishing_lines',
+)
+# Kalem düğümü -> maliyet kategorisi (tablolarda 'Category' kolonu, dahili raporda ara toplam grupları)
+COST_LINE_CATEGORIES = {
+    'structure_lines': 'Taşıyıcı Sistem',
+    'paint_lines': 'Boya',
+    'welding_lines': 'Kaynak İşçiliği',
+    'connection_lines': 'Bağlantı Elemanları',
+    'envelope_lines': 'Duvar ve Çatı Kaplaması',
+    'interior_lines': 'İç Duvarlar',
+    'insulation_lines': 'Yalıtım',
+    'cladding_lines': 'Dış Cephe Kaplaması',
+    'floor_lines': 'Zemin Kaplaması',
+    'opening_lines': 'Kapı ve Pencereler',
+    'kitchen_bath_lines': 'Mutfak ve Banyo',
+    'installation_lines': 'Tesisat ve Isıtma',
+    'delivery_lines': 'Nakliye',
+    'furnishing_lines': 'Paket Donanımları',
+}
 
-    # --- Diğer maliyet kalemleri buraya eklenmeye devam edilebilir ---
+@cost_graph.node(COST_GRAPH, 'costs', *COST_LINE_NODES)
+def _costs_node(**line_groups):
+    return [{'Category': COST_LINE_CATEGORIES[name], **item} for name in COST_LINE_NODES for item in line_groups[name]]
 
-    # --- Finansal Hesaplamalar ---
-    total_material_cost = sum(item['Total (€)'] for item in costs)
-    fire_cost = calculate_rounded_up_cost(total_material_cost * FIRE_RATE)
-    profit_amount = calculate_rounded_up_cost(total_material_cost * project_inputs['profit_rate'][1])
-    total_overhead_cost = MONTHLY_ACCOUNTING_EXPENSES + MONTHLY_OFFICE_RENT
-    
-    total_cost_no_vat = calculate_rounded_up_cost(
-        total_material_cost + profit_amount + fire_cost + total_overhead_cost
-    )
-    
-    vat_amount = calculate_rounded_up_cost(total_cost_no_vat * VAT_RATE)
-    final_sales_price_vat_included = calculate_rounded_up_cost(total_cost_no_vat + vat_amount)
+@cost_graph.node(COST_GRAPH, 'costs_df', 'costs')
+def _costs_df_node(costs):
+    import pandas as pd
+    return pd.DataFrame(costs)
+
+# --- Finansal Hesaplamalar ---
+# Toplamlar tam sayı kuruş olarak tutulur; oranlı tutarlar (fire, kar, KDV) kuruşa yukarı yuvarlanır.
+@cost_graph.node(COST_GRAPH, 'material_cents', 'costs')
+def _material_cents_node(costs):
+    return sum(money.to_cents(item['Total (€)']) for item in costs)
+
+@cost_graph.node(COST_GRAPH, 'fire_cents', 'material_cents', 'catalog')
+def _fire_cents_node(material_cents, catalog):
+    return money.multiply(material_cents, catalog.fire_rate)
+
+@cost_graph.node(COST_GRAPH, 'profit_cents', 'material_cents', 'profit_rate')
+def _profit_cents_node(material_cents, profit_rate):
+    return money.multiply(material_cents, profit_rate[1])
+
+@cost_graph.node(COST_GRAPH, 'overhead_cents', 'catalog')
+def _overhead_cents_node(catalog):
+    return money.to_cents(catalog.monthly_accounting_expenses) + money.to_cents(catalog.monthly_office_rent)
+
+@cost_graph.node(COST_GRAPH, 'no_vat_cents', 'material_cents', 'profit_cents', 'fire_cents', 'overhead_cents')
+def _no_vat_cents_node(material_cents, profit_cents, fire_cents, overhead_cents):
+    return material_cents + profit_cents + fire_cents + overhead_cents
+
+@cost_graph.node(COST_GRAPH, 'vat_cents', 'no_vat_cents', 'catalog')
+def _vat_cents_node(no_vat_cents, catalog):
+    return money.multiply(no_vat_cents, catalog.vat_rate)
+
+@cost_graph.node(COST_GRAPH, 'final_cents', 'no_vat_cents', 'vat_cents')
+def _final_cents_node(no_vat_cents, vat_cents):
+    return no_vat_cents + vat_cents
+
+def calculate_costs_detailed(project_inputs, catalog=None, graph_state=None):
+    """
+    Proje girdilerine göre detaylı maliyet hesaplamalarını yapar. catalog verilmezse
+    geçerli fiyat kataloğu kullanılır. graph_state önceki hesaplamanın grafik
+    durumudur; verilirse yalnızca değişen girdilerden etkilenen düğümler yeniden
+    hesaplanır. (sonuç sözlüğü, yeni grafik durumu) döndürür.
+    """
+    catalog = catalog or get_catalog()
+    graph_state = cost_graph.evaluate(COST_GRAPH, {**project_inputs, 'catalog': catalog}, graph_state)
+    values = graph_state['values']
 
     # --- Sonuçları döndür ---
     return {
-        'costs_df': pd.DataFrame(costs),
-        'total_material_cost': total_material_cost,
-        'fire_cost': fire_cost,
-        'profit_amount': profit_amount,
-        'total_overhead_cost': total_overhead_cost,
-        'total_cost_no_vat': total_cost_no_vat,
-        'vat_amount': vat_amount,
-        'final_sales_price': final_sales_price_vat_included
-    }
-print(detailed_cost_markdown)
-print(financial_summary_markdown)
+        'costs_df': values['costs_df'],
+        'total_material_cost': money.from_cents(values['material_cents']),
+        'fire_cost': money.from_cents(values['fire_cents']),
+        'profit_amount': money.from_cents(values['profit_cents']),
+        'total_overhead_cost': money.from_cents(values['overhead_cents']),
+        'total_cost_no_vat': money.from_cents(values['no_vat_cents']),
+        'vat_amount': money.from_cents(values['vat_cents']),
+        'final_sales_price': money.from_cents(values['final_cents']),
+        'fire_rate': catalog.fire_rate,
+        'vat_rate': catalog.vat_rate,
+    }, graph_state
+
 # ==============================================================================
 # BÖLÜM 2: Yardımcı Hesaplama Fonksiyonları ve Temel PDF Yardımcıları
 # ==============================================================================
 
-# Sabit oranlar ve alanlar
-FIRE_RATE = 0.05
-VAT_RATE = 0.19
-MONTHLY_ACCOUNTING_EXPENSES = 180.00
-MONTHLY_OFFICE_RENT = 280.00
-ANNUAL_INCOME_TAX_RATE = 0.235
-OSB_PANEL_AREA_M2 = 1.22 * 2.44 # Bir OSB panelinin alanı
-GYPSUM_BOARD_UNIT_AREA_M2 = 2.88 # Bir alçıpan levhası alanı (1.2m x 2.4m)
-GLASS_WOOL_M2_PER_PACKET = 10.0 # Bir paket cam yününün kapsadığı alan
+# Mutfak seçimine göre rapor metinleri: (EN/GR gösterim, TR gösterim, hesaba dahil mi)
+KITCHEN_DISPLAY = {
+    'Standard Kitchen': ("Yes (Standard)", "Var (Standart)", True),
+    'Special Design Kitchen': ("Yes (Special Design)", "Var (Özel Tasarım)", True),
+}
 
-# ====================== YARDIMCI FONKSİYONLAR ======================
-def calculate_area(width, length, height):
-    """Boyutlara göre zemin, duvar ve çatı alanlarını hesaplar."""
-    floor_area = width * length
-    wall_area = math.ceil(2 * (width + length) * height)
-    roof_area = floor_area
-    return {"floor": floor_area, "wall": wall_area, "roof": roof_area}
+def normalize_inputs(inputs):
+    """Girdi sözlüğündeki tüm metin değerlerini bir kez temizler; PDF'ler bu değerleri yeniden temizlemez."""
+    return {key: clean_invisible_chars(value) if isinstance(value, str) else value for key, value in inputs.items()}
 
-def format_currency(value):
-    """Parasal değeri Euro para birimi olarak biçimlendirir."""
-    # Binlik ayıracı olarak nokta, ondalık ayıracı olarak virgül kullanır.
-    return f"€{value:,.2f}".replace('.', 'X').replace(',', '.').replace('X', ',')
+def build_customer_info(inputs):
+    """Girdi sözlüğünden (session_state anahtarları) PDF'lerde kullanılan müşteri bilgilerini oluşturur."""
+    return {
+        'name': str(inputs['customer_name']).strip() or "GENEL",
+        'company': str(inputs['customer_company']).strip() or "",
+        'address': str(inputs['customer_address']).strip() or "",
+        'city': str(inputs['customer_city']).strip() or "",
+        'phone': str(inputs['customer_phone']).strip() or "",
+        'email': str(inputs['customer_email']).strip() or "",
+        'id_no': str(inputs['customer_id_no']).strip() or "",
+    }
 
-def calculate_rounded_up_cost(value):
-    """Parasal değeri iki ondalık basamağa yuvarlar."""
-    return math.ceil(value * 100) / 100.0
+def build_project_details(inputs, areas, catalog=None):
+    """
+    Girdi sözlüğünden (session_state anahtarları) teklif ve sözleşme PDF'lerinin
+    beklediği proje detaylarını oluşturur. Streamlit'e bağımlı değildir.
+    """
+    catalog = catalog or get_catalog()
+    floor_area = areas["floor"]
+    kitchen_type_display_en_gr, kitchen_type_display_tr, kitchen_included_in_calc = KITCHEN_DISPLAY.get(
+        inputs['kitchen_choice'], ('No Kitchen', 'Mutfak Yok', False)
+    )
+    solar_price = calculate_rounded_up_cost(inputs['solar_kw'] * catalog.prices['solar_per_kw']) if inputs['solar'] else 0.0
 
-def calculate_recommended_profiles(floor_area):
-    """Proje alanına göre önerilen çelik profil adetlerini hesaplar (kaba tahmin)."""
-    # Bu faktörler örnek içindir ve gerçek mühendislik tasarımına göre ayarlanabilir.
-    base_factor = floor_area / 20.0 
-    
     return {
-        "100x100x3": int(base_factor * 2),
-        "100x50x3": int(base_factor * 3),
-        "40x60x2": int(base_factor * 4),
-        "50x50x2": int(base_factor * 5),
-        "120x60x5mm": int(base_factor * 1.5),
-        "HEA160": int(base_factor * 0.5)
+        'width': inputs['width_val'], 'length': inputs['length_val'], 'height': inputs['height_val'], 'area': floor_area,
+        'structure_type': inputs['structure_type'],
+        'plasterboard_interior': inputs['plasterboard_interior_option'],
+        'plasterboard_all': inputs['plasterboard_all_option'],
+        'osb_inner_wall': inputs['osb_inner_wall_option'],
+        'plasterboard_interior_option': inputs['plasterboard_interior_option'],
+        'plasterboard_all_option': inputs['plasterboard_all_option'],
+        'osb_inner_wall_option': inputs['osb_inner_wall_option'],
+        'insulation_floor': inputs['insulation_floor'],
+        'insulation_wall': inputs['insulation_wall'],
+        'window_count': inputs['window_count'], 'window_size_val': inputs['window_size_val'],
+        'window_door_color_val': inputs['window_door_color_val'],
+        'sliding_door_count': inputs['sliding_door_count'], 'sliding_door_size_val': inputs['sliding_door_size_val'],
+        'wc_window_count': inputs['wc_window_count'], 'wc_window_size_val': inputs['wc_window_size_val'],
+        'wc_sliding_door_count': inputs['wc_sliding_door_count'], 'wc_sliding_door_size_val': inputs['wc_sliding_door_size_val'],
+        'door_count': inputs['door_count'], 'door_size_val': inputs['door_size_val'],
+        'kitchen_choice': inputs['kitchen_choice'],
+        'kitchen_type_display_en_gr': kitchen_type_display_en_gr,
+        'kitchen_type_display_tr': kitchen_type_display_tr,
+        'kitchen_included_in_calc': kitchen_included_in_calc,
+        'shower_wc': inputs['shower_wc'],
+        'wc_ceramic': inputs['wc_ceramic'], 'wc_ceramic_area': inputs['wc_ceramic_area'],
+        'electrical': inputs['electrical'], 'plumbing': inputs['plumbing'],
+        'transportation': inputs['transportation'], 'heating': inputs['heating'],
+        'solar': inputs['solar'], 'solar_kw': inputs['solar_kw'], 'solar_price': solar_price,
+        'wheeled_trailer': inputs['wheeled_trailer'],
+        'wheeled_trailer_price': inputs['wheeled_trailer_price'],
+        'vat_rate': catalog.vat_rate, 'profit_rate_val_tuple': inputs['profit_rate'],
+        'room_configuration': inputs['room_config'],
+        'delivery_duration_business_days': math.ceil((floor_area / 27.0) * 35),
+        'welding_labor_type': inputs['welding_type'],
+        'facade_sandwich_panel_included': inputs['facade_sandwich_panel_option'],
+        'floor_covering_type': inputs['floor_covering'],
+        'skirting_length_val': inputs['skirting_length_val'],
+        'laminate_flooring_m2_val': inputs['laminate_flooring_m2_val'],
+        'under_parquet_mat_m2_val': inputs['under_parquet_mat_m2_val'],
+        'osb2_18mm_count_val': inputs['osb2_18mm_count_val'],
+        'galvanized_sheet_m2_val': inputs['galvanized_sheet_m2_val'],
+        'insulation_material_type': inputs['insulation_material_type'],
+        'exterior_cladding_m2_option': inputs['exterior_cladding_m2_option'],
+        'exterior_cladding_m2_val': inputs['exterior_cladding_m2_val'],
+        'exterior_wood_cladding_m2_option': inputs['exterior_wood_cladding_m2_option'],
+        'exterior_wood_cladding_m2_val': inputs['exterior_wood_cladding_m2_val'],
+        'porcelain_tiles_option': inputs['porcelain_tiles_option'],
+        'porcelain_tiles_m2_val': inputs['porcelain_tiles_m2_val'],
+        'concrete_panel_floor_option': inputs['concrete_panel_floor_option'],
+        'concrete_panel_floor_m2_val': inputs['concrete_panel_floor_m2_val'],
+        'bedroom_set_option': inputs['bedroom_set_option'],
+        'sofa_option': inputs['sofa_option'],
+        'smart_home_systems_option': inputs['smart_home_systems_option'],
+        'security_camera_option': inputs['security_camera_option'],
+        'security_camera_count': inputs['security_camera_count'],
+        'white_goods_fridge_tv_option': inputs['white_goods_fridge_tv_option'],
+        'premium_faucets_option': inputs['premium_faucets_option'],
+        'integrated_fridge_option': inputs['integrated_fridge_option'],
+        'designer_furniture_option': inputs['designer_furniture_option'],
+        'italian_sofa_option': inputs['italian_sofa_option'],
+        'inclass_chairs_option': inputs['inclass_chairs_option'],
+        'inclass_chairs_count': inputs['inclass_chairs_count'],
+        'brushed_granite_countertops_option': inputs['brushed_granite_countertops_option'],
+        'brushed_granite_countertops_m2_val': inputs['brushed_granite_countertops_m2_val'],
+        'terrace_laminated_wood_flooring_option': inputs['terrace_laminated_wood_flooring_option'],
+        'terrace_laminated_wood_flooring_m2_val': inputs['terrace_laminated_wood_flooring_m2_val'],
+        # Profil adetleri de project_details'e eklendi
+        'profile_100x100_count_val': inputs['profile_100x100_count'],
+        'profile_100x50_count_val': inputs['profile_100x50_count'],
+        'profile_40x60_count_val': inputs['profile_40x60_count'],
+        'profile_50x50_count_val': inputs['profile_50x50_count'],
+        'profile_120x60x5mm_count_val': inputs['profile_120x60x5mm_count'],
+        'profile_HEA160_count_val': inputs['profile_HEA160_count'],
     }
 
 # ==============================================================================
 # PDF GENERATION HELPER FUNCTIONS
 # ==============================================================================
 
-@st.cache_data
-def get_company_logo_base64(url):
-    """Şirket logosunu URL'den çeker ve base64 string olarak döndürür."""
-    try:
-        response = requests.get(url)
-        response.raise_for_status() # HTTP hatalarını yakala
-        # PIL Image'ı kullanarak resmi yeniden boyutlandır ve PNG olarak kaydet
-        img = PILImage.open(io.BytesIO(response.content))
-        # Genişlik ve yükseklik oranlarını koruyarak yeniden boyutlandır
-        logo_width = 180 # Örnek genişlik, isteğe bağlı olarak ayarlanabilir
-        w_percent = (logo_width / float(img.size[0]))
-        h_size = int((float(img.size[1]) * float(w_percent)))
-        img = img.resize((logo_width, h_size), PILImage.LANCZOS) # PIL.Image.LANCZOS kullanıldı
-        
-        buffered = io.BytesIO()
-        img.save(buffered, format="PNG") 
-        return base64.b64encode(buffered.getvalue()).decode()
-    except requests.exceptions.RequestException as e:
-        st.warning(f"Logo URL'den alınırken hata oluştu: {e}. Logolar PDF'lerde görünmeyebilir.")
-        return None
-    except Exception as e:
-        st.warning(f"Logo işlenirken veya Base64'e dönüştürülürken hata oluştu: {e}. Logolar PDF'lerde görünmeyebilir.")
+def get_company_logo_base64(url, wait=False):
+    """
+    Şirket logosunu base64 PNG olarak döndürür. Logo bellek/disk önbelleğinden gelir;
+    ağ isteği arka planda yapılır, önbellek boşsa None döner (bkz. logo_asset.py).
+    """
+    return logo_asset.get_logo_base64(url, wait=wait)
+
+# --- Süreç Genelinde Logo Kaynağı ---
+# Base64 logo her sayfada yeniden çözülüp PIL ile açılmasın diye çözülmüş baytlar,
+# boyutlar ve tekrar kullanılabilir ImageReader süreç başına bir kez hazırlanır.
+# Modül seviyesinde tutulduğu için tüm Streamlit oturumları aynı kaynağı paylaşır.
+LOGO_WIDTH_PDF_MM = 40
+_LOGO_RESOURCES = {}
+_LOGO_RESOURCES_LOCK = threading.Lock()
+_LOGO_RESOURCES_MAX = 4 # Farklı logo sayısı sınırı (normalde tek logo vardır)
+
+def get_logo_resource(logo_data_b64):
+    """Base64 logoyu bir kez çözer; {'data', 'width', 'height', 'reader'} sözlüğü veya None döndürür."""
+    if not logo_data_b64:
         return None
-
-def draw_pdf_header_and_footer_common(canvas_obj, doc, customer_name, company_name, logo_data_b64):
-    """Ortak PDF başlık ve altbilgi çizim fonksiyonu."""
-    canvas_obj.saveState()
-    canvas_obj.setFont(MAIN_FONT, 7)
-
-    # Header - Sol üstte logo ve Sağ üstte şirket bilgileri
-    if logo_data_b64:
+    with _LOGO_RESOURCES_LOCK:
+        if logo_data_b64 in _LOGO_RESOURCES:
+            return _LOGO_RESOURCES[logo_data_b64]
         try:
             img_data = base64.b64decode(logo_data_b64)
-            img = Image(io.BytesIO(img_data))
-            # Boyutları ayarla, orantıyı koruyarak
-            logo_width_mm = 40 * mm  # Örnek genişlik
-            aspect_ratio = img.drawWidth / img.drawHeight
-            logo_height_mm = logo_width_mm / aspect_ratio
-            canvas_obj.drawImage(img, doc.leftMargin, A4[1] - logo_height_mm - 10 * mm, width=logo_width_mm, height=logo_height_mm, mask='auto')
-        except Exception as e:
-            st.warning(f"PDF'e logo eklenirken hata oluştu: {e}. Logolar PDF'lerde görünmeyebilir.")
-
-    # Şirket Bilgileri (Sağ üst)
-    textobject = canvas_obj.beginText()
-    textobject.setTextOrigin(A4[0] - doc.rightMargin - 60*mm, A4[1] - 25 * mm) # Sağ kenara hizalı başlangıç
-    textobject.setFont(MAIN_FONT, 8)
-    textobject.setFillColor(colors.HexColor('#2C3E50'))
-    
-    # Her satırı sağa hizalamak için tek tek drawString kullanmak daha iyi olabilir
-    canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 25 * mm, clean_invisible_chars(COMPANY_INFO['name']))
-    canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 30 * mm, clean_invisible_chars(COMPANY_INFO['address']))
-    canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 35 * mm, clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"))
-    canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 40 * mm, clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"))
-    canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 45 * mm, clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"))
+            reader = ImageReader(io.BytesIO(img_data))
+            width, height = reader.getSize()
+            resource = {'data': img_data, 'width': width, 'height': height, 'reader': reader}
+        except Exception:
+            resource = None # Bozuk logo her sayfada tekrar denenmesin
+        if len(_LOGO_RESOURCES) >= _LOGO_RESOURCES_MAX:
+            _LOGO_RESOURCES.clear()
+        _LOGO_RESOURCES[logo_data_b64] = resource
+        return resource
+
+def draw_company_logo(canvas_obj, doc, logo):
+    """Hazırlanmış logo kaynağını sayfanın sol üstüne orantılı olarak çizer."""
+    if not logo:
+        return
+    logo_width = LOGO_WIDTH_PDF_MM * mm
+    logo_height = logo_width * logo['height'] / logo['width']
+    canvas_obj.drawImage(logo['reader'], doc.leftMargin, A4[1] - logo_height - 10 * mm, width=logo_width, height=logo_height, mask='auto')
+
+# --- Sayfa Başlığı/Altbilgisi (Form XObject) ---
+# Logo, şirket bilgileri ve altbilgi metni her sayfada aynıdır. Bunlar belge başına
+# bir kez Form XObject olarak tanımlanır ve her sayfaya damgalanır; sayfada yalnızca
+# sayfa numarası dinamik olarak çizilir.
+PAGE_HEADER_FOOTER_FORM = "CompanyHeaderFooter"
+
+def _draw_static_header_footer(canvas_obj, doc):
+    """Sayfadan sayfaya değişmeyen başlık ve altbilgi öğelerini çizer."""
+    # Header - Sol üstte logo ve Sağ üstte şirket bilgileri
+    try:
+        draw_company_logo(canvas_obj, doc, doc.logo)
+    except Exception as e:
+        # Logo çizilemezse hata vermeden devam et
+        pass
 
+    # Şirket Bilgileri (Sağ üst, sağa hizalı)
+    canvas_obj.setFont(MAIN_FONT, 8)
+    canvas_obj.setFillColor(colors.HexColor('#2C3E50'))
+    company_lines = [
+        COMPANY_INFO['name'],
+        COMPANY_INFO['address'],
+        f"Email: {COMPANY_INFO['email']}",
+        f"Phone: {COMPANY_INFO['phone']}",
+        f"Website: {COMPANY_INFO['website']}",
+    ]
+    for line_no, line in enumerate(company_lines):
+        canvas_obj.drawRightString(A4[0] - doc.rightMargin, A4[1] - (25 + 5 * line_no) * mm, clean_invisible_chars(line))
 
     # Footer
     canvas_obj.line(doc.leftMargin, 20 * mm, A4[0] - doc.rightMargin, 20 * mm) # Footer çizgisi
     canvas_obj.setFont(MAIN_FONT, 7)
     canvas_obj.drawString(doc.leftMargin, 15 * mm, clean_invisible_chars(f"{COMPANY_INFO['name']} - {COMPANY_INFO['website']}"))
-    canvas_obj.drawRightString(A4[0] - doc.rightMargin, 15 * mm, clean_invisible_chars(f"Page {doc.page}")) # Sayfa numarası
+
+def draw_page_header_footer(canvas_obj, doc):
+    """Statik başlık/altbilgi formunu (ilk sayfada tanımlayarak) sayfaya damgalar ve sayfa numarasını yazar."""
+    canvas_obj.saveState()
+    if not canvas_obj.hasForm(PAGE_HEADER_FOOTER_FORM):
+        canvas_obj.beginForm(PAGE_HEADER_FOOTER_FORM)
+        _draw_static_header_footer(canvas_obj, doc)
+        canvas_obj.endForm()
+    canvas_obj.doForm(PAGE_HEADER_FOOTER_FORM)
+
+    canvas_obj.setFont(MAIN_FONT, 7)
+    canvas_obj.setFillColor(colors.HexColor('#2C3E50'))
+    canvas_obj.drawRightString(A4[0] - doc.rightMargin, 15 * mm, f"Page {doc.page}") # Sayfa numarası
     canvas_obj.restoreState()
+
+# --- PDF Çıktı Hedefi (Kopyasız) ---
+# ReportLab belgeyi kaydederken tüm PDF'i tek bir bytes nesnesi olarak üretip
+# hedefin write() metoduna verir. BytesIO bu baytları kendi tamponuna kopyalar;
+# bu hedef ise nesnenin kendisini saklar. Böylece ReportLab'in ürettiği bytes
+# nesnesi PDF önbelleğine, arka plan işinin sonucuna ve indirme butonuna aynen
+# (tek kopya olarak) geçer; Streamlit bytes verisini kopyalamadan saklar.
+def new_pdf_sink():
+    """SimpleDocTemplate'e dosya yerine verilecek, yalnızca yazılabilir PDF hedefini döndürür."""
+    chunks = []
+    return SimpleNamespace(write=lambda data: chunks.append(bytes(data)), chunks=chunks) # bytes(bytes) kopyalamaz
+
+def pdf_sink_bytes(sink):
+    """Hedefe yazılan PDF baytlarını döndürür; tek parça yazıldıysa (ReportLab) kopyalamadan."""
+    return sink.chunks[0] if len(sink.chunks) == 1 else b''.join(sink.chunks)
+
+# --- Süreç Genelinde Paragraf Stilleri ---
+# getSampleStyleSheet() ve özel ParagraphStyle nesneleri her PDF'te yeniden
+# oluşturulmasın diye her dil için bir kez kurulur ve değiştirilemez bir sözlük
+# olarak tüm PDF fonksiyonları ve oturumlar arasında paylaşılır.
+# Diller: 'en_gr' (İngilizce/Yunanca teklif), 'tr' (Türkçe teklif), 'en' (sözleşme).
+@functools.lru_cache(maxsize=None)
+def get_pdf_styles(language):
+    """Dile ait stil kaydını döndürür (ad -> ParagraphStyle, salt okunur)."""
+    load_pdf_support()
+    sample = getSampleStyleSheet()
+    styles = {name: sample[name] for name in sample.byName}
+
+    if language in ('en_gr', 'tr'):
+        normal_name, header_name = ('NormalBilingual', 'ColoredTableHeader') if language == 'en_gr' else ('NormalTR', 'ColoredTableHeaderTR')
+        proposal_styles = [
+            ParagraphStyle(
+                name=normal_name, parent=sample['Normal'], fontSize=8, leading=10,
+                spaceAfter=2, fontName=MAIN_FONT
+            ),
+            ParagraphStyle(
+                name='Heading', parent=sample['Heading2'], fontSize=11, spaceAfter=5, spaceBefore=10,
+                fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce"), alignment=TA_LEFT
+            ),
+            ParagraphStyle(
+                name='PriceTotal', parent=sample['Heading1'], fontSize=21, alignment=TA_CENTER,
+                spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#c53030")
+            ),
+            ParagraphStyle(
+                name='SectionSubheading', parent=sample['Heading3'], fontSize=9, spaceAfter=3, spaceBefore=7,
+                fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#4a5568")
+            ),
+            ParagraphStyle(
+                name='Title', parent=sample['Heading1'], fontSize=17, alignment=TA_CENTER,
+                spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce")
+            ),
+            ParagraphStyle(
+                name='Subtitle', parent=sample['Normal'], fontSize=10, alignment=TA_CENTER,
+                spaceAfter=7, fontName=MAIN_FONT, textColor=colors.HexColor("#4a5568")
+            ),
+            ParagraphStyle(
+                name='PaymentHeading', parent=sample['Heading3'], fontSize=9, spaceAfter=3,
+                spaceBefore=7, fontName=f"{MAIN_FONT}-Bold"
+            ),
+            ParagraphStyle(
+                name=header_name, parent=sample['Normal'], fontSize=8, fontName=f"{MAIN_FONT}-Bold",
+                textColor=colors.white, alignment=TA_LEFT
+            ),
+        ]
+        styles.update({style.name: style for style in proposal_styles})
+    elif language == 'en':
+        contract_styles = [
+            ParagraphStyle(
+                name='ContractHeading', parent=sample['Heading2'], fontSize=13, spaceAfter=8,
+                spaceBefore=12, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce"), alignment=TA_CENTER
+            ),
+            ParagraphStyle(
+                name='ContractSubheading', parent=sample['Heading3'], fontSize=10, spaceAfter=5,
+                spaceBefore=8, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#4a5568")
+            ),
+            ParagraphStyle(
+                name='ContractNormal', parent=sample['Normal'], fontSize=8, leading=10,
+                spaceAfter=4, fontName=MAIN_FONT, alignment=TA_LEFT
+            ),
+            ParagraphStyle(
+                name='ContractList', parent=sample['Normal'], fontSize=8, leading=10,
+                spaceAfter=2, leftIndent=8*mm, fontName=MAIN_FONT
+            ),
+            ParagraphStyle(
+                name='ContractSignature', parent=sample['Normal'], fontSize=8, leading=10,
+                alignment=TA_CENTER
+            ),
+        ]
+        styles.update({style.name: style for style in contract_styles})
+    else:
+        raise ValueError(f"Bilinmeyen PDF stil dili: '{language}'")
+    return MappingProxyType(styles)
+
     # ==============================================================================
 # BÖLÜM 3: Ek PDF Eki Oluşturma Fonksiyonları (Solar ve Yerden Isıtma)
 # ==============================================================================
 
-# PDF için yeni metinler (Koddaki MATERIAL_INFO_ITEMS sözlüğünden kopyalanmıştır)
-ELECTRICAL_MATERIALS_EN = clean_invisible_chars(f"""
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_cable_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_conduits_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_junction_boxes_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_distribution_board_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_circuit_breakers_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_sockets_switches_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_lighting_fixtures_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_grounding_info'])}
-""")
-ELECTRICAL_MATERIALS_GR = ELECTRICAL_MATERIALS_EN.replace("Electrical Cables", "Ηλεκτρικά Καλώδια").replace("Conduits and Pipes for Cabling", "Σωλήνες & Κανάλια για Καλωδίωση").replace("Junction Boxes", "Κουτιά Διακλάδωσης").replace("Distribution Board (Fuse Box)", "Πίνακας Ασφαλειών").replace("Circuit Breakers & Residual Current Device (RCD)", "Ασφάλειες & Ρελέ Διαρροής").replace("Sockets and Switches", "Πρίζες & Διακόπτες").replace("Interior Lighting Fixtures (LED Spots / Ceiling Lamp)", "Εσωτερικά Φωτιστικά (LED Σποτ / Φωτιστικό Οροφής)").replace("Grounding System Components", "Σύστημα Γείωσης")
-ELECTRICAL_MATERIALS_TR = clean_invisible_chars(f"""
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_cable_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_conduits_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_junction_boxes_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_distribution_board_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_circuit_breakers_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_sockets_switches_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_lighting_fixtures_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['electrical_grounding_info'])}
-""")
-
-PLUMBING_MATERIALS_EN = clean_invisible_chars(f"""
-<b>Clean Water System:</b>
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_pprc_pipes_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_faucets_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_shower_mixer_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_valves_info'])}
-<b>Wastewater System:</b>
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_pvc_pipes_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_siphons_info'])}
-""")
-PLUMBING_MATERIALS_GR = PLUMBING_MATERIALS_EN.replace("Clean Water System:", "Σύστημα Καθαρού Νερού:").replace("Wastewater System:", "Σύστημα Ακάθαρτου Νερού:").replace("PPRC Pipes for Hot/Cold Water", "Σωλήνες PPRC για Ζεστό/Κρύο Νερό").replace("Kitchen and Bathroom Faucets", "Μπαταρίες Κουζίνας και Μπάνιου").replace("Shower Head and Mixer", "Κεφαλή Ντους και Μπαταρία").replace("Main and intermediate valves", "Κύριες και ενδιάμεσες βάνες").replace("PVC Pipes (50mm / 100mm)", "Σωλήνες PVC (50mm / 100mm)").replace("Siphons and floor drains", "Σιφώνια και σχάρες δαπέδου")
-PLUMBING_MATERIALS_TR = clean_invisible_chars(f"""
-<b>Temiz Su Tesisatı:</b>
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_pprc_pipes_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_faucets_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_shower_mixer_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_valves_info'])}
-<b>Atık Su Tesisatı:</b>
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_pvc_pipes_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['plumbing_siphons_info'])}
-""")
+# Malzeme listeleri message_catalog'dan bir kez derlenir (EN, EN / GR ve TR)
+ELECTRICAL_MATERIALS_EN = bullet_list('electrical_materials')
+ELECTRICAL_MATERIALS_EN_GR = bullet_list('electrical_materials', ('en', 'gr'))
+ELECTRICAL_MATERIALS_TR = bullet_list('electrical_materials', ('tr',))
 
-FLOOR_HEATING_MATERIALS_EN = clean_invisible_chars("""
-• Nano Heat Paint
-• 48V 2000W Transformer
-• Thermostat Control Unit
-• Wiring and Connection Terminals
-• Insulation Layers
-• Subfloor Preparation Materials
-""")
-FLOOR_HEATING_MATERIALS_GR = clean_invisible_chars("""
-• Νάνο Θερμική Βαφή
-• Μετασχηματιστής 48V 2000W
-• Μονάδα Ελέγχου Θερμοστάτη
-• Καλωδίωση και Τερματικά Σύνδεσης
-• Στρώσεις Μόνωσης
-• Υλικά Προετοιμασίας Υποδαπέδου
-""")
-FLOOR_HEATING_MATERIALS_TR = clean_invisible_chars("""
-• Nano Isı Boyası
-• 48V 2000W Trafo
-• Termostat Kontrol Ünitesi
-• Kablolama ve Bağlantı Terminalleri
-• Yalıtım Katmanları
-• Zemin Hazırlık Malzemeleri
-""")
+PLUMBING_MATERIALS_EN = bullet_list('plumbing_materials')
+PLUMBING_MATERIALS_EN_GR = bullet_list('plumbing_materials', ('en', 'gr'))
+PLUMBING_MATERIALS_TR = bullet_list('plumbing_materials', ('tr',))
 
-KITCHEN_MATERIALS_EN = clean_invisible_chars(f"""
-Standard materials include:
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_mdf_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_cabinets_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_countertop_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_sink_faucet_info'])}
-Note: Final material selection and detailed list will be provided upon design approval.
-""")
-KITCHEN_MATERIALS_GR = KITCHEN_MATERIALS_EN.replace("Standard materials include:", "Τυπικά υλικά περιλαμβάνουν:").replace("Glossy White Color MDF Material", "Υλικό MDF Γυαλιστερό Λευκό Χρώμα").replace("Special Production Kitchen Cabinets (custom dimensions)", "Ειδικές Κατασκευές Ντουλαπιών Κουζίνας (προσαρμοσμένες διαστάσεις)").replace("Countertop (Laminate or specified equivalent)", "Πάγκος (Laminate ή καθορισμένο ισοδύναμο)").replace("Sink and Faucet", "Νεροχύτης και Βρύση").replace("Note: Final material selection and detailed list will be provided upon design approval.", "Σημείωση: Η τελική επιλογή υλικών και η λεπτομερής λίστα θα παρασχεθούν μετά την έγκριση του σχεδιασμού.")
-KITCHEN_MATERIALS_TR = clean_invisible_chars(f"""
-Standart malzemeler:
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_mdf_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_cabinets_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_countertop_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['kitchen_sink_faucet_info'])}
-Not: Malzeme seçimi sonrası nihai ve detaylı liste tasarım onayı ile birlikte sunulacaktır.
-""")
+KITCHEN_MATERIALS_EN_GR = bullet_list('kitchen_materials', ('en', 'gr'))
+KITCHEN_MATERIALS_TR = bullet_list('kitchen_materials', ('tr',))
 
-SHOWER_WC_MATERIALS_EN = clean_invisible_chars(f"""
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_shower_unit_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_toilet_bowl_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_washbasin_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_towel_rail_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_mirror_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_accessories_info'])}
-""")
-SHOWER_WC_MATERIALS_GR = SHOWER_WC_MATERIALS_EN.replace("Shower Unit (Shower Head & Mixer)", "Μονάδα Ντους (Κεφαλή Ντους & Μπαταρία)").replace("Toilet Bowl & Cistern", "Λεκάνη Τουαλέτας & Καζανάκι").replace("Washbasin & Faucet", "Νιπτήρας & Μπαταρία").replace("Towel Rail", "Πετσετοθήκη").replace("Mirror", "Καθρέφτης").replace("Bathroom Accessories", "Αξεσουάρ Μπάνιου")
-SHOWER_WC_MATERIALS_TR = clean_invisible_chars(f"""
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_shower_unit_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_toilet_bowl_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_washbasin_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_towel_rail_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_mirror_info'])}
-• {clean_invisible_chars(MATERIAL_INFO_ITEMS['wc_accessories_info'])}
-""")
+SHOWER_WC_MATERIALS_EN_GR = bullet_list('shower_wc_materials', ('en', 'gr'))
+SHOWER_WC_MATERIALS_TR = bullet_list('shower_wc_materials', ('tr',))
 
 # PDF özellikleri açıklamaları
 LIGHT_STEEL_BUILDING_STRUCTURE_EN_GR = clean_invisible_chars(f"""
@@ -683,19 +1083,19 @@ def _create_solar_appendix_elements_en_gr(solar_kw, solar_price, heading_style,
     """Güneş Enerjisi Sistemi eki için öğeleri oluşturur (İngilizce-Yunanca)."""
     elements = [
         PageBreak(),
-        Paragraph(clean_invisible_chars("APPENDIX B: SOLAR ENERGY SYSTEM / ΠΑΡΑΡΤΗΜΑ Β: ΣΥΣΤΗΜΑ ΗΛΙΑΚΗΣ ΕΝΕΡΓΕΙΑΣ"), heading_style),
+        Paragraph("APPENDIX B: SOLAR ENERGY SYSTEM / ΠΑΡΑΡΤΗΜΑ Β: ΣΥΣΤΗΜΑ ΗΛΙΑΚΗΣ ΕΝΕΡΓΕΙΑΣ", heading_style),
         Spacer(1, 8*mm),
         Paragraph(clean_invisible_chars(f"Below are the details for the included <b>{solar_kw} kW</b> Solar Energy System. The price for this system is handled separately from the main house payment plan.<br/><br/>Ακολουθούν οι λεπτομέρειες για το συμπεριλαμβανόμενο Σύστημα Ηλιακής Ενέργειας <b>{solar_kw} kW</b>. Η τιμή για αυτό το σύστημα διαχειρίζεται ξεχωριστά από το πρόγραμμα πληρωμών του κυρίως σπιτιού."), normal_bilingual_style),
         Spacer(1, 8*mm),
     ]
     solar_materials = [
-        [clean_invisible_chars("<b>Component / Εξάρτημα</b>"), clean_invisible_chars("<b>Description / Περιγραφή</b>")],
-        [clean_invisible_chars("Solar Panels / Ηλιακοί Συλλέκτες"), clean_invisible_chars(f"{solar_kw} kW High-Efficiency Monocrystalline Panels")],
-        [clean_invisible_chars("Inverter / Μετατροπέας"), clean_invisible_chars("Hybrid Inverter with Grid-Tie Capability")],
-        [clean_invisible_chars("Batteries / Μπαταρίες"), clean_invisible_chars("Lithium-Ion Battery Storage System (optional, priced separately)")],
-        [clean_invisible_chars("Mounting System / Σύστημα Στήριξης"), clean_invisible_chars("Certified mounting structure for roof installation")],
-        [clean_invisible_chars("Cabling & Connectors / Καλωδίωση & Συνδέσεις"), clean_invisible_chars("All necessary DC/AC cables, MC4 connectors, and safety switches")],
-        [clean_invisible_chars("Installation & Commissioning / Εγκατάσταση & Θέση σε Λειτουργία"), clean_invisible_chars("Full professional installation and system commissioning")],
+        ["<b>Component / Εξάρτημα</b>", "<b>Description / Περιγραφή</b>"],
+        ["Solar Panels / Ηλιακοί Συλλέκτες", clean_invisible_chars(f"{solar_kw} kW High-Efficiency Monocrystalline Panels")],
+        ["Inverter / Μετατροπέας", "Hybrid Inverter with Grid-Tie Capability"],
+        ["Batteries / Μπαταρίες", "Lithium-Ion Battery Storage System (optional, priced separately)"],
+        ["Mounting System / Σύστημα Στήριξης", "Certified mounting structure for roof installation"],
+        ["Cabling & Connectors / Καλωδίωση & Συνδέσεις", "All necessary DC/AC cables, MC4 connectors, and safety switches"],
+        ["Installation & Commissioning / Εγκατάσταση & Θέση σε Λειτουργία", "Full professional installation and system commissioning"],
     ]
     solar_materials_p = [[Paragraph(clean_invisible_chars(cell), normal_bilingual_style) for cell in row] for row in solar_materials]
     solar_table = Table(solar_materials_p, colWidths=[60*mm, 110*mm])
@@ -710,7 +1110,7 @@ def _create_solar_appendix_elements_en_gr(solar_kw, solar_price, heading_style,
     ]))
     elements.append(solar_table)
     elements.append(Spacer(1, 12*mm))
-    elements.append(Paragraph(clean_invisible_chars("Total Price (Solar System) / Συνολική Τιμή (Ηλιακό Σύστημα)"), heading_style))
+    elements.append(Paragraph("Total Price (Solar System) / Συνολική Τιμή (Ηλιακό Σύστημα)", heading_style))
     elements.append(Paragraph(format_currency(solar_price), price_total_style))
     return elements
 
@@ -718,19 +1118,19 @@ def _create_solar_appendix_elements_tr(solar_kw, solar_price, heading_style, nor
     """Güneş Enerjisi Sistemi eki için öğeleri oluşturur (Türkçe)."""
     elements = [
         PageBreak(),
-        Paragraph(clean_invisible_chars("EK B: GÜNEŞ ENERJİ SİSTEMİ"), heading_style),
+        Paragraph("EK B: GÜNEŞ ENERJİ SİSTEMİ", heading_style),
         Spacer(1, 8*mm),
         Paragraph(clean_invisible_chars(f"Projeye dahil edilen <b>{solar_kw} kW</b> Güneş Enerji Sistemi'nin detayları aşağıdadır. Bu sistemin bedeli, ana ev ödeme planından ayrı olarak faturalandırılacaktır."), normal_tr_style),
         Spacer(1, 8*mm),
     ]
     solar_materials = [
-        [clean_invisible_chars("<b>Bileşen</b>"), clean_invisible_chars("<b>Açıklama</b>")],
-        [clean_invisible_chars("Güneş Panelleri"), clean_invisible_chars(f"{solar_kw} kW Yüksek Verimli Monokristal Panel")],
-        [clean_invisible_chars("Inverter (Çevirici)"), clean_invisible_chars("Hibrit Inverter (Şebeke Bağlantı Özellikli)")],
-        [clean_invisible_chars("Bataryalar"), clean_invisible_chars("Lityum-İyon Batarya Depolama Sistemi (opsiyonel, ayrı fiyatlandırılır)")],
-        [clean_invisible_chars("Montaj Sistemi"), clean_invisible_chars("Çatı kurulumu için sertifikalı montaj yapısı")],
-        [clean_invisible_chars("Kablolama & Bağlantılar"), clean_invisible_chars("Tüm gerekli DC/AC kablolar, MC4 konnektörler ve güvenlik şalterleri")],
-        [clean_invisible_chars("Kurulum & Devreye Alma"), clean_invisible_chars("Tam profesyonel kurulum ve sistemin devreye alınması")],
+        ["<b>Bileşen</b>", "<b>Açıklama</b>"],
+        ["Güneş Panelleri", clean_invisible_chars(f"{solar_kw} kW Yüksek Verimli Monokristal Panel")],
+        ["Inverter (Çevirici)", "Hibrit Inverter (Şebeke Bağlantı Özellikli)"],
+        ["Bataryalar", "Lityum-İyon Batarya Depolama Sistemi (opsiyonel, ayrı fiyatlandırılır)"],
+        ["Montaj Sistemi", "Çatı kurulumu için sertifikalı montaj yapısı"],
+        ["Kablolama & Bağlantılar", "Tüm gerekli DC/AC kablolar, MC4 konnektörler ve güvenlik şalterleri"],
+        ["Kurulum & Devreye Alma", "Tam profesyonel kurulum ve sistemin devreye alınması"],
     ]
     solar_materials_p = [[Paragraph(clean_invisible_chars(cell), normal_tr_style) for cell in row] for row in solar_materials]
     solar_table = Table(solar_materials_p, colWidths=[60*mm, 110*mm])
@@ -745,7 +1145,7 @@ def _create_solar_appendix_elements_tr(solar_kw, solar_price, heading_style, nor
     ]))
     elements.append(solar_table)
     elements.append(Spacer(1, 12*mm))
-    elements.append(Paragraph(clean_invisible_chars("Toplam Fiyat (Güneş Enerji Sistemi)"), heading_style))
+    elements.append(Paragraph("Toplam Fiyat (Güneş Enerji Sistemi)", heading_style))
     elements.append(Paragraph(format_currency(solar_price), price_total_style))
     return elements
 
@@ -756,24 +1156,14 @@ def _create_heating_appendix_elements_en_gr(styles):
     normal_bilingual_style = styles['NormalBilingual']
     elements = [
         PageBreak(),
-        Paragraph(clean_invisible_chars("APPENDIX C: FLOOR HEATING SYSTEM / ΠΑΡΑΡΤΗΜΑ Γ: ΣΥΣΤΗΜΑ ΕΝΔΟΔΑΠΕΔΙΑΣ ΘΕΡΜΑΝΣΗΣ"), heading_style),
+        Paragraph("APPENDIX C: FLOOR HEATING SYSTEM / ΠΑΡΑΡΤΗΜΑ Γ: ΣΥΣΤΗΜΑ ΕΝΔΟΔΑΠΕΔΙΑΣ ΘΕΡΜΑΝΣΗΣ", heading_style),
         Spacer(1, 8*mm),
-        Paragraph(clean_invisible_chars("Below are the standard materials included in the Floor Heating System:<br/><br/>Ακολουθούν τα στάνταρ υλικά που περιλαμβάνονται στο Σύστημα Ενδοδαπέδιας Θέρμανσης:"), normal_bilingual_style),
+        Paragraph("Below are the standard materials included in the Floor Heating System:<br/><br/>Ακολουθούν τα στάνταρ υλικά που περιλαμβάνονται στο Σύστημα Ενδοδαπέδιας Θέρμανσης:", normal_bilingual_style),
         Spacer(1, 4*mm),
     ]
-    heating_materials_en_lines = FLOOR_HEATING_MATERIALS_EN.strip().split('\n')
-    heating_materials_gr_lines = FLOOR_HEATING_MATERIALS_GR.strip().split('\n')
-    
-    heating_materials = [
-        [clean_invisible_chars("<b>Component / Εξάρτημα</b>"), clean_invisible_chars("<b>Description / Περιγραφή</b>")],
-        [clean_invisible_chars("Heating Elements / Στοιχεία Θέρμανσης"), clean_invisible_chars(heating_materials_en_lines[0].strip()) + " / " + clean_invisible_chars(heating_materials_gr_lines[0].strip())],
-        [clean_invisible_chars("Transformer / Μετατροπέας"), clean_invisible_chars(heating_materials_en_lines[1].strip()) + " / " + clean_invisible_chars(heating_materials_gr_lines[1].strip())],
-        [clean_invisible_chars("Thermostat / Θερμοστάτης"), clean_invisible_chars(heating_materials_en_lines[2].strip()) + " / " + clean_invisible_chars(heating_materials_gr_lines[2].strip())],
-        [clean_invisible_chars("Wiring / Καλωδίωση"), clean_invisible_chars(heating_materials_en_lines[3].strip()) + " / " + clean_invisible_chars(heating_materials_gr_lines[3].strip())],
-        [clean_invisible_chars("Insulation / Μόνωση"), clean_invisible_chars(heating_materials_en_lines[4].strip()) + " / " + clean_invisible_chars(heating_materials_gr_lines[4].strip())],
-        [clean_invisible_chars("Subfloor Materials / Υλικά Υποδαπέδου"), clean_invisible_chars(heating_materials_en_lines[5].strip()) + " / " + clean_invisible_chars(heating_materials_gr_lines[5].strip())],
-    ]
-    heating_table_p = [[Paragraph(clean_invisible_chars(cell), normal_bilingual_style) for cell in row] for row in heating_materials]
+    heating_materials = [[f"<b>{bilingual('component_label')}</b>", f"<b>{bilingual('description_label')}</b>"]]
+    heating_materials += [[bilingual(label_key), bilingual(info_key)] for label_key, info_key in FLOOR_HEATING_COMPONENTS]
+    heating_table_p = [[Paragraph(cell, normal_bilingual_style) for cell in row] for row in heating_materials]
     heating_table = Table(heating_table_p, colWidths=[70*mm, 100*mm])
     heating_table.setStyle(TableStyle([
         ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4a5568")),
@@ -786,7 +1176,7 @@ def _create_heating_appendix_elements_en_gr(styles):
     ]))
     elements.append(heating_table)
     elements.append(Spacer(1, 8*mm))
-    elements.append(Paragraph(clean_invisible_chars("Note: Final material selection and detailed specifications will be confirmed during the design phase based on specific project requirements.<br/><br/>Σημείωση: Η τελική επιλογή υλικών και οι λεπτομερείς προδιαγραφές θα επιβεβαιωθούν κατά τη φάση του σχεδιασμού με βάση τις συγκεκριμένες απαιτήσεις του έργου."), normal_bilingual_style))
+    elements.append(Paragraph("Note: Final material selection and detailed specifications will be confirmed during the design phase based on specific project requirements.<br/><br/>Σημείωση: Η τελική επιλογή υλικών και οι λεπτομερείς προδιαγραφές θα επιβεβαιωθούν κατά τη φάση του σχεδιασμού με βάση τις συγκεκριμένες απαιτήσεις του έργου.", normal_bilingual_style))
     return elements
 
 def _create_heating_appendix_elements_tr(styles):
@@ -795,23 +1185,14 @@ def _create_heating_appendix_elements_tr(styles):
     normal_tr_style = styles['NormalTR']
     elements = [
         PageBreak(),
-        Paragraph(clean_invisible_chars("EK C: YERDEN ISITMA SİSTEMİ"), heading_style),
+        Paragraph("EK C: YERDEN ISITMA SİSTEMİ", heading_style),
         Spacer(1, 8*mm),
-        Paragraph(clean_invisible_chars("Yerden Isıtma Sistemi'ne dahil olan standart malzemeler aşağıdadır:"), normal_tr_style),
+        Paragraph("Yerden Isıtma Sistemi'ne dahil olan standart malzemeler aşağıdadır:", normal_tr_style),
         Spacer(1, 4*mm),
     ]
-    heating_materials_tr_lines = FLOOR_HEATING_MATERIALS_TR.strip().split('\n')
-
-    heating_materials = [
-        [clean_invisible_chars("<b>Bileşen</b>"), clean_invisible_chars("<b>Açıklama</b>")],
-        [clean_invisible_chars("Isıtma Elemanları"), clean_invisible_chars(heating_materials_tr_lines[0].strip())],
-        [clean_invisible_chars("Trafo"), clean_invisible_chars(heating_materials_tr_lines[1].strip())],
-        [clean_invisible_chars("Termostat"), clean_invisible_chars(heating_materials_tr_lines[2].strip())],
-        [clean_invisible_chars("Kablolama"), clean_invisible_chars(heating_materials_tr_lines[3].strip())],
-        [clean_invisible_chars("Yalıtım Katmanları"), clean_invisible_chars(heating_materials_tr_lines[4].strip())],
-        [clean_invisible_chars("Zemin Hazırlık Malzemeleri"), clean_invisible_chars(heating_materials_tr_lines[5].strip())],
-    ]
-    heating_table_p = [[Paragraph(clean_invisible_chars(cell), normal_tr_style) for cell in row] for row in heating_materials]
+    heating_materials = [[f"<b>{get_message('component_label', 'tr')}</b>", f"<b>{get_message('description_label', 'tr')}</b>"]]
+    heating_materials += [[get_message(label_key, 'tr'), get_message(info_key, 'tr')] for label_key, info_key in FLOOR_HEATING_COMPONENTS]
+    heating_table_p = [[Paragraph(cell, normal_tr_style) for cell in row] for row in heating_materials]
     heating_table = Table(heating_table_p, colWidths=[70*mm, 100*mm])
     heating_table.setStyle(TableStyle([
         ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4a5568")),
@@ -824,121 +1205,34 @@ def _create_heating_appendix_elements_tr(styles):
     ]))
     elements.append(heating_table)
     elements.append(Spacer(1, 8*mm))
-    elements.append(Paragraph(clean_invisible_chars("Not: Malzeme seçimi sonrası nihai ve detaylı spesifikasyonlar, proje gereksinimlerine göre tasarım aşamasında teyit edilecektir."), normal_tr_style))
+    elements.append(Paragraph("Not: Malzeme seçimi sonrası nihai ve detaylı spesifikasyonlar, proje gereksinimlerine göre tasarım aşamasında teyit edilecektir.", normal_tr_style))
     return elements
     # ==============================================================================
 # BÖLÜM 4.1: Müşteri Teklifi PDF Fonksiyonları - Ortak Ayarlar ve İngilizce/Yunanca PDF Başlangıcı
 # ==============================================================================
 
-def create_customer_proposal_pdf(house_price, solar_price, total_price, project_details, notes, customer_info):
-    """Müşteri için profesyonel bir teklif PDF'i oluşturur (İngilizce ve Yunanca)."""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=15*mm,
-        leftMargin=15*mm,
-        topMargin=40*mm, # Header için artırılmış margin
-        bottomMargin=25*mm
-    )
-
-    doc.customer_name = customer_info['name']
-    doc.company_name = COMPANY_INFO['name']
-    # Logo verisini doc objesine ekle ki header/footer callback'leri erişebilsin
-    # logo_data_b64_global, run_streamlit_app içinde st.session_state'e kaydediliyor.
-    # PDF fonksiyonlarına doğrudan parametre olarak geçirilmesi daha temiz bir yaklaşım olacaktır.
-    # Ancak mevcut yapıda st.session_state'ten okunması gerekiyor.
-    doc.logo_data_b64 = st.session_state.get('logo_data_b64_global', None) 
-
-    # Custom header/footer for proposals
-    def _proposal_page_callback(canvas_obj, doc):
-        # Ortak başlık ve altbilgi çizimi
-        canvas_obj.saveState()
-        canvas_obj.setFont(MAIN_FONT, 7)
-
-        # Header - Sol üstte logo ve Sağ üstte şirket bilgileri
-        if doc.logo_data_b64:
-            try:
-                img_data = base64.b64decode(doc.logo_data_b64)
-                img = PILImage.open(io.BytesIO(img_data)) # PIL Image objesi olarak aç
-                aspect_ratio = img.width / img.height
-                logo_width_mm = 40 * mm  # Örnek genişlik
-                logo_height_mm = logo_width_mm / aspect_ratio
-                # drawImage fonksiyonu PIL Image objesi veya dosya yolu kabul eder
-                canvas_obj.drawImage(Image(io.BytesIO(img_data)), doc.leftMargin, A4[1] - logo_height_mm - 10 * mm, width=logo_width_mm, height=logo_height_mm, mask='auto')
-            except Exception as e:
-                # Logo çizilemezse hata vermeden devam et
-                pass
-
-        # Şirket Bilgileri (Sağ üst)
-        canvas_obj.setFont(MAIN_FONT, 8)
-        canvas_obj.setFillColor(colors.HexColor('#2C3E50'))
-        # Her satırı sağa hizalamak için tek tek drawString kullanmak daha iyi olabilir
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['name']), MAIN_FONT, 8), A4[1] - 25 * mm, clean_invisible_chars(COMPANY_INFO['name']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['address']), MAIN_FONT, 8), A4[1] - 30 * mm, clean_invisible_chars(COMPANY_INFO['address']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"), MAIN_FONT, 8), A4[1] - 35 * mm, clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"), MAIN_FONT, 8), A4[1] - 40 * mm, clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"), MAIN_FONT, 8), A4[1] - 45 * mm, clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"))
-
-
-        # Footer
-        canvas_obj.line(doc.leftMargin, 20 * mm, A4[0] - doc.rightMargin, 20 * mm) # Footer çizgisi
-        canvas_obj.setFont(MAIN_FONT, 7)
-        canvas_obj.drawString(doc.leftMargin, 15 * mm, clean_invisible_chars(f"{COMPANY_INFO['name']} - {COMPANY_INFO['website']}"))
-        canvas_obj.drawRightString(A4[0] - doc.rightMargin, 15 * mm, clean_invisible_chars(f"Page {doc.page}")) # Sayfa numarası
-        canvas_obj.restoreState()
-
-
-    doc.onFirstPage = _proposal_page_callback
-    doc.onLaterPages = _proposal_page_callback
-
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(
-        name='NormalBilingual', parent=styles['Normal'], fontSize=8, leading=10,
-        spaceAfter=2, fontName=MAIN_FONT
-    ))
-    styles.add(ParagraphStyle(
-        name='Heading', parent=styles['Heading2'], fontSize=11, spaceAfter=5, spaceBefore=10,
-        fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce"), alignment=TA_LEFT
-    ))
-    styles.add(ParagraphStyle(
-        name='PriceTotal', parent=styles['Heading1'], fontSize=21, alignment=TA_CENTER,
-        spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#c53030")
-    ))
-    styles.add(ParagraphStyle(
-        name='SectionSubheading', parent=styles['Heading3'], fontSize=9, spaceAfter=3, spaceBefore=7,
-        fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#4a5568")
-    ))
+def get_yes_no(value):
+    """Boolean değeri İngilizce/Yunanca Evet/Hayır metnine çevirir."""
+    return 'Yes / Ναι' if value else 'No / Όχι'
 
-    title_style = ParagraphStyle(
-        name='Title', parent=styles['Heading1'], fontSize=17, alignment=TA_CENTER,
-        spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce")
-    )
-    subtitle_style = ParagraphStyle(
-        name='Subtitle', parent=styles['Normal'], fontSize=10, alignment=TA_CENTER,
-        spaceAfter=7, fontName=MAIN_FONT, textColor=colors.HexColor("#4a5568")
-    )
-    
-    payment_heading_style = ParagraphStyle(
-        name='PaymentHeading', parent=styles['Heading3'], fontSize=9, spaceAfter=3,
-        spaceBefore=7, fontName=f"{MAIN_FONT}-Bold"
-    )
+def get_yes_no_empty(value):
+    """Değer doğruysa İngilizce/Yunanca 'Evet' metni, değilse boş metin döndürür."""
+    return 'Yes / Ναι' if value else ''
 
-    colored_table_header_style = ParagraphStyle(
-        name='ColoredTableHeader', parent=styles['Normal'], fontSize=8, fontName=f"{MAIN_FONT}-Bold",
-        textColor=colors.white, alignment=TA_LEFT
-    )
+def get_yes_no_tr(value):
+    """Boolean değeri Türkçe Evet/Hayır metnine çevirir."""
+    return 'Evet' if value else 'Hayır'
 
-    elements = []
-    # ==============================================================================
-# BÖLÜM 4.1: Müşteri Teklifi PDF Fonksiyonları - Ortak Ayarlar ve İngilizce/Yunanca PDF Başlangıcı
-# ==============================================================================
+def get_yes_no_empty_tr(value):
+    """Değer doğruysa Türkçe 'Evet' metni, değilse boş metin döndürür."""
+    return 'Evet' if value else ''
 
-def create_customer_proposal_pdf(house_price, solar_price, total_price, project_details, notes, customer_info):
+def create_customer_proposal_pdf(house_price, solar_price, total_price, project_details, notes, customer_info, logo_data_b64=None):
     """Müşteri için profesyonel bir teklif PDF'i oluşturur (İngilizce ve Yunanca)."""
-    buffer = io.BytesIO()
+    load_pdf_support()
+    sink = new_pdf_sink()
     doc = SimpleDocTemplate(
-        buffer,
+        sink,
         pagesize=A4,
         rightMargin=15*mm,
         leftMargin=15*mm,
@@ -948,90 +1242,25 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 
     doc.customer_name = customer_info['name']
     doc.company_name = COMPANY_INFO['name']
-    # Logo verisini doc objesine ekle ki header/footer callback'leri erişebilsin
-    # logo_data_b64_global, run_streamlit_app içinde st.session_state'e kaydediliyor.
-    # PDF fonksiyonlarına doğrudan parametre olarak geçirilmesi daha temiz bir yaklaşım olacaktır.
-    # Ancak mevcut yapıda st.session_state'ten okunması gerekiyor.
-    doc.logo_data_b64 = st.session_state.get('logo_data_b64_global', None) 
+    # Logo verisini doc objesine ekle ki header/footer callback'leri erişebilsin.
+    # Logo parametre olarak gelir; st.session_state okunmadığı için fonksiyon
+    # Streamlit betiği dışındaki iş parçacıklarından da güvenle çağrılabilir.
+    doc.logo_data_b64 = logo_data_b64
+    doc.logo = get_logo_resource(doc.logo_data_b64) # Çözülmüş logo süreç genelinde paylaşılır
 
     # Custom header/footer for proposals
     def _proposal_page_callback(canvas_obj, doc):
-        # Ortak başlık ve altbilgi çizimi
-        canvas_obj.saveState()
-        canvas_obj.setFont(MAIN_FONT, 7)
-
-        # Header - Sol üstte logo ve Sağ üstte şirket bilgileri
-        if doc.logo_data_b64:
-            try:
-                img_data = base64.b64decode(doc.logo_data_b64)
-                img = PILImage.open(io.BytesIO(img_data)) # PIL Image objesi olarak aç
-                aspect_ratio = img.width / img.height
-                logo_width_mm = 40 * mm  # Örnek genişlik
-                logo_height_mm = logo_width_mm / aspect_ratio
-                # drawImage fonksiyonu PIL Image objesi veya dosya yolu kabul eder
-                canvas_obj.drawImage(Image(io.BytesIO(img_data)), doc.leftMargin, A4[1] - logo_height_mm - 10 * mm, width=logo_width_mm, height=logo_height_mm, mask='auto')
-            except Exception as e:
-                # Logo çizilemezse hata vermeden devam et
-                pass
-
-        # Şirket Bilgileri (Sağ üst)
-        canvas_obj.setFont(MAIN_FONT, 8)
-        canvas_obj.setFillColor(colors.HexColor('#2C3E50'))
-        # Her satırı sağa hizalamak için tek tek drawString kullanmak daha iyi olabilir
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['name']), MAIN_FONT, 8), A4[1] - 25 * mm, clean_invisible_chars(COMPANY_INFO['name']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['address']), MAIN_FONT, 8), A4[1] - 30 * mm, clean_invisible_chars(COMPANY_INFO['address']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"), MAIN_FONT, 8), A4[1] - 35 * mm, clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"), MAIN_FONT, 8), A4[1] - 40 * mm, clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"), MAIN_FONT, 8), A4[1] - 45 * mm, clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"))
-
-
-        # Footer
-        canvas_obj.line(doc.leftMargin, 20 * mm, A4[0] - doc.rightMargin, 20 * mm) # Footer çizgisi
-        canvas_obj.setFont(MAIN_FONT, 7)
-        canvas_obj.drawString(doc.leftMargin, 15 * mm, clean_invisible_chars(f"{COMPANY_INFO['name']} - {COMPANY_INFO['website']}"))
-        canvas_obj.drawRightString(A4[0] - doc.rightMargin, 15 * mm, clean_invisible_chars(f"Page {doc.page}")) # Sayfa numarası
-        canvas_obj.restoreState()
+        draw_page_header_footer(canvas_obj, doc)
 
 
     doc.onFirstPage = _proposal_page_callback
     doc.onLaterPages = _proposal_page_callback
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(
-        name='NormalBilingual', parent=styles['Normal'], fontSize=8, leading=10,
-        spaceAfter=2, fontName=MAIN_FONT
-    ))
-    styles.add(ParagraphStyle(
-        name='Heading', parent=styles['Heading2'], fontSize=11, spaceAfter=5, spaceBefore=10,
-        fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce"), alignment=TA_LEFT
-    ))
-    styles.add(ParagraphStyle(
-        name='PriceTotal', parent=styles['Heading1'], fontSize=21, alignment=TA_CENTER,
-        spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#c53030")
-    ))
-    styles.add(ParagraphStyle(
-        name='SectionSubheading', parent=styles['Heading3'], fontSize=9, spaceAfter=3, spaceBefore=7,
-        fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#4a5568")
-    ))
-
-    title_style = ParagraphStyle(
-        name='Title', parent=styles['Heading1'], fontSize=17, alignment=TA_CENTER,
-        spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce")
-    )
-    subtitle_style = ParagraphStyle(
-        name='Subtitle', parent=styles['Normal'], fontSize=10, alignment=TA_CENTER,
-        spaceAfter=7, fontName=MAIN_FONT, textColor=colors.HexColor("#4a5568")
-    )
-    
-    payment_heading_style = ParagraphStyle(
-        name='PaymentHeading', parent=styles['Heading3'], fontSize=9, spaceAfter=3,
-        spaceBefore=7, fontName=f"{MAIN_FONT}-Bold"
-    )
-
-    colored_table_header_style = ParagraphStyle(
-        name='ColoredTableHeader', parent=styles['Normal'], fontSize=8, fontName=f"{MAIN_FONT}-Bold",
-        textColor=colors.white, alignment=TA_LEFT
-    )
+    styles = get_pdf_styles('en_gr')
+    title_style = styles['Title']
+    subtitle_style = styles['Subtitle']
+    payment_heading_style = styles['PaymentHeading']
+    colored_table_header_style = styles['ColoredTableHeader']
 
     elements = []
     # ==============================================================================
@@ -1040,8 +1269,8 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 
     # --- Kapak Sayfası ---
     elements.append(Spacer(1, 40*mm))
-    elements.append(Paragraph(clean_invisible_chars("PREFABRICATED HOUSE PROPOSAL"), title_style))
-    elements.append(Paragraph(clean_invisible_chars("ΠΡΟΤΑΣΗ ΠΡΟΚΑΤΑΣΚΕΥΑΣΜΕΝΟΥ ΣΠΙΤΙΟΥ"), title_style))
+    elements.append(Paragraph("PREFABRICATED HOUSE PROPOSAL", title_style))
+    elements.append(Paragraph("ΠΡΟΤΑΣΗ ΠΡΟΚΑΤΑΣΚΕΥΑΣΜΕΝΟΥ ΣΠΙΤΙΟΥ", title_style))
     elements.append(Spacer(1, 20*mm))
     elements.append(Paragraph(clean_invisible_chars(f"For / Για: {customer_info['name']}"), subtitle_style))
     if customer_info['company']:
@@ -1051,7 +1280,7 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
     elements.append(PageBreak())
 
     # --- Müşteri & Proje Bilgileri Bölümü (Tablolar halinde düzenlendi) ---
-    elements.append(Paragraph(clean_invisible_chars("CUSTOMER & PROJECT INFORMATION / ΠΛΗΡΟΦΟΡΙΕΣ ΠΕΛΑΤΗ & ΕΡΓΟΥ"), styles['Heading']))
+    elements.append(Paragraph("CUSTOMER & PROJECT INFORMATION / ΠΛΗΡΟΦΟΡΙΕΣ ΠΕΛΑΤΗ & ΕΡΓΟΥ", styles['Heading']))
     
     # Oda Konfigürasyonu ve Boyut Bilgileri (Müşteri Bilgileri tablosu üstünde)
     elements.append(Paragraph(clean_invisible_chars(f"<b>Room Configuration / Διαμόρφωση Δωματίου:</b> {project_details['room_configuration']}"), styles['NormalBilingual']))
@@ -1059,11 +1288,11 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
     elements.append(Spacer(1, 8*mm))
 
     customer_info_table_data = [
-        [Paragraph(clean_invisible_chars("<b>Name / Όνομα:</b>"), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['name']}"), styles['NormalBilingual'])],
-        [Paragraph(clean_invisible_chars("<b>Company / Εταιρεία:</b>"), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['company'] or ''}"), styles['NormalBilingual'])],
-        [Paragraph(clean_invisible_chars("<b>Address / Διεύθυνση:</b>"), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['address'] or ''}"), styles['NormalBilingual'])],
-        [Paragraph(clean_invisible_chars("<b>Phone / Τηλέφωνο:</b>"), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['phone'] or ''}"), styles['NormalBilingual'])],
-        [Paragraph(clean_invisible_chars("<b>ID/Passport No / Αρ. Ταυτότητας/Διαβατηρίου:</b>"), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['id_no'] or ''}"), styles['NormalBilingual'])],
+        [Paragraph("<b>Name / Όνομα:</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['name']}"), styles['NormalBilingual'])],
+        [Paragraph("<b>Company / Εταιρεία:</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['company'] or ''}"), styles['NormalBilingual'])],
+        [Paragraph("<b>Address / Διεύθυνση:</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['address'] or ''}"), styles['NormalBilingual'])],
+        [Paragraph("<b>Phone / Τηλέφωνο:</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['phone'] or ''}"), styles['NormalBilingual'])],
+        [Paragraph("<b>ID/Passport No / Αρ. Ταυτότητας/Διαβατηρίου:</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"{customer_info['id_no'] or ''}"), styles['NormalBilingual'])],
     ]
     customer_info_table = Table(customer_info_table_data, colWidths=[65*mm, 105*mm])
     customer_info_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1074,7 +1303,7 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 # ==============================================================================
 
     # --- Teknik Özellikler Bölümü (Tablolar halinde düzenlendi) ---
-    elements.append(Paragraph(clean_invisible_chars("TECHNICAL SPECIFICATIONS / ΤΕΧΝΙΚΑ ΧΑΡΑΚΤΗΡΙΣΤΙΚΑ"), styles['Heading']))
+    elements.append(Paragraph("TECHNICAL SPECIFICATIONS / ΤΕΧΝΙΚΑ ΧΑΡΑΚΤΗΡΙΣΤΙΚΑ", styles['Heading']))
     
     # Bu yardımcı fonksiyonlar zaten BÖLÜM 4.1'de tanımlanmıştır, burada tekrar tanımlanmasına gerek yoktur.
     # Ancak kodun bu bölümü çalışırken bu fonksiyonlara erişebildiğinden emin olmalıyız.
@@ -1087,20 +1316,20 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
     # Yapı ve Malzemeler (Construction Materials)
     building_structure_table_data = []
     if project_details['structure_type'] == 'Light Steel':
-        building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Construction Type / Τύπος Κατασκευής</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars('Light Steel'), styles['NormalBilingual'])])
-        building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Steel Structure Details / Λεπτομέρειες Χαλύβδινης Κατασκευής</b>'), styles['NormalBilingual']), Paragraph(LIGHT_STEEL_BUILDING_STRUCTURE_EN_GR, styles['NormalBilingual'])])
+        building_structure_table_data.append([Paragraph('<b>Construction Type / Τύπος Κατασκευής</b>', styles['NormalBilingual']), Paragraph('Light Steel', styles['NormalBilingual'])])
+        building_structure_table_data.append([Paragraph('<b>Steel Structure Details / Λεπτομέρειες Χαλύβδινης Κατασκευής</b>', styles['NormalBilingual']), Paragraph(LIGHT_STEEL_BUILDING_STRUCTURE_EN_GR, styles['NormalBilingual'])])
         # İç duvar ve dış duvar özellikleri, eğer seçildiyse Yapı Malzemeleri altına eklendi
         if project_details['plasterboard_interior'] or project_details['plasterboard_all']: # Koşullu ekleme
-            building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Interior Walls / Εσωτερικοί Τοίχοι</b>'), styles['NormalBilingual']), Paragraph(INTERIOR_WALLS_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
-        building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Roof / Στέγη</b>'), styles['NormalBilingual']), Paragraph(ROOF_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
+            building_structure_table_data.append([Paragraph('<b>Interior Walls / Εσωτερικοί Τοίχοι</b>', styles['NormalBilingual']), Paragraph(INTERIOR_WALLS_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
+        building_structure_table_data.append([Paragraph('<b>Roof / Στέγη</b>', styles['NormalBilingual']), Paragraph(ROOF_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
         if project_details['facade_sandwich_panel_included']:
-            building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Exterior Walls / Εξωτερικοί Τοίχοι</b>'), styles['NormalBilingual']), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
+            building_structure_table_data.append([Paragraph('<b>Exterior Walls / Εξωτερικοί Τοίχοι</b>', styles['NormalBilingual']), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
     else: # Heavy Steel
-        building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Construction Type / Τύπος Κατασκευής</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars('Heavy Steel'), styles['NormalBilingual'])])
-        building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Steel Structure Details / Λεπτομέρειες Χαλύβδινης Κατασκευής</b>'), styles['NormalBilingual']), Paragraph(HEAVY_STEEL_BUILDING_STRUCTURE_EN_GR, styles['NormalBilingual'])])
-        building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Roof / Στέγη</b>'), styles['NormalBilingual']), Paragraph(ROOF_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
+        building_structure_table_data.append([Paragraph('<b>Construction Type / Τύπος Κατασκευής</b>', styles['NormalBilingual']), Paragraph('Heavy Steel', styles['NormalBilingual'])])
+        building_structure_table_data.append([Paragraph('<b>Steel Structure Details / Λεπτομέρειες Χαλύβδινης Κατασκευής</b>', styles['NormalBilingual']), Paragraph(HEAVY_STEEL_BUILDING_STRUCTURE_EN_GR, styles['NormalBilingual'])])
+        building_structure_table_data.append([Paragraph('<b>Roof / Στέγη</b>', styles['NormalBilingual']), Paragraph(ROOF_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
         if project_details['facade_sandwich_panel_included']:
-            building_structure_table_data.append([Paragraph(clean_invisible_chars('<b>Exterior Walls / Εξωτερικοί Τοίχοι</b>'), styles['NormalBilingual']), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
+            building_structure_table_data.append([Paragraph('<b>Exterior Walls / Εξωτερικοί Τοίχοι</b>', styles['NormalBilingual']), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, styles['NormalBilingual'])])
     
     building_materials_table = Table(building_structure_table_data, colWidths=[60*mm, 110*mm])
     building_materials_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1112,8 +1341,8 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 
     # İç Mekan ve Yalıtım (Interior and Insulation)
     interior_insulation_table_data = [
-        [Paragraph(clean_invisible_chars('<b>Interior / Εσωτερικό</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"Floor Covering: {project_details['floor_covering_type']}."), styles['NormalBilingual'])],
-        [Paragraph(clean_invisible_chars('<b>Insulation / Μόνωση</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"Floor Insulation: {get_yes_no_empty(project_details['insulation_floor'])}. Wall Insulation: {get_yes_no_empty(project_details['insulation_wall'])}."), styles['NormalBilingual'])],
+        [Paragraph('<b>Interior / Εσωτερικό</b>', styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"Floor Covering: {project_details['floor_covering_type']}."), styles['NormalBilingual'])],
+        [Paragraph('<b>Insulation / Μόνωση</b>', styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"Floor Insulation: {get_yes_no_empty(project_details['insulation_floor'])}. Wall Insulation: {get_yes_no_empty(project_details['insulation_wall'])}."), styles['NormalBilingual'])],
     ]
     # Zemin yalıtım malzemeleri listesi doğrudan yalıtım bölümünün altına (TEKLİFTE BURAYA TAŞINDI)
     if project_details['insulation_floor']:
@@ -1128,10 +1357,10 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
             floor_insulation_details_display_en_gr_text.append(clean_invisible_chars(f"• OSB2 18mm or Concrete Panel 18mm / OSB2 18mm ή Πάνελ Σκυροδέματος 18mm ({project_details['osb2_18mm_count_val']} pcs)"))
         if project_details['galvanized_sheet_m2_val'] > 0:
             floor_insulation_details_display_en_gr_text.append(clean_invisible_chars(f"• 5mm Galvanized Sheet / 5mm Γαλβανισμένο Φύλλο ({project_details['galvanized_sheet_m2_val']:.2f} m²)"))
-        floor_insulation_details_display_en_gr_text.append(clean_invisible_chars("<i>Note: Insulation thickness can be increased. Ceramic coating can be preferred. (without concrete, special floor system)</i>"))
+        floor_insulation_details_display_en_gr_text.append("<i>Note: Insulation thickness can be increased. Ceramic coating can be preferred. (without concrete, special floor system)</i>")
         
         # Malzeme listesi Paragraph olarak eklendi
-        interior_insulation_table_data.append([Paragraph(clean_invisible_chars('<b>Floor Insulation Materials / Υλικά Μόνωσης Δαπέδου:</b>'), styles['NormalBilingual']), Paragraph("<br/>".join(floor_insulation_details_display_en_gr_text), styles['NormalBilingual'])])
+        interior_insulation_table_data.append([Paragraph('<b>Floor Insulation Materials / Υλικά Μόνωσης Δαπέδου:</b>', styles['NormalBilingual']), Paragraph("<br/>".join(floor_insulation_details_display_en_gr_text), styles['NormalBilingual'])])
 
 
     interior_insulation_table = Table(interior_insulation_table_data, colWidths=[60*mm, 110*mm])
@@ -1141,7 +1370,7 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 
     # Doğramalar (Openings)
     openings_table_data = [
-        [Paragraph(clean_invisible_chars('<b>Openings / Ανοίγματα</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"Windows: {project_details['window_count']} ({project_details['window_size_val']} - {project_details['window_door_color_val']})<br/>Doors: {project_details['door_count']} ({project_details['door_size_val']} - {project_details['window_door_color_val']})<br/>Sliding Doors: {project_details['sliding_door_count']} ({project_details['sliding_door_size_val']} - {project_details['window_door_color_val']})<br/>WC Windows: {project_details['wc_window_count']} ({project_details['wc_window_size_val']} - {project_details['window_door_color_val']}){'' if project_details['wc_sliding_door_count'] == 0 else '<br/>WC Sliding Doors: ' + str(project_details['wc_sliding_door_count']) + ' (' + project_details['wc_sliding_door_size_val'] + ' - ' + project_details['window_door_color_val'] + ')'}<br/>Doors: {project_details['door_count']} ({project_details['door_size_val']})"), styles['NormalBilingual'])],
+        [Paragraph('<b>Openings / Ανοίγματα</b>', styles['NormalBilingual']), Paragraph(clean_invisible_chars(f"Windows: {project_details['window_count']} ({project_details['window_size_val']} - {project_details['window_door_color_val']})<br/>Doors: {project_details['door_count']} ({project_details['door_size_val']} - {project_details['window_door_color_val']})<br/>Sliding Doors: {project_details['sliding_door_count']} ({project_details['sliding_door_size_val']} - {project_details['window_door_color_val']})<br/>WC Windows: {project_details['wc_window_count']} ({project_details['wc_window_size_val']} - {project_details['window_door_color_val']}){'' if project_details['wc_sliding_door_count'] == 0 else '<br/>WC Sliding Doors: ' + str(project_details['wc_sliding_door_count']) + ' (' + project_details['wc_sliding_door_size_val'] + ' - ' + project_details['window_door_color_val'] + ')'}<br/>Doors: {project_details['door_count']} ({project_details['door_size_val']})"), styles['NormalBilingual'])],
     ]
     openings_table = Table(openings_table_data, colWidths=[60*mm, 110*mm])
     openings_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1155,27 +1384,27 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 # ==============================================================================
 
     # Diğer Teknik Özellikler (Mutfak, Duş/WC, Elektrik, Sıhhi Tesisat, Ekstra Genel İlaveler)
-    elements.append(Paragraph(clean_invisible_chars("ADDITIONAL TECHNICAL FEATURES / ΠΡΟΣΘΕΤΑ ΤΕΧΝΙΚΑ ΧΑΡΑΚΤΗΡΙΣΤΙΚΑ"), styles['Heading'])) # Yeni başlık
+    elements.append(Paragraph("ADDITIONAL TECHNICAL FEATURES / ΠΡΟΣΘΕΤΑ ΤΕΧΝΙΚΑ ΧΑΡΑΚΤΗΡΙΣΤΙΚΑ", styles['Heading'])) # Yeni başlık
 
     other_features_table_data = [
-        [Paragraph(clean_invisible_chars('<b>Kitchen / Κουζίνα</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars(project_details['kitchen_type_display_en_gr']), styles['NormalBilingual'])],
+        [Paragraph(f"<b>{bilingual('kitchen_label')}</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(project_details['kitchen_type_display_en_gr']), styles['NormalBilingual'])],
     ]
     if project_details['kitchen_choice'] != 'No Kitchen': # check if kitchen was actually included in calculation
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Kitchen Materials / Υλικά Κουζίνας</b>'), styles['NormalBilingual']), Paragraph(KITCHEN_MATERIALS_EN, styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph(f"<b>{bilingual('kitchen_materials_label')}</b>", styles['NormalBilingual']), Paragraph(KITCHEN_MATERIALS_EN_GR, styles['NormalBilingual'])])
 
-    other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Shower/WC / Ντους/WC</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars(get_yes_no_empty(project_details['shower_wc'])), styles['NormalBilingual'])])
+    other_features_table_data.append([Paragraph(f"<b>{bilingual('shower_wc_label')}</b>", styles['NormalBilingual']), Paragraph(clean_invisible_chars(get_yes_no_empty(project_details['shower_wc'])), styles['NormalBilingual'])])
     if project_details['shower_wc']:
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Shower/WC Materials / Υλικά Ντους/WC</b>'), styles['NormalBilingual']), Paragraph(SHOWER_WC_MATERIALS_EN, styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph(f"<b>{bilingual('shower_wc_materials_label')}</b>", styles['NormalBilingual']), Paragraph(SHOWER_WC_MATERIALS_EN_GR, styles['NormalBilingual'])])
 
     if project_details['electrical']:
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Electrical / Ηλεκτρολογικά</b>'), styles['NormalBilingual']), Paragraph(ELECTRICAL_MATERIALS_EN.strip(), styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph(f"<b>{bilingual('electrical_label')}</b>", styles['NormalBilingual']), Paragraph(ELECTRICAL_MATERIALS_EN_GR, styles['NormalBilingual'])])
     else:
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Electrical / Ηλεκτρολογικά</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars('No / Όχι'), styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph(f"<b>{bilingual('electrical_label')}</b>", styles['NormalBilingual']), Paragraph(bilingual('no'), styles['NormalBilingual'])])
 
     if project_details['plumbing']:
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Plumbing / Υδραυλικά</b>'), styles['NormalBilingual']), Paragraph(PLUMBING_MATERIALS_EN.strip(), styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph(f"<b>{bilingual('plumbing_label')}</b>", styles['NormalBilingual']), Paragraph(PLUMBING_MATERIALS_EN_GR, styles['NormalBilingual'])])
     else:
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Plumbing / Υδραυλικά</b>'), styles['NormalBilingual']), Paragraph(clean_invisible_chars('No / Όχι'), styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph(f"<b>{bilingual('plumbing_label')}</b>", styles['NormalBilingual']), Paragraph(bilingual('no'), styles['NormalBilingual'])])
 
     # Ekstra Genel İlaveler (koşullu olarak ayrı tabloya)
     extra_general_additions_list_en_gr = []
@@ -1222,7 +1451,7 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 
 
     if extra_general_additions_list_en_gr:
-        other_features_table_data.append([Paragraph(clean_invisible_chars('<b>Extra General Additions / Έξτρα Γενικές Προσθήκες</b>'), styles['NormalBilingual']), Paragraph("<br/>".join(extra_general_additions_list_en_gr), styles['NormalBilingual'])])
+        other_features_table_data.append([Paragraph('<b>Extra General Additions / Έξτρα Γενικές Προσθήκες</b>', styles['NormalBilingual']), Paragraph("<br/>".join(extra_general_additions_list_en_gr), styles['NormalBilingual'])])
 
     other_features_table = Table(other_features_table_data, colWidths=[60*mm, 110*mm])
     other_features_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1232,33 +1461,33 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 # BÖLÜM 4.6: create_customer_proposal_pdf - İngilizce/Yunanca Teslimat, Notlar, Fiyat ve Ödeme Planı (Başlangıç)
 # ==============================================================================
 
-    elements.append(Paragraph(clean_invisible_chars('<b>Estimated Delivery / Εκτιμώμενη Παράδοση</b>'), styles['NormalBilingual']))
+    elements.append(Paragraph('<b>Estimated Delivery / Εκτιμώμενη Παράδοση</b>', styles['NormalBilingual']))
     elements.append(Paragraph(clean_invisible_chars(f"Approx. {project_details['delivery_duration_business_days']} business days / Περίπου {project_details['delivery_duration_business_days']} εργάσιμες ημέρες"), styles['NormalBilingual']))
     elements.append(Spacer(1, 8*mm))
 
     if notes.strip():
-        elements.append(Paragraph(clean_invisible_chars("CUSTOMER NOTES / ΣΗΜΕΙΩΣΕΙΣ ΠΕΛΑΤΗ"), styles['Heading']))
-        elements.append(Paragraph(clean_invisible_chars(notes), styles['NormalBilingual']))
+        elements.append(Paragraph("CUSTOMER NOTES / ΣΗΜΕΙΩΣΕΙΣ ΠΕΛΑΤΗ", styles['Heading']))
+        elements.append(Paragraph(notes, styles['NormalBilingual']))
         elements.append(Spacer(1, 8*mm))
 
     # --- Fiyat ve Ödeme Planı Bölümü ---
     elements.append(PageBreak())
     final_page_elements = [Spacer(1, 12*mm)]
 
-    final_page_elements.append(Paragraph(clean_invisible_chars("PRICE & PAYMENT SCHEDULE / ΤΙΜΗ & ΠΡΟΓΡΑΜΜΑ ΠΛΗΡΩΜΩΝ"), styles['Heading']))
+    final_page_elements.append(Paragraph("PRICE & PAYMENT SCHEDULE / ΤΙΜΗ & ΠΡΟΓΡΑΜΜΑ ΠΛΗΡΩΜΩΝ", styles['Heading']))
     
     price_table_data = []
     price_table_data.append([
-        Paragraph(clean_invisible_chars("Main House Price / Τιμή Κυρίως Σπιτιού"), colored_table_header_style),
+        Paragraph("Main House Price / Τιμή Κυρίως Σπιτιού", colored_table_header_style),
         Paragraph(format_currency(house_price), colored_table_header_style)
     ])
     if solar_price > 0:
         price_table_data.append([
-            Paragraph(clean_invisible_chars("Solar System Price / Τιμή Ηλιακού Συστήματος"), colored_table_header_style),
+            Paragraph("Solar System Price / Τιμή Ηλιακού Συστήματος", colored_table_header_style),
             Paragraph(format_currency(solar_price), colored_table_header_style)
         ])
     price_table_data.append([
-        Paragraph(clean_invisible_chars("TOTAL PRICE / ΣΥΝΟΛΙΚΗ ΤΙΜΗ"), colored_table_header_style),
+        Paragraph("TOTAL PRICE / ΣΥΝΟΛΙΚΗ ΤΙΜΗ", colored_table_header_style),
         Paragraph(format_currency(total_price), colored_table_header_style)
     ])
 
@@ -1278,8 +1507,8 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
     final_page_elements.append(Spacer(1, 8*mm))
 
     # KDV Dahildir notu ve garanti açıklaması
-    final_page_elements.append(Paragraph(clean_invisible_chars("All prices are VAT included / Όλες οι τιμές περιλαμβάνουν ΦΠΑ."), payment_heading_style))
-    final_page_elements.append(Paragraph(clean_invisible_chars("Our prefabricated living spaces have a 3-year warranty. Hot and cold balance is provided with polyurethane panels, fire class is A quality and energy consumption is A+++. / Οι προκατασκευασμένοι χώροι διαβίωσης μας έχουν 3ετή εγγύηση. Η ισορροπία ζεστού και κρύου επιτυγχάνεται με πάνελ πολυουρεθάνης, η κλάση πυρός είναι Α ποιότητας και η κατανάλωση ενέργειας είναι Α+++."), styles['NormalBilingual']))
+    final_page_elements.append(Paragraph("All prices are VAT included / Όλες οι τιμές περιλαμβάνουν ΦΠΑ.", payment_heading_style))
+    final_page_elements.append(Paragraph("Our prefabricated living spaces have a 3-year warranty. Hot and cold balance is provided with polyurethane panels, fire class is A quality and energy consumption is A+++. / Οι προκατασκευασμένοι χώροι διαβίωσης μας έχουν 3ετή εγγύηση. Η ισορροπία ζεστού και κρύου επιτυγχάνεται με πάνελ πολυουρεθάνης, η κλάση πυρός είναι Α ποιότητας και η κατανάλωση ενέργειας είναι Α+++.", styles['NormalBilingual']))
     
     final_page_elements.append(Spacer(1, 8*mm))
     final_page_elements.append(Paragraph(clean_invisible_chars(f"<b>Estimated Delivery / Εκτιμώμενη Παράδοση:</b> Approx. {project_details['delivery_duration_business_days']} business days / Περίπου {project_details['delivery_duration_business_days']} εργάσιμες ημέρες"), payment_heading_style))
@@ -1288,26 +1517,26 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
 # BÖLÜM 4.7: create_customer_proposal_pdf - İngilizce/Yunanca Ödeme Planı Detayları ve Eklerin Çağrılması + PDF Kapanışı
 # ==============================================================================
 
-    final_page_elements.append(Paragraph(clean_invisible_chars("Main House Payment Plan / Πρόγραμμα Πληρωμών Κυρίως Σπιτιού"), payment_heading_style))
+    final_page_elements.append(Paragraph("Main House Payment Plan / Πρόγραμμα Πληρωμών Κυρίως Σπιτιού", payment_heading_style))
 
     down_payment = house_price * 0.40
     remaining_balance = house_price - down_payment
     installment_amount = remaining_balance / 3
 
     payment_data = [
-        [Paragraph(clean_invisible_chars("1. Down Payment / Προκαταβολή (40%)"), payment_heading_style), Paragraph(format_currency(down_payment), payment_heading_style)],
-        [Paragraph(clean_invisible_chars("   - Due upon contract signing / Με την υπογραφή της σύμβασης."), styles['NormalBilingual']), ""],
-        [Paragraph(clean_invisible_chars("2. 1st Installment / 1η Δόση"), payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
-        [Paragraph(clean_invisible_chars("   - Due upon completion of structure / Με την ολοκλήρωση της κατασκευής."), styles['NormalBilingual']), ""],
-        [Paragraph(clean_invisible_chars("3. 2nd Installment / 2η Δόση"), payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
-        [Paragraph(clean_invisible_chars("   - Due upon completion of interior works / Με την ολοκλήρωση των εσωτερικών εργασιών."), styles['NormalBilingual']), ""],
-        [Paragraph(clean_invisible_chars("4. Final Payment / Τελική Εξόφληση"), payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
-        [Paragraph(clean_invisible_chars("   - Due upon final delivery / Με την τελική παράδοση."), styles['NormalBilingual']), ""],
+        [Paragraph("1. Down Payment / Προκαταβολή (40%)", payment_heading_style), Paragraph(format_currency(down_payment), payment_heading_style)],
+        [Paragraph("- Due upon contract signing / Με την υπογραφή της σύμβασης.", styles['NormalBilingual']), ""],
+        [Paragraph("2. 1st Installment / 1η Δόση", payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
+        [Paragraph("- Due upon completion of structure / Με την ολοκλήρωση της κατασκευής.", styles['NormalBilingual']), ""],
+        [Paragraph("3. 2nd Installment / 2η Δόση", payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
+        [Paragraph("- Due upon completion of interior works / Με την ολοκλήρωση των εσωτερικών εργασιών.", styles['NormalBilingual']), ""],
+        [Paragraph("4. Final Payment / Τελική Εξόφληση", payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
+        [Paragraph("- Due upon final delivery / Με την τελική παράδοση.", styles['NormalBilingual']), ""],
     ]
 
     if solar_price > 0:
-        payment_data.append([Paragraph(clean_invisible_chars("Solar System / Ηλιακό Σύστημα"), payment_heading_style), Paragraph(format_currency(solar_price), payment_heading_style)])
-        payment_data.append([Paragraph(clean_invisible_chars("   - Due upon contract signing / Με την υπογραφή της σύμβασης."), styles['NormalBilingual']), ""])
+        payment_data.append([Paragraph("Solar System / Ηλιακό Σύστημα", payment_heading_style), Paragraph(format_currency(solar_price), payment_heading_style)])
+        payment_data.append([Paragraph("- Due upon contract signing / Με την υπογραφή της σύμβασης.", styles['NormalBilingual']), ""])
 
     payment_table = Table(payment_data, colWidths=[120*mm, 50*mm])
     payment_table.setStyle(TableStyle([('ALIGN', (0,0), (-1,-1), 'LEFT'), ('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1324,18 +1553,20 @@ def create_customer_proposal_pdf(house_price, solar_price, total_price, project_
         heating_elements = _create_heating_appendix_elements_en_gr(styles)
         elements.extend(heating_elements)
 
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer.getvalue()
+    stage_timing.lap('flowables')
+    with stage_timing.span('doc_build'):
+        doc.build(elements)
+    return pdf_sink_bytes(sink)
     # ==============================================================================
 # BÖLÜM 4.8: create_customer_proposal_pdf_tr - Fonksiyon Tanımı, Doküman Ayarları ve Kapak Sayfası (Türkçe Teklif)
 # ==============================================================================
 
-def create_customer_proposal_pdf_tr(house_price, solar_price, total_price, project_details, notes, customer_info):
+def create_customer_proposal_pdf_tr(house_price, solar_price, total_price, project_details, notes, customer_info, logo_data_b64=None):
     """Müşteri için profesyonel bir teklif PDF'i oluşturur (Türkçe)."""
-    buffer = io.BytesIO()
+    load_pdf_support()
+    sink = new_pdf_sink()
     doc = SimpleDocTemplate(
-        buffer,
+        sink,
         pagesize=A4,
         rightMargin=15*mm,
         leftMargin=15*mm,
@@ -1346,89 +1577,26 @@ def create_customer_proposal_pdf_tr(house_price, solar_price, total_price, proje
     doc.customer_name = customer_info['name']
     doc.company_name = COMPANY_INFO['name']
     # Logo verisini doc objesine ekle
-    doc.logo_data_b64 = st.session_state.get('logo_data_b64_global', None) 
+    doc.logo_data_b64 = logo_data_b64
+    doc.logo = get_logo_resource(doc.logo_data_b64) # Çözülmüş logo süreç genelinde paylaşılır
 
     # Custom header/footer for proposals (Türkçe)
     def _proposal_page_callback_tr(canvas_obj, doc):
-        canvas_obj.saveState()
-        canvas_obj.setFont(MAIN_FONT, 7)
-
-        # Header - Sol üstte logo ve Sağ üstte şirket bilgileri
-        if doc.logo_data_b64:
-            try:
-                img_data = base64.b64decode(doc.logo_data_b64)
-                img = PILImage.open(io.BytesIO(img_data)) # PIL Image objesi olarak aç
-                aspect_ratio = img.width / img.height
-                logo_width_mm = 40 * mm  # Örnek genişlik
-                logo_height_mm = logo_width_mm / aspect_ratio
-                # drawImage fonksiyonu PIL Image objesi veya dosya yolu kabul eder
-                canvas_obj.drawImage(Image(io.BytesIO(img_data)), doc.leftMargin, A4[1] - logo_height_mm - 10 * mm, width=logo_width_mm, height=logo_height_mm, mask='auto')
-            except Exception as e:
-                # Logo çizilemezse hata vermeden devam et
-                pass
-
-        # Şirket Bilgileri (Sağ üst)
-        canvas_obj.setFont(MAIN_FONT, 8)
-        canvas_obj.setFillColor(colors.HexColor('#2C3E50'))
-        # Her satırı sağa hizalamak için tek tek drawString kullanmak daha iyi olabilir
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['name']), MAIN_FONT, 8), A4[1] - 25 * mm, clean_invisible_chars(COMPANY_INFO['name']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['address']), MAIN_FONT, 8), A4[1] - 30 * mm, clean_invisible_chars(COMPANY_INFO['address']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"), MAIN_FONT, 8), A4[1] - 35 * mm, clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 40 * mm, clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin, A4[1] - 45 * mm, clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"))
-
-
-        # Footer
-        canvas_obj.line(doc.leftMargin, 20 * mm, A4[0] - doc.rightMargin, 20 * mm) # Footer çizgisi
-        canvas_obj.setFont(MAIN_FONT, 7)
-        canvas_obj.drawString(doc.leftMargin, 15 * mm, clean_invisible_chars(f"{COMPANY_INFO['name']} - {COMPANY_INFO['website']}"))
-        canvas_obj.drawRightString(A4[0] - doc.rightMargin, 15 * mm, clean_invisible_chars(f"Page {doc.page}")) # Sayfa numarası
-        canvas_obj.restoreState()
+        draw_page_header_footer(canvas_obj, doc)
 
     doc.onFirstPage = _proposal_page_callback_tr
     doc.onLaterPages = _proposal_page_callback_tr
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(
-        name='NormalTR', parent=styles['Normal'], fontSize=8, leading=10,
-        spaceAfter=2, fontName=MAIN_FONT
-    ))
-    styles.add(ParagraphStyle(
-        name='Heading', parent=styles['Heading2'], fontSize=11, spaceAfter=5, spaceBefore=10,
-        fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce"), alignment=TA_LEFT
-    ))
-    styles.add(ParagraphStyle(
-        name='PriceTotal', parent=styles['Heading1'], fontSize=21, alignment=TA_CENTER,
-        spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#c53030")
-    ))
-    styles.add(ParagraphStyle(
-        name='SectionSubheading', parent=styles['Heading3'], fontSize=9, spaceAfter=3, spaceBefore=7,
-        fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#4a5568")
-    ))
-
-    title_style = ParagraphStyle(
-        name='Title', parent=styles['Heading1'], fontSize=17, alignment=TA_CENTER,
-        spaceAfter=10, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce")
-    )
-    subtitle_style = ParagraphStyle(
-        name='Subtitle', parent=styles['Normal'], fontSize=10, alignment=TA_CENTER,
-        spaceAfter=7, fontName=MAIN_FONT, textColor=colors.HexColor("#4a5568")
-    )
-    
-    payment_heading_style = ParagraphStyle(
-        name='PaymentHeading', parent=styles['Heading3'], fontSize=9, spaceAfter=3,
-        spaceBefore=7, fontName=f"{MAIN_FONT}-Bold"
-    )
-
-    colored_table_header_style_tr = ParagraphStyle(
-        name='ColoredTableHeaderTR', parent=styles['Normal'], fontSize=8, fontName=f"{MAIN_FONT}-Bold",
-        textColor=colors.white, alignment=TA_LEFT
-    )
+    styles = get_pdf_styles('tr')
+    title_style = styles['Title']
+    subtitle_style = styles['Subtitle']
+    payment_heading_style = styles['PaymentHeading']
+    colored_table_header_style_tr = styles['ColoredTableHeaderTR']
 
     elements = []
     # --- Kapak Sayfası ---
     elements.append(Spacer(1, 40*mm))
-    elements.append(Paragraph(clean_invisible_chars("PREFABRİK EV TEKLİFİ"), title_style))
+    elements.append(Paragraph("PREFABRİK EV TEKLİFİ", title_style))
     elements.append(Spacer(1, 20*mm))
     elements.append(Paragraph(clean_invisible_chars(f"Müşteri: {customer_info['name']}"), subtitle_style))
     if customer_info['company']:
@@ -1438,7 +1606,7 @@ def create_customer_proposal_pdf_tr(house_price, solar_price, total_price, proje
     elements.append(PageBreak())
 
     # --- Müşteri & Proje Bilgileri Bölümü ---
-    elements.append(Paragraph(clean_invisible_chars("MÜŞTERİ VE PROJE BİLGİLERİ"), styles['Heading']))
+    elements.append(Paragraph("MÜŞTERİ VE PROJE BİLGİLERİ", styles['Heading']))
 
     # Oda Konfigürasyonu ve Boyut Bilgileri (Müşteri Bilgileri tablosu üstünde)
     elements.append(Paragraph(clean_invisible_chars(f"<b>Oda Konfigürasyonu:</b> {project_details['room_configuration']}"), styles['NormalTR']))
@@ -1446,99 +1614,290 @@ def create_customer_proposal_pdf_tr(house_price, solar_price, total_price, proje
     elements.append(Spacer(1, 8*mm))
 
     customer_project_table_data_tr = [
-        [Paragraph(clean_invisible_chars("<b>Adı Soyadı:</b>"), styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['name']}"), styles['NormalTR'])],
-        [Paragraph(clean_invisible_chars("<b>Firma:</b>"), styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['company'] or ''}"), styles['NormalTR'])],
-        [Paragraph(clean_invisible_chars("<b>Adres:</b>"), styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['address'] or ''}"), styles['NormalTR'])],
-        [Paragraph(clean_invisible_chars("<b>Telefon:</b>"), styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['phone'] or ''}"), styles['NormalTR'])],
-        [Paragraph(clean_invisible_chars("<b>Kimlik/Pasaport No:</b>"), styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['id_no'] or ''}"), styles['NormalTR'])],
+        [Paragraph("<b>Adı Soyadı:</b>", styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['name']}"), styles['NormalTR'])],
+        [Paragraph("<b>Firma:</b>", styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['company'] or ''}"), styles['NormalTR'])],
+        [Paragraph("<b>Adres:</b>", styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['address'] or ''}"), styles['NormalTR'])],
+        [Paragraph("<b>Telefon:</b>", styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['phone'] or ''}"), styles['NormalTR'])],
+        [Paragraph("<b>Kimlik/Pasaport No:</b>", styles['NormalTR']), Paragraph(clean_invisible_chars(f"{customer_info['id_no'] or ''}"), styles['NormalTR'])],
     ]
     customer_project_table_tr = Table(customer_project_table_data_tr, colWidths=[65*mm, 105*mm])
     customer_project_table_tr.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
     elements.append(customer_project_table_tr)
     elements.append(Spacer(1, 8*mm))
     # ==============================================================================
-# BÖLÜM 5: Satış Sözleşmesi ve Dahili Rapor PDF Fonksiyonları
+# BÖLÜM 4.9: create_customer_proposal_pdf_tr - Türkçe Teklif Teknik Özellikler, Ek Özellikler, Fiyat ve Ödeme Planı + PDF Kapanışı
 # ==============================================================================
 
-def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_price, project_details, company_info):
-    """Sağlanan şablon ve proje detaylarına göre bir satış sözleşmesi PDF'i oluşturur."""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=15*mm,
-        leftMargin=15*mm,
-        topMargin=40*mm, # Header için artırılmış margin
-        bottomMargin=25*mm
-    )
-    doc.customer_name = customer_info['name']
-    doc.company_name = COMPANY_INFO['name']
-    doc.logo_data_b64 = st.session_state.get('logo_data_b64_global', None)
-
-    # Header ve Footer fonksiyonları, logo verisiyle birlikte onFirstPage/onLaterPages'e geçirilecek
-    def _contract_header_footer_for_contract(canvas_obj, doc):
-        canvas_obj.saveState()
-        canvas_obj.setFont(MAIN_FONT, 7)
+    # --- Teknik Özellikler Bölümü ---
+    elements.append(Paragraph("TEKNİK ÖZELLİKLER", styles['Heading']))
 
-        # Header - Sol üstte logo ve Sağ üstte şirket bilgileri
-        if doc.logo_data_b64:
-            try:
-                img_data = base64.b64decode(doc.logo_data_b64)
-                img = PILImage.open(io.BytesIO(img_data)) # PIL Image objesi olarak aç
-                aspect_ratio = img.width / img.height
-                logo_width_mm = 40 * mm  # Örnek genişlik
-                logo_height_mm = logo_width_mm / aspect_ratio
-                canvas_obj.drawImage(Image(io.BytesIO(img_data)), doc.leftMargin, A4[1] - logo_height_mm - 10 * mm, width=logo_width_mm, height=logo_height_mm, mask='auto')
-            except Exception as e:
-                # Logo çizilemezse hata vermeden devam et
-                pass
-
-        # Şirket Bilgileri (Sağ üst)
-        canvas_obj.setFont(MAIN_FONT, 8)
-        canvas_obj.setFillColor(colors.HexColor('#2C3E50'))
-        # Her satırı sağa hizalamak için tek tek drawString kullanmak daha iyi olabilir
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['name']), MAIN_FONT, 8), A4[1] - 25 * mm, clean_invisible_chars(COMPANY_INFO['name']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(COMPANY_INFO['address']), MAIN_FONT, 8), A4[1] - 30 * mm, clean_invisible_chars(COMPANY_INFO['address']))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"), MAIN_FONT, 8), A4[1] - 35 * mm, clean_invisible_chars(f"Email: {COMPANY_INFO['email']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"), MAIN_FONT, 8), A4[1] - 40 * mm, clean_invisible_chars(f"Phone: {COMPANY_INFO['phone']}"))
-        canvas_obj.drawString(A4[0] - doc.rightMargin - canvas_obj.stringWidth(clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"), MAIN_FONT, 8), A4[1] - 45 * mm, clean_invisible_chars(f"Website: {COMPANY_INFO['website']}"))
-
-        # Footer
-        canvas_obj.line(doc.leftMargin, 20 * mm, A4[0] - doc.rightMargin, 20 * mm) # Footer çizgisi
-        canvas_obj.setFont(MAIN_FONT, 7)
-        canvas_obj.drawString(doc.leftMargin, 15 * mm, clean_invisible_chars(f"{COMPANY_INFO['name']} - {COMPANY_INFO['website']}"))
-        canvas_obj.drawRightString(A4[0] - doc.rightMargin, 15 * mm, clean_invisible_chars(f"Page {doc.page}")) # Sayfa numarası
-        canvas_obj.restoreState()
+    # Yapı ve Malzemeler
+    building_structure_table_data_tr = []
+    if project_details['structure_type'] == 'Light Steel':
+        building_structure_table_data_tr.append([Paragraph('<b>Yapı Tipi</b>', styles['NormalTR']), Paragraph('Hafif Çelik', styles['NormalTR'])])
+        building_structure_table_data_tr.append([Paragraph('<b>Çelik Yapı Detayları</b>', styles['NormalTR']), Paragraph(LIGHT_STEEL_BUILDING_STRUCTURE_TR, styles['NormalTR'])])
+        if project_details['plasterboard_interior'] or project_details['plasterboard_all']: # Koşullu ekleme
+            building_structure_table_data_tr.append([Paragraph('<b>İç Duvarlar</b>', styles['NormalTR']), Paragraph(INTERIOR_WALLS_DESCRIPTION_TR, styles['NormalTR'])])
+        building_structure_table_data_tr.append([Paragraph('<b>Çatı</b>', styles['NormalTR']), Paragraph(ROOF_DESCRIPTION_TR, styles['NormalTR'])])
+        if project_details['facade_sandwich_panel_included']:
+            building_structure_table_data_tr.append([Paragraph('<b>Dış Duvarlar</b>', styles['NormalTR']), Paragraph(EXTERIOR_WALLS_DESCRIPTION_TR, styles['NormalTR'])])
+    else: # Heavy Steel
+        building_structure_table_data_tr.append([Paragraph('<b>Yapı Tipi</b>', styles['NormalTR']), Paragraph('Ağır Çelik', styles['NormalTR'])])
+        building_structure_table_data_tr.append([Paragraph('<b>Çelik Yapı Detayları</b>', styles['NormalTR']), Paragraph(HEAVY_STEEL_BUILDING_STRUCTURE_TR, styles['NormalTR'])])
+        building_structure_table_data_tr.append([Paragraph('<b>Çatı</b>', styles['NormalTR']), Paragraph(ROOF_DESCRIPTION_TR, styles['NormalTR'])])
+        if project_details['facade_sandwich_panel_included']:
+            building_structure_table_data_tr.append([Paragraph('<b>Dış Duvarlar</b>', styles['NormalTR']), Paragraph(EXTERIOR_WALLS_DESCRIPTION_TR, styles['NormalTR'])])
 
-    doc.onFirstPage = _contract_header_footer_for_contract
-    doc.onLaterPages = _contract_header_footer_for_contract
+    building_materials_table_tr = Table(building_structure_table_data_tr, colWidths=[60*mm, 110*mm])
+    building_materials_table_tr.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
+    elements.append(building_materials_table_tr)
+    elements.append(Spacer(1, 5*mm))
 
-    styles = getSampleStyleSheet()
-    contract_heading_style = ParagraphStyle(
-        name='ContractHeading', parent=styles['Heading2'], fontSize=13, spaceAfter=8,
-        spaceBefore=12, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#3182ce"), alignment=TA_CENTER
-    )
-    contract_subheading_style = ParagraphStyle(
-        name='ContractSubheading', parent=styles['Heading3'], fontSize=10, spaceAfter=5,
-        spaceBefore=8, fontName=f"{MAIN_FONT}-Bold", textColor=colors.HexColor("#4a5568")
-    )
-    contract_normal_style = ParagraphStyle(
-        name='ContractNormal', parent=styles['Normal'], fontSize=8, leading=10,
-        spaceAfter=4, fontName=MAIN_FONT, alignment=TA_LEFT
-    )
-    contract_list_style = ParagraphStyle(
-        name='ContractList', parent=styles['Normal'], fontSize=8, leading=10,
-        spaceAfter=2, leftIndent=8*mm, fontName=MAIN_FONT
-    )
-    contract_signature_style = ParagraphStyle(
-        name='ContractSignature', parent=styles['Normal'], fontSize=8, leading=10,
-        alignment=TA_CENTER
+    # İç Mekan ve Yalıtım
+    interior_insulation_table_data_tr = [
+        [Paragraph('<b>İç Mekan</b>', styles['NormalTR']), Paragraph(clean_invisible_chars(f"Zemin Kaplaması: {project_details['floor_covering_type']}."), styles['NormalTR'])],
+        [Paragraph('<b>Yalıtım</b>', styles['NormalTR']), Paragraph(clean_invisible_chars(f"Zemin Yalıtımı: {get_yes_no_empty_tr(project_details['insulation_floor'])}. Duvar Yalıtımı: {get_yes_no_empty_tr(project_details['insulation_wall'])}."), styles['NormalTR'])],
+    ]
+    # Zemin yalıtım malzemeleri listesi doğrudan yalıtım bölümünün altına
+    if project_details['insulation_floor']:
+        floor_insulation_details_display_tr_text = [FLOOR_INSULATION_MATERIALS_TR]
+        if project_details['skirting_length_val'] > 0:
+            floor_insulation_details_display_tr_text.append(clean_invisible_chars(f"• Süpürgelik ({project_details['skirting_length_val']:.2f} m)"))
+        if project_details['laminate_flooring_m2_val'] > 0:
+            floor_insulation_details_display_tr_text.append(clean_invisible_chars(f"• Laminat Parke 12mm ({project_details['laminate_flooring_m2_val']:.2f} m²)"))
+        if project_details['under_parquet_mat_m2_val'] > 0:
+            floor_insulation_details_display_tr_text.append(clean_invisible_chars(f"• Parke Altı Şilte 4mm ({project_details['under_parquet_mat_m2_val']:.2f} m²)"))
+        if project_details['osb2_18mm_count_val'] > 0:
+            floor_insulation_details_display_tr_text.append(clean_invisible_chars(f"• OSB2 18mm veya Beton Panel 18mm ({project_details['osb2_18mm_count_val']} adet)"))
+        if project_details['galvanized_sheet_m2_val'] > 0:
+            floor_insulation_details_display_tr_text.append(clean_invisible_chars(f"• 5mm Galvanizli Sac ({project_details['galvanized_sheet_m2_val']:.2f} m²)"))
+        floor_insulation_details_display_tr_text.append("<i>Not: Yalıtım kalınlığı artırılabilir. Seramik kaplama tercih edilebilir. (betonsuz, özel zemin sistemi)</i>")
+
+        interior_insulation_table_data_tr.append([Paragraph('<b>Zemin Yalıtım Malzemeleri:</b>', styles['NormalTR']), Paragraph("<br/>".join(floor_insulation_details_display_tr_text), styles['NormalTR'])])
+
+    interior_insulation_table_tr = Table(interior_insulation_table_data_tr, colWidths=[60*mm, 110*mm])
+    interior_insulation_table_tr.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
+    elements.append(interior_insulation_table_tr)
+    elements.append(Spacer(1, 5*mm))
+
+    # Doğramalar
+    openings_table_data_tr = [
+        [Paragraph('<b>Doğramalar</b>', styles['NormalTR']), Paragraph(clean_invisible_chars(f"Pencereler: {project_details['window_count']} ({project_details['window_size_val']} - {project_details['window_door_color_val']})<br/>Sürgülü Kapılar: {project_details['sliding_door_count']} ({project_details['sliding_door_size_val']} - {project_details['window_door_color_val']})<br/>WC Pencereleri: {project_details['wc_window_count']} ({project_details['wc_window_size_val']} - {project_details['window_door_color_val']}){'' if project_details['wc_sliding_door_count'] == 0 else '<br/>WC Sürgülü Kapıları: ' + str(project_details['wc_sliding_door_count']) + ' (' + project_details['wc_sliding_door_size_val'] + ' - ' + project_details['window_door_color_val'] + ')'}<br/>Kapılar: {project_details['door_count']} ({project_details['door_size_val']})"), styles['NormalTR'])],
+    ]
+    openings_table_tr = Table(openings_table_data_tr, colWidths=[60*mm, 110*mm])
+    openings_table_tr.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
+    elements.append(openings_table_tr)
+    elements.append(Spacer(1, 5*mm))
+
+    # --- Sayfa Sonu: Teknik Özellikler Bölümünün Kalanı Yeni Sayfada ---
+    elements.append(PageBreak())
+
+    # Diğer Teknik Özellikler (Mutfak, Duş/WC, Elektrik, Sıhhi Tesisat, Ekstra Genel İlaveler)
+    elements.append(Paragraph("EK TEKNİK ÖZELLİKLER", styles['Heading']))
+
+    other_features_table_data_tr = [
+        [Paragraph('<b>Mutfak</b>', styles['NormalTR']), Paragraph(clean_invisible_chars(project_details['kitchen_type_display_tr']), styles['NormalTR'])],
+    ]
+    if project_details['kitchen_choice'] != 'No Kitchen':
+        other_features_table_data_tr.append([Paragraph('<b>Mutfak Malzemeleri</b>', styles['NormalTR']), Paragraph(KITCHEN_MATERIALS_TR, styles['NormalTR'])])
+
+    other_features_table_data_tr.append([Paragraph('<b>Duş/WC</b>', styles['NormalTR']), Paragraph(clean_invisible_chars(get_yes_no_empty_tr(project_details['shower_wc'])), styles['NormalTR'])])
+    if project_details['shower_wc']:
+        other_features_table_data_tr.append([Paragraph('<b>Duş/WC Malzemeleri</b>', styles['NormalTR']), Paragraph(SHOWER_WC_MATERIALS_TR, styles['NormalTR'])])
+
+    if project_details['electrical']:
+        other_features_table_data_tr.append([Paragraph('<b>Elektrik Tesisatı</b>', styles['NormalTR']), Paragraph(ELECTRICAL_MATERIALS_TR, styles['NormalTR'])])
+    else:
+        other_features_table_data_tr.append([Paragraph('<b>Elektrik Tesisatı</b>', styles['NormalTR']), Paragraph('Hayır', styles['NormalTR'])])
+
+    if project_details['plumbing']:
+        other_features_table_data_tr.append([Paragraph('<b>Sıhhi Tesisat</b>', styles['NormalTR']), Paragraph(PLUMBING_MATERIALS_TR, styles['NormalTR'])])
+    else:
+        other_features_table_data_tr.append([Paragraph('<b>Sıhhi Tesisat</b>', styles['NormalTR']), Paragraph('Hayır', styles['NormalTR'])])
+
+    # Ekstra Genel İlaveler
+    extra_general_additions_list_tr = []
+    if project_details['heating']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Yerden Isıtma: {get_yes_no_empty_tr(project_details['heating'])}"))
+    if project_details['solar']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Güneş Enerji Sistemi: {get_yes_no_empty_tr(project_details['solar'])} ({project_details['solar_kw']} kW)"))
+    if project_details['wheeled_trailer']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Tekerlekli Römork: {get_yes_no_empty_tr(project_details['wheeled_trailer'])} ({format_currency(project_details['wheeled_trailer_price'])})"))
+
+    # Aether Living'e özel eklenenler
+    if project_details['smart_home_systems_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Akıllı Ev Sistemleri: {get_yes_no_empty_tr(project_details['smart_home_systems_option'])}"))
+    if project_details['white_goods_fridge_tv_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Beyaz Eşya (Buzdolabı, TV): {get_yes_no_empty_tr(project_details['white_goods_fridge_tv_option'])}"))
+    if project_details['sofa_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Kanepe: {get_yes_no_empty_tr(project_details['sofa_option'])}"))
+    if project_details['security_camera_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Güvenlik Kamerası Ön Kurulumu: {get_yes_no_empty_tr(project_details['security_camera_option'])}"))
+    if project_details['exterior_cladding_m2_option'] and project_details['exterior_cladding_m2_val'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Dış Cephe Kaplama (Knauf Aquapanel): Evet ({project_details['exterior_cladding_m2_val']:.2f} m²)"))
+    if project_details['bedroom_set_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Yatak Odası Takımı: {get_yes_no_empty_tr(project_details['bedroom_set_option'])}"))
+    if project_details['terrace_laminated_wood_flooring_option'] and project_details['terrace_laminated_wood_flooring_m2_val'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Emprenyeli Çam Zemin (Teras Opsiyonu): Evet ({project_details['terrace_laminated_wood_flooring_m2_val']:.2f} m²)"))
+    if project_details['porcelain_tiles_option'] and project_details['porcelain_tiles_m2_val'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Porselen Fayans: Evet ({project_details['porcelain_tiles_m2_val']:.2f} m²)"))
+    if project_details['concrete_panel_floor_option'] and project_details['concrete_panel_floor_m2_val'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Beton Panel Zemin: Evet ({project_details['concrete_panel_floor_m2_val']:.2f} m²)"))
+    if project_details['premium_faucets_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Premium Bataryalar: {get_yes_no_empty_tr(project_details['premium_faucets_option'])}"))
+    if project_details['integrated_fridge_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Entegre Buzdolabı: {get_yes_no_empty_tr(project_details['integrated_fridge_option'])}"))
+    if project_details['designer_furniture_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Entegre Özel Tasarım Mobilyalar: {get_yes_no_empty_tr(project_details['designer_furniture_option'])}"))
+    if project_details['italian_sofa_option']:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"İtalyan Kanepe: {get_yes_no_empty_tr(project_details['italian_sofa_option'])}"))
+    if project_details['inclass_chairs_option'] and project_details['inclass_chairs_count'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Inclass Sandalyeler: Evet ({project_details['inclass_chairs_count']} adet)"))
+    if project_details['brushed_granite_countertops_option'] and project_details['brushed_granite_countertops_m2_val'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Fırçalanmış Granit Tezgahlar: Evet ({project_details['brushed_granite_countertops_m2_val']:.2f} m²)"))
+    if project_details['exterior_wood_cladding_m2_option'] and project_details['exterior_wood_cladding_m2_val'] > 0:
+        extra_general_additions_list_tr.append(clean_invisible_chars(f"Dış Cephe Ahşap Kaplama (Lambiri): Evet ({project_details['exterior_wood_cladding_m2_val']:.2f} m²)"))
+
+    if extra_general_additions_list_tr:
+        other_features_table_data_tr.append([Paragraph('<b>Ekstra Genel İlaveler</b>', styles['NormalTR']), Paragraph("<br/>".join(extra_general_additions_list_tr), styles['NormalTR'])])
+
+    other_features_table_tr = Table(other_features_table_data_tr, colWidths=[60*mm, 110*mm])
+    other_features_table_tr.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
+    elements.append(other_features_table_tr)
+    elements.append(Spacer(1, 5*mm))
+
+    elements.append(Paragraph('<b>Tahmini Teslimat</b>', styles['NormalTR']))
+    elements.append(Paragraph(clean_invisible_chars(f"Yaklaşık {project_details['delivery_duration_business_days']} iş günü"), styles['NormalTR']))
+    elements.append(Spacer(1, 8*mm))
+
+    if notes.strip():
+        elements.append(Paragraph("MÜŞTERİ NOTLARI", styles['Heading']))
+        elements.append(Paragraph(notes, styles['NormalTR']))
+        elements.append(Spacer(1, 8*mm))
+
+    # --- Fiyat ve Ödeme Planı Bölümü ---
+    elements.append(PageBreak())
+    final_page_elements = [Spacer(1, 12*mm)]
+
+    final_page_elements.append(Paragraph("FİYAT VE ÖDEME PLANI", styles['Heading']))
+
+    price_table_data_tr = []
+    price_table_data_tr.append([
+        Paragraph("Ana Ev Fiyatı", colored_table_header_style_tr),
+        Paragraph(format_currency(house_price), colored_table_header_style_tr)
+    ])
+    if solar_price > 0:
+        price_table_data_tr.append([
+            Paragraph("Güneş Enerji Sistemi Fiyatı", colored_table_header_style_tr),
+            Paragraph(format_currency(solar_price), colored_table_header_style_tr)
+        ])
+    price_table_data_tr.append([
+        Paragraph("TOPLAM FİYAT", colored_table_header_style_tr),
+        Paragraph(format_currency(total_price), colored_table_header_style_tr)
+    ])
+
+    price_summary_table_tr = Table(price_table_data_tr, colWidths=[120*mm, 50*mm])
+    price_summary_table_tr.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,-1), colors.HexColor("#3182ce")),
+        ('TEXTCOLOR', (0,0), (-1,-1), colors.white),
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (-1,-1), 8),
+        ('RIGHTPADDING', (0,0), (-1,-1), 8),
+        ('TOPPADDING', (0,0), (-1,-1), 8),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+        ('GRID', (0,0), (-1,-1), 0.5, colors.HexColor("#4a5568")),
+    ]))
+    final_page_elements.append(price_summary_table_tr)
+    final_page_elements.append(Spacer(1, 8*mm))
+
+    # KDV Dahildir notu ve garanti açıklaması
+    final_page_elements.append(Paragraph("Tüm fiyatlara KDV dahildir.", payment_heading_style))
+    final_page_elements.append(Paragraph("Prefabrik yaşam alanlarımız 3 yıl garantilidir. Poliüretan paneller ile sıcak-soğuk dengesi sağlanır, yangın sınıfı A kalitesindedir ve enerji tüketimi A+++'dır.", styles['NormalTR']))
+
+    final_page_elements.append(Spacer(1, 8*mm))
+    final_page_elements.append(Paragraph(clean_invisible_chars(f"<b>Tahmini Teslimat:</b> Yaklaşık {project_details['delivery_duration_business_days']} iş günü"), payment_heading_style))
+    final_page_elements.append(Spacer(1, 8*mm))
+
+    final_page_elements.append(Paragraph("Ana Ev Ödeme Planı", payment_heading_style))
+
+    down_payment = house_price * 0.40
+    remaining_balance = house_price - down_payment
+    installment_amount = remaining_balance / 3
+
+    payment_data_tr = [
+        [Paragraph("1. Peşinat (%40)", payment_heading_style), Paragraph(format_currency(down_payment), payment_heading_style)],
+        [Paragraph("- Sözleşme imzalanırken ödenir.", styles['NormalTR']), ""],
+        [Paragraph("2. 1. Taksit", payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
+        [Paragraph("- Yapı tamamlandığında ödenir.", styles['NormalTR']), ""],
+        [Paragraph("3. 2. Taksit", payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
+        [Paragraph("- İç işler tamamlandığında ödenir.", styles['NormalTR']), ""],
+        [Paragraph("4. Son Ödeme", payment_heading_style), Paragraph(format_currency(installment_amount), payment_heading_style)],
+        [Paragraph("- Nihai teslimatta ödenir.", styles['NormalTR']), ""],
+    ]
+
+    if solar_price > 0:
+        payment_data_tr.append([Paragraph("Güneş Enerji Sistemi", payment_heading_style), Paragraph(format_currency(solar_price), payment_heading_style)])
+        payment_data_tr.append([Paragraph("- Sözleşme imzalanırken ödenir.", styles['NormalTR']), ""])
+
+    payment_table_tr = Table(payment_data_tr, colWidths=[120*mm, 50*mm])
+    payment_table_tr.setStyle(TableStyle([('ALIGN', (0,0), (-1,-1), 'LEFT'), ('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
+    final_page_elements.append(payment_table_tr)
+    elements.append(KeepTogether(final_page_elements))
+
+    # Güneş Enerjisi Eki (varsa)
+    if project_details['solar']:
+        solar_elements = _create_solar_appendix_elements_tr(project_details['solar_kw'], project_details['solar_price'], styles['Heading'], styles['NormalTR'], styles['PriceTotal'])
+        elements.extend(solar_elements)
+
+    # Yerden Isıtma Eki (varsa)
+    if project_details['heating']:
+        heating_elements = _create_heating_appendix_elements_tr(styles)
+        elements.extend(heating_elements)
+
+    stage_timing.lap('flowables')
+    with stage_timing.span('doc_build'):
+        doc.build(elements)
+    return pdf_sink_bytes(sink)
+    # ==============================================================================
+# BÖLÜM 5: Satış Sözleşmesi ve Dahili Rapor PDF Fonksiyonları
+# ==============================================================================
+
+def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_price, project_details, company_info, logo_data_b64=None):
+    """Sağlanan şablon ve proje detaylarına göre bir satış sözleşmesi PDF'i oluşturur."""
+    load_pdf_support()
+    sink = new_pdf_sink()
+    doc = SimpleDocTemplate(
+        sink,
+        pagesize=A4,
+        rightMargin=15*mm,
+        leftMargin=15*mm,
+        topMargin=40*mm, # Header için artırılmış margin
+        bottomMargin=25*mm
     )
+    doc.customer_name = customer_info['name']
+    doc.company_name = COMPANY_INFO['name']
+    doc.logo_data_b64 = logo_data_b64
+    doc.logo = get_logo_resource(doc.logo_data_b64) # Çözülmüş logo süreç genelinde paylaşılır
+
+    # Header ve Footer fonksiyonları, logo verisiyle birlikte onFirstPage/onLaterPages'e geçirilecek
+    def _contract_header_footer_for_contract(canvas_obj, doc):
+        draw_page_header_footer(canvas_obj, doc)
+
+    doc.onFirstPage = _contract_header_footer_for_contract
+    doc.onLaterPages = _contract_header_footer_for_contract
+
+    styles = get_pdf_styles('en')
+    contract_heading_style = styles['ContractHeading']
+    contract_subheading_style = styles['ContractSubheading']
+    contract_normal_style = styles['ContractNormal']
+    contract_list_style = styles['ContractList']
+    contract_signature_style = styles['ContractSignature']
 
     elements = []
 
     # Başlık
-    elements.append(Paragraph(clean_invisible_chars("SALES CONTRACT"), contract_heading_style))
+    elements.append(Paragraph("SALES CONTRACT", contract_heading_style))
     elements.append(Spacer(1, 6*mm))
 
     # İlgili Taraflar (dinamik ID ve Şirket No ile güncellendi)
@@ -1551,17 +1910,17 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
     elements.append(Spacer(1, 6*mm))
 
     # Sözleşme Konusu
-    elements.append(Paragraph(clean_invisible_chars("Subject of the Agreement:"), contract_subheading_style))
+    elements.append(Paragraph("Subject of the Agreement:", contract_subheading_style))
     elements.append(Paragraph(clean_invisible_chars(f"A. The Seller agrees to complete and deliver to the Buyer the LIGHT STEEL STRUCTURE CONSTRUCTION (Tiny House) being constructed under its coordination at the address specified by the Buyer, in accordance with the specifications detailed in Appendix A."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("B. The details of the construction related to the Portable House project will be considered as appendixes to this agreement, which constitute integral parts of the present agreement."), contract_normal_style))
+    elements.append(Paragraph("B. The details of the construction related to the Portable House project will be considered as appendixes to this agreement, which constitute integral parts of the present agreement.", contract_normal_style))
     elements.append(Spacer(1, 6*mm))
 
     # Tanımlar
-    elements.append(Paragraph(clean_invisible_chars("1. Definitions:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("1.1. \"Completion\" refers to the point at which the Light Steel Structure House is fully constructed, inspected, and ready for delivery."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("1.2. \"Delivery Date\" refers to the date on which the property is handed over to the Buyer, at which point the Buyer assumes full ownership and risk."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("1.3. \"Force Majeure Event\" means any event beyond the reasonable control of the Seller that prevents the timely delivery of the house, including but not limited to acts of God, war, terrorism, strikes, lockouts, natural disasters, or any other event recognized under law."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("1.4. \"House\" means the structure, as described in Appendix A."), contract_normal_style))
+    elements.append(Paragraph("1. Definitions:", contract_subheading_style))
+    elements.append(Paragraph("1.1. \"Completion\" refers to the point at which the Light Steel Structure House is fully constructed, inspected, and ready for delivery.", contract_normal_style))
+    elements.append(Paragraph("1.2. \"Delivery Date\" refers to the date on which the property is handed over to the Buyer, at which point the Buyer assumes full ownership and risk.", contract_normal_style))
+    elements.append(Paragraph("1.3. \"Force Majeure Event\" means any event beyond the reasonable control of the Seller that prevents the timely delivery of the house, including but not limited to acts of God, war, terrorism, strikes, lockouts, natural disasters, or any other event recognized under law.", contract_normal_style))
+    elements.append(Paragraph("1.4. \"House\" means the structure, as described in Appendix A.", contract_normal_style))
     elements.append(Spacer(1, 6*mm))
 
     # Satış Fiyatı ve Ödeme Koşulları
@@ -1572,10 +1931,10 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
     remaining_balance = house_sales_price - down_payment
     installment_amount = remaining_balance / 3
 
-    elements.append(Paragraph(clean_invisible_chars("2. Sales Price and Payment Terms:"), contract_subheading_style))
+    elements.append(Paragraph("2. Sales Price and Payment Terms:", contract_subheading_style))
     elements.append(Paragraph(clean_invisible_chars(f"2.1. The sales price of the Portable Container House (herein after \"the house\") is <b>{format_currency(house_sales_price)}</b>, plus 19% VAT, according to the specifications, as described to APPENDIX \"A\", which constitutes an integral part of the present agreement."), contract_list_style))
     elements.append(Paragraph(clean_invisible_chars(f"2.2. The total sales price (including solar if applicable) is <b>{total_sales_price_formatted}</b> (VAT Included)."), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("2.3. The Buyer will pay the following amounts according to the schedule:"), contract_list_style))
+    elements.append(Paragraph("2.3. The Buyer will pay the following amounts according to the schedule:", contract_list_style))
 
     elements.append(Paragraph(clean_invisible_chars(f"- Main House (Total: {format_currency(house_sales_price)})"), contract_list_style, bulletText=''))
     elements.append(Paragraph(clean_invisible_chars(f"   - 40% Down Payment: {format_currency(down_payment)} upon contract signing."), contract_list_style, bulletText='-'))
@@ -1586,21 +1945,21 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
     if solar_sales_price > 0:
         elements.append(Paragraph(clean_invisible_chars(f"- Solar System: {format_currency(solar_sales_price)} due upon contract signing."), contract_list_style, bulletText=''))
 
-    elements.append(Paragraph(clean_invisible_chars("2.4. Any delay in payment shall result in legal interest charges at 2% per month."), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("2.5. If the Buyer fails to pay any installment for more than 20 days upon written notice, the seller reserves the right to terminate the contract and keep the deposit, as a compensation for damages caused."), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("2.6. The payment terms and dates envisaged under the headings of the sales price, payment terms, and delivery above constitute the essence of this sales agreement and form its basis."), contract_list_style))
+    elements.append(Paragraph("2.4. Any delay in payment shall result in legal interest charges at 2% per month.", contract_list_style))
+    elements.append(Paragraph("2.5. If the Buyer fails to pay any installment for more than 20 days upon written notice, the seller reserves the right to terminate the contract and keep the deposit, as a compensation for damages caused.", contract_list_style))
+    elements.append(Paragraph("2.6. The payment terms and dates envisaged under the headings of the sales price, payment terms, and delivery above constitute the essence of this sales agreement and form its basis.", contract_list_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Banka Detayları
-    elements.append(Paragraph(clean_invisible_chars("2.7. Bank Details:"), contract_subheading_style))
+    elements.append(Paragraph("2.7. Bank Details:", contract_subheading_style))
     bank_details_data = [
-        [Paragraph(clean_invisible_chars("Bank Name:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['bank_name']), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("Bank Address:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['bank_address']), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("Account Name:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['account_name']), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("IBAN:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['iban']), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("Account Number:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['account_number']), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("Currency:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['currency_type']), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("SWIFT/BIC:"), contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['swift_bic']), contract_normal_style)],
+        [Paragraph("Bank Name:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['bank_name']), contract_normal_style)],
+        [Paragraph("Bank Address:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['bank_address']), contract_normal_style)],
+        [Paragraph("Account Name:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['account_name']), contract_normal_style)],
+        [Paragraph("IBAN:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['iban']), contract_normal_style)],
+        [Paragraph("Account Number:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['account_number']), contract_normal_style)],
+        [Paragraph("Currency:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['currency_type']), contract_normal_style)],
+        [Paragraph("SWIFT/BIC:", contract_normal_style), Paragraph(clean_invisible_chars(COMPANY_INFO['swift_bic']), contract_normal_style)],
     ]
     bank_details_table = Table(bank_details_data, colWidths=[40*mm, 130*mm])
     bank_details_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1609,76 +1968,76 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
 
 
     # Mülkün İncelemesi ve Kusurlar
-    elements.append(Paragraph(clean_invisible_chars("3. Inspection of the Property and Defects:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("3.1. The Buyer shall have the right to inspect the property during the construction process. The Buyer may request an inspection at any point with 7 days' notice."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("3.2. Any defects or concerns raised during inspections shall be addressed by the Seller at no additional cost to the Buyer. The buyer shall keep a written record of inspections which the byuer signs after each inspection, confirming the status of affairs."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("3.3. Final inspection of the completed house will occur within 10 days of the delivery date, after which the Buyer shall provide written a list of defects."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("3.4. If there are any possible defects, the seller will restore them within ........ days/months and notify the buyer. In such a case, the delivery of the house will be determined accordingly."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("3.5. The seller will repair and/or replace any possible defects, within ........ days/months."), contract_normal_style))
+    elements.append(Paragraph("3. Inspection of the Property and Defects:", contract_subheading_style))
+    elements.append(Paragraph("3.1. The Buyer shall have the right to inspect the property during the construction process. The Buyer may request an inspection at any point with 7 days' notice.", contract_normal_style))
+    elements.append(Paragraph("3.2. Any defects or concerns raised during inspections shall be addressed by the Seller at no additional cost to the Buyer. The buyer shall keep a written record of inspections which the byuer signs after each inspection, confirming the status of affairs.", contract_normal_style))
+    elements.append(Paragraph("3.3. Final inspection of the completed house will occur within 10 days of the delivery date, after which the Buyer shall provide written a list of defects.", contract_normal_style))
+    elements.append(Paragraph("3.4. If there are any possible defects, the seller will restore them within ........ days/months and notify the buyer. In such a case, the delivery of the house will be determined accordingly.", contract_normal_style))
+    elements.append(Paragraph("3.5. The seller will repair and/or replace any possible defects, within ........ days/months.", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Evin Tamamlanması
-    elements.append(Paragraph(clean_invisible_chars("4. Completion of the House:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("4.1. The Seller will issue an invoice and deliver the property to the Buyer after the full payment of the sales price and all amounts specified in Article 2, upon completion of the construction of the light steel structure house. Document procurement related to this matter is outside the specified time for delivery."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("4.2. In order to complete processes such as partitioning, transfer, etc., the Buyer agrees to assist the Seller and, for this purpose, to apply to official, semi-official, and other authorities jointly or individually with the Seller and/or other shareholder or shareholders, to sign necessary signatures, fill out forms, and/or, if necessary, appoint the Seller as a representative."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("4.3. The Buyer will be responsible for the Tax (VAT) of the house from the delivery of the light steel structure house."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("4.4. Despite the Seller's completion of the necessary legal procedures, the Seller will not be responsible for delays and extra transit expenses related to customs procedures and exit of the materials of this house."), contract_normal_style))
+    elements.append(Paragraph("4. Completion of the House:", contract_subheading_style))
+    elements.append(Paragraph("4.1. The Seller will issue an invoice and deliver the property to the Buyer after the full payment of the sales price and all amounts specified in Article 2, upon completion of the construction of the light steel structure house. Document procurement related to this matter is outside the specified time for delivery.", contract_normal_style))
+    elements.append(Paragraph("4.2. In order to complete processes such as partitioning, transfer, etc., the Buyer agrees to assist the Seller and, for this purpose, to apply to official, semi-official, and other authorities jointly or individually with the Seller and/or other shareholder or shareholders, to sign necessary signatures, fill out forms, and/or, if necessary, appoint the Seller as a representative.", contract_normal_style))
+    elements.append(Paragraph("4.3. The Buyer will be responsible for the Tax (VAT) of the house from the delivery of the light steel structure house.", contract_normal_style))
+    elements.append(Paragraph("4.4. Despite the Seller's completion of the necessary legal procedures, the Seller will not be responsible for delays and extra transit expenses related to customs procedures and exit of the materials of this house.", contract_normal_style))
     
     # project_details['delivery_duration_business_days'] zaten calculate() içinde hesaplanmıştır
     elements.append(Paragraph(clean_invisible_chars(f"4.5. The House will be delivered within approximately {project_details['delivery_duration_business_days']} working days (excluding weekends and public holidays), as from the signing of this agreement."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("4.6. Any delays caused by Force Majeure events or by the Buyer shall extend the delivery period accordingly."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("4.7. If the seller fails to deliver the house within the set delivery date (4.5.), due to unforeseen delays, he is obliged to notify the buyer in writing, stating the reasons for the delay and proposing ways of overcoming the said delay."), contract_normal_style))
+    elements.append(Paragraph("4.6. Any delays caused by Force Majeure events or by the Buyer shall extend the delivery period accordingly.", contract_normal_style))
+    elements.append(Paragraph("4.7. If the seller fails to deliver the house within the set delivery date (4.5.), due to unforeseen delays, he is obliged to notify the buyer in writing, stating the reasons for the delay and proposing ways of overcoming the said delay.", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Fesih
-    elements.append(Paragraph(clean_invisible_chars("5. Termination:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("5.1. In case the Buyer fails to fulfill any of the conditions of this agreement, the Seller has the right to terminate the agreement immediately, by sending a written notification explaining the reasons for such termination."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("5.2. If the Buyer decides not to purchase the house by the given date, the Buyer acknowledges and undertakes that they will lose the entire deposit given as compensation for damages. In the event of a problem caused by the Seller or if the Seller decides not to transfer to the Buyer, the Seller will refund the full deposit to the Buyer."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("5.3. All notices to be given under this agreement will be deemed to have been given or served by being left at the above-mentioned addresses of the parties or by being sent by post."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("5.4. This agreement is made in 2 copies, signed and initialed by the parties."), contract_normal_style))
+    elements.append(Paragraph("5. Termination:", contract_subheading_style))
+    elements.append(Paragraph("5.1. In case the Buyer fails to fulfill any of the conditions of this agreement, the Seller has the right to terminate the agreement immediately, by sending a written notification explaining the reasons for such termination.", contract_normal_style))
+    elements.append(Paragraph("5.2. If the Buyer decides not to purchase the house by the given date, the Buyer acknowledges and undertakes that they will lose the entire deposit given as compensation for damages. In the event of a problem caused by the Seller or if the Seller decides not to transfer to the Buyer, the Seller will refund the full deposit to the Buyer.", contract_normal_style))
+    elements.append(Paragraph("5.3. All notices to be given under this agreement will be deemed to have been given or served by being left at the above-mentioned addresses of the parties or by being sent by post.", contract_normal_style))
+    elements.append(Paragraph("5.4. This agreement is made in 2 copies, signed and initialed by the parties.", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Bildirimler
-    elements.append(Paragraph(clean_invisible_chars("6. Notifications:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("The following shall be considered as valid notifications:"), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("6.1. By regular mail"), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("6.2. By registered mail"), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("6.3. By double registered mail"), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("6.4. By email which shall be sent by the usual electronic email used by the parties"), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("6.5. By service via a bailiff"), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("6.6. By fax"), contract_list_style))
-    elements.append(Paragraph(clean_invisible_chars("6.7. Telephone conversations, telephone messages (SMS), messages through viber, whats'app, facebook messenger and any other application/s not mentioned in this paragraph, shall not constitute a valid notice under above paragraph (4c)."), contract_list_style))
+    elements.append(Paragraph("6. Notifications:", contract_subheading_style))
+    elements.append(Paragraph("The following shall be considered as valid notifications:", contract_normal_style))
+    elements.append(Paragraph("6.1. By regular mail", contract_list_style))
+    elements.append(Paragraph("6.2. By registered mail", contract_list_style))
+    elements.append(Paragraph("6.3. By double registered mail", contract_list_style))
+    elements.append(Paragraph("6.4. By email which shall be sent by the usual electronic email used by the parties", contract_list_style))
+    elements.append(Paragraph("6.5. By service via a bailiff", contract_list_style))
+    elements.append(Paragraph("6.6. By fax", contract_list_style))
+    elements.append(Paragraph("6.7. Telephone conversations, telephone messages (SMS), messages through viber, whats'app, facebook messenger and any other application/s not mentioned in this paragraph, shall not constitute a valid notice under above paragraph (4c).", contract_list_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Garanti ve Kusurlara İlişkin Sorumluluk
-    elements.append(Paragraph(clean_invisible_chars("7. Warranty and Defects liability:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("7.1. The seller warrants that the house will be free if defects in materials and workmanship, for a period of ........ (months/year), from the day of delivery."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("7.2. The said warrantee does not cover damages caused by misuse, negligence, or external factors (e.g. natural disasters)."), contract_normal_style))
+    elements.append(Paragraph("7. Warranty and Defects liability:", contract_subheading_style))
+    elements.append(Paragraph("7.1. The seller warrants that the house will be free if defects in materials and workmanship, for a period of ........ (months/year), from the day of delivery.", contract_normal_style))
+    elements.append(Paragraph("7.2. The said warrantee does not cover damages caused by misuse, negligence, or external factors (e.g. natural disasters).", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Uygulanacak Hukuk
-    elements.append(Paragraph(clean_invisible_chars("8. Applicable Law:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("This Agreement and any matter relating thereto shall be governed, construed and interpreted in accordance with the laws of the Republic of Cyprus any dispute arising under it shall be subject to the exclusive jurisdiction of the Cyprus courts."), contract_normal_style))
+    elements.append(Paragraph("8. Applicable Law:", contract_subheading_style))
+    elements.append(Paragraph("This Agreement and any matter relating thereto shall be governed, construed and interpreted in accordance with the laws of the Republic of Cyprus any dispute arising under it shall be subject to the exclusive jurisdiction of the Cyprus courts.", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Anlaşmazlık Çözümü - Arabuluculuk / Tahkim
-    elements.append(Paragraph(clean_invisible_chars("9. Dispute Resolution - Mediation / Arbitration"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("9.1. Any disputes arising under this Agreement and prior to any litigation before the relevant Court, will first be addressed through negotiation between the parties."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("9.2. If the dispute cannot be resolved through negotiation, the parties agree to submit to mediation in the Republic of Cyprus, according to Mediation Act §159(1)/2012."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("9.3. If mediation fails, the dispute will be resolved through binding arbitration under the rules of [Arbitration Organization]."), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("9.4. The above alternative dispute resolution, do not conflict the Constitutional right of either party may seek relief in the courts of Cyprus if there will be no amicable settlement."), contract_normal_style))
+    elements.append(Paragraph("9. Dispute Resolution - Mediation / Arbitration", contract_subheading_style))
+    elements.append(Paragraph("9.1. Any disputes arising under this Agreement and prior to any litigation before the relevant Court, will first be addressed through negotiation between the parties.", contract_normal_style))
+    elements.append(Paragraph("9.2. If the dispute cannot be resolved through negotiation, the parties agree to submit to mediation in the Republic of Cyprus, according to Mediation Act §159(1)/2012.", contract_normal_style))
+    elements.append(Paragraph("9.3. If mediation fails, the dispute will be resolved through binding arbitration under the rules of [Arbitration Organization].", contract_normal_style))
+    elements.append(Paragraph("9.4. The above alternative dispute resolution, do not conflict the Constitutional right of either party may seek relief in the courts of Cyprus if there will be no amicable settlement.", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Değişiklikler
-    elements.append(Paragraph(clean_invisible_chars("10. Amendements:"), contract_subheading_style))
-    elements.append(Paragraph(clean_invisible_chars("Any amendements or modifications to this agreement, must be made in writing and signed by both parties prior to a written notification as above (term 6)."), contract_normal_style))
+    elements.append(Paragraph("10. Amendements:", contract_subheading_style))
+    elements.append(Paragraph("Any amendements or modifications to this agreement, must be made in writing and signed by both parties prior to a written notification as above (term 6).", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
     # Son Madde
-    elements.append(Paragraph(clean_invisible_chars("11. This Agreement is made in two (2) identical copies in English language, with each party receiving one copy of the Agreement."), contract_normal_style))
+    elements.append(Paragraph("11. This Agreement is made in two (2) identical copies in English language, with each party receiving one copy of the Agreement.", contract_normal_style))
     elements.append(Spacer(1, 6*mm)) # Reduced space
 
-    elements.append(Paragraph(clean_invisible_chars("IN WITNESS THEREOF, the parties have caused their authorized representatives to sign this Agreement on their behalf, the day and year above written."), contract_normal_style))
+    elements.append(Paragraph("IN WITNESS THEREOF, the parties have caused their authorized representatives to sign this Agreement on their behalf, the day and year above written.", contract_normal_style))
     elements.append(Spacer(1, 25*mm)) # Yeterli boşluk
 
     # Son İmza Bloğu (belgenin en sonunda, ortalanmış, gerçek imzalar için daha büyük boşluk)
@@ -1702,19 +2061,19 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
 
     # Tanıklar
     elements.append(Spacer(1, 8*mm)) # Tanıklar öncesi boşluk
-    elements.append(Paragraph(clean_invisible_chars("Witnesses:"), contract_normal_style))
+    elements.append(Paragraph("Witnesses:", contract_normal_style))
     elements.append(Spacer(1, 4*mm))
-    elements.append(Paragraph(clean_invisible_chars("1 (Sgn.) _____________________________________"), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("(name and i.d.)"), contract_normal_style))
+    elements.append(Paragraph("1 (Sgn.) _____________________________________", contract_normal_style))
+    elements.append(Paragraph("(name and i.d.)", contract_normal_style))
     elements.append(Spacer(1, 4*mm))
-    elements.append(Paragraph(clean_invisible_chars("2 (Sgn.) _____________________________________"), contract_normal_style))
-    elements.append(Paragraph(clean_invisible_chars("(name and i.d.)"), contract_normal_style))
+    elements.append(Paragraph("2 (Sgn.) _____________________________________", contract_normal_style))
+    elements.append(Paragraph("(name and i.d.)", contract_normal_style))
 
     elements.append(PageBreak())
 
     # EK "A" - Çalışma Kapsamı (Tablolar halinde düzenlendi)
-    elements.append(Paragraph(clean_invisible_chars("APPENDIX \"A\" - SCOPE OF WORK"), contract_heading_style))
-    elements.append(Paragraph(clean_invisible_chars("Within the scope of this sales agreement, the specified Light Steel Structure House will have the following features and materials:"), contract_normal_style))
+    elements.append(Paragraph("APPENDIX \"A\" - SCOPE OF WORK", contract_heading_style))
+    elements.append(Paragraph("Within the scope of this sales agreement, the specified Light Steel Structure House will have the following features and materials:", contract_normal_style))
     elements.append(Spacer(1, 5*mm))
 
     def get_yes_no_en(value):
@@ -1722,7 +2081,7 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
 
     # Boyutlar ve Alan
     dimensions_area_table_data = []
-    dimensions_area_table_data.append([Paragraph(clean_invisible_chars("<b>Dimensions and Area:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"The house has dimensions of {project_details['width']}m x {project_details['length']}m x {project_details['height']}m. It has a total area of {project_details['area']:.2f} m²."), contract_normal_style)])
+    dimensions_area_table_data.append([Paragraph("<b>Dimensions and Area:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"The house has dimensions of {project_details['width']}m x {project_details['length']}m x {project_details['height']}m. It has a total area of {project_details['area']:.2f} m²."), contract_normal_style)])
     dimensions_area_table = Table(dimensions_area_table_data, colWidths=[40*mm, 130*mm])
     dimensions_area_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
     elements.append(dimensions_area_table)
@@ -1731,19 +2090,19 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
     # Yapı Malzemeleri
     construction_materials_table_data = []
     if project_details['structure_type'] == 'Light Steel':
-        construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Construction Type:</b>'), contract_subheading_style), Paragraph(clean_invisible_chars('Light Steel'), contract_normal_style)])
-        construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Steel Structure Details:</b>'), contract_subheading_style), Paragraph(LIGHT_STEEL_BUILDING_STRUCTURE_EN_GR, contract_normal_style)])
+        construction_materials_table_data.append([Paragraph('<b>Construction Type:</b>', contract_subheading_style), Paragraph('Light Steel', contract_normal_style)])
+        construction_materials_table_data.append([Paragraph('<b>Steel Structure Details:</b>', contract_subheading_style), Paragraph(LIGHT_STEEL_BUILDING_STRUCTURE_EN_GR, contract_normal_style)])
         if project_details['plasterboard_interior'] or project_details['plasterboard_all']: # Koşullu ekleme
-            construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Interior Walls:</b>'), contract_subheading_style), Paragraph(INTERIOR_WALLS_DESCRIPTION_EN_GR, contract_normal_style)])
-        construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Roof:</b>'), contract_subheading_style), Paragraph(ROOF_DESCRIPTION_EN_GR, contract_normal_style)])
+            construction_materials_table_data.append([Paragraph('<b>Interior Walls:</b>', contract_subheading_style), Paragraph(INTERIOR_WALLS_DESCRIPTION_EN_GR, contract_normal_style)])
+        construction_materials_table_data.append([Paragraph('<b>Roof:</b>', contract_subheading_style), Paragraph(ROOF_DESCRIPTION_EN_GR, contract_normal_style)])
         if project_details['facade_sandwich_panel_included']:
-            construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Exterior Walls:</b>'), contract_subheading_style), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, contract_normal_style)])
+            construction_materials_table_data.append([Paragraph('<b>Exterior Walls:</b>', contract_subheading_style), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, contract_normal_style)])
     else: # Heavy Steel
-        construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Construction Type:</b>'), contract_subheading_style), Paragraph(clean_invisible_chars('Heavy Steel'), contract_normal_style)])
-        construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Steel Structure Details:</b>'), contract_subheading_style), Paragraph(HEAVY_STEEL_BUILDING_STRUCTURE_EN_GR, contract_normal_style)])
-        construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Roof:</b>'), contract_subheading_style), Paragraph(ROOF_DESCRIPTION_EN_GR, contract_normal_style)])
+        construction_materials_table_data.append([Paragraph('<b>Construction Type:</b>', contract_subheading_style), Paragraph('Heavy Steel', contract_normal_style)])
+        construction_materials_table_data.append([Paragraph('<b>Steel Structure Details:</b>', contract_subheading_style), Paragraph(HEAVY_STEEL_BUILDING_STRUCTURE_EN_GR, contract_normal_style)])
+        construction_materials_table_data.append([Paragraph('<b>Roof:</b>', contract_subheading_style), Paragraph(ROOF_DESCRIPTION_EN_GR, contract_normal_style)])
         if project_details['facade_sandwich_panel_included']:
-            construction_materials_table_data.append([Paragraph(clean_invisible_chars('<b>Exterior Walls:</b>'), contract_subheading_style), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, contract_normal_style)])
+            construction_materials_table_data.append([Paragraph('<b>Exterior Walls:</b>', contract_subheading_style), Paragraph(EXTERIOR_WALLS_DESCRIPTION_EN_GR, contract_normal_style)])
     
     construction_materials_table = Table(construction_materials_table_data, colWidths=[40*mm, 130*mm])
     construction_materials_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1752,8 +2111,8 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
 
     # İç Mekan ve Yalıtım (Interior and Insulation)
     interior_insulation_table_data_contract_en = [
-        [Paragraph(clean_invisible_chars('<b>Interior Covering:</b>'), contract_subheading_style), Paragraph(clean_invisible_chars(f"Floor Covering: {project_details['floor_covering_type']}. Inner Wall OSB: {get_yes_no_en(project_details['osb_inner_wall_option'])}. Interior Walls: Plasterboard {get_yes_no_en(project_details['plasterboard_interior_option'] or project_details['plasterboard_all_option'])}."), contract_normal_style)],
-        [Paragraph(clean_invisible_chars('<b>Insulation:</b>'), contract_subheading_style), Paragraph(clean_invisible_chars(f"Floor Insulation: {get_yes_no_en(project_details['insulation_floor'])}. Wall Insulation: {get_yes_no_en(project_details['insulation_wall'])}."), contract_normal_style)],
+        [Paragraph('<b>Interior Covering:</b>', contract_subheading_style), Paragraph(clean_invisible_chars(f"Floor Covering: {project_details['floor_covering_type']}. Inner Wall OSB: {get_yes_no_en(project_details['osb_inner_wall_option'])}. Interior Walls: Plasterboard {get_yes_no_en(project_details['plasterboard_interior_option'] or project_details['plasterboard_all_option'])}."), contract_normal_style)],
+        [Paragraph('<b>Insulation:</b>', contract_subheading_style), Paragraph(clean_invisible_chars(f"Floor Insulation: {get_yes_no_en(project_details['insulation_floor'])}. Wall Insulation: {get_yes_no_en(project_details['insulation_wall'])}."), contract_normal_style)],
     ]
     # Zemin yalıtım malzemeleri listesi doğrudan yalıtım bölümünün altına (Sözleşme'de de)
     if project_details['insulation_floor']:
@@ -1769,9 +2128,9 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
             floor_insulation_details_contract_en.append(clean_invisible_chars(f"• OSB2 18mm or Concrete Panel 18mm ({project_details['osb2_18mm_count_val']} pcs)"))
         if project_details['galvanized_sheet_m2_val'] > 0:
             floor_insulation_details_contract_en.append(clean_invisible_chars(f"• 5mm Galvanized Sheet ({project_details['galvanized_sheet_m2_val']:.2f} m²)"))
-        floor_insulation_details_contract_en.append(clean_invisible_chars("<i>Note: Insulation thickness can be increased. Ceramic coating can be preferred. (without concrete, special floor system)</i>"))
+        floor_insulation_details_contract_en.append("<i>Note: Insulation thickness can be increased. Ceramic coating can be preferred. (without concrete, special floor system)</i>")
         
-        interior_insulation_table_data_contract_en.append([Paragraph(clean_invisible_chars("<b>Floor Insulation Details:</b>"), contract_subheading_style), Paragraph("<br/>".join(floor_insulation_details_contract_en), contract_normal_style)])
+        interior_insulation_table_data_contract_en.append([Paragraph("<b>Floor Insulation Details:</b>", contract_subheading_style), Paragraph("<br/>".join(floor_insulation_details_contract_en), contract_normal_style)])
 
     interior_insulation_table_contract_en = Table(interior_insulation_table_data_contract_en, colWidths=[40*mm, 130*mm])
     interior_insulation_table_contract_en.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1780,8 +2139,8 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
 
     # Zemin Kaplamaları ve Çatı Kaplaması (Floor Coverings and Roof Covering)
     coverings_table_data = [
-        [Paragraph(clean_invisible_chars("<b>Floor Coverings:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"{project_details['floor_covering_type']} will be used for floor coverings."), contract_normal_style)],
-        [Paragraph(clean_invisible_chars("<b>Roof Covering:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars("100mm Sandwich Panel will be used for the roof."), contract_normal_style)],
+        [Paragraph("<b>Floor Coverings:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"{project_details['floor_covering_type']} will be used for floor coverings."), contract_normal_style)],
+        [Paragraph("<b>Roof Covering:</b>", contract_subheading_style), Paragraph("100mm Sandwich Panel will be used for the roof.", contract_normal_style)],
     ]
     coverings_table = Table(coverings_table_data, colWidths=[40*mm, 130*mm])
     coverings_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1791,9 +2150,9 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
     # Tesisatlar (Plumbing and Electrical)
     plumbing_electrical_table_data = []
     if project_details['plumbing']:
-        plumbing_electrical_table_data.append([Paragraph(clean_invisible_chars("<b>Plumbing:</b>"), contract_subheading_style), Paragraph(PLUMBING_MATERIALS_EN.strip(), contract_normal_style)])
+        plumbing_electrical_table_data.append([Paragraph("<b>Plumbing:</b>", contract_subheading_style), Paragraph(PLUMBING_MATERIALS_EN, contract_normal_style)])
     if project_details['electrical']:
-        plumbing_electrical_table_data.append([Paragraph(clean_invisible_chars("<b>Electrical:</b>"), contract_subheading_style), Paragraph(ELECTRICAL_MATERIALS_EN.strip(), contract_normal_style)])
+        plumbing_electrical_table_data.append([Paragraph("<b>Electrical:</b>", contract_subheading_style), Paragraph(ELECTRICAL_MATERIALS_EN, contract_normal_style)])
     
     if plumbing_electrical_table_data:
         plumbing_electrical_table = Table(plumbing_electrical_table_data, colWidths=[40*mm, 130*mm])
@@ -1804,7 +2163,7 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
 
     # Pencere ve Kapılar (Windows and Doors)
     windows_doors_table_data = [
-        [Paragraph(clean_invisible_chars("<b>Windows and Doors:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Aluminum windows and doors of various sizes will be used, with a height of 2.00m. Color: {project_details['window_door_color']}. The following windows and doors will be included in this project:<br/>Windows: {project_details['window_count']} ({project_details['window_size_val']})<br/>Sliding Doors: {project_details['sliding_door_count']} ({project_details['sliding_door_size_val']})<br/>WC Windows: {project_details['wc_window_count']} ({project_details['wc_window_size_val']}){'' if project_details['wc_sliding_door_count'] == 0 else '<br/>WC Sliding Doors: ' + str(project_details['wc_sliding_door_count']) + ' (' + project_details['wc_sliding_door_size_val'] + ')'}<br/>Doors: {project_details['door_count']} ({project_details['door_size_val']})"), contract_normal_style)],
+        [Paragraph("<b>Windows and Doors:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Aluminum windows and doors of various sizes will be used, with a height of 2.00m. Color: {project_details['window_door_color_val']}. The following windows and doors will be included in this project:<br/>Windows: {project_details['window_count']} ({project_details['window_size_val']})<br/>Sliding Doors: {project_details['sliding_door_count']} ({project_details['sliding_door_size_val']})<br/>WC Windows: {project_details['wc_window_count']} ({project_details['wc_window_size_val']}){'' if project_details['wc_sliding_door_count'] == 0 else '<br/>WC Sliding Doors: ' + str(project_details['wc_sliding_door_count']) + ' (' + project_details['wc_sliding_door_size_val'] + ')'}<br/>Doors: {project_details['door_count']} ({project_details['door_size_val']})"), contract_normal_style)],
     ]
     windows_doors_table = Table(windows_doors_table_data, colWidths=[40*mm, 130*mm])
     windows_doors_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
@@ -1816,57 +2175,57 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
     
     # İç Alçıpan ve OSB koşullu olarak Ekstra İlavelere eklendi (Sözleşme'de de)
     if project_details['plasterboard_interior_option'] or project_details['plasterboard_all_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Interior Plasterboard:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['plasterboard_interior_option'] or project_details['plasterboard_all_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Interior Plasterboard:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['plasterboard_interior_option'] or project_details['plasterboard_all_option'])), contract_normal_style)])
     if project_details['osb_inner_wall_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Inner Wall OSB Material:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['osb_inner_wall_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Inner Wall OSB Material:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['osb_inner_wall_option'])), contract_normal_style)])
     
     # Mutfak ve Duş/WC (eğer pakete dahil değilse ve seçiliyse)
     if project_details['kitchen_choice'] != 'No Kitchen':
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Kitchen:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(project_details['kitchen_type_display_en_gr']), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Kitchen:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(project_details['kitchen_type_display_en_gr']), contract_normal_style)])
     if project_details['shower_wc']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Shower/WC:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['shower_wc'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Shower/WC:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['shower_wc'])), contract_normal_style)])
     
     # Diğer Opsiyonel Özellikler (Aether Living'e özel olanlar dahil)
     if project_details['heating']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Floor Heating:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['heating'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Floor Heating:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['heating'])), contract_normal_style)])
     if project_details['solar']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Solar System:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"{get_yes_no_en(project_details['solar'])} ({project_details['solar_kw']} kW)"), contract_normal_style)] if project_details['solar'] else '')
+        additional_features_table_data.append([Paragraph("<b>Solar System:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"{get_yes_no_en(project_details['solar'])} ({project_details['solar_kw']} kW)"), contract_normal_style)] if project_details['solar'] else '')
     if project_details['wheeled_trailer']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Wheeled Trailer:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"{get_yes_no_en(project_details['wheeled_trailer'])} ({format_currency(project_details['wheeled_trailer_price'])})"), contract_normal_style)] if project_details['wheeled_trailer'] else '')
+        additional_features_table_data.append([Paragraph("<b>Wheeled Trailer:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"{get_yes_no_en(project_details['wheeled_trailer'])} ({format_currency(project_details['wheeled_trailer_price'])})"), contract_normal_style)] if project_details['wheeled_trailer'] else '')
     
     # Aether Living'e özel eklenenler (UI'dan kaldırılsa da raporlarda yer almalı)
     if project_details['smart_home_systems_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Smart Home Systems:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['smart_home_systems_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Smart Home Systems:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['smart_home_systems_option'])), contract_normal_style)])
     if project_details['white_goods_fridge_tv_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>White Goods (Fridge, TV):</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['white_goods_fridge_tv_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>White Goods (Fridge, TV):</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['white_goods_fridge_tv_option'])), contract_normal_style)])
     if project_details['sofa_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Sofa:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['sofa_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Sofa:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['sofa_option'])), contract_normal_style)])
     if project_details['security_camera_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Security Camera Pre-Installation:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['security_camera_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Security Camera Pre-Installation:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['security_camera_option'])), contract_normal_style)])
     if project_details['exterior_cladding_m2_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Exterior Cladding:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['exterior_cladding_m2_val']:.2f} m²)"), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Exterior Cladding:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['exterior_cladding_m2_val']:.2f} m²)"), contract_normal_style)])
     if project_details['bedroom_set_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Bedroom Set:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['bedroom_set_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Bedroom Set:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['bedroom_set_option'])), contract_normal_style)])
     if project_details['terrace_laminated_wood_flooring_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Treated Pine Floor (Terrace Option):</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['terrace_laminated_wood_flooring_m2_val']:.2f} m²)"), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Treated Pine Floor (Terrace Option):</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['terrace_laminated_wood_flooring_m2_val']:.2f} m²)"), contract_normal_style)])
     if project_details['porcelain_tiles_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Porcelain Tiles:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['porcelain_tiles_m2_val']:.2f} m²)"), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Porcelain Tiles:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['porcelain_tiles_m2_val']:.2f} m²)"), contract_normal_style)])
     if project_details['concrete_panel_floor_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Concrete Panel Floor:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['concrete_panel_floor_m2_val']:.2f} m²)"), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Concrete Panel Floor:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['concrete_panel_floor_m2_val']:.2f} m²)"), contract_normal_style)])
     if project_details['premium_faucets_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Premium Faucets:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['premium_faucets_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Premium Faucets:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['premium_faucets_option'])), contract_normal_style)])
     if project_details['integrated_fridge_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Integrated Refrigerator:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['integrated_fridge_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Integrated Refrigerator:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['integrated_fridge_option'])), contract_normal_style)])
     if project_details['designer_furniture_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Integrated Custom Design Furniture:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['designer_furniture_option'])), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Integrated Custom Design Furniture:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['designer_furniture_option'])), contract_normal_style)])
     if project_details['italian_sofa_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Italian Sofa:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['italian_sofa_option'])), contract_normal_style)])
-    if project_details['inclass_chairs_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Inclass Chairs:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['inclass_chairs_count']} pcs)"), contract_normal_style)] if project_details['inclass_chairs_count'] > 0 else '')
+        additional_features_table_data.append([Paragraph("<b>Italian Sofa:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(get_yes_no_en(project_details['italian_sofa_option'])), contract_normal_style)])
+    if project_details['inclass_chairs_option'] and project_details['inclass_chairs_count'] > 0:
+        additional_features_table_data.append([Paragraph("<b>Inclass Chairs:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['inclass_chairs_count']} pcs)"), contract_normal_style)])
     if project_details['brushed_granite_countertops_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Brushed Granite Countertops:</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['brushed_granite_countertops_m2_val']:.2f} m²)"), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Brushed Granite Countertops:</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['brushed_granite_countertops_m2_val']:.2f} m²)"), contract_normal_style)])
     if project_details['exterior_wood_cladding_m2_option']:
-        additional_features_table_data.append([Paragraph(clean_invisible_chars("<b>Exterior Wood Cladding (Lambiri):</b>"), contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['exterior_wood_cladding_m2_val']:.2f} m²)"), contract_normal_style)])
+        additional_features_table_data.append([Paragraph("<b>Exterior Wood Cladding (Lambiri):</b>", contract_subheading_style), Paragraph(clean_invisible_chars(f"Yes ({project_details['exterior_wood_cladding_m2_val']:.2f} m²)"), contract_normal_style)])
 
 
     if additional_features_table_data:
@@ -1874,6 +2233,739 @@ def create_sales_contract_pdf(customer_info, house_sales_price, solar_sales_pric
         additional_features_table.setStyle(TableStyle([('VALIGN', (0,0), (-1,-1), 'TOP'), ('LEFTPADDING', (0,0), (-1,-1), 0), ('BOTTOMPADDING', (0,0), (-1,-1), 2)]))
         elements.append(additional_features_table)
         elements.append(Spacer(1, 5*mm))
+
+    stage_timing.lap('flowables')
+    with stage_timing.span('doc_build'):
+        doc.build(elements)
+    return pdf_sink_bytes(sink)
+
+# --- Dahili Maliyet Raporu ---
+# Rapor yüzlerce kalem içerebilir. Hücreler Paragraph yerine düz metindir (işaretleme
+# gerekmez); uzun kalem adları simpleSplit ile önceden satırlara bölünür. Tablolar
+# LongTable'dır ve başlık satırı her sayfada tekrarlanır. Kalemler kategoriye göre
+# gruplanır ve her grubun ara toplamı yazılır.
+INTERNAL_REPORT_FONT_SIZE = 7
+INTERNAL_REPORT_HEADER_COLOR = "#3182ce"
+INTERNAL_REPORT_CATEGORY_COLOR = "#EDF2F7"
+INTERNAL_REPORT_COST_COLUMNS = (('Item', "Kalem"), ('Quantity', "Miktar"), ('Unit Price (€)', "Birim Fiyat"), ('Total (€)', "Toplam"))
+
+def financial_summary_rows(cost_results, profit_rate_label):
+    """Finansal özet tablosunun satırlarını ({'Item', 'Value'}) döndürür; arayüz ve dahili rapor ortak kullanır."""
+    return [
+        {'Item': 'Toplam Malzeme ve İşçilik Maliyeti (KDV Hariç)', 'Value': format_currency(cost_results['total_material_cost'])},
+        {'Item': f"Fire ve Atık Maliyeti (%{cost_results['fire_rate']*100:.0f})", 'Value': format_currency(cost_results['fire_cost'])},
+        {'Item': 'Genel Giderler (Aylık Sabit)', 'Value': format_currency(cost_results['total_overhead_cost'])},
+        {'Item': f"Kar ({profit_rate_label})", 'Value': format_currency(cost_results['profit_amount'])},
+        {'Item': 'KDV Hariç Satış Fiyatı', 'Value': format_currency(cost_results['total_cost_no_vat'])},
+        {'Item': f"KDV (%{cost_results['vat_rate']*100:.0f})", 'Value': format_currency(cost_results['vat_amount'])},
+        {'Item': 'Nihai Satış Fiyatı (KDV Dahil)', 'Value': format_currency(cost_results['final_sales_price'])},
+    ]
+
+def profile_analysis_frame(costs_df, structure_type, catalog=None):
+    """Hafif çelikte çelik profil kalemlerini döndürür; ağır çelikte boş DataFrame."""
+    if structure_type != 'Light Steel' or costs_df.empty:
+        return costs_df.iloc[0:0]
+    catalog = catalog or get_catalog()
+    return costs_df[costs_df['Item'].str.startswith(catalog.material_info['steel_skeleton_info'])]
+
+def _wrap_cell(text, width, font_name, font_size=INTERNAL_REPORT_FONT_SIZE):
+    """Düz metni hücre genişliğine göre satırlara böler (Paragraph'tan çok daha ucuzdur)."""
+    text = clean_invisible_chars(str(text))
+    return '\n'.join(simpleSplit(text, font_name, font_size, width)) or text
+
+def _internal_report_table(rows, col_widths, extra_styles=(), numeric_from=None):
+    """İlk satırı her sayfada tekrarlanan başlık olan, düz metin hücreli bir LongTable döndürür."""
+    table = LongTable(rows, colWidths=col_widths, repeatRows=1)
+    style = [
+        ('FONTNAME', (0, 0), (-1, -1), MAIN_FONT),
+        ('FONTSIZE', (0, 0), (-1, -1), INTERNAL_REPORT_FONT_SIZE),
+        ('LEADING', (0, 0), (-1, -1), INTERNAL_REPORT_FONT_SIZE + 2),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('TOPPADDING', (0, 0), (-1, -1), 1.5),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 1.5),
+        ('FONTNAME', (0, 0), (-1, 0), f"{MAIN_FONT}-Bold"),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(INTERNAL_REPORT_HEADER_COLOR)),
+        ('LINEBELOW', (0, 0), (-1, -1), 0.25, colors.HexColor("#CBD5E0")),
+    ]
+    if numeric_from is not None:
+        style.append(('ALIGN', (numeric_from, 0), (-1, -1), 'RIGHT'))
+    table.setStyle(TableStyle(style + list(extra_styles)))
+    return table
+
+def create_internal_cost_report_pdf(costs_df, financial_summary_df, profile_analysis_df, project_details, customer_info, logo_data_b64=None, catalog_version=None):
+    """
+    Şirket içi kullanım için maliyet raporu PDF'i oluşturur (Türkçe): finansal özet,
+    kategori ara toplamlı maliyet kalemleri ve (hafif çelikte) çelik profil analizi.
+    costs_df'te 'Category' kolonu yoksa tüm kalemler tek grupta listelenir.
+    """
+    load_pdf_support()
+    sink = new_pdf_sink()
+    doc = SimpleDocTemplate(
+        sink,
+        pagesize=A4,
+        rightMargin=15*mm,
+        leftMargin=15*mm,
+        topMargin=40*mm, # Header için artırılmış margin
+        bottomMargin=25*mm
+    )
+    doc.customer_name = customer_info['name']
+    doc.company_name = COMPANY_INFO['name']
+    doc.logo_data_b64 = logo_data_b64
+    doc.logo = get_logo_resource(doc.logo_data_b64) # Çözülmüş logo süreç genelinde paylaşılır
+    doc.onFirstPage = draw_page_header_footer
+    doc.onLaterPages = draw_page_header_footer
+
+    styles = get_pdf_styles('tr')
+    normal_style = styles['NormalTR']
+    bold_font = f"{MAIN_FONT}-Bold"
+    elements = []
+
+    # --- Başlık ve Proje Bilgileri ---
+    elements.append(Paragraph("DAHİLİ MALİYET RAPORU", styles['Title']))
+    elements.append(Paragraph(clean_invisible_chars(
+        f"<b>Müşteri:</b> {customer_info['name']}{' / ' + customer_info['company'] if customer_info['company'] else ''} | "
+        f"<b>Tarih:</b> {datetime.now().strftime('%d/%m/%Y')}"
+        + (f" | <b>Fiyat Kataloğu:</b> {catalog_version}" if catalog_version else "")
+    ), normal_style))
+    elements.append(Paragraph(clean_invisible_chars(
+        f"<b>Boyutlar:</b> {project_details['width']}m x {project_details['length']}m x {project_details['height']}m | "
+        f"<b>Toplam Alan:</b> {project_details['area']:.2f} m² | <b>Yapı Tipi:</b> {project_details['structure_type']} | "
+        f"<b>Oda Konfigürasyonu:</b> {project_details['room_configuration']}"
+    ), normal_style))
+    elements.append(Spacer(1, 5*mm))
+
+    # --- Finansal Özet ---
+    elements.append(Paragraph("FİNANSAL ÖZET", styles['Heading']))
+    summary_rows = [["Kalem", "Tutar"]] + [[clean_invisible_chars(str(item)), str(value)] for item, value in zip(financial_summary_df['Item'], financial_summary_df['Value'])]
+    elements.append(_internal_report_table(
+        summary_rows, [130*mm, 50*mm], numeric_from=1,
+        extra_styles=[('FONTNAME', (0, len(summary_rows) - 1), (-1, len(summary_rows) - 1), bold_font)], # Nihai fiyat
+    ))
+    elements.append(Spacer(1, 5*mm))
+
+    # --- Maliyet Kalemleri (kategori ara toplamlarıyla) ---
+    elements.append(Paragraph("MALİYET KALEMLERİ", styles['Heading']))
+    col_widths = [95*mm, 25*mm, 30*mm, 30*mm]
+    item_width = col_widths[0] - 12 # Hücre iç boşlukları (6pt + 6pt)
+    rows = [[header for _, header in INTERNAL_REPORT_COST_COLUMNS]]
+    extra_styles = []
+    categories = costs_df['Category'] if 'Category' in costs_df.columns else ['Maliyet Kalemleri'] * len(costs_df)
+    items, quantities = costs_df['Item'].tolist(), costs_df['Quantity'].tolist()
+    unit_prices, totals = costs_df['Unit Price (€)'].tolist(), costs_df['Total (€)'].tolist()
+    group_start = None
+    for index, category in enumerate(categories):
+        if index == 0 or category != categories[index - 1]:
+            rows.append([clean_invisible_chars(str(category)), '', '', ''])
+            extra_styles += [
+                ('SPAN', (0, len(rows) - 1), (-1, len(rows) - 1)),
+                ('FONTNAME', (0, len(rows) - 1), (-1, len(rows) - 1), bold_font),
+                ('BACKGROUND', (0, len(rows) - 1), (-1, len(rows) - 1), colors.HexColor(INTERNAL_REPORT_CATEGORY_COLOR)),
+            ]
+            group_start = index
+        rows.append([
+            _wrap_cell(items[index], item_width, MAIN_FONT), str(quantities[index]),
+            format_currency(unit_prices[index]), format_currency(totals[index]),
+        ])
+        if index == len(categories) - 1 or categories[index + 1] != category:
+            subtotal = money.from_cents(sum(money.to_cents(total) for total in totals[group_start:index + 1]))
+            rows.append([clean_invisible_chars(f"Ara Toplam - {category}"), '', '', format_currency(subtotal)])
+            extra_styles.append(('FONTNAME', (0, len(rows) - 1), (-1, len(rows) - 1), bold_font))
+    material_total = money.from_cents(sum(money.to_cents(total) for total in totals))
+    rows.append(["Toplam Malzeme ve İşçilik Maliyeti (KDV Hariç)", '', '', format_currency(material_total)])
+    extra_styles += [
+        ('FONTNAME', (0, len(rows) - 1), (-1, len(rows) - 1), bold_font),
+        ('LINEABOVE', (0, len(rows) - 1), (-1, len(rows) - 1), 0.75, colors.HexColor('#2C3E50')),
+    ]
+    elements.append(_internal_report_table(rows, col_widths, extra_styles, numeric_from=1))
+
+    # --- Çelik Profil Analizi ---
+    if profile_analysis_df is not None and not profile_analysis_df.empty:
+        elements.append(Spacer(1, 5*mm))
+        elements.append(Paragraph("ÇELİK PROFİL DETAYLI ANALİZİ", styles['Heading']))
+        profile_rows = [[header for _, header in INTERNAL_REPORT_COST_COLUMNS]] + [
+            [_wrap_cell(item, item_width, MAIN_FONT), str(quantity), format_currency(unit_price), format_currency(total)]
+            for item, quantity, unit_price, total in zip(
+                profile_analysis_df['Item'], profile_analysis_df['Quantity'],
+                profile_analysis_df['Unit Price (€)'], profile_analysis_df['Total (€)'],
+            )
+        ]
+        elements.append(_internal_report_table(profile_rows, col_widths, numeric_from=1))
+
+    stage_timing.lap('flowables')
+    with stage_timing.span('doc_build'):
+        doc.build(elements)
+    return pdf_sink_bytes(sink)
+
+# ==============================================================================
+# BÖLÜM 5.1: Teklif Verisi, Belge Kaydı ve PDF Sonuç Önbelleği
+# ==============================================================================
+
+# Belge türü -> (indirme butonu etiketi, dosya adı öneki)
+QUOTE_DOCUMENTS = {
+    'proposal_en_gr': ("Müşteri Teklifi İndir (EN/GR)", "Customer_Proposal_EN_GR"),
+    'proposal_tr': ("Müşteri Teklifi İndir (TR)", "Customer_Proposal_TR"),
+    'sales_contract': ("Satış Sözleşmesi İndir (EN)", "Sales_Contract_EN"),
+    'internal_cost_report': ("Dahili Maliyet Raporu İndir (TR)", "Internal_Cost_Report"),
+}
+QUOTE_DOCUMENT_LANGUAGES = {'proposal_en_gr': 'en_gr', 'proposal_tr': 'tr', 'sales_contract': 'en', 'internal_cost_report': 'tr'} # Belge -> get_pdf_styles() dili
+INTERNAL_DOCUMENTS = frozenset(['internal_cost_report']) # Müşteri paketine (ZIP) eklenmeyen belgeler
+
+# Teklif dili seçenekleri ve her seçimde üretilecek teklif belgeleri. Çok dilli
+# seçimde tüm teklifler aynı hesaplama sonucundan eşzamanlı üretilir (pdf_workers.py).
+PDF_LANGUAGE_OPTIONS = [('English-Greek', 'en_gr'), ('Turkish', 'tr'), ('English-Greek + Turkish', 'both')]
+PROPOSAL_DOCUMENTS = {'en_gr': ('proposal_en_gr',), 'tr': ('proposal_tr',), 'both': ('proposal_en_gr', 'proposal_tr')}
+
+def quote_documents(pdf_language):
+    """Dil koduna göre üretilecek belgeleri döndürür (dahili rapor + teklif(ler) + satış sözleşmesi)."""
+    return ['internal_cost_report', *PROPOSAL_DOCUMENTS[pdf_language], 'sales_contract']
+
+def build_quote(inputs, previous_quote=None):
+    """
+    Girdi sözlüğünü (session_state anahtarları) fiyatlandırır ve PDF'lerin ihtiyaç duyduğu
+    teklif verisini döndürür. previous_quote verilirse maliyet grafiğinde yalnızca değişen
+    girdilerden etkilenen düğümler yeniden hesaplanır.
+    """
+    with stage_timing.span('normalize_inputs'):
+        inputs = normalize_inputs(inputs)
+    catalog = get_catalog() # Tek teklifin tüm hesapları aynı katalog sürümüyle yapılır
+    with stage_timing.span('cost_calculation'):
+        graph_state = previous_quote.get('cost_graph_state') if previous_quote else None
+        cost_results, graph_state = calculate_costs_detailed(inputs, catalog, graph_state)
+        areas = graph_state['values']['areas']
+    with stage_timing.span('project_details'):
+        project_details = build_project_details(inputs, areas, catalog)
+    return {
+        'catalog_version': catalog.version,
+        'cost_graph_state': graph_state, # Sonraki hesaplamanın artımlı değerlendirmesi için
+        'areas': areas,
+        'cost_results': cost_results,
+        'project_details': project_details,
+        'customer_info': build_customer_info(inputs),
+        'notes': inputs['customer_notes'],
+        'house_price': cost_results['final_sales_price'], # KDV dahil (teklifler)
+        'house_price_no_vat': cost_results['total_cost_no_vat'], # KDV hariç (sözleşme "plus 19% VAT" yazar)
+        'solar_price': project_details['solar_price'],
+    }
+
+def build_quote_pdf(document, quote, logo_data_b64=None):
+    """Belge türüne göre ilgili PDF fonksiyonunu çağırır ve PDF baytlarını döndürür."""
+    total_price = quote['house_price'] + quote['solar_price']
+    if document == 'proposal_en_gr':
+        return create_customer_proposal_pdf(quote['house_price'], quote['solar_price'], total_price, quote['project_details'], quote['notes'], quote['customer_info'], logo_data_b64)
+    if document == 'proposal_tr':
+        return create_customer_proposal_pdf_tr(quote['house_price'], quote['solar_price'], total_price, quote['project_details'], quote['notes'], quote['customer_info'], logo_data_b64)
+    if document == 'sales_contract':
+        return create_sales_contract_pdf(quote['customer_info'], quote['house_price_no_vat'], quote['solar_price'], quote['project_details'], COMPANY_INFO, logo_data_b64)
+    if document == 'internal_cost_report':
+        import pandas as pd
+        cost_results = quote['cost_results']
+        costs_df = cost_results['costs_df']
+        project_details = quote['project_details']
+        return create_internal_cost_report_pdf(
+            costs_df,
+            pd.DataFrame(financial_summary_rows(cost_results, project_details['profit_rate_val_tuple'][0])),
+            profile_analysis_frame(costs_df, project_details['structure_type']),
+            project_details, quote['customer_info'], logo_data_b64, quote.get('catalog_version'),
+        )
+    raise ValueError(f"Bilinmeyen belge türü: '{document}'")
+
+def quote_content_digest(quote, logo_data_b64=None):
+    """Teklif girdileri, fiyatlar, fiyat kataloğu sürümü ve logonun belgeden bağımsız özetini üretir."""
+    logo_digest = hashlib.sha256(logo_data_b64.encode('ascii')).hexdigest() if logo_data_b64 else None
+    return pdf_cache.make_key(
+        quote['project_details'], quote['customer_info'], quote['notes'],
+        quote['house_price'], quote['house_price_no_vat'], quote['catalog_version'], logo_digest,
+    )
+
+def quote_pdf_cache_key(document, quote, logo_data_b64=None, content_digest=None):
+    """
+    Belge türü ve teklif özetinden içerik adresli önbellek anahtarı üretir. Aynı teklifin
+    birden çok belgesi için quote_content_digest() bir kez hesaplanıp verilebilir.
+    """
+    return pdf_cache.make_key(document, content_digest or quote_content_digest(quote, logo_data_b64))
+
+def build_quote_pdf_isolated(document, quote, logo_data_b64=None):
+    """
+    Belgeyi PDF işçi süreçlerinden birinde üretir; böylece aynı teklifin belgeleri
+    GIL'e takılmadan eşzamanlı hazırlanır. Havuz kapalıysa bu süreçte üretir.
+    """
+    result = pdf_workers.render_in_worker(document, quote, logo_data_b64)
+    if result is None:
+        return build_quote_pdf(document, quote, logo_data_b64)
+    pdf_bytes, stages = result
+    stage_timing.add_stages(stages)
+    return pdf_bytes
+
+def get_quote_pdf(document, quote, logo_data_b64=None):
+    """PDF'i önbellekten döndürür; aynı girdilerle daha önce üretilmediyse oluşturup önbelleğe ekler."""
+    with stage_timing.span('cache_key'):
+        key = quote_pdf_cache_key(document, quote, logo_data_b64)
+    return pdf_cache.get_or_build(key, lambda: build_quote_pdf_isolated(document, quote, logo_data_b64))
+
+def quote_file_name(document, file_stem):
+    """Belgenin indirme/dosya adını döndürür (örn. Customer_Proposal_TR_<stem>.pdf)."""
+    return f"{QUOTE_DOCUMENTS[document][1]}_{file_stem}.pdf"
+
+# --- Belge Paketi (Tek Geçişte Teklif + Sözleşme, İsteğe Bağlı ZIP) ---
+# Fontlar, dil stilleri ve çözülmüş logo süreç genelinde paylaşılır; paket bunları
+# tüm belgeler için baştan bir kez hazırlar ve teklif özetini (önbellek anahtarının
+# pahalı kısmı) bir kez hesaplar. Önbellekte olan belgeler yeniden üretilmez.
+# PDF'ler zaten sıkıştırılmış olduğundan ZIP'e sıkıştırılmadan (ZIP_STORED) ve her
+# belge hazır oldukça sırayla yazılır.
+def prepare_pdf_resources(documents, logo_data_b64=None):
+    """Belgelerin ortak kaynaklarını (ReportLab/fontlar, dil stilleri, logo) bir kez hazırlar."""
+    load_pdf_support()
+    for language in dict.fromkeys(QUOTE_DOCUMENT_LANGUAGES[document] for document in documents):
+        get_pdf_styles(language)
+    get_logo_resource(logo_data_b64)
+
+def build_quote_bundle(quote, documents=tuple(QUOTE_DOCUMENTS), logo_data_b64=None):
+    """Teklifin istenen belgelerini tek geçişte üretir; {belge: PDF baytları} döndürür (sıra korunur)."""
+    unknown = [document for document in documents if document not in QUOTE_DOCUMENTS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen belge türü: {unknown}")
+    with stage_timing.span('bundle_resources'):
+        prepare_pdf_resources(documents, logo_data_b64)
+        digest = quote_content_digest(quote, logo_data_b64)
+    bundle = {}
+    for document in documents:
+        key = quote_pdf_cache_key(document, quote, logo_data_b64, digest)
+        bundle[document] = pdf_cache.get_or_build(key, lambda: build_quote_pdf(document, quote, logo_data_b64))
+    return bundle
+
+def write_quote_bundle_zip(fileobj, named_pdfs):
+    """
+    (dosya adı, PDF baytları) çiftlerini ZIP olarak fileobj'e yazar. named_pdfs bir üreteç
+    olabilir; her belge üretildiği anda arşive eklenir, hepsi bellekte toplanmaz.
+    """
+    import zipfile
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for file_name, pdf_bytes in named_pdfs:
+            archive.writestr(file_name, pdf_bytes)
+    return fileobj
+
+def quote_bundle_zip(named_pdfs):
+    """write_quote_bundle_zip() ile bellekte oluşturulan ZIP baytlarını döndürür."""
+    return write_quote_bundle_zip(io.BytesIO(), named_pdfs).getvalue()
+
+def render_quote_pdf(document, quote_result):
+    """Arka plan işi: PDF'i üretir (veya önbellekten alır), aşama sürelerini kaydeder ve loglar."""
+    with stage_timing.trace('pdf', document=document, quote_id=quote_result['timestamp']) as record:
+        pdf_bytes = get_quote_pdf(document, quote_result['quote'], quote_result['logo_data_b64'])
+    record['cache_hit'] = 'doc_build' not in record['stages']
+    record['size_bytes'] = len(pdf_bytes)
+    quote_result['timings'][document] = record
+    stage_timing.log_record(record)
+    if quote_result.get('store_id'):
+        try:
+            quote_store.save_pdf(quote_result['store_id'], document, pdf_bytes)
+        except Exception as e: # Depo hatası indirmeyi engellemez
+            logger.warning(f"PDF teklif deposuna kaydedilemedi ({document}): {e}")
+    return pdf_bytes
+
+# --- Paket Karşılaştırması ---
+# Tüm Aether Living paketleri ve paketsiz seçim, güncel boyutlar ve finansal
+# ayarlarla tek bir vektörel geçişte (pricing_engine.price_projects) fiyatlandırılır.
+PACKAGE_SUMMARY_ROWS = {
+    'total_material_cost': 'Toplam Malzeme ve İşçilik Maliyeti (KDV Hariç)',
+    'fire_cost': 'Fire ve Atık Maliyeti',
+    'total_overhead_cost': 'Genel Giderler (Aylık Sabit)',
+    'profit_amount': 'Kar',
+    'total_cost_no_vat': 'KDV Hariç Satış Fiyatı',
+    'vat_amount': 'KDV',
+    'final_sales_price': 'Nihai Satış Fiyatı (KDV Dahil)',
+    'solar_price': 'Solar Sistem',
+    'grand_total': 'Genel Toplam (Ev + Solar)',
+}
+
+def compare_packages(inputs, catalog=None):
+    """
+    Girdi sözlüğünü her paketle (PACKAGE_CHOICES) birleştirip hepsini tek seferde
+    fiyatlandırır. {'summary', 'line_items', 'features', 'catalog_version'} döndürür;
+    tablolarda her paket bir kolondur. 'features' yalnızca paketler arasında farklı
+    olan girdileri içerir.
+    """
+    import pandas as pd
+    import pricing_engine
+    catalog = catalog or get_catalog()
+    inputs = normalize_inputs(inputs)
+    labels = [package_short_label(package) for package in PACKAGE_CHOICES]
+    package_inputs = [{**inputs, **package_updates(package), 'aether_package_choice': package} for package in PACKAGE_CHOICES]
+    priced = pricing_engine.price_projects(pricing_engine.inputs_frame(package_inputs, index=labels), catalog=catalog)
+
+    summary = priced['summary'].assign(solar_price=[
+        calculate_rounded_up_cost(values['solar_kw'] * catalog.prices['solar_per_kw']) if values['solar'] else 0.0
+        for values in package_inputs
+    ])
+    summary['grand_total'] = summary['final_sales_price'] + summary['solar_price'] # PDF'lerdeki toplam fiyatla aynı
+    summary = summary[list(PACKAGE_SUMMARY_ROWS)].T.rename(index=PACKAGE_SUMMARY_ROWS)
+    line_items = priced['line_items'].assign(package=lambda df: [labels[i] for i in df['project']])
+    line_items = (line_items.pivot_table(index='Item', columns='package', values='Total (€)', aggfunc='sum', sort=False)
+                  .reindex(columns=labels).fillna(0.0))
+    line_items['Fark'] = line_items.max(axis=1) - line_items.min(axis=1)
+
+    feature_keys = [key for key in dict.fromkeys(key for preset in AETHER_PACKAGE_PRESETS.values() for key in preset)
+                    if len({repr(values[key]) for values in package_inputs}) > 1]
+    features = pd.DataFrame(
+        {label: [values[key] for key in feature_keys] for label, values in zip(labels, package_inputs)}, index=feature_keys,
+    )
+    return {'summary': summary, 'line_items': line_items, 'features': features, 'catalog_version': priced['catalog_version']}
+
+# --- Arka Plan PDF Üretimi ---
+# PDF'ler Streamlit betiğini bloklamadan, süreç genelinde paylaşılan bir iş parçacığı
+# havuzunda üretilir. Müşteri teklifi hesaplama anında sıraya girer, böylece tablolar
+# gösterilirken hazırlanır; dahili rapor ve satış sözleşmesi yalnızca indirme
+# butonuna tıklanınca üretilir. Her belge için bir Future saklanır; arayüz bu
+# Future'ların durumunu gösterir. PDF_EAGER_RENDER: 'proposal' (varsayılan),
+# 'all' (tüm belgeler, CPU'su bol sunucular için) veya '0' (yalnızca tıklamayla).
+PDF_RENDER_WORKERS = int(os.environ.get("PDF_RENDER_WORKERS", "4")) # ZIP indirmede bir teklifin tüm belgeleri (en fazla 4) aynı anda sıraya girer
+PDF_EAGER_RENDER = os.environ.get("PDF_EAGER_RENDER", "proposal")
+PDF_STATUS_POLL_SECONDS = 0.5
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+def get_render_pool():
+    """PDF üretim havuzunu ilk kullanımda oluşturur ve döndürür."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ThreadPoolExecutor(max_workers=PDF_RENDER_WORKERS, thread_name_prefix="pdf-render")
+        return _render_pool
+
+def request_quote_pdf(document, quote_result):
+    """Belgenin üretim işini (henüz yoksa) havuza gönderir ve Future nesnesini döndürür."""
+    pool = get_render_pool()
+    with _render_pool_lock:
+        future = quote_result['pdf_jobs'].get(document)
+        if future is None:
+            future = pool.submit(render_quote_pdf, document, quote_result)
+            quote_result['pdf_jobs'][document] = future
+    return future
+
+def eager_documents(pdf_language):
+    """Hesaplama anında sıraya girecek belgeleri PDF_EAGER_RENDER ayarına göre döndürür."""
+    if PDF_EAGER_RENDER in ('all', '1'):
+        return quote_documents(pdf_language)
+    if PDF_EAGER_RENDER == 'proposal':
+        return list(PROPOSAL_DOCUMENTS[pdf_language])
+    return []
+
+def pdf_job_status(future):
+    """Future durumunu arayüzde gösterilecek kısa Türkçe metne çevirir (None: henüz istenmedi)."""
+    if future is None:
+        return "İndirmede hazırlanır"
+    if future.done():
+        return "Hata" if future.exception() is not None else "Hazır"
+    return "Hazırlanıyor" if future.running() else "Sırada"
+
+def lazy_quote_pdf(document, quote_result):
+    """
+    İndirme butonuna verilecek çağrılabilir nesneyi döndürür. Belge henüz bitmediyse
+    tıklama anında arka plan işini bekler (veya başlatır). Çağrı Streamlit betiğinin
+    dışında ayrı bir iş parçacığında çalışır; bu yüzden st.session_state kullanılmaz.
+    """
+    def _build():
+        return request_quote_pdf(document, quote_result).result()
+    return _build
+
+def lazy_quote_bundle_zip(documents, quote_result, file_stem):
+    """Tüm belgeleri tek ZIP olarak indiren çağrılabilir nesne; belgeler arka plan işlerinden sırayla alınır."""
+    def _build():
+        return quote_bundle_zip(
+            (quote_file_name(document, file_stem), request_quote_pdf(document, quote_result).result())
+            for document in documents
+        )
+    return _build
+
+def show_pdf_downloads(quote_result, documents):
+    """
+    İndirme bölümünü bir fragment olarak çizer. Sıradaki veya üretilen belge varsa
+    fragment PDF_STATUS_POLL_SECONDS aralıkla yalnızca kendini yeniler; tüm işler
+    bitince zamanlayıcı bir sonraki tam çalıştırmada kaldırılır. Burada yeni iş
+    başlatılmaz; hesaplamada sıraya girmeyen belgeler indirme tıklamasıyla üretilir.
+    """
+    pending = any(not future.done() for future in list(quote_result['pdf_jobs'].values()))
+    quote_result['pdf_polling'] = pending
+    st.fragment(_pdf_downloads_fragment, run_every=PDF_STATUS_POLL_SECONDS if pending else None)(quote_result, documents)
+
+def _pdf_downloads_fragment(quote_result, documents):
+    """Belgelerin üretim durumunu gösterir ve bitenleri indirmeye sunar."""
+    quote = quote_result['quote']
+    customer_file_part = clean_invisible_chars(quote['customer_info']['name'].replace(' ', '_'))
+    file_stem = f"{customer_file_part}_{quote_result['timestamp']}"
+    pending = False
+    failed = False
+
+    for column, document in zip(st.columns(len(documents)), documents):
+        label = QUOTE_DOCUMENTS[document][0]
+        future = quote_result['pdf_jobs'].get(document)
+        status = pdf_job_status(future)
+        with column:
+            if status == "Hata":
+                st.error(clean_invisible_chars(f"{label}: PDF oluşturulamadı ({future.exception()})"))
+                failed = True
+                continue
+            pending = pending or (future is not None and not future.done())
+            st.download_button(
+                label=clean_invisible_chars(label),
+                data=lazy_quote_pdf(document, quote_result),
+                file_name=quote_file_name(document, file_stem),
+                mime="application/pdf",
+                on_click="ignore", # İndirme sayfayı yeniden çalıştırmaz
+                key=f"download_{document}"
+            )
+            st.caption(clean_invisible_chars(f"Durum: {status}"))
+
+    customer_documents = [document for document in documents if document not in INTERNAL_DOCUMENTS]
+    if not failed and customer_documents:
+        st.download_button(
+            label="Müşteri Paketini İndir (ZIP)",
+            data=lazy_quote_bundle_zip(customer_documents, quote_result, file_stem),
+            file_name=f"Quote_Pack_{file_stem}.zip",
+            mime="application/zip",
+            on_click="ignore",
+            key="download_bundle"
+        )
+
+    cache_stats = pdf_cache.stats()
+    st.caption(clean_invisible_chars(
+        f"PDF önbelleği: {cache_stats['hits']} isabet / {cache_stats['misses']} ıskalama, "
+        f"{cache_stats['entries']} belge, {cache_stats['bytes'] / (1024 * 1024):.1f} / {cache_stats['max_bytes'] / (1024 * 1024):.0f} MB"
+    ))
+
+    if not pending and quote_result.get('pdf_polling'):
+        # Tüm belgeler hazır: yenileme zamanlayıcısını kaldırmak için uygulamayı bir kez yeniden çalıştır
+        quote_result['pdf_polling'] = False
+        st.rerun()
+
+def show_timing_panel(quote_result):
+    """Kenar çubuğunda son hesaplamanın ve PDF'lerin aşama sürelerini gösterir."""
+    import pandas as pd
+    with st.sidebar.expander("Aşama Süreleri (ms)", expanded=True):
+        if not quote_result:
+            st.caption("Henüz hesaplama yapılmadı.")
+            return
+        timings = dict(quote_result['timings']) # PDF kayıtları arka plan iş parçacıklarından eklenir
+        for name, record in timings.items():
+            title = "Hesaplama" if name == 'submit' else QUOTE_DOCUMENTS[name][1]
+            suffix = " (önbellekten)" if record.get('cache_hit') else ""
+            st.markdown(f"**{title}** — toplam {record['total_ms']:.1f} ms{suffix}")
+            if 'recomputed_nodes' in record:
+                st.caption(f"Yeniden hesaplanan maliyet düğümü: {record['recomputed_nodes']}/{len(COST_GRAPH['nodes'])}")
+            st.dataframe(
+                pd.DataFrame(record['stages'].items(), columns=['Aşama', 'ms']).set_index('Aşama'),
+                width="stretch",
+            )
+        if quote_result.get('restored'):
+            st.caption("Teklif depodan açıldı; hesaplama yapılmadı.")
+        for document, future in list(quote_result['pdf_jobs'].items()):
+            if document not in timings:
+                status = "depodan" if future.done() else "hazırlanıyor..."
+                st.caption(f"{QUOTE_DOCUMENTS[document][1]}: {status}")
+
+def _sweep_axis(label, current, low, high, key):
+    """Tarama ekseni için (en küçük, en büyük) aralık ve adım girdilerini gösterir; değer listesini döndürür."""
+    current = min(max(current, low), high)
+    col_range, col_step = st.columns([3, 1])
+    start, stop = col_range.slider(label, min_value=low, max_value=high, value=(max(low, current - 1.0), min(high, current + 1.0)), step=0.1, key=f"{key}_range")
+    step = col_step.number_input("Adım (m)", min_value=0.1, value=0.5, step=0.1, key=f"{key}_step")
+    count = int(round((stop - start) / step)) + 1
+    return [round(start + i * step, 2) for i in range(count) if start + i * step <= stop + 1e-9]
+
+def show_price_sweep():
+    """
+    Boyut ve kar oranı aralıklarındaki tüm senaryoların KDV dahil fiyatını tek
+    vektörel geçişte hesaplar (pricing_engine.price_sweep) ve ısı haritası/tablo
+    olarak gösterir. Diğer girdiler formdaki güncel değerlerden alınır.
+    """
+    with st.expander("Fiyat Taraması (Boyut ve Kar Oranı Senaryoları)"):
+        with st.form("price_sweep_form"):
+            widths = _sweep_axis("Genişlik aralığı (m):", float(st.session_state.width_val), 2.0, 30.0, "sweep_width")
+            lengths = _sweep_axis("Uzunluk aralığı (m):", float(st.session_state.length_val), 2.0, 30.0, "sweep_length")
+            height_options = sorted({2.4, 2.6, 2.8, 3.0, round(float(st.session_state.height_val), 2)})
+            heights = st.multiselect("Yükseklikler (m):", height_options, default=[round(float(st.session_state.height_val), 2)], key="sweep_heights")
+            profit_rate_options = [(clean_invisible_chars(f'{i}%'), i/100) for i in range(5, 45, 5)]
+            profit_rates = st.multiselect("Kar oranları:", profit_rate_options, default=[tuple(st.session_state.profit_rate)], format_func=lambda x: x[0], key="sweep_profit_rates")
+            run_sweep = st.form_submit_button("Taramayı Hesapla")
+
+        if run_sweep:
+            import pricing_engine
+            base = {key: st.session_state[key] for key in pricing_engine.INPUT_DEFAULTS if key in st.session_state}
+            try:
+                with stage_timing.trace('price_sweep') as sweep_timing:
+                    sweep = pricing_engine.price_sweep(widths, lengths, heights, [rate for _, rate in profit_rates], base=base)
+            except ValueError as e:
+                st.warning(str(e))
+                return
+            sweep['elapsed_ms'] = sweep_timing['total_ms']
+            st.session_state.price_sweep_result = sweep
+
+        sweep = st.session_state.get('price_sweep_result')
+        if not sweep:
+            return
+        import altair as alt
+        grid = sweep['grid']
+        st.caption(f"{len(grid)} senaryo {sweep['elapsed_ms']:.1f} ms içinde hesaplandı (fiyat kataloğu {sweep['catalog_version']}). Fiyatlar KDV dahil, solar hariçtir.")
+
+        # Isı haritası tek bir yükseklik ve kar oranı için genişlik x uzunluk fiyatlarını gösterir
+        col_height, col_rate = st.columns(2)
+        height = col_height.selectbox("Yükseklik (m):", sorted(grid['height'].unique()), key="sweep_view_height")
+        rate = col_rate.selectbox("Kar oranı:", sorted(grid['profit_rate'].unique()), format_func=lambda x: f"{x*100:.0f}%", key="sweep_view_rate")
+        view = grid[(grid['height'] == height) & (grid['profit_rate'] == rate)]
+        heatmap = alt.Chart(view).mark_rect().encode(
+            x=alt.X('width:O', title='Genişlik (m)'),
+            y=alt.Y('length:O', title='Uzunluk (m)'),
+            color=alt.Color('final_sales_price:Q', title='Fiyat (€)', scale=alt.Scale(scheme='blues')),
+            tooltip=['width', 'length', 'floor_area', alt.Tooltip('final_sales_price:Q', format=',.2f')],
+        )
+        st.altair_chart(heatmap, width="stretch")
+        pivot = view.pivot(index='length', columns='width', values='final_sales_price')
+        st.dataframe(pivot.style.format("€{:,.0f}"), width="stretch")
+
+def show_package_comparison():
+    """Tüm paketleri güncel boyutlar için yan yana fiyatlandırır; toplamları, kalem farklarını ve paket içeriklerini gösterir."""
+    with st.expander("Paket Karşılaştırması (Tüm Aether Living Paketleri)"):
+        st.caption("Paket içerikleri her kolonda o pakete göre fiyatlandırılır; boyutlar, yapı tipi, kaynak, kar oranı ve paket dışı seçenekler formdaki güncel değerlerden alınır. Paket seçimi değiştirilmez.")
+        if st.button("Tüm Paketleri Karşılaştır", key="compare_packages_button"):
+            import pricing_engine # İlk içe aktarma (NumPy/pandas) ölçülen süreye dahil edilmesin
+            inputs = {key: st.session_state[key] for key in SESSION_STATE_DEFAULTS if key != 'logo_data_b64_global'}
+            with stage_timing.trace('package_comparison') as comparison_timing:
+                comparison = compare_packages(inputs)
+            comparison['elapsed_ms'] = comparison_timing['total_ms']
+            comparison['dimensions'] = (inputs['width_val'], inputs['length_val'], inputs['height_val'])
+            st.session_state.package_comparison = comparison
+
+        comparison = st.session_state.get('package_comparison')
+        if not comparison:
+            return
+        width, length, height = comparison['dimensions']
+        st.caption(f"{width} x {length} x {height} m için {len(PACKAGE_CHOICES)} seçenek {comparison['elapsed_ms']:.1f} ms içinde hesaplandı (fiyat kataloğu {comparison['catalog_version']}).")
+        st.dataframe(comparison['summary'].style.format(format_currency), width="stretch")
+
+        st.markdown("**Maliyet Kalemleri (Toplam €)**")
+        line_items = comparison['line_items']
+        st.dataframe(
+            line_items.style.format(format_currency).apply(
+                lambda row: ['background-color: #fff3cd' if row['Fark'] else '' for _ in row], axis=1
+            ),
+            width="stretch",
+        )
+
+        st.markdown("**Paket İçerikleri (farklı olan seçenekler)**")
+        features = comparison['features'].map(lambda value: ('✓' if value else '–') if isinstance(value, bool) else str(value))
+        st.dataframe(features, width="stretch")
+
+# --- Kayıtlı Teklifler ---
+# Her hesaplama quote_store ile SQLite'a yazılır. Açılan teklif girdileri forma,
+# sonuçları ve kayıtlı PDF'leri quote_result'a geri yükler; hesaplama ve PDF
+# üretimi tekrarlanmaz (depoda olmayan belgeler ilk istekte üretilip eklenir).
+FORM_WIDGET_KEY_SUFFIXES = ('_input', '_checkbox', '_cb', '_select', '_radio', '_textarea', '_display') # Ana formdaki widget anahtarları
+
+def stored_quote_inputs(inputs):
+    """Depodaki girdileri session_state biçimine çevirir (JSON listeleri -> demet, eksik anahtarlar -> varsayılan)."""
+    restored = {}
+    for key, default in SESSION_STATE_DEFAULTS.items():
+        if key == 'logo_data_b64_global':
+            continue
+        value = inputs.get(key, default)
+        restored[key] = tuple(value) if isinstance(default, tuple) and isinstance(value, list) else value
+    return restored
+
+def quote_result_from_store(record, inputs, logo_data_b64=None):
+    """quote_store.load_quote() kaydından, yeni hesaplamanın ürettiğiyle aynı yapıda quote_result oluşturur."""
+    import pandas as pd
+    quote = {
+        **record['quote'],
+        'catalog_version': record['catalog_version'],
+        'cost_results': {**record['totals'], 'costs_df': pd.DataFrame(record['line_items'])},
+        'cost_graph_state': None, # Sonraki hesaplama tüm maliyet grafiğini yeniden değerlendirir
+    }
+    pdf_jobs = {}
+    for document, pdf_bytes in record['pdfs'].items():
+        if document in QUOTE_DOCUMENTS:
+            future = Future()
+            future.set_result(bytes(pdf_bytes))
+            pdf_jobs[document] = future
+    return {
+        'quote': quote,
+        'profit_rate_label': inputs['profit_rate'][0],
+        'pdf_language': record['pdf_language'],
+        'logo_data_b64': logo_data_b64,
+        'timestamp': record['quote_label'],
+        'pdf_jobs': pdf_jobs,
+        'timings': {},
+        'store_id': record['id'],
+        'restored': True,
+    }
+
+def open_saved_quote(quote_id):
+    """
+    Buton geri çağrısı: kayıtlı teklifi forma ve sonuçlara yükler. Widget'lar kendi
+    durumlarını session_state değerlerine tercih ettiğinden ana formun widget
+    durumları silinir; sonraki çalıştırmada geri yüklenen değerlerle oluşturulurlar.
+    """
+    record = quote_store.load_quote(quote_id)
+    if record is None:
+        st.session_state.saved_quote_message = f"Teklif #{quote_id} bulunamadı."
+        return
+    inputs = stored_quote_inputs(record['inputs'])
+    for key in [key for key in st.session_state if key.endswith(FORM_WIDGET_KEY_SUFFIXES) and key not in SESSION_STATE_DEFAULTS]:
+        del st.session_state[key]
+    for key, value in inputs.items():
+        st.session_state[key] = value
+    st.session_state.quote_result = quote_result_from_store(record, inputs, get_company_logo_base64(LOGO_URL))
+    st.session_state.saved_quote_message = None
+
+def show_saved_quotes():
+    """Kayıtlı teklifleri müşteri, paket, tarih ve fiyata göre arar; seçilen teklifi yeniden hesaplamadan açar."""
+    import pandas as pd
+    with st.expander("Kayıtlı Teklifler"):
+        with st.form("saved_quotes_form"):
+            col_customer, col_package = st.columns(2)
+            customer = col_customer.text_input("Müşteri adı (baş harfleri yeterli):", key="saved_quotes_customer")
+            package = col_package.selectbox("Paket:", ['Tümü', *PACKAGE_CHOICES], key="saved_quotes_package")
+            col_dates, col_min, col_max = st.columns([2, 1, 1])
+            dates = col_dates.date_input("Tarih aralığı:", value=(), key="saved_quotes_dates")
+            min_price = col_min.number_input("En düşük fiyat (€):", min_value=0.0, value=0.0, step=1000.0, key="saved_quotes_min_price")
+            max_price = col_max.number_input("En yüksek fiyat (€, 0 = sınırsız):", min_value=0.0, value=0.0, step=1000.0, key="saved_quotes_max_price")
+            search = st.form_submit_button("Ara")
+
+        if search:
+            date_from, date_to = (tuple(dates) + (None, None))[:2] if dates else (None, None)
+            try:
+                st.session_state.saved_quotes = quote_store.search_quotes(
+                    customer=customer, package=None if package == 'Tümü' else package,
+                    date_from=date_from, date_to=date_to or date_from,
+                    min_price=min_price or None, max_price=max_price or None,
+                )
+            except Exception as e:
+                st.error(f"Teklif deposu okunamadı: {e}")
+                return
+
+        if st.session_state.get('saved_quote_message'):
+            st.warning(st.session_state.saved_quote_message)
+        results = st.session_state.get('saved_quotes')
+        if results is None:
+            return
+        if not results:
+            st.caption("Filtrelere uyan kayıtlı teklif yok.")
+            return
+        if len(results) == quote_store.SEARCH_LIMIT:
+            st.caption(f"İlk {quote_store.SEARCH_LIMIT} sonuç gösteriliyor; aramayı daraltın.")
+        st.dataframe(pd.DataFrame([{
+            'No': row['id'],
+            'Tarih': row['created_at'],
+            'Müşteri': row['customer_name'],
+            'Paket': package_short_label(row['package']),
+            'Nihai Fiyat (KDV Dahil)': money.format_cents(row['final_price_cents']),
+            'Katalog': row['catalog_version'],
+            'PDF': len(row['documents']),
+        } for row in results]).set_index('No'), width="stretch")
+        labels = {row['id']: f"#{row['id']} — {row['customer_name']} ({row['created_at']})" for row in results}
+        quote_id = st.selectbox("Açılacak teklif:", list(labels), format_func=labels.get, key="saved_quote_choice")
+        st.button("Teklifi Aç", key="open_saved_quote_button", on_click=open_saved_quote, args=(quote_id,))
+
 # ==============================================================================
 # BÖLÜM 6.1: run_streamlit_app() - Uygulama Başlatma, CSS, session_state Tanımları ve Paket Varsayılanları (Kısım 1)
 # ==============================================================================
@@ -1960,401 +3052,50 @@ def run_streamlit_app():
     </style>
     """, unsafe_allow_html=True)
 
-    st.title(clean_invisible_chars("🏠 Premium Home Maliyet Hesaplayıcı"))
+    st.title("🏠 Premium Home Maliyet Hesaplayıcı")
 
     # --- Oturum Durumu Başlatma ---
-    # Tüm st.session_state anahtarları ve varsayılan değerleri
-    session_state_defaults = {
-        'customer_name': 'GENEL',
-        'customer_company': '',
-        'customer_address': '',
-        'customer_city': '',
-        'customer_phone': '',
-        'customer_email': '',
-        'customer_id_no': '',
-        'aether_package_choice': 'None',
-        'width_val': 10.0,
-        'length_val': 8.0,
-        'height_val': 2.6,
-        'structure_type': 'Light Steel',
-        'welding_type': 'Standard Welding (160€/m²)',
-        'room_config': 'Empty Model',
-        'profile_100x100_count': 0,
-        'profile_100x50_count': 0,
-        'profile_40x60_count': 0,
-        'profile_50x50_count': 0,
-        'profile_120x60x5mm_count': 0,
-        'profile_HEA160_count': 0,
-        'plasterboard_interior_option': False,
-        'plasterboard_all_option': False,
-        'osb_inner_wall_option': False,
-        'facade_sandwich_panel_option': False,
-        'window_count': 4,
-        'window_size_val': "100x100 cm",
-        'sliding_door_count': 0,
-        'sliding_door_size_val': "200x200 cm",
-        'wc_window_count': 1,
-        'wc_window_size_val': "60x50 cm",
-        'wc_sliding_door_count': 0,
-        'wc_sliding_door_size_val': "140x70 cm",
-        'door_count': 2,
-        'door_size_val': "90x210 cm",
-        'window_door_color_val': 'White',
-        'kitchen_choice': 'No Kitchen',
-        'shower_wc': False,
-        'wc_ceramic': False,
-        'wc_ceramic_area': 0.0,
-        'electrical': False,
-        'plumbing': False,
-        'insulation_floor': False,
-        'skirting_length_val': 0.0,
-        'laminate_flooring_m2_val': 0.0,
-        'under_parquet_mat_m2_val': 0.0,
-        'osb2_18mm_count_val': 0,
-        'galvanized_sheet_m2_val': 0.0,
-        'insulation_material_type': 'Stone Wool', # Yeni yalıtım tipi
-        'insulation_wall': False,
-        'transportation': False,
-        'heating': False,
-        'solar': False,
-        'solar_kw': 5,
-        'wheeled_trailer': False,
-        'wheeled_trailer_price': 0.0,
-        'profit_rate': ('20%', 0.20), # Tuple olarak tanımlandı
-        'customer_notes': "",
-        'pdf_language': ('Turkish', 'tr'), # Varsayılan Türkçe
-
-        # Aether Living seçenekleri (varsayılanlar UI'dan kaldırıldı, kodda yönetilecek)
-        'exterior_cladding_m2_option': False,
-        'exterior_cladding_m2_val': 0.0,
-        'exterior_wood_cladding_m2_option': False,
-        'exterior_wood_cladding_m2_val': 0.0,
-        'porcelain_tiles_option': False,
-        'porcelain_tiles_m2_val': 0.0,
-        'concrete_panel_floor_option': False,
-        'concrete_panel_floor_m2_val': 0.0,
-        'bedroom_set_option': False,
-        'sofa_option': False,
-        'smart_home_systems_option': False,
-        'security_camera_option': False,
-        'security_camera_count': 1, # Default 1 adet kamera için
-        'white_goods_fridge_tv_option': False,
-        'premium_faucets_option': False,
-        'integrated_fridge_option': False,
-        'designer_furniture_option': False,
-        'italian_sofa_option': False,
-        'inclass_chairs_option': False,
-        'inclass_chairs_count': 0,
-        'brushed_granite_countertops_option': False,
-        'brushed_granite_countertops_m2_val': 0.0,
-        'terrace_laminated_wood_flooring_option': False,
-        'terrace_laminated_wood_flooring_m2_val': 0.0,
-        
-        # Logo verisini bir kez çekip session state'te tut
-        'logo_data_b64_global': None, 
-    }
+    # Tüm st.session_state anahtarları ve varsayılan değerleri (BÖLÜM 1.2'de tanımlı)
+    session_state_defaults = SESSION_STATE_DEFAULTS
 
     # Streamlit oturum durumunu başlat veya güncelle
     for key, default_value in session_state_defaults.items():
         if key not in st.session_state:
             st.session_state[key] = default_value
 
-    # Logo'yu uygulama başladığında bir kez çek ve session_state'e kaydet
-    if st.session_state.logo_data_b64_global is None:
-        try: # get_company_logo_base64 fonksiyonunu try-except içine al
-            # LOGO_URL, BÖLÜM 1.2'de tanımlı. Burada doğrudan kullanabiliriz.
-            st.session_state.logo_data_b64_global = get_company_logo_base64(LOGO_URL) 
-        except Exception as e:
-            st.warning(f"Logo yüklenirken hata oluştu: {e}. PDF'lerde logo gösterilemeyebilir.")
-            st.session_state.logo_data_b64_global = None # Hata durumunda None olarak ayarla
-
+    # Logo önbelleği eskiyse veya boşsa yenilemeyi şimdiden arka planda başlat (beklemez)
+    get_company_logo_base64(LOGO_URL)
+    pdf_workers.warm_up() # PDF işçi süreçleri (varsa) ilk tekliften önce hazır olsun
 
     # --- Paket seçimine göre varsayılan değerleri UI elementlerine uygula ---
     prev_aether_package_choice = st.session_state.aether_package_choice # Mevcut paket seçimini kaydet
     
-    st.sidebar.header(clean_invisible_chars("Müşteri Bilgileri (İsteğe Bağlı)"))
-    st.session_state.customer_name = st.sidebar.text_input(clean_invisible_chars("Ad Soyad:"), value=st.session_state.customer_name, key="customer_name_input")
-    st.session_state.customer_company = st.sidebar.text_input(clean_invisible_chars("Şirket:"), value=st.session_state.customer_company, key="customer_company_input")
-    st.session_state.customer_address = st.sidebar.text_input(clean_invisible_chars("Adres:"), value=st.session_state.customer_address, key="customer_address_input")
-    st.session_state.customer_city = st.sidebar.text_input(clean_invisible_chars("Şehir:"), value=st.session_state.customer_city, key="customer_city_input")
-    st.session_state.customer_phone = st.sidebar.text_input(clean_invisible_chars("Telefon:"), value=st.session_state.customer_phone, key="customer_phone_input")
-    st.session_state.customer_email = st.sidebar.text_input(clean_invisible_chars("E-posta:"), value=st.session_state.customer_email, key="customer_email_input")
-    st.session_state.customer_id_no = st.sidebar.text_input(clean_invisible_chars("Kimlik/Pasaport No:"), value=st.session_state.customer_id_no, key="customer_id_input")
-    st.sidebar.markdown(clean_invisible_chars("<div class='warning'>Not: Müşteri bilgileri zorunlu değildir. Boş bırakılırsa 'GENEL' olarak işaretlenecektir.</div>"), unsafe_allow_html=True)
-
-    st.sidebar.header(clean_invisible_chars("Paket Seçimi"))
+    st.sidebar.header("Müşteri Bilgileri (İsteğe Bağlı)")
+    st.session_state.customer_name = st.sidebar.text_input("Ad Soyad:", value=st.session_state.customer_name, key="customer_name_input")
+    st.session_state.customer_company = st.sidebar.text_input("Şirket:", value=st.session_state.customer_company, key="customer_company_input")
+    st.session_state.customer_address = st.sidebar.text_input("Adres:", value=st.session_state.customer_address, key="customer_address_input")
+    st.session_state.customer_city = st.sidebar.text_input("Şehir:", value=st.session_state.customer_city, key="customer_city_input")
+    st.session_state.customer_phone = st.sidebar.text_input("Telefon:", value=st.session_state.customer_phone, key="customer_phone_input")
+    st.session_state.customer_email = st.sidebar.text_input("E-posta:", value=st.session_state.customer_email, key="customer_email_input")
+    st.session_state.customer_id_no = st.sidebar.text_input("Kimlik/Pasaport No:", value=st.session_state.customer_id_no, key="customer_id_input")
+    st.sidebar.markdown("<div class='warning'>Not: Müşteri bilgileri zorunlu değildir. Boş bırakılırsa 'GENEL' olarak işaretlenecektir.</div>", unsafe_allow_html=True)
+
+    st.sidebar.header("Paket Seçimi")
     st.session_state.aether_package_choice = st.sidebar.selectbox(
-        clean_invisible_chars("Aether Living | Loft Serisi Paket Seçimi:"),
-        ['None', 'Aether Living | Loft Standard (BASICS)',
-         'Aether Living | Loft Premium (ESSENTIAL)',
-         'Aether Living | Loft Elite (LUXURY)'],
-        index=['None', 'Aether Living | Loft Standard (BASICS)',
-               'Aether Living | Loft Premium (ESSENTIAL)',
-               'Aether Living | Loft Elite (LUXURY)'].index(st.session_state.aether_package_choice),
+        "Aether Living | Loft Serisi Paket Seçimi:",
+        PACKAGE_CHOICES,
+        index=PACKAGE_CHOICES.index(st.session_state.aether_package_choice),
         key="aether_package_select"
     )
     
     # Paket değiştiğinde varsayılanları güncelle
     if st.session_state.aether_package_choice != prev_aether_package_choice:
-        if st.session_state.aether_package_choice == 'None':
-            # Tüm paket varsayılanlarını sıfırla, manuel girdileri koru
-            for key, default_value in session_state_defaults.items():
-                if key not in ['customer_name', 'customer_company', 'customer_address', 'customer_city', 'customer_phone', 'customer_email', 'customer_id_no', 'aether_package_choice', 'width_val', 'length_val', 'height_val', 'structure_type', 'welding_type', 'room_config', 'profit_rate', 'customer_notes', 'pdf_language', 'logo_data_b64_global']: # logo_data_b64_global'ı sıfırlama
-                    st.session_state[key] = session_state_defaults[key]
-        elif st.session_state.aether_package_choice == 'Aether Living | Loft Standard (BASICS)':
-            st.session_state.kitchen_choice = 'Standard Kitchen'
-            st.session_state.shower_wc = True
-            st.session_state.electrical = True
-            st.session_state.plumbing = True
-            st.session_state.insulation_floor = True
-            st.session_state.insulation_wall = True
-            st.session_state.floor_covering = 'Laminate Parquet'
-            st.session_state.heating = False
-            st.session_state.solar = False
-            st.session_state.bedroom_set_option = False
-            st.session_state.brushed_granite_countertops_option = False
-            st.session_state.terrace_laminated_wood_flooring_option = False
-            st.session_state.exterior_cladding_m2_option = False
-            st.session_state.concrete_panel_floor_option = False
-            st.session_state.premium_faucets_option = False
-            st.session_state.integrated_fridge_option = False
-            st.session_state.designer_furniture_option = False
-            st.session_state.italian_sofa_option = False
-            st.session_state.inclass_chairs_option = False
-            st.session_state.inclass_chairs_count = 0
-            st.session_state.smart_home_systems_option = False
-            st.session_state.security_camera_option = False
-            st.session_state.white_goods_fridge_tv_option = False
-            st.session_state.exterior_wood_cladding_m2_option = False
-            st.session_state.porcelain_tiles_option = False
-            st.session_state.plasterboard_interior_option = True 
-            st.session_state.plasterboard_all_option = False
-            st.session_state.osb_inner_wall_option = True
-            st.session_state.facade_sandwich_panel_option = False
-
-        elif st.session_state.aether_package_choice == 'Aether Living | Loft Premium (ESSENTIAL)':
-            st.session_state.kitchen_choice = 'Standard Kitchen'
-            st.session_state.shower_wc = True
-            st.session_state.electrical = True
-            st.session_state.plumbing = True
-            st.session_state.insulation_floor = True
-            st.session_state.insulation_wall = True
-            st.session_state.floor_covering = 'Laminate Parquet'
-            st.session_state.heating = False
-            st.session_state.solar = False
-            st.session_state.bedroom_set_option = True
-            st.session_state.brushed_granite_countertops_option = True
-            st.session_state.terrace_laminated_wood_flooring_option = True 
-            st.session_state.exterior_cladding_m2_option = False
-            st.session_state.concrete_panel_floor_option = False
-            st.session_state.premium_faucets_option = False
-            st.session_state.integrated_fridge_option = False
-            st.session_state.designer_furniture_option = False
-            st.session_state.italian_sofa_option = False
-            st.session_state.inclass_chairs_option = False
-            st.session_state.inclass_chairs_count = 0
-            st.session_state.smart_home_systems_option = False
-            st.session_state.security_camera_option = False
-            st.session_state.white_goods_fridge_tv_option = False
-            st.session_state.exterior_wood_cladding_m2_option = False
-            st.session_state.porcelain_tiles_option = False
-            st.session_state.plasterboard_interior_option = True
-            st.session_state.plasterboard_all_option = False
-            st.session_state.osb_inner_wall_option = True
-            st.session_state.facade_sandwich_panel_option = False
-
-        elif st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)':
-            st.session_state.kitchen_choice = 'Special Design Kitchen'
-            st.session_state.shower_wc = True
-            st.session_state.electrical = True
-            st.session_state.plumbing = True
-            st.session_state.insulation_floor = True
-            st.session_state.insulation_wall = True
-            st.session_state.floor_covering = 'Ceramic'
-            st.session_state.heating = True
-            st.session_state.solar = True
-            st.session_state.bedroom_set_option = True
-            st.session_state.brushed_granite_countertops_option = True
-            st.session_state.terrace_laminated_wood_flooring_option = True
-            st.session_state.exterior_cladding_m2_option = True 
-            st.session_state.concrete_panel_floor_option = True
-            st.session_state.premium_faucets_option = True
-            st.session_state.integrated_fridge_option = True
-            st.session_state.designer_furniture_option = True
-            st.session_state.italian_sofa_option = True
-            st.session_state.inclass_chairs_option = True
-            st.session_state.inclass_chairs_count = 1 
-            st.session_state.smart_home_systems_option = True
-            st.session_state.security_camera_option = True
-            st.session_state.white_goods_fridge_tv_option = True
-            st.session_state.exterior_wood_cladding_m2_option = False
-            st.session_state.porcelain_tiles_option = True 
-            st.session_state.plasterboard_all_option = True 
-            st.session_state.osb_inner_wall_option = True
-            st.session_state.facade_sandwich_panel_option = True
+        # 'None' tüm paket varsayılanlarını sıfırlar, manuel girdiler (PACKAGE_RESET_PRESERVED_KEYS) korunur
+        for key, value in package_updates(st.session_state.aether_package_choice).items():
+            st.session_state[key] = value
 
         st.rerun()
     
-    # --- Ana Form ---
-    with st.form(clean_invisible_chars("main_form")): 
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(clean_invisible_chars("<div class='section-title'>BOYUTLAR</div>"), unsafe_allow_html=True)
-            _temp_width_val = st.session_state.width_val
-            st.session_state.width_val = st.number_input(clean_invisible_chars("Genişlik (m):"), value=_temp_width_val, step=0.1, key="width_input")
-            
-            _temp_length_val = st.session_state.length_val
-            st.session_state.length_val = st.number_input(clean_invisible_chars("Uzunluk (m):"), value=_temp_length_val, step=0.1, key="length_input")
-            
-            _temp_height_val = st.session_state.height_val
-            st.session_state.height_val = st.number_input(clean_invisible_chars("Yükseklik (m):"), value=_temp_height_val, step=0.1, key="height_input")
-
-            st.markdown(clean_invisible_chars("<div class='section-title'>YAPI</div>"), unsafe_allow_html=True)
-            _temp_structure_type = st.session_state.structure_type
-            st.session_state.structure_type = st.radio(clean_invisible_chars("Yapı Tipi:"), ['Light Steel', 'Heavy Steel'], index=['Light Steel', 'Heavy Steel'].index(_temp_structure_type), key="structure_type_radio")
-            
-            _temp_welding_type = st.session_state.welding_type
-            st.session_state.welding_type = st.selectbox(clean_invisible_chars("Çelik Kaynak İşçiliği:"), ['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'], index=['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'].index(_temp_welding_type), key="welding_labor_select")
-
-            plasterboard_interior_disabled = (st.session_state.structure_type == 'Heavy Steel')
-            plasterboard_all_disabled = (st.session_state.structure_type == 'Light Steel')
-
-            _temp_plasterboard_interior_option = st.session_state.plasterboard_interior_option
-            st.session_state.plasterboard_interior_option = st.checkbox(clean_invisible_chars("İç Alçıpan Dahil Et"), value=_temp_plasterboard_interior_option, disabled=plasterboard_interior_disabled, key="pb_int_checkbox")
-            
-            _temp_plasterboard_all_option = st.session_state.plasterboard_all_option
-            st.session_state.plasterboard_all_option = st.checkbox(clean_invisible_chars("İç ve Dış Alçıpan Dahil Et"), value=_temp_plasterboard_all_option, disabled=plasterboard_all_disabled, key="pb_all_checkbox")
-
-            osb_inner_wall_disabled = not (st.session_state.plasterboard_interior_option or st.session_state.plasterboard_all_option)
-            _temp_osb_inner_wall_option = st.session_state.osb_inner_wall_option
-            st.session_state.osb_inner_wall_option = st.checkbox(clean_invisible_chars("İç Duvar OSB Malzemesi Dahil Et"), value=_temp_osb_inner_wall_option, disabled=osb_inner_wall_disabled, key="osb_inner_checkbox")
-
-            facade_sandwich_panel_disabled = (st.session_state.structure_type == 'Light Steel')
-            _temp_facade_sandwich_panel_option = st.session_state.facade_sandwich_panel_option
-            st.session_state.facade_sandwich_panel_option = st.checkbox(clean_invisible_chars("Dış Cephe Sandviç Panel Dahil Et (Ağır Çelik için)"), value=_temp_facade_sandwich_panel_option, disabled=facade_sandwich_panel_disabled, key="facade_panel_checkbox")
-            
-        with col2:
-            st.markdown(clean_invisible_chars("<div class='section-title'>KONFİGÜRASYON</div>"), unsafe_allow_html=True)
-            _temp_room_config = st.session_state.room_config
-            st.session_state.room_config = st.selectbox(
-                clean_invisible_chars("Oda Konfigürasyonu:"),
-                ['Empty Model', '1 Room', '1 Room + Shower / WC', '1 Room + Kitchen',
-                 '1 Room + Kitchen + WC', '1 Room + Shower / WC + Kitchen',
-                 '2 Rooms + Shower / WC + Kitchen', '3 Rooms + 2 Showers / WC + Kitchen'],
-                index=['Empty Model', '1 Room', '1 Room + Shower / WC', '1 Room + Kitchen',
-                       '1 Room + Kitchen + WC', '1 Room + Shower / WC + Kitchen',
-                       '2 Rooms + Shower / WC + Kitchen', '3 Rooms + 2 Showers / WC + Kitchen'].index(_temp_room_config),
-                key="room_config_select"
-            )
-            
-            _temp_kitchen_choice = st.session_state.kitchen_choice
-            st.session_state.kitchen_choice = st.radio(clean_invisible_chars("Mutfak Tipi Seçimi:"), ['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'], index=['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'].index(_temp_kitchen_choice), key="kitchen_type_radio_select")
-            
-            _temp_floor_covering = st.session_state.floor_covering
-            st.session_state.floor_covering = st.selectbox(
-                clean_invisible_chars("Zemin Kaplama Tipi:"),
-                ['Laminate Parquet', 'Ceramic'],
-                index=['Laminate Parquet', 'Ceramic'].index(_temp_floor_covering),
-                key="floor_covering_select"
-            )
-
-            st.markdown(clean_invisible_chars("---"), unsafe_allow_html=True)
-            st.subheader(clean_invisible_chars("Yalıtım Türleri"))
-            _temp_insulation_material_type = st.session_state.insulation_material_type
-            st.session_state.insulation_material_type = st.radio(
-                clean_invisible_chars("Yalıtım Malzemesi Tipi:"),
-                options=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'],
-                index=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'].index(_temp_insulation_material_type) if _temp_insulation_material_type in ['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'] else 0,
-                key="insulation_material_select"
-            )
-
-            if st.session_state.insulation_material_type == 'Yalıtım Yapılmayacak':
-                if st.session_state.insulation_floor: 
-                    st.session_state.insulation_floor = False
-                if st.session_state.insulation_wall: 
-                    st.session_state.insulation_wall = False
-                st.warning(clean_invisible_chars("Yalıtım yapılmayacak seçildiği için zemin ve duvar yalıtım seçenekleri devre dışı bırakıldı."))
-
-        st.markdown(clean_invisible_chars("<div class='section-title'>ÇELİK PROFİL MİKTARLARI (Hafif Çelik için)</div>"), unsafe_allow_html=True)
-        st.markdown(clean_invisible_chars("<b>(Her 6m parça için - manuel olarak girin, aksi takdirde otomatik hesaplanır)</b>"), unsafe_allow_html=True)
-
-        steel_profile_disabled = (st.session_state.structure_type == 'Heavy Steel')
-
-        col3, col4, col5 = st.columns(3)
-        with col3:
-            _temp_profile_100x100_count = st.session_state.profile_100x100_count
-            st.session_state.profile_100x100_count = st.number_input(clean_invisible_chars("100x100x3 Adet:"), value=_temp_profile_100x100_count, min_value=0, disabled=steel_profile_disabled, key="p100x100_input")
-        with col4:
-            _temp_profile_100x50_count = st.session_state.profile_100x50_count
-            st.session_state.profile_100x50_count = st.number_input(clean_invisible_chars("100x50x3 Adet:"), value=_temp_profile_100x50_count, min_value=0, disabled=steel_profile_disabled, key="p100x50_input")
-        with col5:
-            _temp_profile_40x60_count = st.session_state.profile_40x60_count
-            st.session_state.profile_40x60_count = st.number_input(clean_invisible_chars("40x60x2 Adet:"), value=_temp_profile_40x60_count, min_value=0, disabled=steel_profile_disabled, key="p40x60_input")
-
-        col6, col7, col8 = st.columns(3)
-        with col6:
-            _temp_profile_50x50_count = st.session_state.profile_50x50_count
-            st.session_state.profile_50x50_count = st.number_input(clean_invisible_chars("50x50x2 Adet:"), value=_temp_profile_50x50_count, min_value=0, disabled=steel_profile_disabled, key="p50x50_input")
-        with col7:
-            _temp_profile_120x60x5mm_count = st.session_state.profile_120x60x5mm_count
-            st.session_state.profile_120x60x5mm_count = st.number_input(clean_invisible_chars("120x60x5mm Adet:"), value=_temp_profile_120x60x5mm_count, min_value=0, disabled=steel_profile_disabled, key="p120x60x5mm_input")
-        with col8:
-            _temp_profile_HEA160_count = st.session_state.profile_HEA160_count
-            st.session_state.profile_HEA160_count = st.number_input(clean_invisible_chars("HEA160 Adet:"), value=_temp_profile_HEA160_count, min_value=0, disabled=steel_profile_disabled, key="pHEA160_input")
-
-
-        st.markdown(clean_invisible_chars("<div class='section-title'>PENCERELER VE KAPILAR</div>"), unsafe_allow_html=True)
-        col9, col10, col11 = st.columns(3)
-        with col9:
-            _temp_window_count = st.session_state.window_count
-            st.session_state.window_count = st.number_input(clean_invisible_chars("Pencere Adedi:"), value=_temp_window_count, min_value=0, key="window_count_input")
-        with col10:
-            _temp_window_size = st.session_state.window_size_val
-            st.session_state.window_size_val = st.text_input(clean_invisible_chars("Pencere Boyutu:"), value=_temp_window_size, key="window_size_input")
-        with col11:
-            _temp_window_door_color = st.session_state.window_door_color_val
-            st.session_state.window_door_color_val = st.selectbox(clean_invisible_chars("Pencere/Kapı Rengi:"), ['White', 'Black', 'Grey'], index=['White', 'Black', 'Grey'].index(_temp_window_door_color), key="window_door_color_select")
-
-        col_door1, col_door2, col_door3 = st.columns(3)
-        with col_door1:
-            _temp_sliding_door_count = st.session_state.sliding_door_count
-            st.session_state.sliding_door_count = st.number_input(clean_invisible_chars("Sürme Cam Kapı Adedi:"), value=_temp_sliding_door_count, min_value=0, key="sliding_door_count_input")
-        with col_door2:
-            _temp_sliding_door_size = st.session_state.sliding_door_size_val
-            st.session_state.sliding_door_size_val = st.text_input(clean_invisible_chars("Sürme Kapı Boyutu:"), value=_temp_sliding_door_size, key="sliding_door_size_input")
-        with col_door3:
-            pass
-
-        col_wc_win1, col_wc_win2, col_wc_win3 = st.columns(3)
-        with col_wc_win1:
-            _temp_wc_window_count = st.session_state.wc_window_count
-            st.session_state.wc_window_count = st.number_input(clean_invisible_chars("WC Pencere Adedi:"), value=_temp_wc_window_count, min_value=0, key="wc_window_count_input")
-        with col_wc_win2:
-            _temp_wc_window_size = st.session_state.wc_window_size_val
-            st.session_state.wc_window_size_val = st.text_input(clean_invisible_chars("WC Pencere Boyutu:"), value=_temp_wc_window_size, key="wc_window_size_input")
-        with col_wc_win3:
-            pass
-
-        col_wc_slid1, col_wc_slid2, col_wc_slid3 = st.columns(3)
-        with col_wc_slid1:
-            _temp_wc_sliding_door_count = st.session_state.wc_sliding_door_count
-            st.session_state.wc_sliding_door_count = st.number_input(clean_invisible_chars("WC Sürme Kapı Adedi:"), value=_temp_wc_sliding_door_count, min_value=0, key="wc_sliding_door_count_input")
-        with col_wc_slid2:
-            _temp_wc_sliding_door_size = st.session_state.wc_sliding_door_size_val
-            st.session_state.wc_sliding_door_size_val = st.text_input(clean_invisible_chars("WC Sürme Kapı Boyutu:"), value=_temp_wc_sliding_door_size, key="wc_sliding_door_size_input")
-        with col_wc_slid3:
-            pass
-        
-        col_door_main1, col_door_main2, col_door_main3 = st.columns(3)
-        with col_door_main1:
-            _temp_door_count = st.session_state.door_count
-            st.session_state.door_count = st.number_input(clean_invisible_chars("Ana Kapı Adedi:"), value=_temp_door_count, min_value=0, key="door_count_input")
-        with col_door_main2:
-            _temp_door_size = st.session_state.door_size_val
-            st.session_state.door_size_val = st.text_input(clean_invisible_chars("Ana Kapı Boyutu:"), value=_temp_door_size, key="door_size_input")
-        with col_door_main3:
-            pass
 # ==============================================================================
 # BÖLÜM 6.2: run_streamlit_app() - Paket Varsayılanlarının session_state'e Atanması ve Ana UI Formunun Başlangıcı
 # ==============================================================================
@@ -2523,51 +3264,54 @@ def run_streamlit_app():
     st.session_state.solar_kw = _solar_capacity_default_val # Solar kapasite de güncellendi
     st.session_state.insulation_material_type = _insulation_material_type_default_val # Yalıtım malzeme tipi de güncellendi
 
+# ==============================================================================
+# BÖLÜM 7: run_streamlit_app() - Kullanıcı Arayüzü Girişleri (Müşteri, Boyutlar, Yapı, Çelik Profiller, Kapılar/Pencereler)
+# ==============================================================================
 
     # --- Ana Form ---
-    with st.form(clean_invisible_chars("main_form")): 
+    with st.form("main_form"): 
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown(clean_invisible_chars("<div class='section-title'>BOYUTLAR</div>"), unsafe_allow_html=True)
+            st.markdown("<div class='section-title'>BOYUTLAR</div>", unsafe_allow_html=True)
             _temp_width_val = st.session_state.width_val
-            st.session_state.width_val = st.number_input(clean_invisible_chars("Genişlik (m):"), value=_temp_width_val, step=0.1, key="width_input")
+            st.session_state.width_val = st.number_input("Genişlik (m):", value=_temp_width_val, step=0.1, key="width_input")
             
             _temp_length_val = st.session_state.length_val
-            st.session_state.length_val = st.number_input(clean_invisible_chars("Uzunluk (m):"), value=_temp_length_val, step=0.1, key="length_input")
+            st.session_state.length_val = st.number_input("Uzunluk (m):", value=_temp_length_val, step=0.1, key="length_input")
             
             _temp_height_val = st.session_state.height_val
-            st.session_state.height_val = st.number_input(clean_invisible_chars("Yükseklik (m):"), value=_temp_height_val, step=0.1, key="height_input")
+            st.session_state.height_val = st.number_input("Yükseklik (m):", value=_temp_height_val, step=0.1, key="height_input")
 
-            st.markdown(clean_invisible_chars("<div class='section-title'>YAPI</div>"), unsafe_allow_html=True)
+            st.markdown("<div class='section-title'>YAPI</div>", unsafe_allow_html=True)
             _temp_structure_type = st.session_state.structure_type
-            st.session_state.structure_type = st.radio(clean_invisible_chars("Yapı Tipi:"), ['Light Steel', 'Heavy Steel'], index=['Light Steel', 'Heavy Steel'].index(_temp_structure_type), key="structure_type_radio")
+            st.session_state.structure_type = st.radio("Yapı Tipi:", ['Light Steel', 'Heavy Steel'], index=['Light Steel', 'Heavy Steel'].index(_temp_structure_type), key="structure_type_radio")
             
             _temp_welding_type = st.session_state.welding_type
-            st.session_state.welding_type = st.selectbox(clean_invisible_chars("Çelik Kaynak İşçiliği:"), ['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'], index=['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'].index(_temp_welding_type), key="welding_labor_select")
+            st.session_state.welding_type = st.selectbox("Çelik Kaynak İşçiliği:", ['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'], index=['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'].index(_temp_welding_type), key="welding_labor_select")
 
             plasterboard_interior_disabled = (st.session_state.structure_type == 'Heavy Steel')
             plasterboard_all_disabled = (st.session_state.structure_type == 'Light Steel')
 
             _temp_plasterboard_interior_option = st.session_state.plasterboard_interior_option
-            st.session_state.plasterboard_interior_option = st.checkbox(clean_invisible_chars("İç Alçıpan Dahil Et"), value=_temp_plasterboard_interior_option, disabled=plasterboard_interior_disabled, key="pb_int_checkbox")
+            st.session_state.plasterboard_interior_option = st.checkbox("İç Alçıpan Dahil Et", value=_temp_plasterboard_interior_option, disabled=plasterboard_interior_disabled, key="pb_int_checkbox")
             
             _temp_plasterboard_all_option = st.session_state.plasterboard_all_option
-            st.session_state.plasterboard_all_option = st.checkbox(clean_invisible_chars("İç ve Dış Alçıpan Dahil Et"), value=_temp_plasterboard_all_option, disabled=plasterboard_all_disabled, key="pb_all_checkbox")
+            st.session_state.plasterboard_all_option = st.checkbox("İç ve Dış Alçıpan Dahil Et", value=_temp_plasterboard_all_option, disabled=plasterboard_all_disabled, key="pb_all_checkbox")
 
             osb_inner_wall_disabled = not (st.session_state.plasterboard_interior_option or st.session_state.plasterboard_all_option)
             _temp_osb_inner_wall_option = st.session_state.osb_inner_wall_option
-            st.session_state.osb_inner_wall_option = st.checkbox(clean_invisible_chars("İç Duvar OSB Malzemesi Dahil Et"), value=_temp_osb_inner_wall_option, disabled=osb_inner_wall_disabled, key="osb_inner_checkbox")
+            st.session_state.osb_inner_wall_option = st.checkbox("İç Duvar OSB Malzemesi Dahil Et", value=_temp_osb_inner_wall_option, disabled=osb_inner_wall_disabled, key="osb_inner_checkbox")
 
             facade_sandwich_panel_disabled = (st.session_state.structure_type == 'Light Steel')
             _temp_facade_sandwich_panel_option = st.session_state.facade_sandwich_panel_option
-            st.session_state.facade_sandwich_panel_option = st.checkbox(clean_invisible_chars("Dış Cephe Sandviç Panel Dahil Et (Ağır Çelik için)"), value=_temp_facade_sandwich_panel_option, disabled=facade_sandwich_panel_disabled, key="facade_panel_checkbox")
+            st.session_state.facade_sandwich_panel_option = st.checkbox("Dış Cephe Sandviç Panel Dahil Et (Ağır Çelik için)", value=_temp_facade_sandwich_panel_option, disabled=facade_sandwich_panel_disabled, key="facade_panel_checkbox")
             
         with col2:
-            st.markdown(clean_invisible_chars("<div class='section-title'>KONFİGÜRASYON</div>"), unsafe_allow_html=True)
+            st.markdown("<div class='section-title'>KONFİGÜRASYON</div>", unsafe_allow_html=True)
             _temp_room_config = st.session_state.room_config
             st.session_state.room_config = st.selectbox(
-                clean_invisible_chars("Oda Konfigürasyonu:"),
+                "Oda Konfigürasyonu:",
                 ['Empty Model', '1 Room', '1 Room + Shower / WC', '1 Room + Kitchen',
                  '1 Room + Kitchen + WC', '1 Room + Shower / WC + Kitchen',
                  '2 Rooms + Shower / WC + Kitchen', '3 Rooms + 2 Showers / WC + Kitchen'],
@@ -2578,21 +3322,21 @@ def run_streamlit_app():
             )
             
             _temp_kitchen_choice = st.session_state.kitchen_choice
-            st.session_state.kitchen_choice = st.radio(clean_invisible_chars("Mutfak Tipi Seçimi:"), ['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'], index=['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'].index(_temp_kitchen_choice), key="kitchen_type_radio_select")
+            st.session_state.kitchen_choice = st.radio("Mutfak Tipi Seçimi:", ['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'], index=['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'].index(_temp_kitchen_choice), key="kitchen_type_radio_select")
             
             _temp_floor_covering = st.session_state.floor_covering
             st.session_state.floor_covering = st.selectbox(
-                clean_invisible_chars("Zemin Kaplama Tipi:"),
+                "Zemin Kaplama Tipi:",
                 ['Laminate Parquet', 'Ceramic'],
                 index=['Laminate Parquet', 'Ceramic'].index(_temp_floor_covering),
                 key="floor_covering_select"
             )
 
-            st.markdown(clean_invisible_chars("---"), unsafe_allow_html=True)
-            st.subheader(clean_invisible_chars("Yalıtım Türleri"))
+            st.markdown("---", unsafe_allow_html=True)
+            st.subheader("Yalıtım Türleri")
             _temp_insulation_material_type = st.session_state.insulation_material_type
             st.session_state.insulation_material_type = st.radio(
-                clean_invisible_chars("Yalıtım Malzemesi Tipi:"),
+                "Yalıtım Malzemesi Tipi:",
                 options=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'],
                 index=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'].index(_temp_insulation_material_type) if _temp_insulation_material_type in ['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'] else 0,
                 key="insulation_material_select"
@@ -2603,279 +3347,116 @@ def run_streamlit_app():
                     st.session_state.insulation_floor = False
                 if st.session_state.insulation_wall: 
                     st.session_state.insulation_wall = False
-                st.warning(clean_invisible_chars("Yalıtım yapılmayacak seçildiği için zemin ve duvar yalıtım seçenekleri devre dışı bırakıldı."))
+                st.warning("Yalıtım yapılmayacak seçildiği için zemin ve duvar yalıtım seçenekleri devre dışı bırakıldı.")
 
-        st.markdown(clean_invisible_chars("<div class='section-title'>ÇELİK PROFİL MİKTARLARI (Hafif Çelik için)</div>"), unsafe_allow_html=True)
-        st.markdown(clean_invisible_chars("<b>(Her 6m parça için - manuel olarak girin, aksi takdirde otomatik hesaplanır)</b>"), unsafe_allow_html=True)
+        st.markdown("<div class='section-title'>ÇELİK PROFİL MİKTARLARI (Hafif Çelik için)</div>", unsafe_allow_html=True)
+        st.markdown("<b>(Her 6m parça için - manuel olarak girin, aksi takdirde otomatik hesaplanır)</b>", unsafe_allow_html=True)
 
         steel_profile_disabled = (st.session_state.structure_type == 'Heavy Steel')
 
         col3, col4, col5 = st.columns(3)
         with col3:
             _temp_profile_100x100_count = st.session_state.profile_100x100_count
-            st.session_state.profile_100x100_count = st.number_input(clean_invisible_chars("100x100x3 Adet:"), value=_temp_profile_100x100_count, min_value=0, disabled=steel_profile_disabled, key="p100x100_input")
+            st.session_state.profile_100x100_count = st.number_input("100x100x3 Adet:", value=_temp_profile_100x100_count, min_value=0, disabled=steel_profile_disabled, key="p100x100_input")
         with col4:
             _temp_profile_100x50_count = st.session_state.profile_100x50_count
-            st.session_state.profile_100x50_count = st.number_input(clean_invisible_chars("100x50x3 Adet:"), value=_temp_profile_100x50_count, min_value=0, disabled=steel_profile_disabled, key="p100x50_input")
+            st.session_state.profile_100x50_count = st.number_input("100x50x3 Adet:", value=_temp_profile_100x50_count, min_value=0, disabled=steel_profile_disabled, key="p100x50_input")
         with col5:
             _temp_profile_40x60_count = st.session_state.profile_40x60_count
-            st.session_state.profile_40x60_count = st.number_input(clean_invisible_chars("40x60x2 Adet:"), value=_temp_profile_40x60_count, min_value=0, disabled=steel_profile_disabled, key="p40x60_input")
+            st.session_state.profile_40x60_count = st.number_input("40x60x2 Adet:", value=_temp_profile_40x60_count, min_value=0, disabled=steel_profile_disabled, key="p40x60_input")
 
         col6, col7, col8 = st.columns(3)
         with col6:
             _temp_profile_50x50_count = st.session_state.profile_50x50_count
-            st.session_state.profile_50x50_count = st.number_input(clean_invisible_chars("50x50x2 Adet:"), value=_temp_profile_50x50_count, min_value=0, disabled=steel_profile_disabled, key="p50x50_input")
+            st.session_state.profile_50x50_count = st.number_input("50x50x2 Adet:", value=_temp_profile_50x50_count, min_value=0, disabled=steel_profile_disabled, key="p50x50_input")
         with col7:
             _temp_profile_120x60x5mm_count = st.session_state.profile_120x60x5mm_count
-            st.session_state.profile_120x60x5mm_count = st.number_input(clean_invisible_chars("120x60x5mm Adet:"), value=_temp_profile_120x60x5mm_count, min_value=0, disabled=steel_profile_disabled, key="p120x60x5mm_input")
+            st.session_state.profile_120x60x5mm_count = st.number_input("120x60x5mm Adet:", value=_temp_profile_120x60x5mm_count, min_value=0, disabled=steel_profile_disabled, key="p120x60x5mm_input")
         with col8:
             _temp_profile_HEA160_count = st.session_state.profile_HEA160_count
-            st.session_state.profile_HEA160_count = st.number_input(clean_invisible_chars("HEA160 Adet:"), value=_temp_profile_HEA160_count, min_value=0, disabled=steel_profile_disabled, key="pHEA160_input")
+            st.session_state.profile_HEA160_count = st.number_input("HEA160 Adet:", value=_temp_profile_HEA160_count, min_value=0, disabled=steel_profile_disabled, key="pHEA160_input")
 
 
-        st.markdown(clean_invisible_chars("<div class='section-title'>PENCERELER VE KAPILAR</div>"), unsafe_allow_html=True)
+        st.markdown("<div class='section-title'>PENCERELER VE KAPILAR</div>", unsafe_allow_html=True)
         col9, col10, col11 = st.columns(3)
         with col9:
             _temp_window_count = st.session_state.window_count
-            st.session_state.window_count = st.number_input(clean_invisible_chars("Pencere Adedi:"), value=_temp_window_count, min_value=0, key="window_count_input")
+            st.session_state.window_count = st.number_input("Pencere Adedi:", value=_temp_window_count, min_value=0, key="window_count_input")
         with col10:
             _temp_window_size = st.session_state.window_size_val
-            st.session_state.window_size_val = st.text_input(clean_invisible_chars("Pencere Boyutu:"), value=_temp_window_size, key="window_size_input")
+            st.session_state.window_size_val = st.text_input("Pencere Boyutu:", value=_temp_window_size, key="window_size_input")
         with col11:
             _temp_window_door_color = st.session_state.window_door_color_val
-            st.session_state.window_door_color_val = st.selectbox(clean_invisible_chars("Pencere/Kapı Rengi:"), ['White', 'Black', 'Grey'], index=['White', 'Black', 'Grey'].index(_temp_window_door_color), key="window_door_color_select")
+            st.session_state.window_door_color_val = st.selectbox("Pencere/Kapı Rengi:", ['White', 'Black', 'Grey'], index=['White', 'Black', 'Grey'].index(_temp_window_door_color), key="window_door_color_select")
 
         col_door1, col_door2, col_door3 = st.columns(3)
         with col_door1:
             _temp_sliding_door_count = st.session_state.sliding_door_count
-            st.session_state.sliding_door_count = st.number_input(clean_invisible_chars("Sürme Cam Kapı Adedi:"), value=_temp_sliding_door_count, min_value=0, key="sliding_door_count_input")
+            st.session_state.sliding_door_count = st.number_input("Sürme Cam Kapı Adedi:", value=_temp_sliding_door_count, min_value=0, key="sliding_door_count_input")
         with col_door2:
             _temp_sliding_door_size = st.session_state.sliding_door_size_val
-            st.session_state.sliding_door_size_val = st.text_input(clean_invisible_chars("Sürme Kapı Boyutu:"), value=_temp_sliding_door_size, key="sliding_door_size_input")
-        with col3:
+            st.session_state.sliding_door_size_val = st.text_input("Sürme Kapı Boyutu:", value=_temp_sliding_door_size, key="sliding_door_size_input")
+        with col_door3:
             pass
 
         col_wc_win1, col_wc_win2, col_wc_win3 = st.columns(3)
         with col_wc_win1:
             _temp_wc_window_count = st.session_state.wc_window_count
-            st.session_state.wc_window_count = st.number_input(clean_invisible_chars("WC Pencere Adedi:"), value=_temp_wc_window_count, min_value=0, key="wc_window_count_input")
+            st.session_state.wc_window_count = st.number_input("WC Pencere Adedi:", value=_temp_wc_window_count, min_value=0, key="wc_window_count_input")
         with col_wc_win2:
             _temp_wc_window_size = st.session_state.wc_window_size_val
-            st.session_state.wc_window_size_val = st.text_input(clean_invisible_chars("WC Pencere Boyutu:"), value=_temp_wc_window_size, key="wc_window_size_input")
-        with col3:
+            st.session_state.wc_window_size_val = st.text_input("WC Pencere Boyutu:", value=_temp_wc_window_size, key="wc_window_size_input")
+        with col_wc_win3:
             pass
 
         col_wc_slid1, col_wc_slid2, col_wc_slid3 = st.columns(3)
         with col_wc_slid1:
             _temp_wc_sliding_door_count = st.session_state.wc_sliding_door_count
-            st.session_state.wc_sliding_door_count = st.number_input(clean_invisible_chars("WC Sürme Kapı Adedi:"), value=_temp_wc_sliding_door_count, min_value=0, key="wc_sliding_door_count_input")
+            st.session_state.wc_sliding_door_count = st.number_input("WC Sürme Kapı Adedi:", value=_temp_wc_sliding_door_count, min_value=0, key="wc_sliding_door_count_input")
         with col_wc_slid2:
             _temp_wc_sliding_door_size = st.session_state.wc_sliding_door_size_val
-            st.session_state.wc_sliding_door_size_val = st.text_input(clean_invisible_chars("WC Sürme Kapı Boyutu:"), value=_temp_wc_sliding_door_size, key="wc_sliding_door_size_input")
-        with col3:
+            st.session_state.wc_sliding_door_size_val = st.text_input("WC Sürme Kapı Boyutu:", value=_temp_wc_sliding_door_size, key="wc_sliding_door_size_input")
+        with col_wc_slid3:
             pass
         
         col_door_main1, col_door_main2, col_door_main3 = st.columns(3)
         with col_door_main1:
             _temp_door_count = st.session_state.door_count
-            st.session_state.door_count = st.number_input(clean_invisible_chars("Ana Kapı Adedi:"), value=_temp_door_count, min_value=0, key="door_count_input")
+            st.session_state.door_count = st.number_input("Ana Kapı Adedi:", value=_temp_door_count, min_value=0, key="door_count_input")
         with col_door_main2:
             _temp_door_size = st.session_state.door_size_val
-            st.session_state.door_size_val = st.text_input(clean_invisible_chars("Ana Kapı Boyutu:"), value=_temp_door_size, key="door_size_input")
-        with col3:
+            st.session_state.door_size_val = st.text_input("Ana Kapı Boyutu:", value=_temp_door_size, key="door_size_input")
+        with col_door_main3:
             pass
 
-# ==============================================================================
-# BÖLÜM 7: run_streamlit_app() - Kullanıcı Arayüzü Girişleri (Müşteri, Boyutlar, Yapı, Çelik Profiller, Kapılar/Pencereler)
-# ==============================================================================
-
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(clean_invisible_chars("<div class='section-title'>BOYUTLAR</div>"), unsafe_allow_html=True)
-        _temp_width_val = st.session_state.width_val
-        st.session_state.width_val = st.number_input(clean_invisible_chars("Genişlik (m):"), value=_temp_width_val, step=0.1, key="width_input")
-        
-        _temp_length_val = st.session_state.length_val
-        st.session_state.length_val = st.number_input(clean_invisible_chars("Uzunluk (m):"), value=_temp_length_val, step=0.1, key="length_input")
-        
-        _temp_height_val = st.session_state.height_val
-        st.session_state.height_val = st.number_input(clean_invisible_chars("Yükseklik (m):"), value=_temp_height_val, step=0.1, key="height_input")
-
-        st.markdown(clean_invisible_chars("<div class='section-title'>YAPI</div>"), unsafe_allow_html=True)
-        _temp_structure_type = st.session_state.structure_type
-        st.session_state.structure_type = st.radio(clean_invisible_chars("Yapı Tipi:"), ['Light Steel', 'Heavy Steel'], index=['Light Steel', 'Heavy Steel'].index(_temp_structure_type), key="structure_type_radio")
-        
-        _temp_welding_type = st.session_state.welding_type
-        st.session_state.welding_type = st.selectbox(clean_invisible_chars("Çelik Kaynak İşçiliği:"), ['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'], index=['Standard Welding (160€/m²)', 'TR Assembly Welding (20€/m²)'].index(_temp_welding_type), key="welding_labor_select")
-
-        plasterboard_interior_disabled = (st.session_state.structure_type == 'Heavy Steel')
-        plasterboard_all_disabled = (st.session_state.structure_type == 'Light Steel')
-
-        _temp_plasterboard_interior_option = st.session_state.plasterboard_interior_option
-        st.session_state.plasterboard_interior_option = st.checkbox(clean_invisible_chars("İç Alçıpan Dahil Et"), value=_temp_plasterboard_interior_option, disabled=plasterboard_interior_disabled, key="pb_int_checkbox")
-        
-        _temp_plasterboard_all_option = st.session_state.plasterboard_all_option
-        st.session_state.plasterboard_all_option = st.checkbox(clean_invisible_chars("İç ve Dış Alçıpan Dahil Et"), value=_temp_plasterboard_all_option, disabled=plasterboard_all_disabled, key="pb_all_checkbox")
-
-        osb_inner_wall_disabled = not (st.session_state.plasterboard_interior_option or st.session_state.plasterboard_all_option)
-        _temp_osb_inner_wall_option = st.session_state.osb_inner_wall_option
-        st.session_state.osb_inner_wall_option = st.checkbox(clean_invisible_chars("İç Duvar OSB Malzemesi Dahil Et"), value=_temp_osb_inner_wall_option, disabled=osb_inner_wall_disabled, key="osb_inner_checkbox")
-
-        facade_sandwich_panel_disabled = (st.session_state.structure_type == 'Heavy Steel')
-        _temp_facade_sandwich_panel_option = st.session_state.facade_sandwich_panel_option
-        st.session_state.facade_sandwich_panel_option = st.checkbox(clean_invisible_chars("Dış Cephe Sandviç Panel Dahil Et (Ağır Çelik için)"), value=_temp_facade_sandwich_panel_option, disabled=facade_sandwich_panel_disabled, key="facade_panel_checkbox")
-        
-    with col2:
-        st.markdown(clean_invisible_chars("<div class='section-title'>KONFİGÜRASYON</div>"), unsafe_allow_html=True)
-        _temp_room_config = st.session_state.room_config
-        st.session_state.room_config = st.selectbox(
-            clean_invisible_chars("Oda Konfigürasyonu:"),
-            ['Empty Model', '1 Room', '1 Room + Shower / WC', '1 Room + Kitchen',
-             '1 Room + Kitchen + WC', '1 Room + Shower / WC + Kitchen',
-             '2 Rooms + Shower / WC + Kitchen', '3 Rooms + 2 Showers / WC + Kitchen'],
-            index=['Empty Model', '1 Room', '1 Room + Shower / WC', '1 Room + Kitchen',
-                   '1 Room + Kitchen + WC', '1 Room + Shower / WC + Kitchen',
-                   '2 Rooms + Shower / WC + Kitchen', '3 Rooms + 2 Showers / WC + Kitchen'].index(_temp_room_config),
-            key="room_config_select"
-        )
-        
-        _temp_kitchen_choice = st.session_state.kitchen_choice
-        st.session_state.kitchen_choice = st.radio(clean_invisible_chars("Mutfak Tipi Seçimi:"), ['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'], index=['No Kitchen', 'Standard Kitchen', 'Special Design Kitchen'].index(_temp_kitchen_choice), key="kitchen_type_radio_select")
-        
-        _temp_floor_covering = st.session_state.floor_covering
-        st.session_state.floor_covering = st.selectbox(
-            clean_invisible_chars("Zemin Kaplama Tipi:"),
-            ['Laminate Parquet', 'Ceramic'],
-            index=['Laminate Parquet', 'Ceramic'].index(_temp_floor_covering),
-            key="floor_covering_select"
-        )
-
-        st.markdown(clean_invisible_chars("---"), unsafe_allow_html=True)
-        st.subheader(clean_invisible_chars("Yalıtım Türleri"))
-        _temp_insulation_material_type = st.session_state.insulation_material_type
-        st.session_state.insulation_material_type = st.radio(
-            clean_invisible_chars("Yalıtım Malzemesi Tipi:"),
-            options=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'],
-            index=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'].index(_temp_insulation_material_type) if _temp_insulation_material_type in ['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'] else 0,
-            key="insulation_material_select"
-        )
-
-        if st.session_state.insulation_material_type == 'Yalıtım Yapılmayacak':
-            if st.session_state.insulation_floor: 
-                st.session_state.insulation_floor = False
-            if st.session_state.insulation_wall: 
-                st.session_state.insulation_wall = False
-            st.warning(clean_invisible_chars("Yalıtım yapılmayacak seçildiği için zemin ve duvar yalıtım seçenekleri devre dışı bırakıldı."))
-
-    st.markdown(clean_invisible_chars("<div class='section-title'>ÇELİK PROFİL MİKTARLARI (Hafif Çelik için)</div>"), unsafe_allow_html=True)
-    st.markdown(clean_invisible_chars("<b>(Her 6m parça için - manuel olarak girin, aksi takdirde otomatik hesaplanır)</b>"), unsafe_allow_html=True)
-
-    steel_profile_disabled = (st.session_state.structure_type == 'Heavy Steel')
-
-    col3, col4, col5 = st.columns(3)
-    with col3:
-        _temp_profile_100x100_count = st.session_state.profile_100x100_count
-        st.session_state.profile_100x100_count = st.number_input(clean_invisible_chars("100x100x3 Adet:"), value=_temp_profile_100x100_count, min_value=0, disabled=steel_profile_disabled, key="p100x100_input")
-    with col4:
-        _temp_profile_100x50_count = st.session_state.profile_100x50_count
-        st.session_state.profile_100x50_count = st.number_input(clean_invisible_chars("100x50x3 Adet:"), value=_temp_profile_100x50_count, min_value=0, disabled=steel_profile_disabled, key="p100x50_input")
-    with col5:
-        _temp_profile_40x60_count = st.session_state.profile_40x60_count
-        st.session_state.profile_40x60_count = st.number_input(clean_invisible_chars("40x60x2 Adet:"), value=_temp_profile_40x60_count, min_value=0, disabled=steel_profile_disabled, key="p40x60_input")
-
-    col6, col7, col8 = st.columns(3)
-    with col6:
-        _temp_profile_50x50_count = st.session_state.profile_50x50_count
-        st.session_state.profile_50x50_count = st.number_input(clean_invisible_chars("50x50x2 Adet:"), value=_temp_profile_50x50_count, min_value=0, disabled=steel_profile_disabled, key="p50x50_input")
-    with col7:
-        _temp_profile_120x60x5mm_count = st.session_state.profile_120x60x5mm_count
-        st.session_state.profile_120x60x5mm_count = st.number_input(clean_invisible_chars("120x60x5mm Adet:"), value=_temp_profile_120x60x5mm_count, min_value=0, disabled=steel_profile_disabled, key="p120x60x5mm_input")
-    with col8:
-        _temp_profile_HEA160_count = st.session_state.profile_HEA160_count
-        st.session_state.profile_HEA160_count = st.number_input(clean_invisible_chars("HEA160 Adet:"), value=_temp_profile_HEA160_count, min_value=0, disabled=steel_profile_disabled, key="pHEA160_input")
-
-
-    st.markdown(clean_invisible_chars("<div class='section-title'>PENCERELER VE KAPILAR</div>"), unsafe_allow_html=True)
-    col9, col10, col11 = st.columns(3)
-    with col9:
-        _temp_window_count = st.session_state.window_count
-        st.session_state.window_count = st.number_input(clean_invisible_chars("Pencere Adedi:"), value=_temp_window_count, min_value=0, key="window_count_input")
-    with col10:
-        _temp_window_size = st.session_state.window_size_val
-        st.session_state.window_size_val = st.text_input(clean_invisible_chars("Pencere Boyutu:"), value=_temp_window_size, key="window_size_input")
-    with col11:
-        _temp_window_door_color = st.session_state.window_door_color_val
-        st.session_state.window_door_color_val = st.selectbox(clean_invisible_chars("Pencere/Kapı Rengi:"), ['White', 'Black', 'Grey'], index=['White', 'Black', 'Grey'].index(_temp_window_door_color), key="window_door_color_select")
-
-    col_door1, col_door2, col_door3 = st.columns(3)
-    with col_door1:
-        _temp_sliding_door_count = st.session_state.sliding_door_count
-        st.session_state.sliding_door_count = st.number_input(clean_invisible_chars("Sürme Cam Kapı Adedi:"), value=_temp_sliding_door_count, min_value=0, key="sliding_door_count_input")
-    with col_door2:
-        _temp_sliding_door_size = st.session_state.sliding_door_size_val
-        st.session_state.sliding_door_size_val = st.text_input(clean_invisible_chars("Sürme Kapı Boyutu:"), value=_temp_sliding_door_size, key="sliding_door_size_input")
-    with col3: # Bu kolonu tekrar kullanma
-        pass
-
-    col_wc_win1, col_wc_win2, col_wc_win3 = st.columns(3)
-    with col_wc_win1:
-        _temp_wc_window_count = st.session_state.wc_window_count
-        st.session_state.wc_window_count = st.number_input(clean_invisible_chars("WC Pencere Adedi:"), value=_temp_wc_window_count, min_value=0, key="wc_window_count_input")
-    with col_wc_win2:
-        _temp_wc_window_size = st.session_state.wc_window_size_val
-        st.session_state.wc_window_size_val = st.text_input(clean_invisible_chars("WC Pencere Boyutu:"), value=_temp_wc_window_size, key="wc_window_size_input")
-    with col3: # Bu kolonu tekrar kullanma
-        pass
-
-    col_wc_slid1, col_wc_slid2, col_wc_slid3 = st.columns(3)
-    with col_wc_slid1:
-        _temp_wc_sliding_door_count = st.session_state.wc_sliding_door_count
-        st.session_state.wc_sliding_door_count = st.number_input(clean_invisible_chars("WC Sürme Kapı Adedi:"), value=_temp_wc_sliding_door_count, min_value=0, key="wc_sliding_door_count_input")
-    with col_wc_slid2:
-        _temp_wc_sliding_door_size = st.session_state.wc_sliding_door_size_val
-        st.session_state.wc_sliding_door_size_val = st.text_input(clean_invisible_chars("WC Sürme Kapı Boyutu:"), value=_temp_wc_sliding_door_size, key="wc_sliding_door_size_input")
-    with col3: # Bu kolonu tekrar kullanma
-        pass
-    
-    col_door_main1, col_door_main2, col_door_main3 = st.columns(3)
-    with col_door_main1:
-        _temp_door_count = st.session_state.door_count
-        st.session_state.door_count = st.number_input(clean_invisible_chars("Ana Kapı Adedi:"), value=_temp_door_count, min_value=0, key="door_count_input")
-    with col_door_main2:
-        _temp_door_size = st.session_state.door_size_val
-        st.session_state.door_size_val = st.text_input(clean_invisible_chars("Ana Kapı Boyutu:"), value=_temp_door_size, key="door_size_input")
-    with col3: # Bu kolonu tekrar kullanma
-        pass
-
 # ==============================================================================
 # BÖLÜM 8: run_streamlit_app() - Kullanıcı Arayüzü Girişleri (Ek Donanımlar, Finansal Ayarlar, Notlar) ve Hesaplama/PDF Tetikleme
 # ==============================================================================
 
-        st.markdown(clean_invisible_chars("<div class='section-title'>EK DONANIMLAR</div>"), unsafe_allow_html=True)
+        st.markdown("<div class='section-title'>EK DONANIMLAR</div>", unsafe_allow_html=True)
         
         _temp_shower_wc = st.session_state.shower_wc
-        st.session_state.shower_wc = st.checkbox(clean_invisible_chars("Duş/WC Dahil Et"), value=_temp_shower_wc, key="shower_checkbox")
+        st.session_state.shower_wc = st.checkbox("Duş/WC Dahil Et", value=_temp_shower_wc, key="shower_checkbox")
         
         col_ceramic1, col_ceramic2 = st.columns(2)
         with col_ceramic1:
             wc_ceramic_disabled = not st.session_state.shower_wc # WC seramik sadece duş/WC seçiliyse etkin
             _temp_wc_ceramic = st.session_state.wc_ceramic
-            st.session_state.wc_ceramic = st.checkbox(clean_invisible_chars("WC Seramik Zemin/Duvar"), value=_temp_wc_ceramic, disabled=wc_ceramic_disabled, key="wc_ceramic_checkbox")
+            st.session_state.wc_ceramic = st.checkbox("WC Seramik Zemin/Duvar", value=_temp_wc_ceramic, disabled=wc_ceramic_disabled, key="wc_ceramic_checkbox")
         with col_ceramic2:
             wc_ceramic_area_disabled = not st.session_state.wc_ceramic
             _temp_wc_ceramic_area = st.session_state.wc_ceramic_area
-            st.session_state.wc_ceramic_area = st.number_input(clean_invisible_chars("WC Seramik Alanı (m²):"), value=_temp_wc_ceramic_area, step=0.1, min_value=0.0, disabled=wc_ceramic_area_disabled, key="wc_ceramic_area_input")
+            st.session_state.wc_ceramic_area = st.number_input("WC Seramik Alanı (m²):", value=_temp_wc_ceramic_area, step=0.1, min_value=0.0, disabled=wc_ceramic_area_disabled, key="wc_ceramic_area_input")
         
         _temp_electrical = st.session_state.electrical
-        st.session_state.electrical = st.checkbox(clean_invisible_chars("Elektrik Tesisatı (Malzemelerle)"), value=_temp_electrical, key="electrical_checkbox")
+        st.session_state.electrical = st.checkbox("Elektrik Tesisatı (Malzemelerle)", value=_temp_electrical, key="electrical_checkbox")
         _temp_plumbing = st.session_state.plumbing
-        st.session_state.plumbing = st.checkbox(clean_invisible_chars("Sıhhi Tesisat (Malzemelerle)"), value=_temp_plumbing, key="plumbing_checkbox")
+        st.session_state.plumbing = st.checkbox("Sıhhi Tesisat (Malzemelerle)", value=_temp_plumbing, key="plumbing_checkbox")
         
-        st.markdown(clean_invisible_chars("---"), unsafe_allow_html=True)
-        st.subheader(clean_invisible_chars("Zemin Yalıtımı ve Malzemeleri"))
+        st.markdown("---", unsafe_allow_html=True)
+        st.subheader("Zemin Yalıtımı ve Malzemeleri")
         _temp_insulation_floor = st.session_state.insulation_floor
-        st.session_state.insulation_floor = st.checkbox(clean_invisible_chars("Zemin Yalıtımı Dahil Et (5€/m²)"), value=_temp_insulation_floor, key="floor_insulation_checkbox")
+        st.session_state.insulation_floor = st.checkbox("Zemin Yalıtımı Dahil Et (5€/m²)", value=_temp_insulation_floor, key="floor_insulation_checkbox")
         
         floor_insulation_material_disabled = not st.session_state.insulation_floor
 
@@ -2898,621 +3479,228 @@ def run_streamlit_app():
             _temp_galvanized_sheet_m2 = st.session_state.galvanized_sheet_m2_val
             st.session_state.galvanized_sheet_m2_val = st.number_input(clean_invisible_chars(f"5mm Galvanizli Sac ({0}€/m²) Alanı (m²):"), value=_temp_galvanized_sheet_m2, step=0.1, min_value=0.0, disabled=floor_insulation_material_disabled, key="galvanized_sheet_input")
         with col_floor_mats2[2]:
-            _temp_insulation_material_type = st.session_state.insulation_material_type
-            st.session_state.insulation_material_type = st.selectbox(
-                clean_invisible_chars("Duvar Yalıtım Malzemesi Tipi:"),
-                options=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'],
-                index=['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'].index(_temp_insulation_material_type) if _temp_insulation_material_type in ['Yalıtım Yapılmayacak', 'Stone Wool', 'Glass Wool'] else 0,
-                key="insulation_material_select"
-            )
+            pass # Yalıtım malzemesi tipi yukarıdaki 'Yalıtım Türleri' bölümünden seçilir
 
         _temp_insulation_wall = st.session_state.insulation_wall
-        st.session_state.insulation_wall = st.checkbox(clean_invisible_chars("Duvar Yalıtımı Dahil Et (10€/m²)"), value=_temp_insulation_wall, key="wall_insulation_checkbox")
+        st.session_state.insulation_wall = st.checkbox("Duvar Yalıtımı Dahil Et (10€/m²)", value=_temp_insulation_wall, key="wall_insulation_checkbox")
         
-        st.markdown(clean_invisible_chars("---"), unsafe_allow_html=True)
+        st.markdown("---", unsafe_allow_html=True)
 
         _temp_transportation = st.session_state.transportation
-        st.session_state.transportation = st.checkbox(clean_invisible_chars("Nakliye Dahil Et (350€)"), value=_temp_transportation, key="transportation_checkbox")
+        st.session_state.transportation = st.checkbox("Nakliye Dahil Et (350€)", value=_temp_transportation, key="transportation_checkbox")
         _temp_heating = st.session_state.heating
-        st.session_state.heating = st.checkbox(clean_invisible_chars("Yerden Isıtma Dahil Et (50€/m²)"), value=_temp_heating, key="heating_checkbox")
+        st.session_state.heating = st.checkbox("Yerden Isıtma Dahil Et (50€/m²)", value=_temp_heating, key="heating_checkbox")
         _temp_solar = st.session_state.solar
-        st.session_state.solar = st.checkbox(clean_invisible_chars("Güneş Enerjisi Sistemi"), value=_temp_solar, key="solar_checkbox")
+        st.session_state.solar = st.checkbox("Güneş Enerjisi Sistemi", value=_temp_solar, key="solar_checkbox")
         
         col14, col15 = st.columns(2)
         with col14:
             _temp_solar_kw = st.session_state.solar_kw
-            st.session_state.solar_kw = st.selectbox(clean_invisible_chars("Güneş Enerjisi Kapasitesi (kW):"), [5, 7.2, 11], disabled=not st.session_state.solar, index=[5, 7.2, 11].index(_temp_solar_kw), key="solar_capacity_select")
+            st.session_state.solar_kw = st.selectbox("Güneş Enerjisi Kapasitesi (kW):", [5, 7.2, 11], disabled=not st.session_state.solar, index=[5, 7.2, 11].index(_temp_solar_kw), key="solar_capacity_select")
         with col15:
             solar_price_display = st.session_state.solar_kw * 0 if st.session_state.solar else 0.0
-            st.number_input(clean_invisible_chars("Güneş Enerjisi Fiyatı (€):"), value=solar_price_display, disabled=True, key="solar_price_display")
+            st.number_input("Güneş Enerjisi Fiyatı (€):", value=solar_price_display, disabled=True, key="solar_price_display")
 
         _temp_wheeled_trailer = st.session_state.wheeled_trailer
-        st.session_state.wheeled_trailer = st.checkbox(clean_invisible_chars("Tekerlekli Römork"), value=_temp_wheeled_trailer, key="trailer_checkbox")
+        st.session_state.wheeled_trailer = st.checkbox("Tekerlekli Römork", value=_temp_wheeled_trailer, key="trailer_checkbox")
         _temp_wheeled_trailer_price = st.session_state.wheeled_trailer_price
-        st.session_state.wheeled_trailer_price = st.number_input(clean_invisible_chars("Römork Fiyatı (€):"), value=_temp_wheeled_trailer_price, step=0.1, disabled=not st.session_state.wheeled_trailer, key="trailer_price_input")
+        st.session_state.wheeled_trailer_price = st.number_input("Römork Fiyatı (€):", value=_temp_wheeled_trailer_price, step=0.1, disabled=not st.session_state.wheeled_trailer, key="trailer_price_input")
 
 
         # --- Aether Living Opsiyonları (Pakete göre görünür/gizlenir) ---
         if st.session_state.aether_package_choice != 'None':
-            st.markdown(clean_invisible_chars("<div class='section-title'>AETHER LIVING EK OPSİYONLARI</div>"), unsafe_allow_html=True)
+            st.markdown("<div class='section-title'>AETHER LIVING EK OPSİYONLARI</div>", unsafe_allow_html=True)
             
             col_aether_1, col_aether_2 = st.columns(2)
             with col_aether_1:
                 _disabled_prem_elite = (st.session_state.aether_package_choice not in ['Aether Living | Loft Premium (ESSENTIAL)', 'Aether Living | Loft Elite (LUXURY)'])
 
                 _temp_bedroom_set_option = st.session_state.bedroom_set_option
-                st.session_state.bedroom_set_option = st.checkbox(clean_invisible_chars("Yatak Odası Takımı"), value=_temp_bedroom_set_option, disabled=_disabled_prem_elite, key="bedroom_set_cb")
+                st.session_state.bedroom_set_option = st.checkbox("Yatak Odası Takımı", value=_temp_bedroom_set_option, disabled=_disabled_prem_elite, key="bedroom_set_cb")
                 
                 _temp_brushed_granite_countertops_option = st.session_state.brushed_granite_countertops_option
-                st.session_state.brushed_granite_countertops_option = st.checkbox(clean_invisible_chars("Fırçalanmış Granit Tezgahlar"), value=_temp_brushed_granite_countertops_option, disabled=_disabled_prem_elite, key="granite_cb")
+                st.session_state.brushed_granite_countertops_option = st.checkbox("Fırçalanmış Granit Tezgahlar", value=_temp_brushed_granite_countertops_option, disabled=_disabled_prem_elite, key="granite_cb")
                 if st.session_state.brushed_granite_countertops_option:
                     _granite_area_default = st.session_state.width_val * st.session_state.length_val / 10
                     _temp_brushed_granite_countertops_m2 = st.session_state.brushed_granite_countertops_m2_val
-                    st.session_state.brushed_granite_countertops_m2_val = st.number_input(clean_invisible_chars("Granit Tezgah Alanı (m²):"), value=_granite_area_default if st.session_state.aether_package_choice in ['Aether Living | Loft Premium (ESSENTIAL)', 'Aether Living | Loft Elite (LUXURY)'] else _temp_brushed_granite_countertops_m2, min_value=0.0, step=0.1, key="granite_area_input", disabled=_disabled_prem_elite)
+                    st.session_state.brushed_granite_countertops_m2_val = st.number_input("Granit Tezgah Alanı (m²):", value=_granite_area_default if st.session_state.aether_package_choice in ['Aether Living | Loft Premium (ESSENTIAL)', 'Aether Living | Loft Elite (LUXURY)'] else _temp_brushed_granite_countertops_m2, min_value=0.0, step=0.1, key="granite_area_input", disabled=_disabled_prem_elite)
                 
                 _temp_terrace_laminated_wood_flooring_option = st.session_state.terrace_laminated_wood_flooring_option
-                st.session_state.terrace_laminated_wood_flooring_option = st.checkbox(clean_invisible_chars("Teras Laminat Ahşap Zemin Kaplaması"), value=_temp_terrace_laminated_wood_flooring_option, disabled=_disabled_prem_elite, key="terrace_flooring_cb")
+                st.session_state.terrace_laminated_wood_flooring_option = st.checkbox("Teras Laminat Ahşap Zemin Kaplaması", value=_temp_terrace_laminated_wood_flooring_option, disabled=_disabled_prem_elite, key="terrace_flooring_cb")
                 if st.session_state.terrace_laminated_wood_flooring_option:
                     _terrace_area_default = st.session_state.width_val * st.session_state.length_val / 5
                     _temp_terrace_laminated_wood_flooring_m2 = st.session_state.terrace_laminated_wood_flooring_m2_val
-                    st.session_state.terrace_laminated_wood_flooring_m2_val = st.number_input(clean_invisible_chars("Teras Zemin Alanı (m²):"), value=_terrace_area_default if st.session_state.aether_package_choice in ['Aether Living | Loft Premium (ESSENTIAL)', 'Aether Living | Loft Elite (LUXURY)'] else _temp_terrace_laminated_wood_flooring_m2, min_value=0.0, step=0.1, key="terrace_flooring_area_input", disabled=_disabled_prem_elite)
+                    st.session_state.terrace_laminated_wood_flooring_m2_val = st.number_input("Teras Zemin Alanı (m²):", value=_terrace_area_default if st.session_state.aether_package_choice in ['Aether Living | Loft Premium (ESSENTIAL)', 'Aether Living | Loft Elite (LUXURY)'] else _temp_terrace_laminated_wood_flooring_m2, min_value=0.0, step=0.1, key="terrace_flooring_area_input", disabled=_disabled_prem_elite)
                 
                 _temp_exterior_wood_cladding_m2_option = st.session_state.exterior_wood_cladding_m2_option
-                st.session_state.exterior_wood_cladding_m2_option = st.checkbox(clean_invisible_chars("Dış Cephe Ahşap Kaplama (Lambiri)"), value=_temp_exterior_wood_cladding_m2_option, disabled=False, key="wood_cladding_cb")
+                st.session_state.exterior_wood_cladding_m2_option = st.checkbox("Dış Cephe Ahşap Kaplama (Lambiri)", value=_temp_exterior_wood_cladding_m2_option, disabled=False, key="wood_cladding_cb")
                 if st.session_state.exterior_wood_cladding_m2_option:
                     _temp_exterior_wood_cladding_m2 = st.session_state.exterior_wood_cladding_m2_val
-                    st.session_state.exterior_wood_cladding_m2_val = st.number_input(clean_invisible_chars("Dış Ahşap Kaplama Alanı (m²):"), value=_temp_exterior_wood_cladding_m2, min_value=0.0, step=0.1, key="wood_cladding_area_input")
+                    st.session_state.exterior_wood_cladding_m2_val = st.number_input("Dış Ahşap Kaplama Alanı (m²):", value=_temp_exterior_wood_cladding_m2, min_value=0.0, step=0.1, key="wood_cladding_area_input")
                 
                 _temp_porcelain_tiles_option = st.session_state.porcelain_tiles_option
-                st.session_state.porcelain_tiles_option = st.checkbox(clean_invisible_chars("Porselen Fayans (Ekstra Zemin)"), value=_temp_porcelain_tiles_option, disabled=False, key="porcelain_tiles_cb")
+                st.session_state.porcelain_tiles_option = st.checkbox("Porselen Fayans (Ekstra Zemin)", value=_temp_porcelain_tiles_option, disabled=False, key="porcelain_tiles_cb")
                 if st.session_state.porcelain_tiles_option:
                     _porcelain_area_default = st.session_state.width_val * st.session_state.length_val
                     _temp_porcelain_tiles_m2 = st.session_state.porcelain_tiles_m2_val
-                    st.session_state.porcelain_tiles_m2_val = st.number_input(clean_invisible_chars("Porselen Fayans Alanı (m²):"), value=_porcelain_area_default if st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)' else _temp_porcelain_tiles_m2, min_value=0.0, step=0.1, key="porcelain_tiles_area_input")
+                    st.session_state.porcelain_tiles_m2_val = st.number_input("Porselen Fayans Alanı (m²):", value=_porcelain_area_default if st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)' else _temp_porcelain_tiles_m2, min_value=0.0, step=0.1, key="porcelain_tiles_area_input")
 
             with col_aether_2:
                 _disabled_elite = (st.session_state.aether_package_choice != 'Aether Living | Loft Elite (LUXURY)')
                 
                 _temp_exterior_cladding_m2_option = st.session_state.exterior_cladding_m2_option
-                st.session_state.exterior_cladding_m2_option = st.checkbox(clean_invisible_chars("Dış Cephe Kaplama (Knauf Aquapanel)"), value=_temp_exterior_cladding_m2_option, disabled=_disabled_elite, key="ext_cladding_cb")
+                st.session_state.exterior_cladding_m2_option = st.checkbox("Dış Cephe Kaplama (Knauf Aquapanel)", value=_temp_exterior_cladding_m2_option, disabled=_disabled_elite, key="ext_cladding_cb")
                 if st.session_state.exterior_cladding_m2_option:
                     _cladding_area_default = st.session_state.width_val * st.session_state.length_val
                     _temp_exterior_cladding_m2 = st.session_state.exterior_cladding_m2_val
-                    st.session_state.exterior_cladding_m2_val = st.number_input(clean_invisible_chars("Dış Cephe Kaplama Alanı (m²):"), value=_cladding_area_default if st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)' else _temp_cladding_area_default, min_value=0.0, step=0.1, key="ext_cladding_area_input", disabled=_disabled_elite)
+                    st.session_state.exterior_cladding_m2_val = st.number_input("Dış Cephe Kaplama Alanı (m²):", value=_cladding_area_default if st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)' else _temp_cladding_area_default, min_value=0.0, step=0.1, key="ext_cladding_area_input", disabled=_disabled_elite)
 
                 _temp_concrete_panel_floor_option = st.session_state.concrete_panel_floor_option
-                st.session_state.concrete_panel_floor_option = st.checkbox(clean_invisible_chars("Beton Panel Zemin"), value=_temp_concrete_panel_floor_option, disabled=_disabled_elite, key="concrete_floor_cb")
+                st.session_state.concrete_panel_floor_option = st.checkbox("Beton Panel Zemin", value=_temp_concrete_panel_floor_option, disabled=_disabled_elite, key="concrete_floor_cb")
                 if st.session_state.concrete_panel_floor_option:
                     _concrete_floor_area_default = st.session_state.width_val * st.session_state.length_val
                     _temp_concrete_panel_floor_m2 = st.session_state.concrete_panel_floor_m2_val
-                    st.session_state.concrete_panel_floor_m2_val = st.number_input(clean_invisible_chars("Beton Zemin Alanı (m²):"), value=_concrete_floor_area_default if st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)' else _temp_concrete_panel_floor_m2, min_value=0.0, step=0.1, key="concrete_floor_area_input", disabled=_disabled_elite)
+                    st.session_state.concrete_panel_floor_m2_val = st.number_input("Beton Zemin Alanı (m²):", value=_concrete_floor_area_default if st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)' else _temp_concrete_panel_floor_m2, min_value=0.0, step=0.1, key="concrete_floor_area_input", disabled=_disabled_elite)
 
                 _temp_premium_faucets_option = st.session_state.premium_faucets_option
-                st.session_state.premium_faucets_option = st.checkbox(clean_invisible_chars("Premium Bataryalar"), value=_temp_premium_faucets_option, disabled=_disabled_elite, key="premium_faucets_cb")
+                st.session_state.premium_faucets_option = st.checkbox("Premium Bataryalar", value=_temp_premium_faucets_option, disabled=_disabled_elite, key="premium_faucets_cb")
                 _temp_integrated_fridge_option = st.session_state.integrated_fridge_option
-                st.session_state.integrated_fridge_option = st.checkbox(clean_invisible_chars("Entegre Buzdolabı"), value=_temp_integrated_fridge_option, disabled=_disabled_elite, key="integrated_fridge_cb")
+                st.session_state.integrated_fridge_option = st.checkbox("Entegre Buzdolabı", value=_temp_integrated_fridge_option, disabled=_disabled_elite, key="integrated_fridge_cb")
                 _temp_designer_furniture_option = st.session_state.designer_furniture_option
-                st.session_state.designer_furniture_option = st.checkbox(clean_invisible_chars("Özel Tasarım Mobilyalar"), value=_temp_designer_furniture_option, disabled=_disabled_elite, key="designer_furniture_cb")
+                st.session_state.designer_furniture_option = st.checkbox("Özel Tasarım Mobilyalar", value=_temp_designer_furniture_option, disabled=_disabled_elite, key="designer_furniture_cb")
                 _temp_italian_sofa_option = st.session_state.italian_sofa_option
-                st.session_state.italian_sofa_option = st.checkbox(clean_invisible_chars("İtalyan Kanepe"), value=_temp_italian_sofa_option, disabled=_disabled_elite, key="italian_sofa_cb")
+                st.session_state.italian_sofa_option = st.checkbox("İtalyan Kanepe", value=_temp_italian_sofa_option, disabled=_disabled_elite, key="italian_sofa_cb")
                 _temp_inclass_chairs_option = st.session_state.inclass_chairs_option
-                st.session_state.inclass_chairs_option = st.checkbox(clean_invisible_chars("Inclass Sandalyeler"), value=_temp_inclass_chairs_option, disabled=_disabled_elite, key="inclass_chairs_cb")
+                st.session_state.inclass_chairs_option = st.checkbox("Inclass Sandalyeler", value=_temp_inclass_chairs_option, disabled=_disabled_elite, key="inclass_chairs_cb")
                 if st.session_state.inclass_chairs_option:
                     _temp_inclass_chairs_count = st.session_state.inclass_chairs_count
-                    st.session_state.inclass_chairs_count = st.number_input(clean_invisible_chars("Sandalye Adedi:"), value=_temp_inclass_chairs_count, min_value=0, disabled=_disabled_elite, key="chairs_count_input")
+                    st.session_state.inclass_chairs_count = st.number_input("Sandalye Adedi:", value=_temp_inclass_chairs_count, min_value=0, disabled=_disabled_elite, key="chairs_count_input")
                 
                 _temp_smart_home_systems_option = st.session_state.smart_home_systems_option
-                st.session_state.smart_home_systems_option = st.checkbox(clean_invisible_chars("Akıllı Ev Sistemleri"), value=_temp_smart_home_systems_option, disabled=_disabled_elite, key="smart_home_cb")
+                st.session_state.smart_home_systems_option = st.checkbox("Akıllı Ev Sistemleri", value=_temp_smart_home_systems_option, disabled=_disabled_elite, key="smart_home_cb")
                 _temp_security_camera_option = st.session_state.security_camera_option
-                st.session_state.security_camera_option = st.checkbox(clean_invisible_chars("Güvenlik Kamerası Sistemi"), value=_temp_security_camera_option, disabled=_disabled_elite, key="security_cam_cb")
+                st.session_state.security_camera_option = st.checkbox("Güvenlik Kamerası Sistemi", value=_temp_security_camera_option, disabled=_disabled_elite, key="security_cam_cb")
                 _temp_white_goods_fridge_tv_option = st.session_state.white_goods_fridge_tv_option
-                st.session_state.white_goods_fridge_tv_option = st.checkbox(clean_invisible_chars("Beyaz Eşya (Buzdolabı/TV)"), value=_temp_white_goods_fridge_tv_option, disabled=_disabled_elite, key="white_goods_cb")
+                st.session_state.white_goods_fridge_tv_option = st.checkbox("Beyaz Eşya (Buzdolabı/TV)", value=_temp_white_goods_fridge_tv_option, disabled=_disabled_elite, key="white_goods_cb")
                 _temp_sofa_option = st.session_state.sofa_option
-                st.session_state.sofa_option = st.checkbox(clean_invisible_chars("Kanepe"), value=_temp_sofa_option, disabled=_disabled_elite, key="sofa_cb")
+                st.session_state.sofa_option = st.checkbox("Kanepe", value=_temp_sofa_option, disabled=_disabled_elite, key="sofa_cb")
 
 
         # --- Finansal Ayarlar ---
-        st.markdown(clean_invisible_chars("<div class='section-title'>FİNANSAL AYARLAR</div>"), unsafe_allow_html=True)
+        st.markdown("<div class='section-title'>FİNANSAL AYARLAR</div>", unsafe_allow_html=True)
         profit_rate_options = [(clean_invisible_chars(f'{i}%'), i/100) for i in range(5, 45, 5)]
         _temp_profit_rate_tuple = st.session_state.profit_rate
-        st.session_state.profit_rate = st.selectbox(clean_invisible_chars("Kar Oranı:"), options=profit_rate_options, format_func=lambda x: x[0], index=profit_rate_options.index(_temp_profit_rate_tuple), key="profit_rate_select")
-        st.markdown(clean_invisible_chars(f"<div>KDV Oranı: {VAT_RATE*100:.0f}% (Sabit)</div>"), unsafe_allow_html=True)
+        st.session_state.profit_rate = st.selectbox("Kar Oranı:", options=profit_rate_options, format_func=lambda x: x[0], index=profit_rate_options.index(_temp_profit_rate_tuple), key="profit_rate_select")
+        st.markdown(clean_invisible_chars(f"<div>KDV Oranı: {get_catalog().vat_rate*100:.0f}% (Sabit)</div>"), unsafe_allow_html=True)
 
         # --- Müşteri Notları ---
-        st.markdown(clean_invisible_chars("<div class='section-title'>MÜŞTERİ ÖZEL İSTEKLERİ VE NOTLAR</div>"), unsafe_allow_html=True)
+        st.markdown("<div class='section-title'>MÜŞTERİ ÖZEL İSTEKLERİ VE NOTLAR</div>", unsafe_allow_html=True)
         _temp_customer_notes = st.session_state.customer_notes
-        st.session_state.customer_notes = st.text_area(clean_invisible_chars("Müşteri Notları:"), value=_temp_customer_notes, key="customer_notes_textarea")
+        st.session_state.customer_notes = st.text_area("Müşteri Notları:", value=_temp_customer_notes, key="customer_notes_textarea")
 
         # --- PDF Dil Seçimi ---
         _temp_pdf_language_tuple = st.session_state.pdf_language
         st.session_state.pdf_language = st.selectbox(
-            clean_invisible_chars("Teklif PDF Dili:"),
-            options=[('English-Greek', 'en_gr'), ('Turkish', 'tr')],
+            "Teklif PDF Dili:",
+            options=PDF_LANGUAGE_OPTIONS,
             format_func=lambda x: x[0],
-            index=[('English-Greek', 'en_gr'), ('Turkish', 'tr')].index(_temp_pdf_language_tuple),
+            index=PDF_LANGUAGE_OPTIONS.index(_temp_pdf_language_tuple),
             key="pdf_language_select"
         )
 
-        submit_button = st.form_submit_button(clean_invisible_chars("Hesapla ve Teklifleri Oluştur"))
-
-    if submit_button: 
-        try:
-            # --- Hesaplama Mantığı ---
-            width, length, height = st.session_state.width_val, st.session_state.length_val, st.session_state.height_val
-            areas = calculate_area(width, length, height)
-            floor_area = areas["floor"]
-            wall_area = areas["wall"]
-            roof_area = areas["roof"]
-
-            costs = [] # Tüm maliyet kalemleri buraya eklenecek
-            profile_analysis_details = [] # Çelik profil analiz detaylarını tutacak
-
-            # Yapı (metal iskelet ve boya her zaman eklenir, maliyeti 0 olsa bile bilgi için)
-            costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['protective_automotive_paint_info']), 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-
-            # Hafif/Ağır Çelik Yapısal Maliyetler
-            if st.session_state.structure_type == 'Light Steel':
-                profile_types_and_counts = {
-                    "100x100x3": st.session_state.profile_100x100_count,
-                    "100x50x3": st.session_state.profile_100x50_count,
-                    "40x60x2": st.session_state.profile_40x60_count,
-                    "50x50x2": st.session_state.profile_50x50_count,
-                    "120x60x5mm": st.session_state.profile_120x60x5mm_count,
-                    "HEA160": st.session_state.profile_HEA160_count,
-                }
-                
-                has_manual_steel_profiles = sum(profile_types_and_counts.values()) > 0
-                
-                if has_manual_steel_profiles:
-                    for p_type, p_count in profile_types_and_counts.items():
-                        if p_count > 0:
-                            fiytlar_key = f"steel_profile_{p_type.replace('x', '_').lower()}" 
-                            cost_per_piece = FIYATLAR.get(fiytlar_key, 0.0)
-                            total_profile_cost = p_count * cost_per_piece
-                            costs.append({'Item': clean_invisible_chars(f"{MATERIAL_INFO_ITEMS['steel_skeleton_info']} ({p_type})"), 'Quantity': f"{p_count} adet", 'Unit Price (€)': cost_per_piece, 'Total (€)': calculate_rounded_up_cost(total_profile_cost)})
-                            profile_analysis_details.append({'Item': p_type, 'Quantity': p_count, 'Unit Price (€)': cost_per_piece, 'Total (€)': calculate_rounded_up_cost(total_profile_cost)})
-                else:
-                    auto_100x100_count = math.ceil(floor_area * (12 / 27.0))
-                    auto_50x50_count = math.ceil(floor_area * (6 / 27.0))
-                    if auto_100x100_count > 0:
-                        costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['steel_skeleton_info']) + ' (100x100x3) (Auto)', 'Quantity': f"{auto_100x100_count} adet ({auto_100x100_count * 6:.1f}m)", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(auto_100x100_count * 0)})
-                        profile_analysis_details.append({'Item': '100x100x3 (Auto)', 'Quantity': auto_100x100_count, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(auto_100x100_count * 0)})
-                    if auto_50x50_count > 0:
-                        costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['steel_skeleton_info']) + ' (50x50x2) (Auto)', 'Quantity': f"{auto_50x50_count} adet ({auto_50x50_count * 6:.1f}m)", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(auto_50x50_count * 0)})
-                        profile_analysis_details.append({'Item': '50x50x2 (Auto)', 'Quantity': auto_50x50_count, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(auto_50x50_count * 0)})
-
-            else: # Heavy Steel
-                heavy_steel_cost = floor_area * 0
-                costs.append({'Item': clean_invisible_chars('Heavy Steel Structure'), 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(heavy_steel_cost)})
-                profile_analysis_details.append({'Item': 'Heavy Steel Structure', 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(heavy_steel_cost)})
-            
-            # Kaynak işçiliği
-            welding_labor_price = 0 if st.session_state.welding_type == 'Standard Welding (160€/m²)' else 0
-            welding_cost = floor_area * welding_labor_price
-            costs.append({'Item': clean_invisible_chars(f"Steel Welding Labor ({st.session_state.welding_type.split(' ')[0]})"), 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': welding_labor_price, 'Total (€)': calculate_rounded_up_cost(welding_cost)})
-
-            # Bağlantı elemanları (metrekare başına)
-            connection_elements_cost = floor_area * 0
-            costs.append({'Item': 'Connection Elements', 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(connection_elements_cost)})
-
-
-            # 2. Duvarlar (Sandviç Panel, Alçıpan, OSB, Kaplamalar ve Yalıtım)
-            # Dış/İç Duvar Sandviç Panel
-            if st.session_state.structure_type == 'Light Steel' or st.session_state.facade_sandwich_panel_option:
-                sandwich_panel_total_area = wall_area + roof_area
-                sandwich_panel_cost = sandwich_panel_total_area * 0
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['60mm_eps_sandwich_panel_info']), 'Quantity': f"{sandwich_panel_total_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(sandwich_panel_cost)})
-                costs.append({'Item': 'Panel Assembly Labor', 'Quantity': f"{sandwich_panel_total_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(sandwich_panel_total_area * 0)})
-
-            # İç Alçıpan / İç ve Dış Alçıpan
-            plasterboard_total_area_calc = 0
-            if st.session_state.plasterboard_interior_option:
-                plasterboard_total_area_calc = wall_area
-                costs.append({'Item': 'Interior Plasterboard (White)', 'Quantity': f"{plasterboard_total_area_calc:.2f} m²", 'Unit Price (€)': 0 / GYPSUM_BOARD_UNIT_AREA_M2, 'Total (€)': calculate_rounded_up_cost(plasterboard_total_area_calc * (0 / GYPSUM_BOARD_UNIT_AREA_M2))})
-                costs.append({'Item': 'Plasterboard Labor', 'Quantity': f"{plasterboard_total_area_calc:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(plasterboard_total_area_calc * 0)})
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['satin_plaster_paint_info']), 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-            
-            if st.session_state.plasterboard_all_option:
-                plasterboard_total_area_calc = wall_area * 2
-                costs.append({'Item': 'Interior & Exterior Plasterboard (White)', 'Quantity': f"{plasterboard_total_area_calc:.2f} m²", 'Unit Price (€)': 0 / GYPSUM_BOARD_UNIT_AREA_M2, 'Total (€)': calculate_rounded_up_cost(plasterboard_total_area_calc * (0 / GYPSUM_BOARD_UNIT_AREA_M2))})
-                costs.append({'Item': 'Plasterboard Labor', 'Quantity': f"{plasterboard_total_area_calc:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(plasterboard_total_area_calc * 0)})
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['satin_plaster_paint_info']), 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-
-            # İç Duvar OSB Malzemesi
-            if st.session_state.osb_inner_wall_option:
-                osb_inner_wall_pieces = math.ceil(wall_area / OSB_PANEL_AREA_M2)
-                costs.append({'Item': 'OSB Inner Wall Material', 'Quantity': f"{osb_inner_wall_pieces} adet", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(osb_inner_wall_pieces * 0)})
-
-            # Duvar Yalıtımı
-            if st.session_state.insulation_wall and st.session_state.insulation_material_type != 'Yalıtım Yapılmayacak':
-                insulation_m2_cost_for_wall = 0
-                if st.session_state.insulation_material_type == 'Stone Wool':
-                    insulation_m2_cost_for_wall = 0
-                    costs.append({'Item': clean_invisible_chars(f"Wall Insulation ({st.session_state.insulation_material_type})"), 'Quantity': f"{wall_area:.2f} m²", 'Unit Price (€)': insulation_m2_cost_for_wall, 'Total (€)': calculate_rounded_up_cost(wall_area * insulation_m2_cost_for_wall)})
-                elif st.session_state.insulation_material_type == 'Glass Wool':
-                    glass_wool_packets_for_wall = math.ceil(wall_area / GLASS_WOOL_M2_PER_PACKET)
-                    glass_wool_cost_for_wall = glass_wool_packets_for_wall * 0
-                    costs.append({'Item': clean_invisible_chars(f"Wall Insulation ({st.session_state.insulation_material_type})"), 'Quantity': f"{glass_wool_packets_for_wall} paket", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(glass_wool_cost_for_wall)})
-            
-            # Dış Cephe Kaplaması (Knauf Aquapanel)
-            if st.session_state.exterior_cladding_m2_option and st.session_state.exterior_cladding_m2_val > 0:
-                exterior_cladding_cost = st.session_state.exterior_cladding_m2_val * 0
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['knauf_aquapanel_gypsum_board_info']) + ' (Cladding)', 'Quantity': f"{st.session_state.exterior_cladding_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(exterior_cladding_cost)})
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['eps_styrofoam_info']), 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['knauf_mineralplus_insulation_info']), 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-            
-            # Dış Ahşap Kaplama (Lambiri)
-            if st.session_state.exterior_wood_cladding_m2_option and st.session_state.exterior_wood_cladding_m2_val > 0:
-                wood_cladding_cost = st.session_state.exterior_wood_cladding_m2_val * 0
-                costs.append({'Item': clean_invisible_chars(MATERIAL_INFO_ITEMS['exterior_wood_cladding_lambiri_info']), 'Quantity': f"{st.session_state.exterior_wood_cladding_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(wood_cladding_cost)})
-
-            # 3. Zemin Maliyetleri (Yalıtım ve Kaplama)
-            if st.session_state.insulation_floor: # Bu senaryoda false
-                floor_insulation_cost = floor_area * 0
-                costs.append({'Item': 'Floor Insulation', 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(floor_insulation_cost)})
-            
-                if st.session_state.skirting_length_val > 0:
-                    costs.append({'Item': 'Skirting', 'Quantity': f"{st.session_state.skirting_length_val:.2f} m", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(st.session_state.skirting_length_val * 0)})
-                if st.session_state.laminate_flooring_m2_val > 0:
-                    costs.append({'Item': 'Laminate Flooring 12mm', 'Quantity': f"{st.session_state.laminate_flooring_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(st.session_state.laminate_flooring_m2_val * 0)})
-                if st.session_state.under_parquet_mat_m2_val > 0:
-                    costs.append({'Item': 'Under Parquet Mat 4mm', 'Quantity': f"{st.session_state.under_parquet_mat_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(st.session_state.under_parquet_mat_m2_val * 0)})
-                if st.session_state.osb2_18mm_count_val > 0:
-                    costs.append({'Item': 'OSB2 18mm Panel', 'Quantity': f"{st.session_state.osb2_18mm_count_val} adet", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(st.session_state.osb2_18mm_count_val * 0)})
-                if st.session_state.galvanized_sheet_m2_val > 0:
-                    costs.append({'Item': '5mm Galvanized Sheet', 'Quantity': f"{st.session_state.galvanized_sheet_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(st.session_state.galvanized_sheet_m2_val * 0)})
-
-                if st.session_state.concrete_panel_floor_option and st.session_state.concrete_panel_floor_m2_val > 0:
-                    concrete_panel_cost = st.session_state.concrete_panel_floor_m2_val * 0
-                    costs.append({'Item': MATERIAL_INFO_ITEMS['concrete_panel_floor_info'], 'Quantity': f"{st.session_state.concrete_panel_floor_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(concrete_panel_cost)})
-
-                if st.session_state.terrace_laminated_wood_flooring_option and st.session_state.terrace_laminated_wood_flooring_m2_val > 0:
-                    terrace_laminated_cost = st.session_state.terrace_laminated_wood_flooring_m2_val * 0
-                    costs.append({'Item': MATERIAL_INFO_ITEMS['treated_pine_floor_info'], 'Quantity': f"{st.session_state.terrace_laminated_wood_flooring_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(terrace_laminated_cost)})
-
-                if st.session_state.porcelain_tiles_option and st.session_state.porcelain_tiles_m2_val > 0:
-                    porcelain_tiles_cost = st.session_state.porcelain_tiles_m2_val * (0 + 0)
-                    costs.append({'Item': MATERIAL_INFO_ITEMS['porcelain_tiles_info'], 'Quantity': f"{st.session_state.porcelain_tiles_m2_val:.2f} m²", 'Unit Price (€)': (0 + 0), 'Total (€)': calculate_rounded_up_cost(porcelain_tiles_cost)})
-                    
-            # 4. Doğramalar (Pencere ve Kapılar)
-            window_cost = st.session_state.window_count * 0
-            costs.append({'Item': f"Window ({st.session_state.window_size_val})", 'Quantity': st.session_state.window_count, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(window_cost)})
-            
-            sliding_door_count_val = st.session_state.sliding_door_count
-            if sliding_door_count_val > 0:
-                sliding_door_cost = sliding_door_count_val * 0
-                costs.append({'Item': f"Sliding Glass Door ({st.session_state.sliding_door_size_val})", 'Quantity': sliding_door_count_val, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(sliding_door_cost)})
-
-            wc_window_count_val = st.session_state.wc_window_count
-            if wc_window_count_val > 0:
-                wc_window_cost = wc_window_count_val * 0
-                costs.append({'Item': f"WC Window ({st.session_state.wc_window_size_val})", 'Quantity': wc_window_count_val, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(wc_window_cost)})
-
-            wc_sliding_door_count_val = st.session_state.wc_sliding_door_count
-            if wc_sliding_door_count_val > 0:
-                wc_sliding_door_cost = wc_sliding_door_count_val * 0
-                costs.append({'Item': f"WC Sliding Door ({st.session_state.wc_sliding_door_size_val})", 'Quantity': wc_sliding_door_count_val, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(wc_sliding_door_cost)})
-            
-            door_count_val = st.session_state.door_count
-            door_cost = door_count_val * 0
-            costs.append({'Item': f"Door ({st.session_state.door_size_val})", 'Quantity': door_count_val, 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(door_cost)})
-            
-            total_doors_windows = window_count + sliding_door_count_val + wc_window_count_val + wc_sliding_door_count_val + door_count_val
-            door_window_assembly_cost = total_doors_windows * 0
-            costs.append({'Item': 'Door/Window Assembly Labor', 'Quantity': f"{total_doors_windows} adet", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(door_window_assembly_cost)})
-
-            # 5. Mutfak ve Banyo Tesisatları
-            kitchen_cost_calc = 0.0
-            kitchen_type_display_en_gr = 'No Kitchen'
-            kitchen_type_display_tr = 'Mutfak Yok'
-            kitchen_included_in_calc = False
-
-            if st.session_state.kitchen_choice == 'Standard Kitchen':
-                kitchen_cost_calc = 0
-                kitchen_type_display_en_gr = "Yes (Standard)"
-                kitchen_type_display_tr = "Var (Standart)"
-                kitchen_included_in_calc = True
-                costs.append({'Item': f"Kitchen ({kitchen_type_display_en_gr.split('(')[0].strip()})", 'Quantity': '0 adet', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(kitchen_cost_calc)})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['induction_hob_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['electric_faucet_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['kitchen_sink_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['kitchen_bathroom_countertops_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-
-            elif st.session_state.kitchen_choice == 'Special Design Kitchen':
-                kitchen_cost_calc = 0
-                kitchen_type_display_en_gr = "Yes (Special Design)"
-                kitchen_type_display_tr = "Var (Özel Tasarım)"
-                kitchen_included_in_calc = True
-                costs.append({'Item': f"Kitchen ({kitchen_type_display_en_gr.split('(')[0].strip()})", 'Quantity': '0 adet', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(kitchen_cost_calc)})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['induction_hob_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['electric_faucet_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['kitchen_sink_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['kitchen_bathroom_countertops_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                
-            if st.session_state.shower_wc:
-                shower_wc_cost = 0
-                costs.append({'Item': 'Shower/WC Installation', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(shower_wc_cost)})
-                costs.append({'Item': MATERIAL_INFO_ITEMS['fully_functional_bathroom_fixtures_info'], 'Quantity': 'N/A', 'Unit Price (€)': 0.0, 'Total (€)': 0.0})
-                if st.session_state.wc_ceramic and st.session_state.wc_ceramic_area > 0:
-                    wc_ceramic_cost = st.session_state.wc_ceramic_area * (0 + 0)
-                    costs.append({'Item': 'WC Ceramic Material & Labor', 'Quantity': f"{st.session_state.wc_ceramic_area:.2f} m²", 'Unit Price (€)': 0 + 0, 'Total (€)': calculate_rounded_up_cost(wc_ceramic_cost)})
-
-            if st.session_state.electrical:
-                electrical_cost = floor_area * 0
-                costs.append({'Item': 'Electrical Installation', 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(electrical_cost)})
-
-            if st.session_state.plumbing:
-                plumbing_cost = floor_area * 0
-                costs.append({'Item': 'Plumbing Installation', 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(plumbing_cost)})
-
-            if st.session_state.transportation:
-                costs.append({'Item': 'Transportation', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-
-            if st.session_state.heating:
-                heating_cost = floor_area * 0
-                costs.append({'Item': 'Floor Heating System', 'Quantity': f"{floor_area:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(heating_cost)})
-
-            solar_cost = 0.0
-            if st.session_state.solar:
-                solar_cost = st.session_state.solar_kw * 0
-                costs.append({'Item': f'Solar Energy System ({st.session_state.solar_kw} kW)', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(solar_cost)})
-
-            if st.session_state.wheeled_trailer:
-                costs.append({'Item': 'Wheeled Trailer', 'Quantity': '1', 'Unit Price (€)': st.session_state.wheeled_trailer_price, 'Total (€)': calculate_rounded_up_cost(st.session_state.wheeled_trailer_price)})
-
-            # Aether Living Paketlerine Özel Maliyetler
-            if st.session_state.aether_package_choice == 'Aether Living | Loft Standard (BASICS)':
-                pass
-            elif st.session_state.aether_package_choice == 'Aether Living | Loft Premium (ESSENTIAL)':
-                if st.session_state.bedroom_set_option:
-                    costs.append({'Item': 'Bedroom Set', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.brushed_granite_countertops_option and st.session_state.brushed_granite_countertops_m2_val > 0:
-                    granite_cost = st.session_state.brushed_granite_countertops_m2_val * 0
-                    costs.append({'Item': 'Brushed Granite Countertops', 'Quantity': f"{st.session_state.brushed_granite_countertops_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(granite_cost)})
-                if st.session_state.terrace_laminated_wood_flooring_option and st.session_state.terrace_laminated_wood_flooring_m2_val > 0:
-                    terrace_laminated_cost = st.session_state.terrace_laminated_wood_flooring_m2_val * 0
-                    costs.append({'Item': 'Terrace Laminated Wood Flooring', 'Quantity': f"{st.session_state.terrace_laminated_wood_flooring_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(terrace_laminated_cost)})
-
-            elif st.session_state.aether_package_choice == 'Aether Living | Loft Elite (LUXURY)':
-                if st.session_state.exterior_cladding_m2_option and st.session_state.exterior_cladding_m2_val > 0:
-                    cladding_material_cost = st.session_state.exterior_cladding_m2_val * (0 / GYPSUM_BOARD_UNIT_AREA_M2)
-                    cladding_labor_cost = st.session_state.exterior_cladding_m2_val * 0
-                    costs.append({'Item': 'Exterior Cladding Material (Knauf Aquapanel)', 'Quantity': f"{st.session_state.exterior_cladding_m2_val:.2f} m²", 'Unit Price (€)': (0 / GYPSUM_BOARD_UNIT_AREA_M2), 'Total (€)': calculate_rounded_up_cost(cladding_material_cost)})
-                    costs.append({'Item': 'Exterior Cladding Labor', 'Quantity': f"{st.session_state.exterior_cladding_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(cladding_labor_cost)})
-                
-                if st.session_state.concrete_panel_floor_option and st.session_state.concrete_panel_floor_m2_val > 0:
-                    concrete_panel_cost = st.session_state.concrete_panel_floor_m2_val * 0
-                    costs.append({'Item': 'Concrete Panel Floor', 'Quantity': f"{st.session_state.concrete_panel_floor_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(concrete_panel_cost)})
-                
-                if st.session_state.premium_faucets_option:
-                    costs.append({'Item': 'Premium Faucets', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.integrated_fridge_option:
-                    costs.append({'Item': 'Integrated Refrigerator', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.designer_furniture_option:
-                    costs.append({'Item': 'Designer Furniture', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.italian_sofa_option:
-                    costs.append({'Item': 'Italian Sofa', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.inclass_chairs_option and st.session_state.inclass_chairs_count > 0:
-                    chairs_cost = st.session_state.inclass_chairs_count * 0
-                    costs.append({'Item': 'Inclass Chairs', 'Quantity': f"{st.session_state.inclass_chairs_count} pcs", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(chairs_cost)})
-                if st.session_state.smart_home_systems_option:
-                    costs.append({'Item': 'Smart Home Systems', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.security_camera_option:
-                    costs.append({'Item': 'Security Camera System', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.white_goods_fridge_tv_option:
-                    costs.append({'Item': 'White Goods (Fridge/TV)', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.sofa_option:
-                    costs.append({'Item': 'Sofa', 'Quantity': '1', 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(0)})
-                if st.session_state.exterior_wood_cladding_m2_option and st.session_state.exterior_wood_cladding_m2_val > 0:
-                    wood_cladding_cost = st.session_state.exterior_wood_cladding_m2_val * 0
-                    costs.append({'Item': 'Exterior Wood Cladding (Lambiri)', 'Quantity': f"{st.session_state.exterior_wood_cladding_m2_val:.2f} m²", 'Unit Price (€)': 0, 'Total (€)': calculate_rounded_up_cost(wood_cladding_cost)})
-                if st.session_state.porcelain_tiles_option and st.session_state.porcelain_tiles_m2_val > 0:
-                    porcelain_tiles_cost = st.session_state.porcelain_tiles_m2_val * (0 + 0)
-                    costs.append({'Item': 'Porcelain Tiles', 'Quantity': f"{st.session_state.porcelain_tiles_m2_val:.2f} m²", 'Unit Price (€)': (0 + 0), 'Total (€)': calculate_rounded_up_cost(porcelain_tiles_cost)})
-                    
-                # Finansal Hesaplamalar
-                material_subtotal = sum(item['Total (€)'] for item in costs if 'Total (€)' in item)
-                waste_cost = calculate_rounded_up_cost(material_subtotal * FIRE_RATE)
-                total_cost_no_profit = material_subtotal + waste_cost # Karsız toplam maliyet
-                profit_amount = calculate_rounded_up_cost(total_cost_no_profit * st.session_state.profit_rate[1])
-                
-                vat_base = total_cost_no_profit + profit_amount
-                vat_amount = calculate_rounded_up_cost(vat_base * VAT_RATE)
-                final_sales_price = calculate_rounded_up_cost(vat_base + vat_amount)
-
-                # Finansal özet verileri
-                financial_summary_data = [
-                    {'Item': 'Toplam Malzeme ve İşçilik Maliyeti (KDV Hariç)', 'Value': format_currency(material_subtotal)},
-                    {'Item': 'Fire ve Atık Maliyeti (%5)', 'Value': format_currency(waste_cost)},
-                    {'Item': 'Kar Öncesi Toplam Maliyet', 'Value': format_currency(total_cost_no_profit)},
-                    {'Item': f'Kar Oranı (%{st.session_state.profit_rate[0]})', 'Value': format_currency(profit_amount)},
-                    {'Item': 'KDV Hariç Satış Fiyatı', 'Value': format_currency(vat_base)},
-                    {'Item': f'KDV (%{VAT_RATE*100:.0f})', 'Value': format_currency(vat_amount)},
-                    {'Item': 'Nihai Satış Fiyatı (KDV Dahil)', 'Value': format_currency(final_sales_price)},
-                    {'Item': 'Aylık Muhasebe Giderleri', 'Value': format_currency(MONTHLY_ACCOUNTING_EXPENSES)},
-                    {'Item': 'Aylık Ofis Kirası', 'Value': format_currency(MONTHLY_OFFICE_RENT)},
-                ]
-
-                # Proje detayları (raporlar için)
-                project_details_result = {
-                    'width': width, 'length': length, 'height': height, 'area': floor_area,
-                    'structure_type': st.session_state.structure_type,
-                    'plasterboard_interior': st.session_state.plasterboard_interior_option,
-                    'plasterboard_all': st.session_state.plasterboard_all_option,
-                    'osb_inner_wall': st.session_state.osb_inner_wall_option,
-                    'insulation_floor': st.session_state.insulation_floor,
-                    'insulation_wall': st.session_state.insulation_wall,
-                    'window_count': st.session_state.window_count, 'window_size_val': st.session_state.window_size_val,
-                    'window_door_color': st.session_state.window_door_color_val,
-                    'sliding_door_count': st.session_state.sliding_door_count, 'sliding_door_size_val': st.session_state.sliding_door_size_val,
-                    'wc_window_count': st.session_state.wc_window_count, 'wc_window_size_val': st.session_state.wc_window_size_val,
-                    'wc_sliding_door_count': st.session_state.wc_sliding_door_count, 'wc_sliding_door_size_val': st.session_state.wc_sliding_door_size_val,
-                    'door_count': st.session_state.door_count, 'door_size_val': st.session_state.door_size_val,
-                    'kitchen_choice': st.session_state.kitchen_choice,
-                    'kitchen_type_display_en_gr': kitchen_type_display_en_gr,
-                    'kitchen_type_display_tr': kitchen_type_display_tr,
-                    'kitchen_included_in_calc': kitchen_included_in_calc,
-                    'shower_wc': st.session_state.shower_wc,
-                    'wc_ceramic': st.session_state.wc_ceramic, 'wc_ceramic_area': st.session_state.wc_ceramic_area,
-                    'electrical': st.session_state.electrical, 'plumbing': st.session_state.plumbing,
-                    'transportation': st.session_state.transportation, 'heating': st.session_state.heating,
-                    'solar': st.session_state.solar, 'solar_kw': st.session_state.solar_kw, 'solar_price': solar_cost,
-                    'wheeled_trailer': st.session_state.wheeled_trailer,
-                    'wheeled_trailer_price': st.session_state.wheeled_trailer_price,
-                    'vat_rate': VAT_RATE, 'profit_rate_val_tuple': st.session_state.profit_rate,
-                    'room_configuration': st.session_state.room_config,
-                    'delivery_duration_business_days': math.ceil((floor_area / 27.0) * 35),
-                    'welding_labor_type': st.session_state.welding_type,
-                    'facade_sandwich_panel_included': st.session_state.facade_sandwich_panel_option,
-                    'floor_covering_type': st.session_state.floor_covering,
-                    'skirting_length_val': st.session_state.skirting_length_val,
-                    'laminate_flooring_m2_val': st.session_state.laminate_flooring_m2_val,
-                    'under_parquet_mat_m2_val': st.session_state.under_parquet_mat_m2_val,
-                    'osb2_18mm_count_val': st.session_state.osb2_18mm_count_val,
-                    'galvanized_sheet_m2_val': st.session_state.galvanized_sheet_m2_val,
-                    'insulation_material_type': st.session_state.insulation_material_type,
-                    'exterior_cladding_m2_option': st.session_state.exterior_cladding_m2_option,
-                    'exterior_cladding_m2_val': st.session_state.exterior_cladding_m2_val,
-                    'exterior_wood_cladding_m2_option': st.session_state.exterior_wood_cladding_m2_option,
-                    'exterior_wood_cladding_m2_val': st.session_state.exterior_wood_cladding_m2_val,
-                    'porcelain_tiles_option': st.session_state.porcelain_tiles_option,
-                    'porcelain_tiles_m2_val': st.session_state.porcelain_tiles_m2_val,
-                    'concrete_panel_floor_option': st.session_state.concrete_panel_floor_option,
-                    'concrete_panel_floor_m2_val': st.session_state.concrete_panel_floor_m2_val,
-                    'bedroom_set_option': st.session_state.bedroom_set_option,
-                    'sofa_option': st.session_state.sofa_option,
-                    'smart_home_systems_option': st.session_state.smart_home_systems_option,
-                    'security_camera_option': st.session_state.security_camera_option,
-                    'security_camera_count': st.session_state.security_camera_count,
-                    'white_goods_fridge_tv_option': st.session_state.white_goods_fridge_tv_option,
-                    'premium_faucets_option': st.session_state.premium_faucets_option,
-                    'integrated_fridge_option': st.session_state.integrated_fridge_option,
-                    'designer_furniture_option': st.session_state.designer_furniture_option,
-                    'italian_sofa_option': st.session_state.italian_sofa_option,
-                    'inclass_chairs_option': st.session_state.inclass_chairs_option,
-                    'inclass_chairs_count': st.session_state.inclass_chairs_count,
-                    'brushed_granite_countertops_option': st.session_state.brushed_granite_countertops_option,
-                    'brushed_granite_countertops_m2_val': st.session_state.brushed_granite_countertops_m2_val,
-                    'terrace_laminated_wood_flooring_option': st.session_state.terrace_laminated_wood_flooring_option,
-                    'terrace_laminated_wood_flooring_m2_val': st.session_state.terrace_laminated_wood_flooring_m2_val,
-                    # Profil adetleri de project_details'e eklendi
-                    'profile_100x100_count_val': st.session_state.profile_100x100_count,
-                    'profile_100x50_count_val': st.session_state.profile_100x50_count,
-                    'profile_40x60_count_val': st.session_state.profile_40x60_count,
-                    'profile_50x50_count_val': st.session_state.profile_50x50_count,
-                    'profile_120x60x5mm_count_val': st.session_state.profile_120x60x5mm_count,
-                    'profile_HEA160_count_val': st.session_state.profile_HEA160_count,
-                }
+        submit_button = st.form_submit_button("Hesapla ve Teklifleri Oluştur")
 
-                # Müşteri bilgileri (raporlar için)
-                customer_info_result = {
-                    'name': st.session_state.customer_name.strip() or "GENEL",
-                    'company': st.session_state.customer_company.strip() or "",
-                    'address': st.session_state.customer_address.strip() or "",
-                    'city': st.session_state.customer_city.strip() or "",
-                    'phone': st.session_state.customer_phone.strip() or "",
-                    'email': st.session_state.customer_email.strip() or "",
-                    'id_no': st.session_state.customer_id_no.strip() or ""
+    # Gönderimde hesaplama ve sonuç tablolarının aşama süreleri tek bir kayıtta toplanır; kayıt hata veya st.rerun durumunda da kapatılır
+    submit_timing = stage_timing.begin('submit') if submit_button else None
+    try:
+        if submit_button: 
+            try:
+                # --- Hesaplama Mantığı ---
+                # Burada sadece fiyatlar hesaplanır; PDF'ler arka plan havuzunda üretilir.
+                with stage_timing.span('collect_inputs'):
+                    quote_inputs = {key: st.session_state[key] for key in SESSION_STATE_DEFAULTS if key != 'logo_data_b64_global'}
+                previous_result = st.session_state.get('quote_result')
+                quote = build_quote(quote_inputs, previous_result['quote'] if previous_result else None)
+                submit_timing['recomputed_nodes'] = len(quote['cost_graph_state']['recomputed'])
+                # Logo önbellekten gelir (ağı beklemez); arka plan yenilemesi bittiyse sonraki hesaplamada güncel logo kullanılır
+                with stage_timing.span('logo'):
+                    try:
+                        st.session_state.logo_data_b64_global = get_company_logo_base64(LOGO_URL)
+                    except Exception as e:
+                        st.warning(f"Logo yüklenirken hata oluştu: {e}. PDF'lerde logo gösterilemeyebilir.")
+                        st.session_state.logo_data_b64_global = None # Hata durumunda None olarak ayarla
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                submit_timing['quote_id'] = timestamp
+                st.session_state.quote_result = {
+                    'quote': quote,
+                    'profit_rate_label': st.session_state.profit_rate[0],
+                    'pdf_language': st.session_state.pdf_language[1],
+                    'logo_data_b64': st.session_state.logo_data_b64_global,
+                    'timestamp': timestamp,
+                    'pdf_jobs': {}, # Belge türü -> Future (bu hesaplamanın arka plan PDF işleri)
+                    'timings': {'submit': submit_timing}, # Aşama süreleri (stage_timing kayıtları)
                 }
-                
-                # Maliyetleri hesapla (calculate_costs_detailed fonksiyonu şimdi parametreleri doğru kullanacak)
-                costs_df, kitchen_type_display_en_gr, kitchen_type_display_tr, kitchen_included_in_calc, solar_cost_calc, profile_analysis_details = calculate_costs_detailed(project_details_result, areas)
-
-                # Finansal özeti oluştur
-                financial_summary_data = [
-                    {'Item': 'Malzeme Ara Toplamı', 'Value': format_currency(sum(item['Total (€)'] for item in costs_df))},
-                    {'Item': f'Atık Maliyeti ({FIRE_RATE*100:.0f}%)', 'Value': format_currency(calculate_rounded_up_cost(sum(item['Total (€)'] for item in costs_df) * FIRE_RATE))},
-                    {'Item': 'Genel Giderler (Aylık Sabit)', 'Value': format_currency(MONTHLY_ACCOUNTING_EXPENSES + MONTHLY_OFFICE_RENT)},
-                    {'Item': 'Maliyeti Karşılama (Kar Hariç)', 'Value': format_currency(sum(item['Total (€)'] for item in costs_df) + calculate_rounded_up_cost(sum(item['Total (€)'] for item in costs_df) * FIRE_RATE) + MONTHLY_ACCOUNTING_EXPENSES + MONTHLY_OFFICE_RENT)},
-                    {'Item': f'Kar (%{st.session_state.profit_rate[0]})', 'Value': format_currency(calculate_rounded_up_cost((sum(item['Total (€)'] for item in costs_df) + calculate_rounded_up_cost(sum(item['Total (€)'] for item in costs_df) * FIRE_RATE) + MONTHLY_ACCOUNTING_EXPENSES + MONTHLY_OFFICE_RENT) * st.session_state.profit_rate[1]))},
-                    {'Item': 'KDV Hariç Satış Fiyatı', 'Value': format_currency(calculate_rounded_up_cost((sum(item['Total (€)'] for item in costs_df) + calculate_rounded_up_cost(sum(item['Total (€)'] for item in costs_df) * FIRE_RATE) + MONTHLY_ACCOUNTING_EXPENSES + MONTHLY_OFFICE_RENT) * (1 + st.session_state.profit_rate[1])))},
-                   # Düzeltilmiş Satır (calculate_rounded_up_cost ifadesinin sonunda fazladan bir ) kaldırıldı)
-                    {'Item': f'KDV Dahil Satış Fiyatı (%{VAT_RATE*100:.0f})', 'Value': format_currency(calculate_rounded_up_cost((sum(item['Total (€)'] for item in costs_df) + calculate_rounded_up_cost(sum(item['Total (€)'] for item in costs_df) * FIRE_RATE) + MONTHLY_ACCOUNTING_EXPENSES + MONTHLY_OFFICE_RENT) * (1 + st.session_state.profit_rate[1]) * (1 + VAT_RATE)))}, 
-                    ]
-                # --- Streamlit'te Sonuçları Göster ---
-                st.subheader(clean_invisible_chars("Hesaplama Sonuçları"))
-                st.dataframe(pd.DataFrame(financial_summary_data).set_index('Item'), use_container_width=True)
-                st.dataframe(pd.DataFrame(costs_df).style.format({'Unit Price (€)': "€{:,.2f}", 'Total (€)': "€{:,.2f}"}), use_container_width=True)
-
-                if project_details_result['structure_type'] == 'Light Steel': # Sadece Hafif Çelik ise profil analizi göster
-                    st.subheader(clean_invisible_chars("Çelik Profil Detaylı Analizi"))
-                    st.dataframe(pd.DataFrame(profile_analysis_details).style.format({'Unit Price (€)': "€{:,.2f}", 'Total (€)': "€{:,.2f}"}), use_container_width=True)
-
-                # --- PDF Oluşturma ve İndirme Bağlantıları ---
-                st.markdown(clean_invisible_chars("---"), unsafe_allow_html=True)
-                st.subheader(clean_invisible_chars("PDF Çıktıları"))
-
-                logo_data_b64 = st.session_state.logo_data_b64_global
-
-                col_pdf1, col_pdf2, col_pdf3 = st.columns(3)
-
-                with col_pdf1:
-                    internal_pdf_buffer = create_internal_cost_report_pdf(
-                        pd.DataFrame(costs_df),
-                        pd.DataFrame(financial_summary_data),
-                        pd.DataFrame(profile_analysis_details),
-                        project_details_result,
-                        customer_info_result,
-                        logo_data_b64
-                    )
-                    st.download_button(
-                        label=clean_invisible_chars("Dahili Maliyet Raporu İndir (TR)"),
-                        data=internal_pdf_buffer,
-                        file_name=f"Internal_Cost_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                        mime="application/pdf"
-                    )
-
-                with col_pdf2:
-                    if st.session_state.pdf_language[1] == 'en_gr':
-                        customer_proposal_pdf_buffer = create_customer_proposal_pdf(
-                            financial_summary_data[5]['Value'], # KDV Hariç Satış Fiyatı
-                            solar_cost_calc, # Solar maliyeti
-                            financial_summary_data[6]['Value'], # KDV Dahil Satış Fiyatı
-                            project_details_result,
-                            st.session_state.customer_notes,
-                            customer_info_result
-                        )
-                        st.download_button(
-                            label=clean_invisible_chars("Müşteri Teklifi İndir (EN/GR)"),
-                            data=customer_proposal_pdf_buffer,
-                            file_name=f"Customer_Proposal_EN_GR_{clean_invisible_chars(customer_info_result['name'].replace(' ', '_'))}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                            mime="application/pdf"
-                        )
-                    else: # Turkish
-                        customer_proposal_pdf_buffer = create_customer_proposal_pdf_tr(
-                            financial_summary_data[5]['Value'], # KDV Hariç Satış Fiyatı
-                            solar_cost_calc, # Solar maliyeti
-                            financial_summary_data[6]['Value'], # KDV Dahil Satış Fiyatı
-                            project_details_result,
-                            st.session_state.customer_notes,
-                            customer_info_result
-                        )
-                        st.download_button(
-                            label=clean_invisible_chars("Müşteri Teklifi İndir (TR)"),
-                            data=customer_proposal_pdf_buffer,
-                            file_name=f"Customer_Proposal_TR_{clean_invisible_chars(customer_info_result['name'].replace(' ', '_'))}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                            mime="application/pdf"
+                # PDF işleri kuyruğa girmeden önce kaydedilir ki üretilen belgeler de teklife eklensin
+                with stage_timing.span('store_quote'):
+                    try:
+                        st.session_state.quote_result['store_id'] = quote_store.save_quote(
+                            quote_inputs, quote, timestamp, st.session_state.pdf_language[1]
                         )
-                with col_pdf3:
-                    sales_contract_pdf_buffer = create_sales_contract_pdf(
-                        customer_info_result,
-                        financial_summary_data[5]['Value'], # Evin KDV Hariç fiyatı
-                        solar_cost_calc, # Solar maliyeti
-                        project_details_result,
-                        COMPANY_INFO
-                    )
-                    st.download_button(
-                        label=clean_invisible_chars("Satış Sözleşmesi İndir (EN)"),
-                        data=sales_contract_pdf_buffer,
-                        file_name=f"Sales_Contract_EN_{clean_invisible_chars(customer_info_result['name'].replace(' ', '_'))}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                        mime="application/pdf"
-                    )
-
-        except Exception as e: # Bu 'except' bloğu, yukarıdaki 'try' bloğuyla aynı girinti seviyesinde olmalı
-            st.error(clean_invisible_chars(f"Bir hata oluştu: {e}"))
-            st.exception(e) # Detaylı traceback göster
+                    except Exception as e:
+                        logger.warning(f"Teklif depoya kaydedilemedi: {e}")
+                        st.warning(f"Teklif kaydedilemedi ({e}); PDF'ler yine de oluşturulacak.")
+                with stage_timing.span('queue_pdfs'):
+                    for document in eager_documents(st.session_state.pdf_language[1]):
+                        request_quote_pdf(document, st.session_state.quote_result)
+            except Exception as e: # Bu 'except' bloğu, yukarıdaki 'try' bloğuyla aynı girinti seviyesinde olmalı
+                st.session_state.quote_result = None
+                st.error(clean_invisible_chars(f"Bir hata oluştu: {e}"))
+                st.exception(e) # Detaylı traceback göster
+
+        # Son hesaplamanın sonuçları, indirme gibi sonraki yeniden çalıştırmalarda da gösterilir
+        quote_result = st.session_state.get('quote_result')
+        if quote_result:
+            import pandas as pd
+            quote = quote_result['quote']
+            cost_results = quote['cost_results']
+            costs_df = cost_results['costs_df']
+
+            # Finansal özet verileri
+            financial_summary_data = financial_summary_rows(cost_results, quote_result['profit_rate_label'])
+
+            # --- Streamlit'te Sonuçları Göster ---
+            with stage_timing.span('results_tables'):
+                st.subheader("Hesaplama Sonuçları")
+                st.caption(f"Fiyat kataloğu sürümü: {quote['catalog_version']}")
+                st.dataframe(pd.DataFrame(financial_summary_data).set_index('Item'), width="stretch")
+                st.dataframe(costs_df.style.format({'Unit Price (€)': format_currency, 'Total (€)': format_currency}), width="stretch")
+
+                if quote['project_details']['structure_type'] == 'Light Steel': # Sadece Hafif Çelik ise profil analizi göster
+                    profile_analysis_df = profile_analysis_frame(costs_df, 'Light Steel')
+                    st.subheader("Çelik Profil Detaylı Analizi")
+                    st.dataframe(profile_analysis_df.style.format({'Unit Price (€)': format_currency, 'Total (€)': format_currency}), width="stretch")
+
+            # --- PDF İndirme Bağlantıları (arka planda üretilir, biten hemen indirilebilir) ---
+            st.markdown("---", unsafe_allow_html=True)
+            st.subheader("PDF Çıktıları")
+            show_pdf_downloads(quote_result, quote_documents(quote_result['pdf_language']))
+
+        # --- Fiyat Taraması ve Paket Karşılaştırması (form gönderimi gerektirmeden senaryo karşılaştırma) ---
+        st.markdown("---", unsafe_allow_html=True)
+        show_price_sweep()
+        show_package_comparison()
+        show_saved_quotes()
+    finally:
+        if submit_timing is not None:
+            stage_timing.end(submit_timing)
+            stage_timing.log_record(submit_timing)
+
+    if st.sidebar.checkbox("Performans ayrıntılarını göster", key="show_timing_debug"):
+        show_timing_panel(quote_result)
 
 # Uygulamanın ana giriş noktası
 if __name__ == "__main__":
+    # Log handler'ı yalnızca burada kurulur (basicConfig yeniden çalıştırmalarda bir şey yapmaz)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
     run_streamlit_app()
     
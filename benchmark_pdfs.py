@@ -0,0 +1,254 @@
+# ==============================================================================
+# PDF Üretim Kıyaslama Paketi (Komut Satırı)
+# ==============================================================================
+# Teklif (EN/GR, TR), satış sözleşmesi ve dahili maliyet raporu PDF'lerini
+# Streamlit arayüzü olmadan, sabit bir proje fikstür kümesi üzerinde üretir. Her belge için süre (ms),
+# tepe bellek kullanımı (KB) ve çıktı boyutu (bayt) ölçülür. Sonuçlar JSON
+# temel çizgisi olarak kaydedilebilir ve sonraki ölçümler bu temel çizgiyle
+# karşılaştırılarak gerilemeler sayısal olarak raporlanır.
+#
+# Kullanım:
+#   python benchmark_pdfs.py --repeat 5 --save-baseline benchmark_baseline.json
+#   python benchmark_pdfs.py --compare benchmark_baseline.json --tolerance 0.25
+#   python benchmark_pdfs.py --import-time --repeat 5
+#
+# Depoda hazır temel çizgi yoktur; süre ve bellek değerleri makineye özgüdür.
+# Temel çizgi, karşılaştırılacak değişiklikten önce aynı makinede ana daldan
+# üretilir (git stash / git checkout main, ardından --save-baseline), sonra
+# değişiklikle birlikte --compare çalıştırılır. Gerileme varsa çıkış kodu 1'dir.
+# Soğuk başlangıç ölçümünün (--import-time) temel çizgisi ayrı bir dosyada tutulur.
+#
+# PDF önbelleği (pdf_cache) devre dışıdır; builder'lar her tekrarda doğrudan çağrılır.
+
+import argparse
+import base64
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+LONG_NOTES = " ".join(
+    f"{i}. Müşteri notu: teslimat öncesi zemin etüdü yapılacak, pencere ölçüleri sahada teyit edilecektir."
+    for i in range(1, 61)
+)
+
+# Fikstür adı -> SESSION_STATE_DEFAULTS üzerine uygulanacak değerler.
+# 'package' anahtarı verilirse ilgili app.AETHER_PACKAGE_PRESETS değerleri önce uygulanır.
+FIXTURES = {
+    'light_minimal': {},
+    'heavy_minimal': {'structure_type': 'Heavy Steel'},
+    'light_large_all_options': {
+        'width_val': 20.0, 'length_val': 12.0, 'height_val': 3.0,
+        'kitchen_choice': 'Special Design Kitchen', 'shower_wc': True, 'wc_ceramic': True, 'wc_ceramic_area': 8.0,
+        'electrical': True, 'plumbing': True, 'insulation_floor': True, 'insulation_wall': True,
+        'plasterboard_all_option': True, 'facade_sandwich_panel_option': True, 'transportation': True,
+        'window_count': 10, 'sliding_door_count': 2, 'door_count': 5,
+    },
+    'package_basics': {'package': 'Aether Living | Loft Standard (BASICS)'},
+    'package_essential': {'package': 'Aether Living | Loft Premium (ESSENTIAL)'},
+    'package_luxury': {'package': 'Aether Living | Loft Elite (LUXURY)'},
+    'heavy_luxury': {'package': 'Aether Living | Loft Elite (LUXURY)', 'structure_type': 'Heavy Steel'},
+    'light_solar_only': {'solar': True, 'solar_kw': 10},
+    'light_heating_only': {'heating': True},
+    'light_solar_heating': {'solar': True, 'solar_kw': 10, 'heating': True},
+    'long_notes': {'customer_notes': LONG_NOTES},
+    'luxury_long_notes': {'package': 'Aether Living | Loft Elite (LUXURY)', 'customer_notes': LONG_NOTES},
+}
+
+# Temel çizgiyle karşılaştırılan ölçümler (min/max süreler gürültülü olduğu için hariç)
+COMPARED_METRICS = ('median_ms', 'peak_kb', 'size_bytes', 'import_ms', 'first_pdf_ms')
+
+_CUSTOMER = {
+    'customer_name': 'Çağrı Öztürk', 'customer_company': 'Örnek İnşaat Ltd.',
+    'customer_address': 'Makarios Cd. 12', 'customer_city': 'Lefkoşa',
+    'customer_phone': '+90 533 000 00 00', 'customer_email': 'ornek@example.com', 'customer_id_no': 'K-123456',
+}
+
+
+def _import_app():
+    """app modülünü Streamlit uyarılarını bastırarak içe aktarır."""
+    import streamlit.logger
+    streamlit.logger.set_log_level("error") # Başsız çalışmada 'ScriptRunContext' uyarılarını gizle
+    import app
+    return app
+
+
+def _fixture_logo():
+    """Ağ erişimi gerektirmeyen sabit bir PNG logo üretir (base64)."""
+    from PIL import Image as PILImage
+    buffer = io.BytesIO()
+    PILImage.new('RGB', (360, 120), (30, 64, 120)).save(buffer, 'PNG')
+    return base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def fixture_inputs(app, name):
+    """Fikstürün tam girdi sözlüğünü (session_state anahtarları) oluşturur."""
+    overrides = dict(FIXTURES[name])
+    inputs = {key: value for key, value in app.SESSION_STATE_DEFAULTS.items() if key != 'logo_data_b64_global'}
+    inputs.update(_CUSTOMER)
+    package = overrides.pop('package', None)
+    if package:
+        inputs['aether_package_choice'] = package
+        inputs.update(app.AETHER_PACKAGE_PRESETS[package])
+    inputs.update(overrides)
+    return inputs
+
+
+def measure_document(app, document, quote, logo_data_b64, repeat):
+    """Bir belgeyi `repeat` kez üretip süre istatistiklerini, tepe belleği ve boyutu döndürür."""
+    app.build_quote_pdf(document, quote, logo_data_b64) # Isınma (font, stil ve logo önbellekleri)
+
+    timings_ms = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        pdf_bytes = app.build_quote_pdf(document, quote, logo_data_b64)
+        timings_ms.append((time.perf_counter() - started) * 1000)
+
+    # Bellek ölçümü süre ölçümünü etkilemesin diye ayrı bir çalıştırmada yapılır
+    tracemalloc.start()
+    app.build_quote_pdf(document, quote, logo_data_b64)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'median_ms': round(statistics.median(timings_ms), 2),
+        'min_ms': round(min(timings_ms), 2),
+        'max_ms': round(max(timings_ms), 2),
+        'peak_kb': round(peak_bytes / 1024, 1),
+        'size_bytes': len(pdf_bytes),
+    }
+
+
+def run_benchmarks(fixtures, documents, repeat=3, with_logo=True):
+    """Seçilen fikstür ve belgeler için ölçüm yapar; {fikstür: {belge: sonuç}} döndürür."""
+    from reportlab import rl_config
+    rl_config.invariant = 1 # Zaman damgası/ID sabit olsun; boyutlar çalıştırmalar arasında karşılaştırılabilir
+
+    app = _import_app()
+    logo_data_b64 = _fixture_logo() if with_logo else None
+    results = {}
+    for name in fixtures:
+        quote = app.build_quote(fixture_inputs(app, name))
+        results[name] = {}
+        for document in documents:
+            results[name][document] = measure_document(app, document, quote, logo_data_b64, repeat)
+            row = results[name][document]
+            print(f"{name:<26} {document:<16} {row['median_ms']:>9.1f} ms {row['peak_kb']:>10.1f} KB {row['size_bytes']:>9d} B")
+    return results
+
+
+# Yeni bir yorumlayıcıda çalıştırılır: app içe aktarma süresini, ilk PDF'in (ertelenen
+# ReportLab ve font yüklemesi dahil) süresini ve içe aktarmadan sonra yüklü ağır modülleri ölçer.
+_IMPORT_PROBE = """
+import json, sys, time
+import streamlit.logger
+streamlit.logger.set_log_level("error")
+started = time.perf_counter()
+import app
+import_ms = (time.perf_counter() - started) * 1000
+heavy = [name for name in ('pandas', 'reportlab', 'PIL', 'requests') if name in sys.modules]
+inputs = {key: value for key, value in app.SESSION_STATE_DEFAULTS.items() if key != 'logo_data_b64_global'}
+started = time.perf_counter()
+app.build_quote_pdf('proposal_tr', app.build_quote(inputs))
+first_pdf_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({'import_ms': import_ms, 'first_pdf_ms': first_pdf_ms, 'heavy_modules': heavy}))
+"""
+
+
+def measure_import_time(repeat=3):
+    """app modülünün soğuk içe aktarma süresini ve ilk PDF süresini ayrı süreçlerde ölçer."""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, '-c', _IMPORT_PROBE], cwd=package_dir,
+                                   capture_output=True, text=True, check=True)
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return {
+        'import_ms': round(statistics.median(run['import_ms'] for run in runs), 2),
+        'first_pdf_ms': round(statistics.median(run['first_pdf_ms'] for run in runs), 2),
+        'heavy_modules_after_import': runs[-1]['heavy_modules'],
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Medyan süre, tepe bellek, boyut veya içe aktarma süresi temel çizgiden `tolerance` oranından fazla artmışsa gerileme sayar."""
+    regressions = []
+    for name, documents in results.items():
+        for document, row in documents.items():
+            reference = baseline.get('results', {}).get(name, {}).get(document)
+            if reference is None:
+                continue
+            for metric in COMPARED_METRICS:
+                if metric not in row or not reference.get(metric):
+                    continue
+                if row[metric] > reference[metric] * (1 + tolerance):
+                    change = (row[metric] / reference[metric] - 1) * 100
+                    regressions.append(f"{name}/{document} {metric}: {reference[metric]} -> {row[metric]} (+{change:.0f}%)")
+    return regressions
+
+
+def parse_args(argv=None, documents=()):
+    parser = argparse.ArgumentParser(description="Teklif ve sözleşme PDF'lerinin üretim süresini, belleğini ve boyutunu ölçer.")
+    parser.add_argument('-r', '--repeat', type=int, default=3, help="Her belge için süre ölçüm tekrarı (varsayılan: 3)")
+    parser.add_argument('-f', '--fixture', action='append', choices=sorted(FIXTURES), help="Yalnızca verilen fikstürleri çalıştır (tekrarlanabilir)")
+    parser.add_argument('-d', '--document', action='append', choices=documents, metavar='BELGE',
+                        help=f"Yalnızca verilen belgeleri ölç ({', '.join(documents)})")
+    parser.add_argument('--no-logo', action='store_true', help="Logosuz PDF üret")
+    parser.add_argument('--import-time', action='store_true', help="Yalnızca app içe aktarma (soğuk başlangıç) süresini ölç")
+    parser.add_argument('--save-baseline', metavar='JSON', help="Sonuçları temel çizgi olarak bu dosyaya yaz")
+    parser.add_argument('--compare', metavar='JSON', help="Sonuçları bu temel çizgi dosyasıyla karşılaştır")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Gerileme sayılacak artış oranı (varsayılan: 0.25)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    app = _import_app() # Belge seçenekleri app.QUOTE_DOCUMENTS'ten gelir
+    args = parse_args(argv, list(app.QUOTE_DOCUMENTS))
+    fixtures = args.fixture or list(FIXTURES)
+    documents = args.document or list(app.QUOTE_DOCUMENTS)
+
+    if args.import_time:
+        cold_start = measure_import_time(repeat=max(1, args.repeat))
+        print(f"app içe aktarma: {cold_start['import_ms']:.1f} ms, ilk PDF: {cold_start['first_pdf_ms']:.1f} ms, "
+              f"içe aktarma sonrası yüklü ağır modüller: {', '.join(cold_start['heavy_modules_after_import']) or 'yok'}")
+        results = {'cold_start': {'app': cold_start}}
+    else:
+        print(f"{'Fikstür':<26} {'Belge':<16} {'Medyan':>12} {'Tepe Bellek':>13} {'Boyut':>11}")
+        results = run_benchmarks(fixtures, documents, repeat=max(1, args.repeat), with_logo=not args.no_logo)
+
+    if args.save_baseline:
+        payload = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        print(f"Temel çizgi '{args.save_baseline}' dosyasına yazıldı.")
+
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"Temel çizgi dosyası bulunamadı: {args.compare}", file=sys.stderr)
+            return 2
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"[GERİLEME] {line}")
+        print(f"{len(regressions)} gerileme bulundu (tolerans %{args.tolerance * 100:.0f}).")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# ==============================================================================
+# Toplu Teklif Üretici (Komut Satırı)
+# ==============================================================================
+# CSV/JSON dosyasındaki her müşteri satırı için teklif PDF'i (EN/GR veya TR) ve
+# satış sözleşmesi PDF'i üretir. PDF'ler CPU çekirdeklerine dağıtılarak
+# ProcessPoolExecutor ile paralel oluşturulur.
+#
+# Kullanım:
+#   python bulk_quotes.py musteriler.csv --output-dir teklifler --workers 4
+#   python bulk_quotes.py musteriler.csv --zip   # satır başına tek ZIP paketi
+#
+# Kolon adları Streamlit formundaki session_state anahtarlarıyla aynıdır
+# (customer_name, width_val, length_val, height_val, structure_type, solar, ...).
+# Dosyada olmayan kolonlar için app.SESSION_STATE_DEFAULTS kullanılır.
+
+import argparse
+import logging
+import math
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+import pricing_engine
+
+PDF_LANGUAGE_OPTIONS = {'en_gr': ('English-Greek', 'en_gr'), 'tr': ('Turkish', 'tr'), 'both': ('English-Greek + Turkish', 'both')}
+TRUE_STRINGS = {'1', 'true', 'yes', 'y', 'evet', 'x'}
+
+# Her işçi süreçte bir kez yüklenen app modülü ve logo
+_app = None
+_logo_data_b64 = None
+
+
+def _import_app():
+    """app modülünü Streamlit uyarılarını bastırarak içe aktarır."""
+    import streamlit.logger
+    streamlit.logger.set_log_level("error") # Başsız çalışmada 'ScriptRunContext' uyarılarını gizle
+    import app
+    return app
+
+
+def _init_worker(logo_data_b64):
+    """İşçi süreç başlatıcı: app modülünü ve fontları yükler, logoyu süreç genelinde saklar."""
+    global _app, _logo_data_b64
+    _app = _import_app()
+    _app.load_pdf_support() # Fontlar her işçide bir kez yüklenir
+    _logo_data_b64 = logo_data_b64
+
+
+def load_rows(path):
+    """CSV veya JSON (kayıt listesi) dosyasını DataFrame olarak okur."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return pd.read_csv(path, keep_default_na=False, na_values=[''])
+    if extension == '.json':
+        return pd.read_json(path, orient='records')
+    raise ValueError(f"Desteklenmeyen dosya tipi: '{extension}'. CSV veya JSON kullanın.")
+
+
+def _parse_profit_rate(value):
+    """Kar oranını ('20%', 0.20) demetine çevirir; '20%', '20' veya 0.2 kabul edilir."""
+    if isinstance(value, (tuple, list)):
+        return (str(value[0]), float(value[1]))
+    text = str(value).strip().rstrip('%')
+    rate = float(text)
+    if rate > 1:
+        rate = rate / 100
+    return (f"{round(rate * 100)}%", rate)
+
+
+def _coerce(key, value, default):
+    """Dosyadan gelen değeri varsayılan değerin tipine dönüştürür; boş hücrelerde varsayılanı döndürür."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return default
+    if key == 'profit_rate':
+        return _parse_profit_rate(value)
+    if key == 'pdf_language':
+        code = value[1] if isinstance(value, (tuple, list)) else str(value).strip()
+        if code not in PDF_LANGUAGE_OPTIONS:
+            raise ValueError(f"Geçersiz pdf_language değeri: '{code}' (en_gr, tr veya both olmalı).")
+        return PDF_LANGUAGE_OPTIONS[code]
+    if isinstance(default, bool):
+        return value if isinstance(value, bool) else str(value).strip().lower() in TRUE_STRINGS
+    if isinstance(default, int):
+        return int(float(value))
+    if isinstance(default, float):
+        return float(value)
+    return str(value)
+
+
+def build_inputs(row, defaults):
+    """Bir dosya satırını varsayılanlarla birleştirerek tam girdi sözlüğü oluşturur."""
+    inputs = dict(defaults)
+    for key, value in row.items():
+        if key in defaults:
+            inputs[key] = _coerce(key, value, defaults[key])
+    return inputs
+
+
+def _safe_file_part(text):
+    """Dosya adında kullanılamayacak karakterleri '_' ile değiştirir."""
+    return re.sub(r'[^\w\-]+', '_', text).strip('_') or "GENEL"
+
+
+def prepare_jobs(rows, defaults, language=None, include_contract=True, as_zip=False):
+    """
+    Tüm satırları tek vektörel geçişte fiyatlandırır ve işçi süreçlere gönderilecek
+    iş tanımlarını (girdiler + fiyatlar) döndürür.
+    """
+    inputs_list = [build_inputs(row, defaults) for row in rows.to_dict(orient='records')]
+    if not inputs_list:
+        return []
+    priced = pricing_engine.price_projects(pricing_engine.inputs_frame(inputs_list), include_line_items=False)
+    summary = priced['summary']
+
+    jobs = []
+    for index, inputs in enumerate(inputs_list):
+        code = language or inputs['pdf_language'][1]
+        languages = ['en_gr', 'tr'] if code == 'both' else [code]
+        jobs.append({
+            'index': index,
+            'inputs': inputs,
+            'house_price': float(summary['final_sales_price'].iloc[index]), # KDV dahil
+            'house_price_no_vat': float(summary['total_cost_no_vat'].iloc[index]),
+            'catalog_version': priced['catalog_version'],
+            'languages': languages,
+            'include_contract': include_contract,
+            'as_zip': as_zip,
+        })
+    return jobs
+
+
+def render_job(job, output_dir):
+    """Tek bir satırın PDF'lerini üretir ve yazılan dosya yollarını döndürür (işçi süreçte çalışır)."""
+    app = _app or _import_app()
+    inputs = app.normalize_inputs(job['inputs'])
+    areas = app.calculate_area(inputs['width_val'], inputs['length_val'], inputs['height_val'])
+    project_details = app.build_project_details(inputs, areas)
+    customer_info = app.build_customer_info(inputs)
+    quote = {
+        'catalog_version': job['catalog_version'],
+        'project_details': project_details,
+        'customer_info': customer_info,
+        'notes': inputs['customer_notes'],
+        'house_price': job['house_price'],
+        'house_price_no_vat': job['house_price_no_vat'],
+        'solar_price': project_details['solar_price'],
+    }
+    file_stem = f"{job['index'] + 1:04d}_{_safe_file_part(customer_info['name'])}"
+
+    document_names = [f"proposal_{language}" for language in job['languages']]
+    if job['include_contract']:
+        document_names.append('sales_contract')
+    # Her satır benzersizdir; PDF önbelleği yalnızca işçi belleğini doldururdu, bu yüzden belgeler doğrudan üretilir
+    app.prepare_pdf_resources(document_names, _logo_data_b64)
+    documents = [(app.quote_file_name(name, file_stem), app.build_quote_pdf(name, quote, _logo_data_b64)) for name in document_names]
+
+    if job.get('as_zip'):
+        path = os.path.join(output_dir, f"Quote_Pack_{file_stem}.zip")
+        with open(path, 'wb') as f:
+            app.write_quote_bundle_zip(f, documents)
+        return [path]
+
+    written_paths = []
+    for file_name, pdf_bytes in documents:
+        path = os.path.join(output_dir, file_name)
+        with open(path, 'wb') as f:
+            f.write(pdf_bytes)
+        written_paths.append(path)
+    return written_paths
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="CSV/JSON dosyasından toplu teklif ve sözleşme PDF'leri üretir.")
+    parser.add_argument('input', help="Müşteri ve proje seçeneklerini içeren CSV veya JSON dosyası")
+    parser.add_argument('-o', '--output-dir', default='teklifler', help="PDF'lerin yazılacağı klasör (varsayılan: teklifler)")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help="Paralel işçi süreç sayısı (varsayılan: CPU çekirdek sayısı)")
+    parser.add_argument('--language', choices=['en_gr', 'tr', 'both'], default=None,
+                        help="Teklif dili; verilmezse her satırın pdf_language kolonu kullanılır")
+    parser.add_argument('--no-contract', action='store_true', help="Satış sözleşmesi PDF'lerini üretme")
+    parser.add_argument('--no-logo', action='store_true', help="Logoyu indirmeden PDF üret")
+    parser.add_argument('--zip', action='store_true', help="Her satırın belgelerini tek bir ZIP paketine yaz")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    app = _import_app()
+
+    rows = load_rows(args.input)
+    defaults = {key: value for key, value in app.SESSION_STATE_DEFAULTS.items() if key != 'logo_data_b64_global'}
+    jobs = prepare_jobs(rows, defaults, language=args.language, include_contract=not args.no_contract, as_zip=args.zip)
+    if not jobs:
+        print("Girdi dosyasında satır bulunamadı.")
+        return 0
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    app.load_pdf_support() # fork ile başlayan işçiler ana süreçte kayıtlı fontları devralır
+    logo_data_b64 = None if args.no_logo else app.get_company_logo_base64(app.LOGO_URL, wait=True)
+
+    failures = 0
+    written_count = 0
+    file_kind = 'ZIP' if args.zip else 'PDF'
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=_init_worker, initargs=(logo_data_b64,)) as executor:
+        futures = {executor.submit(render_job, job, args.output_dir): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            customer_name = job['inputs']['customer_name']
+            try:
+                paths = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"[HATA] Satır {job['index'] + 1} ({customer_name}): {e}", file=sys.stderr)
+                continue
+            written_count += len(paths)
+            print(f"[OK] Satır {job['index'] + 1} ({customer_name}): {len(paths)} {file_kind}")
+
+    print(f"{len(jobs) - failures}/{len(jobs)} satır işlendi, {written_count} {file_kind} '{args.output_dir}' klasörüne yazıldı "
+          f"(fiyat kataloğu {jobs[0]['catalog_version']}).")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+# ==============================================================================
+# Maliyet Bağımlılık Grafiği (Artımlı Yeniden Hesaplama)
+# ==============================================================================
+# Maliyet modeli düğümlerden oluşur: girdiler (boyutlar, yapı tipi, kar oranı...)
+# alanları, alanlar maliyet kalemlerini, kalemler toplamları besler. evaluate()
+# önceki değerlendirmenin durumunu alır ve yalnızca değişen girdilerden
+# etkilenen düğümleri yeniden hesaplar; yeniden hesaplanan bir düğümün değeri
+# öncekiyle aynıysa ondan sonraki düğümler de yeniden hesaplanmaz.
+#
+# Modül Streamlit'e bağımlı değildir; grafik app.py içinde tanımlanır.
+
+
+def new_graph(inputs):
+    """Verilen girdi adlarıyla boş bir grafik döndürür."""
+    return {'inputs': tuple(inputs), 'nodes': {}}
+
+
+def add_node(graph, name, deps, compute):
+    """
+    Grafiğe `name` düğümünü ekler. `deps` girdi veya daha önce eklenmiş düğüm adlarıdır;
+    böylece ekleme sırası her zaman geçerli bir topolojik sıradır. compute(**deps) çağrılır.
+    """
+    if name in graph['nodes'] or name in graph['inputs']:
+        raise ValueError(f"'{name}' düğümü zaten tanımlı")
+    unknown = [dep for dep in deps if dep not in graph['nodes'] and dep not in graph['inputs']]
+    if unknown:
+        raise ValueError(f"'{name}' düğümünün bilinmeyen bağımlılıkları: {unknown}")
+    graph['nodes'][name] = (tuple(deps), compute)
+
+
+def node(graph, name, *deps):
+    """add_node() için dekoratör biçimi."""
+    def register(compute):
+        add_node(graph, name, deps, compute)
+        return compute
+    return register
+
+
+def _same(old, new):
+    """İki değerin aynı olup olmadığını döndürür; karşılaştırılamayan değerler (DataFrame vb.) farklı sayılır."""
+    if old is new:
+        return True
+    try:
+        result = old == new
+    except Exception:
+        return False
+    return result if isinstance(result, bool) else False
+
+
+def evaluate(graph, inputs, state=None):
+    """
+    Grafiği değerlendirir ve yeni durumu döndürür: {'inputs', 'values', 'recomputed'}.
+    `state` önceki evaluate() sonucudur; verilirse yalnızca etkilenen düğümler hesaplanır.
+    Önceki durum değiştirilmez (oturumlar arasında paylaşılsa bile güvenlidir).
+    """
+    inputs = {name: inputs[name] for name in graph['inputs']}
+    previous_inputs = state['inputs'] if state else {}
+    values = dict(state['values']) if state else {}
+    dirty = {name for name in graph['inputs'] if name not in previous_inputs or not _same(previous_inputs[name], inputs[name])}
+    values.update(inputs)
+
+    recomputed = []
+    for name, (deps, compute) in graph['nodes'].items():
+        if name in values and not any(dep in dirty for dep in deps):
+            continue
+        value = compute(**{dep: values[dep] for dep in deps})
+        recomputed.append(name)
+        if name in values and _same(values[name], value):
+            continue # Değer değişmediyse bağımlı düğümler yeniden hesaplanmaz
+        values[name] = value
+        dirty.add(name)
+    return {'inputs': inputs, 'values': values, 'recomputed': recomputed}
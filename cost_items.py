@@ -0,0 +1,123 @@
+# ==============================================================================
+# Seçenek Maliyet Kalemleri (Tekil ve Toplu Fiyatlandırmanın Ortak Tabloları)
+# ==============================================================================
+# app.py'deki maliyet grafiği düğümleri ile pricing_engine.py'deki vektörel
+# kalemler seçenek kalemlerini bu tablolardan üretir; bir kalem eklendiğinde
+# veya fiyat anahtarı değiştiğinde iki hesap yolu ayrışmaz. Miktar biçimleri
+# printf biçimidir ('%' ve numpy.char.mod ile aynı sonucu verir).
+#
+# Modül Streamlit'e ve NumPy'a bağımlı değildir.
+
+# Seçenek kalemlerinin girdileri ve varsayılanları (app.SESSION_STATE_DEFAULTS ile aynı)
+OPTION_INPUT_DEFAULTS = {
+    'plasterboard_interior_option': False,
+    'plasterboard_all_option': False,
+    'osb_inner_wall_option': False,
+    'insulation_wall': False,
+    'insulation_floor': False,
+    'insulation_material_type': 'Stone Wool',
+    'exterior_cladding_m2_option': False,
+    'exterior_cladding_m2_val': 0.0,
+    'exterior_wood_cladding_m2_option': False,
+    'exterior_wood_cladding_m2_val': 0.0,
+    'skirting_length_val': 0.0,
+    'laminate_flooring_m2_val': 0.0,
+    'under_parquet_mat_m2_val': 0.0,
+    'osb2_18mm_count_val': 0,
+    'galvanized_sheet_m2_val': 0.0,
+    'concrete_panel_floor_option': False,
+    'concrete_panel_floor_m2_val': 0.0,
+    'terrace_laminated_wood_flooring_option': False,
+    'terrace_laminated_wood_flooring_m2_val': 0.0,
+    'porcelain_tiles_option': False,
+    'porcelain_tiles_m2_val': 0.0,
+    'window_count': 4,
+    'window_size_val': "100x100 cm",
+    'sliding_door_count': 0,
+    'sliding_door_size_val': "200x200 cm",
+    'wc_window_count': 1,
+    'wc_window_size_val': "60x50 cm",
+    'wc_sliding_door_count': 0,
+    'wc_sliding_door_size_val': "140x70 cm",
+    'door_count': 2,
+    'door_size_val': "90x210 cm",
+    'kitchen_choice': 'No Kitchen',
+    'shower_wc': False,
+    'wc_ceramic': False,
+    'wc_ceramic_area': 0.0,
+    'electrical': False,
+    'plumbing': False,
+    'heating': False,
+    'transportation': False,
+    'wheeled_trailer': False,
+    'wheeled_trailer_price': 0.0,
+    'bedroom_set_option': False,
+    'brushed_granite_countertops_option': False,
+    'brushed_granite_countertops_m2_val': 0.0,
+    'premium_faucets_option': False,
+    'integrated_fridge_option': False,
+    'designer_furniture_option': False,
+    'italian_sofa_option': False,
+    'inclass_chairs_option': False,
+    'inclass_chairs_count': 0,
+    'smart_home_systems_option': False,
+    'security_camera_option': False,
+    'white_goods_fridge_tv_option': False,
+    'sofa_option': False,
+}
+
+# Zemin kaplaması kalemleri: (girdi, kalem adı, fiyat anahtarı, miktar biçimi). Arayüzde bu girdiler
+# yalnızca zemin yalıtımı seçiliyken açıktır; kalemler de yalnızca o durumda eklenir.
+FLOOR_MATERIAL_LINES = (
+    ('skirting_length_val', 'Skirting', 'skirting_meter_price', "%.2f m"),
+    ('laminate_flooring_m2_val', 'Laminate Flooring 12mm', 'laminate_flooring_m2_price', "%.2f m²"),
+    ('under_parquet_mat_m2_val', 'Under Parquet Mat 4mm', 'under_parquet_mat_m2_price', "%.2f m²"),
+    ('osb2_18mm_count_val', 'OSB2 18mm Panel', 'osb2_18mm_piece_price', "%d adet"),
+    ('galvanized_sheet_m2_val', '5mm Galvanized Sheet', 'galvanized_sheet_m2_price', "%.2f m²"),
+)
+
+# Paket seçeneği zemin kalemleri: (seçenek, m² girdisi, bilgi metni anahtarı, fiyat anahtarı)
+FLOOR_OPTION_LINES = (
+    ('concrete_panel_floor_option', 'concrete_panel_floor_m2_val', 'concrete_panel_floor_info', 'concrete_panel_floor_price_per_m2'),
+    ('terrace_laminated_wood_flooring_option', 'terrace_laminated_wood_flooring_m2_val', 'treated_pine_floor_info', 'terrace_laminated_wood_flooring_price_per_m2'),
+    ('porcelain_tiles_option', 'porcelain_tiles_m2_val', 'porcelain_tiles_info', 'porcelain_tile_m2_price'),
+)
+
+# Doğramalar: (adet girdisi, ölçü girdisi, kalem adı, fiyat anahtarı, adet 0 iken de listelenir mi)
+OPENING_LINES = (
+    ('window_count', 'window_size_val', 'Window', 'aluminum_window_piece', True),
+    ('sliding_door_count', 'sliding_door_size_val', 'Sliding Glass Door', 'sliding_glass_door_piece', False),
+    ('wc_window_count', 'wc_window_size_val', 'WC Window', 'wc_window_piece', False),
+    ('wc_sliding_door_count', 'wc_sliding_door_size_val', 'WC Sliding Door', 'wc_sliding_door_piece', False),
+    ('door_count', 'door_size_val', 'Door', 'door_piece', True),
+)
+
+# Mutfak seçimi -> (kalem adı, fiyat anahtarı) ve mutfakla listelenen bilgi satırları
+KITCHEN_LINES = {
+    'Standard Kitchen': ('Kitchen (Standard)', 'kitchen_installation_standard_piece'),
+    'Special Design Kitchen': ('Kitchen (Special Design)', 'kitchen_installation_special_piece'),
+}
+KITCHEN_INFO_KEYS = ('induction_hob_info', 'electric_faucet_info', 'kitchen_sink_info', 'kitchen_bathroom_countertops_info')
+
+# Zemin alanıyla fiyatlanan tesisatlar: (seçenek, kalem adı, m² fiyat anahtarı)
+INSTALLATION_LINES = (
+    ('electrical', 'Electrical Installation', 'electrical_per_m2'),
+    ('plumbing', 'Plumbing Installation', 'plumbing_per_m2'),
+    ('heating', 'Floor Heating System', 'floor_heating_m2'),
+)
+
+# Paket donanımları: (seçenek, kalem adı, fiyat anahtarı, miktar girdisi, miktar biçimi). Miktar
+# girdisi None ise kalem tek adettir. Katalogda fiyatı olmayan kalemler (entegre buzdolabı) 0 € ile listelenir.
+FURNISHING_LINES = (
+    ('bedroom_set_option', 'Bedroom Set', 'bedroom_set_total_price', None, None),
+    ('brushed_granite_countertops_option', 'Brushed Granite Countertops', 'brushed_grey_granite_countertops_price_m2_avg', 'brushed_granite_countertops_m2_val', "%.2f m²"),
+    ('premium_faucets_option', 'Premium Faucets', 'premium_faucets_total_price', None, None),
+    ('integrated_fridge_option', 'Integrated Refrigerator', 'integrated_fridge_total_price', None, None),
+    ('designer_furniture_option', 'Designer Furniture', 'designer_furniture_total_price', None, None),
+    ('italian_sofa_option', 'Italian Sofa', 'italian_sofa_total_price', None, None),
+    ('inclass_chairs_option', 'Inclass Chairs', 'inclass_chairs_unit_price', 'inclass_chairs_count', "%d adet"),
+    ('smart_home_systems_option', 'Smart Home Systems', 'smart_home_systems_total_price', None, None),
+    ('security_camera_option', 'Security Camera System', 'security_camera_total_price', None, None),
+    ('white_goods_fridge_tv_option', 'White Goods (Fridge/TV)', 'white_goods_total_price', None, None),
+    ('sofa_option', 'Sofa', 'sofa_total_price', None, None),
+)
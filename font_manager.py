@@ -0,0 +1,54 @@
+# ==============================================================================
+# Font Yöneticisi (Süreç Genelinde TTF Yükleme)
+# ==============================================================================
+# FreeSans TTF dosyaları süreç başına bir kez ayrıştırılır ve ReportLab'e
+# kaydedilir; aynı süreçteki tüm oturumlar ve PDF'ler bu kaydı paylaşır. Yeni
+# süreçler (toplu üretim işçileri, yeniden başlayan sunucu) fontu kendi
+# başlangıçlarında yeniden ayrıştırır; ayrıştırılmış yüz diske yazılmaz.
+
+import logging
+import os
+import threading
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+FONT_FILES = {'FreeSans': "FreeSans.ttf", 'FreeSans-Bold': "FreeSansBold.ttf"}
+MAIN_FONT_FAMILY = 'FreeSans'
+FALLBACK_FONT = "Helvetica"
+
+logger = logging.getLogger("premium_home")
+
+_fonts = {} # font adı -> TTFont (bu süreçte kayıtlı)
+_lock = threading.Lock()
+_main_font = None
+
+
+def register_fonts():
+    """
+    FreeSans fontlarını bu süreçte bir kez kaydeder ve PDF'lerde kullanılacak ana
+    font adını döndürür. Font dosyaları yoksa veya yüklenemezse Helvetica döner.
+    """
+    global _main_font
+    if _main_font is not None:
+        return _main_font
+    with _lock:
+        if _main_font is not None:
+            return _main_font
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        try:
+            for name, file_name in FONT_FILES.items():
+                font_path = os.path.join(FONTS_DIR, file_name)
+                if not os.path.exists(font_path):
+                    raise FileNotFoundError(f"'{file_name}' font dosyası 'fonts/' klasöründe bulunamadı")
+                _fonts[name] = TTFont(name, font_path)
+            for font in _fonts.values():
+                pdfmetrics.registerFont(font)
+            pdfmetrics.registerFontFamily(MAIN_FONT_FAMILY, normal='FreeSans', bold='FreeSans-Bold')
+            _main_font = MAIN_FONT_FAMILY
+        except Exception as e:
+            # Fontlar bulunamazsa veya kaydedilemezse Helvetica'ya geri dön
+            logger.warning(f"Font yükleme hatası: {e}. PDF'lerde '{FALLBACK_FONT}' fontu kullanılacak.")
+            _fonts.clear()
+            _main_font = FALLBACK_FONT
+        return _main_font
+
@@ -0,0 +1,199 @@
+# ==============================================================================
+# Şirket Logosu (Çevrimdışı Öncelikli, Disk Önbellekli)
+# ==============================================================================
+# Logo önce bellekten, sonra disk önbelleğindeki yeniden boyutlandırılmış PNG'den
+# çözülür. Ağ isteği hiçbir zaman çağıranı bekletmez: önbellek eskidiyse veya hiç
+# yoksa arka planda tek bir iş parçacığı ETag/Last-Modified ile koşullu istek atar,
+# yeni logo gelirse önbelleği atomik olarak günceller. Önbellek dizini aynı
+# kullanıcının tüm süreçlerince paylaşıldığından logo yalnızca bir kez indirilip
+# boyutlandırılır. Dizin kullanıcıya özeldir (0700); başka bir kullanıcıya ait
+# veya başkalarınca yazılabilir bir dizindeki dosyalara güvenilmez, süreç kendi
+# geçici dizinini kullanır.
+#
+# Depoda logo dosyası bulunmaz. Önbellek boşken (ilk kurulum, temizlenmiş
+# önbellek dizini) ve URL'ye ulaşılamıyorsa logo None döner; PDF'ler logosuz üretilir ve
+# arka plan yenilemesi LOGO_RETRY_SECONDS aralıklarla yeniden dener. CLI
+# (wait=True) bu durumda bir kez LOGO_FETCH_TIMEOUT süresince bekler.
+
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+
+LOGO_CACHE_DIR = os.environ.get("LOGO_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "premium_home", "logo")
+LOGO_WIDTH_PX = 180 # PNG genişliği (oran korunur)
+LOGO_REFRESH_SECONDS = 24 * 60 * 60 # Önbellekteki logo bu süreden eskiyse arka planda yenilenir
+LOGO_FETCH_TIMEOUT = (3, 10) # requests (bağlantı, okuma) zaman aşımı, saniye
+LOGO_RETRY_SECONDS = 5 * 60 # Başarısız yenilemeden sonra bu süre yeni deneme yapılmaz
+
+logger = logging.getLogger("premium_home")
+
+_logos = {} # URL -> (önbellek dosyasının mtime_ns değeri, base64 PNG)
+_refreshing = set() # Arka planda yenilenen URL'ler
+_last_attempt = {} # URL -> son yenileme denemesinin zamanı (başarısız denemeler her yeniden çalıştırmada tekrarlanmasın)
+_lock = threading.Lock()
+_cache_dir = None # Doğrulanmış önbellek dizini (ilk kullanımda belirlenir)
+
+
+def _is_private_dir(path):
+    """Dizin bu kullanıcıya aitse ve grup/diğerlerine izin vermiyorsa True döndürür (sembolik bağ kabul edilmez)."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o077:
+        return False
+    return not hasattr(os, 'getuid') or st.st_uid == os.getuid()
+
+
+def _get_cache_dir():
+    """
+    LOGO_CACHE_DIR'i 0700 izinle oluşturur ve sahipliğini doğrular. Dizin güvenilir
+    değilse (başka kullanıcıya ait, başkalarınca yazılabilir) uyarı verip bu sürece
+    özel bir geçici dizin döndürür; logo o durumda süreçler arasında paylaşılmaz.
+    """
+    global _cache_dir
+    with _lock:
+        if _cache_dir is None:
+            try:
+                os.makedirs(LOGO_CACHE_DIR, mode=0o700, exist_ok=True)
+            except OSError:
+                pass
+            if _is_private_dir(LOGO_CACHE_DIR):
+                _cache_dir = LOGO_CACHE_DIR
+            else:
+                _cache_dir = tempfile.mkdtemp(prefix="premium_home_logo_")
+                logger.warning(f"Logo önbellek dizini '{LOGO_CACHE_DIR}' bu kullanıcıya özel değil; '{_cache_dir}' kullanılacak.")
+        return _cache_dir
+
+
+def _cache_paths(url):
+    """URL'ye özgü PNG ve meta (ETag/Last-Modified) dosyalarının yollarını döndürür."""
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    base = os.path.join(_get_cache_dir(), f"logo.{digest}")
+    return base + ".png", base + ".json"
+
+
+def _write_atomic(path, data):
+    """Baytları geçici dosyaya yazıp yerine taşır; paralel süreçler yarım dosya görmez."""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def resize_logo(image_bytes):
+    """Görseli LOGO_WIDTH_PX genişliğine orantılı olarak küçültür ve PNG baytları döndürür."""
+    from PIL import Image as PILImage
+    img = PILImage.open(io.BytesIO(image_bytes))
+    w_percent = (LOGO_WIDTH_PX / float(img.size[0]))
+    h_size = int((float(img.size[1]) * float(w_percent)))
+    img = img.resize((LOGO_WIDTH_PX, h_size), PILImage.LANCZOS)
+    buffered = io.BytesIO()
+    img.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+def _read_cached(url):
+    """Disk önbelleğindeki logoyu (bellekte de saklayarak) base64 olarak döndürür; yoksa None."""
+    png_path, _ = _cache_paths(url)
+    try:
+        mtime_ns = os.stat(png_path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _logos.get(url)
+    if cached and cached[0] == mtime_ns: # Başka bir süreç yenilemediyse bellekteki kopya geçerli
+        return cached[1]
+    try:
+        with open(png_path, 'rb') as f:
+            logo_b64 = base64.b64encode(f.read()).decode()
+    except OSError:
+        return None
+    _logos[url] = (mtime_ns, logo_b64)
+    return logo_b64
+
+
+def _is_stale(url):
+    """Son başarılı kontrolün üzerinden LOGO_REFRESH_SECONDS geçtiyse True döndürür."""
+    _, meta_path = _cache_paths(url)
+    try:
+        return time.time() - os.stat(meta_path).st_mtime > LOGO_REFRESH_SECONDS
+    except OSError:
+        return True
+
+
+def refresh_logo(url, timeout=LOGO_FETCH_TIMEOUT):
+    """
+    Logoyu koşullu istekle (If-None-Match / If-Modified-Since) yeniler. Sunucu 304
+    dönerse yalnızca kontrol zamanı güncellenir. Başarıda True, hatada False döner.
+    """
+    import requests
+    png_path, meta_path = _cache_paths(url)
+    meta = {}
+    if os.path.exists(png_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            os.utime(meta_path, None)
+            return True
+        response.raise_for_status() # HTTP hatalarını yakala
+        png = resize_logo(response.content)
+        _write_atomic(png_path, png)
+        meta = {'url': url, 'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        return True
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Logo URL'den alınırken hata oluştu: {e}. Önbellekteki logo kullanılacak.")
+    except Exception as e:
+        logger.warning(f"Logo işlenirken hata oluştu: {e}. Önbellekteki logo kullanılacak.")
+    return False
+
+
+def _refresh_in_background(url):
+    """URL için çalışan bir yenileme yoksa daemon iş parçacığında refresh_logo başlatır."""
+    with _lock:
+        if url in _refreshing or time.monotonic() - _last_attempt.get(url, float('-inf')) < LOGO_RETRY_SECONDS:
+            return
+        _refreshing.add(url)
+        _last_attempt[url] = time.monotonic()
+
+    def run():
+        try:
+            refresh_logo(url)
+        finally:
+            with _lock:
+                _refreshing.discard(url)
+
+    threading.Thread(target=run, name="logo-refresh", daemon=True).start()
+
+
+def get_logo_base64(url, wait=False):
+    """
+    Logoyu base64 PNG olarak döndürür; önbellekte yoksa None. Varsayılan olarak
+    ağı beklemez, gerekirse arka planda yenileme başlatır. wait=True (CLI) ise
+    önbellek boşken bir kez zaman aşımı sınırlı olarak indirir.
+    """
+    logo_b64 = _read_cached(url)
+    if logo_b64 is None and wait:
+        refresh_logo(url)
+        return _read_cached(url)
+    if _is_stale(url):
+        _refresh_in_background(url)
+    return logo_b64
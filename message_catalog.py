@@ -0,0 +1,295 @@
+# ==============================================================================
+# Çok Dilli Mesaj Kataloğu (Anahtar -> EN / GR / TR)
+# ==============================================================================
+# PDF'lerde kullanılan malzeme listeleri ve tablo etiketleri burada tek bir veri
+# tablosunda tutulur. Katalog modül yüklenirken bir kez dil bazlı sözlüklere
+# derlenir; yeni bir dil eklemek için MESSAGES kayıtlarına yeni bir dil kodu
+# eklemek yeterlidir. Bu modül Streamlit'e bağımlı değildir.
+
+import functools
+import re
+
+LANGUAGES = ('en', 'gr', 'tr')
+FALLBACK_LANGUAGE = 'en'
+BULLET = '•'
+
+MESSAGES = {
+    # --- Elektrik Tesisatı ---
+    'electrical_cable_info': {
+        'en': "Electrical Cables (3x2.5 mm², 3x1.5 mm²)",
+        'gr': "Ηλεκτρικά Καλώδια (3x2.5 mm², 3x1.5 mm²)",
+        'tr': "Elektrik Kabloları (3x2.5 mm², 3x1.5 mm²)",
+    },
+    'electrical_conduits_info': {
+        'en': "Conduits and Pipes for Cabling",
+        'gr': "Σωλήνες & Κανάλια για Καλωδίωση",
+        'tr': "Kablolama için Spiral Borular ve Kanallar",
+    },
+    'electrical_junction_boxes_info': {
+        'en': "Junction Boxes",
+        'gr': "Κουτιά Διακλάδωσης",
+        'tr': "Buatlar",
+    },
+    'electrical_distribution_board_info': {
+        'en': "Distribution Board (Fuse Box)",
+        'gr': "Πίνακας Ασφαλειών",
+        'tr': "Sigorta Kutusu (Dağıtım Panosu)",
+    },
+    'electrical_circuit_breakers_info': {
+        'en': "Circuit Breakers & Residual Current Device (RCD)",
+        'gr': "Ασφάλειες & Ρελέ Διαρροής",
+        'tr': "Sigortalar & Kaçak Akım Rölesi",
+    },
+    'electrical_sockets_switches_info': {
+        'en': "Sockets and Switches",
+        'gr': "Πρίζες & Διακόπτες",
+        'tr': "Prizler ve Anahtarlar",
+    },
+    'electrical_lighting_fixtures_info': {
+        'en': "Interior Lighting Fixtures (LED Spots / Ceiling Lamp)",
+        'gr': "Εσωτερικά Φωτιστικά (LED Σποτ / Φωτιστικό Οροφής)",
+        'tr': "İç Aydınlatma Armatürleri (LED Spot / Tavan Lambası)",
+    },
+    'electrical_grounding_info': {
+        'en': "Grounding System Components",
+        'gr': "Σύστημα Γείωσης",
+        'tr': "Topraklama Sistemi Bileşenleri",
+    },
+
+    # --- Sıhhi Tesisat ---
+    'plumbing_clean_water_heading': {
+        'en': "Clean Water System:",
+        'gr': "Σύστημα Καθαρού Νερού:",
+        'tr': "Temiz Su Tesisatı:",
+    },
+    'plumbing_pprc_pipes_info': {
+        'en': "PPRC Pipes for Hot/Cold Water",
+        'gr': "Σωλήνες PPRC για Ζεστό/Κρύο Νερό",
+        'tr': "Sıcak/Soğuk Su için PPRC Borular",
+    },
+    'plumbing_faucets_info': {
+        'en': "Kitchen and Bathroom Faucets",
+        'gr': "Μπαταρίες Κουζίνας και Μπάνιου",
+        'tr': "Mutfak ve Banyo Bataryaları",
+    },
+    'plumbing_shower_mixer_info': {
+        'en': "Shower Head and Mixer",
+        'gr': "Κεφαλή Ντους και Μπαταρία",
+        'tr': "Duş Başlığı ve Bataryası",
+    },
+    'plumbing_valves_info': {
+        'en': "Main and intermediate valves",
+        'gr': "Κύριες και ενδιάμεσες βάνες",
+        'tr': "Ana ve ara kesme vanaları",
+    },
+    'plumbing_wastewater_heading': {
+        'en': "Wastewater System:",
+        'gr': "Σύστημα Ακάθαρτου Νερού:",
+        'tr': "Atık Su Tesisatı:",
+    },
+    'plumbing_pvc_pipes_info': {
+        'en': "PVC Pipes (50mm / 100mm)",
+        'gr': "Σωλήνες PVC (50mm / 100mm)",
+        'tr': "PVC Gider Boruları (50mm / 100mm)",
+    },
+    'plumbing_siphons_info': {
+        'en': "Siphons and floor drains",
+        'gr': "Σιφώνια και σχάρες δαπέδου",
+        'tr': "Sifonlar ve yer süzgeçleri",
+    },
+
+    # --- Mutfak ---
+    'kitchen_materials_intro': {
+        'en': "Standard materials include:",
+        'gr': "Τυπικά υλικά περιλαμβάνουν:",
+        'tr': "Standart malzemeler:",
+    },
+    'kitchen_mdf_info': {
+        'en': "Glossy White Color MDF Material",
+        'gr': "Υλικό MDF Γυαλιστερό Λευκό Χρώμα",
+        'tr': "Parlak Beyaz Renk MDF Malzeme",
+    },
+    'kitchen_cabinets_info': {
+        'en': "Special Production Kitchen Cabinets (custom dimensions)",
+        'gr': "Ειδικές Κατασκευές Ντουλαπιών Κουζίνας (προσαρμοσμένες διαστάσεις)",
+        'tr': "Özel Üretim Mutfak Dolapları (özel ölçülerde)",
+    },
+    'kitchen_countertop_info': {
+        'en': "Countertop (Laminate or specified equivalent)",
+        'gr': "Πάγκος (Laminate ή καθορισμένο ισοδύναμο)",
+        'tr': "Tezgah (Laminat veya belirtilen eşdeğeri)",
+    },
+    'kitchen_sink_faucet_info': {
+        'en': "Sink and Faucet",
+        'gr': "Νεροχύτης και Βρύση",
+        'tr': "Evye ve Batarya",
+    },
+    'kitchen_materials_note': {
+        'en': "Note: Final material selection and detailed list will be provided upon design approval.",
+        'gr': "Σημείωση: Η τελική επιλογή υλικών και η λεπτομερής λίστα θα παρασχεθούν μετά την έγκριση του σχεδιασμού.",
+        'tr': "Not: Malzeme seçimi sonrası nihai ve detaylı liste tasarım onayı ile birlikte sunulacaktır.",
+    },
+
+    # --- Duş / WC ---
+    'wc_shower_unit_info': {
+        'en': "Shower Unit (Shower Head & Mixer)",
+        'gr': "Μονάδα Ντους (Κεφαλή Ντους & Μπαταρία)",
+        'tr': "Duş Ünitesi (Duş Başlığı ve Batarya)",
+    },
+    'wc_toilet_bowl_info': {
+        'en': "Toilet Bowl & Cistern",
+        'gr': "Λεκάνη Τουαλέτας & Καζανάκι",
+        'tr': "Klozet & Rezervuar",
+    },
+    'wc_washbasin_info': {
+        'en': "Washbasin & Faucet",
+        'gr': "Νιπτήρας & Μπαταρία",
+        'tr': "El Yıkama Lavabosu & Batarya",
+    },
+    'wc_towel_rail_info': {
+        'en': "Towel Rail",
+        'gr': "Πετσετοθήκη",
+        'tr': "Havluluk",
+    },
+    'wc_mirror_info': {
+        'en': "Mirror",
+        'gr': "Καθρέφτης",
+        'tr': "Ayna",
+    },
+    'wc_accessories_info': {
+        'en': "Bathroom Accessories",
+        'gr': "Αξεσουάρ Μπάνιου",
+        'tr': "Banyo Aksesuarları",
+    },
+
+    # --- Yerden Isıtma (bileşen etiketi ve açıklaması) ---
+    'heating_elements_label': {'en': "Heating Elements", 'gr': "Στοιχεία Θέρμανσης", 'tr': "Isıtma Elemanları"},
+    'heating_elements_info': {'en': "Nano Heat Paint", 'gr': "Νάνο Θερμική Βαφή", 'tr': "Nano Isı Boyası"},
+    'heating_transformer_label': {'en': "Transformer", 'gr': "Μετατροπέας", 'tr': "Trafo"},
+    'heating_transformer_info': {'en': "48V 2000W Transformer", 'gr': "Μετασχηματιστής 48V 2000W", 'tr': "48V 2000W Trafo"},
+    'heating_thermostat_label': {'en': "Thermostat", 'gr': "Θερμοστάτης", 'tr': "Termostat"},
+    'heating_thermostat_info': {'en': "Thermostat Control Unit", 'gr': "Μονάδα Ελέγχου Θερμοστάτη", 'tr': "Termostat Kontrol Ünitesi"},
+    'heating_wiring_label': {'en': "Wiring", 'gr': "Καλωδίωση", 'tr': "Kablolama"},
+    'heating_wiring_info': {'en': "Wiring and Connection Terminals", 'gr': "Καλωδίωση και Τερματικά Σύνδεσης", 'tr': "Kablolama ve Bağlantı Terminalleri"},
+    'heating_insulation_label': {'en': "Insulation", 'gr': "Μόνωση", 'tr': "Yalıtım Katmanları"},
+    'heating_insulation_info': {'en': "Insulation Layers", 'gr': "Στρώσεις Μόνωσης", 'tr': "Yalıtım Katmanları"},
+    'heating_subfloor_label': {'en': "Subfloor Materials", 'gr': "Υλικά Υποδαπέδου", 'tr': "Zemin Hazırlık Malzemeleri"},
+    'heating_subfloor_info': {'en': "Subfloor Preparation Materials", 'gr': "Υλικά Προετοιμασίας Υποδαπέδου", 'tr': "Zemin Hazırlık Malzemeleri"},
+
+    # --- Tablo Etiketleri ---
+    'kitchen_label': {'en': "Kitchen", 'gr': "Κουζίνα", 'tr': "Mutfak"},
+    'kitchen_materials_label': {'en': "Kitchen Materials", 'gr': "Υλικά Κουζίνας", 'tr': "Mutfak Malzemeleri"},
+    'shower_wc_label': {'en': "Shower/WC", 'gr': "Ντους/WC", 'tr': "Duş/WC"},
+    'shower_wc_materials_label': {'en': "Shower/WC Materials", 'gr': "Υλικά Ντους/WC", 'tr': "Duş/WC Malzemeleri"},
+    'electrical_label': {'en': "Electrical", 'gr': "Ηλεκτρολογικά", 'tr': "Elektrik Tesisatı"},
+    'plumbing_label': {'en': "Plumbing", 'gr': "Υδραυλικά", 'tr': "Sıhhi Tesisat"},
+    'component_label': {'en': "Component", 'gr': "Εξάρτημα", 'tr': "Bileşen"},
+    'description_label': {'en': "Description", 'gr': "Περιγραφή", 'tr': "Açıklama"},
+    'yes': {'en': "Yes", 'gr': "Ναι", 'tr': "Evet"},
+    'no': {'en': "No", 'gr': "Όχι", 'tr': "Hayır"},
+}
+
+# Madde listeleri: ('heading', anahtar) kalın ara başlık, ('text', anahtar) düz satır,
+# ('item', anahtar) madde işaretli satırdır.
+MESSAGE_LISTS = {
+    'electrical_materials': [
+        ('item', 'electrical_cable_info'),
+        ('item', 'electrical_conduits_info'),
+        ('item', 'electrical_junction_boxes_info'),
+        ('item', 'electrical_distribution_board_info'),
+        ('item', 'electrical_circuit_breakers_info'),
+        ('item', 'electrical_sockets_switches_info'),
+        ('item', 'electrical_lighting_fixtures_info'),
+        ('item', 'electrical_grounding_info'),
+    ],
+    'plumbing_materials': [
+        ('heading', 'plumbing_clean_water_heading'),
+        ('item', 'plumbing_pprc_pipes_info'),
+        ('item', 'plumbing_faucets_info'),
+        ('item', 'plumbing_shower_mixer_info'),
+        ('item', 'plumbing_valves_info'),
+        ('heading', 'plumbing_wastewater_heading'),
+        ('item', 'plumbing_pvc_pipes_info'),
+        ('item', 'plumbing_siphons_info'),
+    ],
+    'kitchen_materials': [
+        ('text', 'kitchen_materials_intro'),
+        ('item', 'kitchen_mdf_info'),
+        ('item', 'kitchen_cabinets_info'),
+        ('item', 'kitchen_countertop_info'),
+        ('item', 'kitchen_sink_faucet_info'),
+        ('text', 'kitchen_materials_note'),
+    ],
+    'shower_wc_materials': [
+        ('item', 'wc_shower_unit_info'),
+        ('item', 'wc_toilet_bowl_info'),
+        ('item', 'wc_washbasin_info'),
+        ('item', 'wc_towel_rail_info'),
+        ('item', 'wc_mirror_info'),
+        ('item', 'wc_accessories_info'),
+    ],
+}
+
+# Yerden ısıtma ekindeki tablo satırları: (bileşen etiketi, açıklama)
+FLOOR_HEATING_COMPONENTS = [
+    ('heating_elements_label', 'heating_elements_info'),
+    ('heating_transformer_label', 'heating_transformer_info'),
+    ('heating_thermostat_label', 'heating_thermostat_info'),
+    ('heating_wiring_label', 'heating_wiring_info'),
+    ('heating_insulation_label', 'heating_insulation_info'),
+    ('heating_subfloor_label', 'heating_subfloor_info'),
+]
+
+
+def _normalise(text):
+    """Görünmez karakterleri ve ardışık boşlukları tek boşluğa indirir."""
+    return re.sub(r'[\u00A0\u200B\s]+', ' ', text).strip()
+
+
+def _compile(messages):
+    """Kataloğu dil kodu -> {anahtar: metin} sözlüklerine bir kez derler."""
+    compiled = {}
+    for key, translations in messages.items():
+        for language, text in translations.items():
+            compiled.setdefault(language, {})[key] = _normalise(text)
+    return compiled
+
+
+_CATALOG = _compile(MESSAGES)
+
+
+def get_message(key, language):
+    """Anahtarın verilen dildeki metnini döndürür; çeviri yoksa İngilizceye düşer."""
+    texts = _CATALOG.get(language)
+    if texts is not None and key in texts:
+        return texts[key]
+    return _CATALOG[FALLBACK_LANGUAGE][key]
+
+
+def _joined(key, languages, separator):
+    return separator.join(get_message(key, language) for language in languages)
+
+
+@functools.lru_cache(maxsize=None)
+def bilingual(key, languages=('en', 'gr'), separator=' / '):
+    """Bir anahtarı birden fazla dilde 'EN / GR' biçiminde birleştirir."""
+    return _joined(key, languages, separator)
+
+
+@functools.lru_cache(maxsize=None)
+def bullet_list(name, languages=('en',), separator=' / '):
+    """
+    MESSAGE_LISTS içindeki listeyi Paragraph'a verilecek '<br/>' ayrımlı metne çevirir.
+    Birden fazla dil verilirse her satır 'EN / GR' biçiminde yazılır. Sonuç
+    önbelleğe alındığı için her PDF'te yeniden birleştirilmez.
+    """
+    parts = []
+    for kind, key in MESSAGE_LISTS[name]:
+        text = _joined(key, languages, separator)
+        if kind == 'heading':
+            parts.append(f"<b>{text}</b>")
+        elif kind == 'item':
+            parts.append(f"{BULLET} {text}")
+        else:
+            parts.append(text)
+    return '<br/>'.join(parts)
@@ -0,0 +1,102 @@
+# ==============================================================================
+# Para Birimi Katmanı (Tam Sayı Kuruş, Yuvarlama Politikaları, Biçimlendirme)
+# ==============================================================================
+# Tutarlar içeride int (tekil) veya int64 NumPy dizisi (toplu) olarak kuruş
+# cinsinden tutulur; toplama ve çıkarma böylece kesindir. Kayan noktalı bir
+# çarpımın sonucu (m² x birim fiyat, tutar x oran) kuruşa açık bir politika
+# ile çevrilir: 'ceil' (yukarı, mevcut fiyatlandırma kuralı) veya 'half_even'
+# (banker yuvarlaması). Çarpımdan kalan ikili gösterim gürültüsü (örn.
+# 73690.00000000001 kuruş) yuvarlamadan önce en yakın tam kuruşa oturtulur,
+# böylece 14738.00 * %5 = 736.90 olur, 736.91 değil.
+#
+# Modül Streamlit'e bağımlı değildir; NumPy yalnızca dizi fonksiyonlarında
+# içe aktarılır.
+
+import math
+
+CEIL = 'ceil'
+HALF_EVEN = 'half_even'
+CENT_TOLERANCE = 1e-6 # Bu kadar yakın kuruş değerleri tam kuruş sayılır (kayan nokta gürültüsü)
+
+
+def cents_from_float(cents, rounding=CEIL):
+    """Kuruş cinsinden kayan noktalı değeri politikaya göre tam sayı kuruşa çevirir."""
+    nearest = round(cents)
+    if abs(cents - nearest) <= CENT_TOLERANCE:
+        return int(nearest)
+    if rounding == CEIL:
+        return math.ceil(cents)
+    if rounding == HALF_EVEN:
+        return round(cents) # Python round() çift sayıya yuvarlar
+    raise ValueError(f"Bilinmeyen yuvarlama politikası: '{rounding}'")
+
+
+def to_cents(euros, rounding=CEIL):
+    """Euro tutarını tam sayı kuruşa çevirir."""
+    return cents_from_float(euros * 100, rounding)
+
+
+def from_cents(cents):
+    """Kuruşu euro (float) olarak döndürür; DataFrame ve PDF arayüzleri euro bekler."""
+    return cents / 100
+
+
+def multiply(cents, factor, rounding=CEIL):
+    """Kuruş tutarını bir miktar veya oranla çarpar ve sonucu politikaya göre kuruşa yuvarlar."""
+    return cents_from_float(cents * factor, rounding)
+
+
+def round_euros(euros, rounding=CEIL):
+    """Euro tutarını kuruşa yuvarlanmış euro olarak döndürür (float arayüzler için)."""
+    return from_cents(to_cents(euros, rounding))
+
+
+# --- Dizi (NumPy) Karşılıkları ---
+def cents_from_float_array(cents, rounding=CEIL):
+    """cents_from_float() fonksiyonunun int64 dizisi döndüren vektörel karşılığı."""
+    import numpy as np
+    cents = np.asarray(cents, dtype=float)
+    nearest = np.rint(cents) # np.rint çift sayıya yuvarlar (half-even)
+    if rounding == CEIL:
+        rounded = np.ceil(cents)
+    elif rounding == HALF_EVEN:
+        rounded = nearest
+    else:
+        raise ValueError(f"Bilinmeyen yuvarlama politikası: '{rounding}'")
+    return np.where(np.abs(cents - nearest) <= CENT_TOLERANCE, nearest, rounded).astype(np.int64)
+
+
+def to_cents_array(euros, rounding=CEIL):
+    """Euro dizisini int64 kuruş dizisine çevirir."""
+    import numpy as np
+    return cents_from_float_array(np.asarray(euros, dtype=float) * 100, rounding)
+
+
+def multiply_array(cents, factors, rounding=CEIL):
+    """Kuruş dizisini miktar/oran dizisiyle çarpar ve politikaya göre int64 kuruşa yuvarlar."""
+    import numpy as np
+    return cents_from_float_array(np.asarray(cents, dtype=np.int64) * np.asarray(factors, dtype=float), rounding)
+
+
+def from_cents_array(cents):
+    """int64 kuruş dizisini euro (float64) dizisine çevirir."""
+    import numpy as np
+    return np.asarray(cents, dtype=np.int64) / 100
+
+
+# --- Biçimlendirme ---
+def format_cents(cents, locale='eu', symbol='€'):
+    """
+    Tam sayı kuruşu para birimi metnine çevirir: 'eu' (TR/GR) -> €1.234,56, 'en' -> €1,234.56.
+    """
+    return format_euros(cents / 100, locale, symbol) # |kuruş| < 2**53 için iki ondalık basamak kesindir
+
+
+def format_euros(euros, locale='eu', symbol='€'):
+    """Kuruşa yuvarlanmış euro tutarını (float) format_cents() ile aynı biçimde yazar."""
+    if locale == 'eu':
+        # Binlikler '_' ile gruplanır; böylece geçici 'X' karakteri olmadan iki replace() yeter
+        return f"{symbol}{euros:_.2f}".replace('.', ',').replace('_', '.')
+    if locale == 'en':
+        return f"{symbol}{euros:,.2f}"
+    raise ValueError(f"Bilinmeyen para biçimi: '{locale}'")
@@ -0,0 +1,86 @@
+# ==============================================================================
+# PDF Sonuç Önbelleği (İçerik Adresli, Bayt Bütçeli LRU)
+# ==============================================================================
+# Aynı girdilerle üretilen PDF'ler tekrar oluşturulmaz. Anahtar; belge türü, proje
+# detayları, müşteri bilgileri, notlar, dil ve fiyat kataloğu sürümünün kanonik
+# JSON özetidir (SHA-256). Önbellek toplam bayt boyutuyla sınırlıdır; sınır
+# aşıldığında en uzun süredir kullanılmayan PDF'ler atılır. Modül seviyesinde
+# tutulduğu için tüm Streamlit oturumları aynı önbelleği paylaşır.
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+PDF_CACHE_MAX_MB = float(os.environ.get("PDF_CACHE_MAX_MB", "64"))
+
+_entries = OrderedDict() # anahtar -> PDF baytları (sondaki en son kullanılan)
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
+
+
+def _json_default(value):
+    """JSON'a doğrudan çevrilemeyen değerleri (NumPy sayıları, datetime vb.) metne çevirir."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def make_key(*parts):
+    """Verilen parçaların kanonik JSON gösteriminden içerik adresli bir anahtar üretir."""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def get(key):
+    """Önbellekteki PDF baytlarını döndürür; yoksa None. İsabetler LRU sırasını günceller."""
+    with _lock:
+        data = _entries.get(key)
+        if data is None:
+            _stats['misses'] += 1
+            return None
+        _entries.move_to_end(key)
+        _stats['hits'] += 1
+        return data
+
+
+def put(key, data, max_bytes=None):
+    """PDF baytlarını önbelleğe ekler ve bayt bütçesi aşılırsa en eski kayıtları atar."""
+    max_bytes = int(PDF_CACHE_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+    size = len(data)
+    if size > max_bytes:
+        return # Bütçeden büyük tek bir PDF önbelleğe alınmaz
+    with _lock:
+        previous = _entries.pop(key, None)
+        if previous is not None:
+            _stats['bytes'] -= len(previous)
+        _entries[key] = data
+        _stats['bytes'] += size
+        while _stats['bytes'] > max_bytes:
+            _, evicted = _entries.popitem(last=False)
+            _stats['bytes'] -= len(evicted)
+            _stats['evictions'] += 1
+
+
+def get_or_build(key, builder):
+    """Anahtar önbellekte varsa PDF'i döndürür, yoksa builder() ile üretip saklar."""
+    data = get(key)
+    if data is None:
+        data = builder()
+        put(key, data)
+    return data
+
+
+def stats():
+    """İsabet/ıskalama sayaçlarını, kayıt sayısını ve toplam boyutu döndürür."""
+    with _lock:
+        return {**_stats, 'entries': len(_entries), 'max_bytes': int(PDF_CACHE_MAX_MB * 1024 * 1024)}
+
+
+def clear():
+    """Önbelleği ve sayaçları sıfırlar."""
+    with _lock:
+        _entries.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,103 @@
+# ==============================================================================
+# PDF İşçi Süreçleri (Çok Dilli Teklifleri Eşzamanlı Üretme)
+# ==============================================================================
+# ReportLab saf Python'dur; aynı süreçteki iş parçacıkları GIL yüzünden PDF'leri
+# fiilen sırayla üretir. Aynı hesaplama sonucundan üretilecek belgeler (EN/GR
+# teklif, TR teklif, sözleşme) bu modüldeki süreç havuzuna gönderilir; toplam
+# süre en yavaş belgenin süresine yaklaşır.
+#
+# Havuz 'spawn' ile başlatılır: Streamlit sunucusu çok iş parçacıklıdır ve fork
+# kilitleri kopyalayabilir. Her işçi app modülünü ve fontları bir kez yükler.
+# PDF_RENDER_PROCESSES=0 (tek çekirdekte varsayılan) havuzu kapatır; belgeler o
+# zaman çağıranın sürecinde üretilir.
+
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+_CPU_COUNT = os.cpu_count() or 1
+PDF_RENDER_PROCESSES = int(os.environ.get("PDF_RENDER_PROCESSES", str(min(3, _CPU_COUNT) if _CPU_COUNT > 1 else 0)))
+
+# İşçiye gönderilen teklif alanları (build_quote_pdf yalnızca bunları okur). Maliyet
+# grafiği durumu hiç taşınmaz; maliyet tablosu yalnızca dahili rapor için gönderilir.
+QUOTE_PDF_FIELDS = ('project_details', 'customer_info', 'notes', 'house_price', 'house_price_no_vat', 'solar_price')
+DOCUMENT_EXTRA_FIELDS = {'internal_cost_report': ('cost_results', 'catalog_version')} # Yalnızca bu belgenin okuduğu alanlar
+
+logger = logging.getLogger("premium_home")
+
+_state = {'executor': None}
+_lock = threading.Lock()
+_app = None # İşçi süreçte yüklenen app modülü
+
+
+def _init_worker():
+    """İşçi süreç başlatıcısı: app modülünü (Streamlit uyarıları bastırılarak) ve PDF desteğini yükler."""
+    global _app
+    import streamlit.logger
+    streamlit.logger.set_log_level("error") # Başsız çalışmada 'ScriptRunContext' uyarılarını gizle
+    import app
+    app.load_pdf_support()
+    _app = app
+
+
+def _render(document, quote, logo_data_b64):
+    """İşçi süreçte belgeyi üretir; (PDF baytları, aşama süreleri) döndürür."""
+    import stage_timing
+    with stage_timing.trace('pdf_worker') as record:
+        pdf_bytes = _app.build_quote_pdf(document, quote, logo_data_b64)
+    return pdf_bytes, record['stages']
+
+
+def _ping():
+    return os.getpid()
+
+
+def get_pool():
+    """Süreç havuzunu ilk kullanımda oluşturur ve döndürür; havuz kapalıysa None."""
+    if PDF_RENDER_PROCESSES <= 0:
+        return None
+    with _lock:
+        if _state['executor'] is None:
+            _state['executor'] = ProcessPoolExecutor(
+                max_workers=PDF_RENDER_PROCESSES, mp_context=multiprocessing.get_context('spawn'), initializer=_init_worker,
+            )
+        return _state['executor']
+
+
+def warm_up():
+    """Havuz henüz yoksa işçileri arka planda başlatır; ilk teklifte süreç açılışı ve font yüklemesi beklenmez."""
+    if _state['executor'] is not None:
+        return
+    pool = get_pool()
+    if pool is not None:
+        for _ in range(PDF_RENDER_PROCESSES):
+            pool.submit(_ping)
+
+
+def _reset_pool(pool):
+    """Bozulan havuzu kapatır; sonraki get_pool() çağrısı yenisini oluşturur."""
+    with _lock:
+        if _state['executor'] is pool:
+            _state['executor'] = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def render_in_worker(document, quote, logo_data_b64=None):
+    """
+    Belgeyi bir işçi süreçte üretir ve (PDF baytları, aşama süreleri) döndürür. Havuz
+    kapalıysa veya işçi süreç çöktüyse None döner; çağıran belgeyi kendi sürecinde üretir.
+    """
+    pool = get_pool()
+    if pool is None:
+        return None
+    payload = {field: quote[field] for field in QUOTE_PDF_FIELDS + DOCUMENT_EXTRA_FIELDS.get(document, ())}
+    try:
+        return pool.submit(_render, document, payload, logo_data_b64).result()
+    except (BrokenProcessPool, pickle.PicklingError) as e: # Belge hataları olduğu gibi yükseltilir
+        logger.warning(f"PDF işçi süreci kullanılamadı ({type(e).__name__}: {e}); belge bu süreçte üretilecek.")
+        _reset_pool(pool)
+        return None
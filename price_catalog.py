@@ -0,0 +1,124 @@
+# ==============================================================================
+# Fiyat Kataloğu: Malzeme/İşçilik Fiyatları, Bilgi Kalemleri ve Sabit Oranlar
+# ==============================================================================
+# Bu modül Streamlit'e bağımlı değildir; hem app.py hem de toplu fiyatlandırma
+# motoru (pricing_engine.py) aynı tanımları buradan kullanır.
+#
+# Fiyatlar price_catalog.json dosyasından (veya PRICE_CATALOG_PATH ortam
+# değişkenindeki dosyadan) değiştirilemez bir Catalog yapısına yüklenir.
+# get_catalog() dosya değiştiyse kataloğu yeniden yükler; böylece fiyat
+# güncellemesi yeniden başlatma gerektirmez. Her hesaplama kullandığı kataloğun
+# sürüm kimliğini teklife ekler ve bu kimlik PDF önbellek anahtarına girer.
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+CATALOG_PATH = os.environ.get(
+    "PRICE_CATALOG_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "price_catalog.json")
+)
+
+logger = logging.getLogger("premium_home")
+
+# Tüm fiyatlar KDV hariç maliyet fiyatlarıdır. steel_profiles, "steel_profile_<tip>"
+# fiyatlarının profil tipine göre indeksidir (örn. "100x100x3" -> 45.0).
+Catalog = namedtuple('Catalog', [
+    'version', 'label', 'prices', 'steel_profiles', 'material_info',
+    'fire_rate', 'vat_rate', 'annual_income_tax_rate',
+    'monthly_accounting_expenses', 'monthly_office_rent',
+    'osb_panel_area_m2', 'gypsum_board_unit_area_m2', 'glass_wool_m2_per_packet',
+])
+
+# Katalog dosyasındaki bölüm -> alan adları (hepsi zorunlu ve sayısal)
+_NUMERIC_FIELDS = {
+    'rates': ('fire_rate', 'vat_rate', 'annual_income_tax_rate'),
+    'overheads': ('monthly_accounting_expenses', 'monthly_office_rent'),
+    'units': ('osb_panel_area_m2', 'gypsum_board_unit_area_m2', 'glass_wool_m2_per_packet'),
+}
+
+_state = {'catalog': None, 'signature': None} # Geçerli katalog ve yüklendiği dosyanın (mtime_ns, boyut) imzası
+_lock = threading.Lock()
+
+
+# --- Katalog Sürümü ---
+# Ayrıştırılmış kataloğun tamamından (fiyatlar, bilgi kalemleri, oranlar, giderler,
+# birimler) türetilen kısa özet. Dosyadaki "version" etiketi unutularak artırılmasa
+# bile herhangi bir değişiklik (PDF'lere giren bir malzeme metni dahil) yeni bir kimlik üretir.
+def catalog_fingerprint(fields):
+    """Ayrıştırılmış katalog alanları için kararlı, kısa bir sürüm kimliği döndürür."""
+    payload = json.dumps(fields, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def parse_catalog(data):
+    """Katalog sözlüğünü doğrular ve Catalog döndürür; eksik/hatalı alanda ValueError yükseltir."""
+    prices = data.get('prices')
+    if not isinstance(prices, dict) or not prices:
+        raise ValueError("'prices' bölümü eksik veya boş")
+    for key, value in prices.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"'{key}' fiyatı sayı değil: {value!r}")
+    numeric = {}
+    for section, fields in _NUMERIC_FIELDS.items():
+        values = data.get(section) or {}
+        for field in fields:
+            value = values.get(field)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"'{section}.{field}' eksik veya sayı değil")
+            numeric[field] = float(value)
+
+    prices = {key: float(value) for key, value in prices.items()}
+    material_info = {key: str(value) for key, value in (data.get('material_info') or {}).items()}
+    label = str(data.get('version', '0'))
+    fingerprint = catalog_fingerprint({'label': label, 'prices': prices, 'material_info': material_info, **numeric})
+    return Catalog(
+        version=f"v{label}-{fingerprint}",
+        label=label,
+        prices=MappingProxyType(prices),
+        steel_profiles=MappingProxyType({
+            key[len("steel_profile_"):]: value for key, value in prices.items() if key.startswith("steel_profile_")
+        }),
+        material_info=MappingProxyType(material_info),
+        **numeric,
+    )
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Katalog dosyasını okuyup Catalog döndürür (önbelleğe almaz)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_catalog(json.load(f))
+
+
+def get_catalog():
+    """
+    Geçerli kataloğu döndürür. Dosyanın değişiklik zamanı veya boyutu değiştiyse
+    yeniden yükler; yeni dosya okunamaz veya geçersizse önceki katalog kullanılmaya
+    devam eder (ilk yüklemede hata yükseltilir).
+    """
+    try:
+        stat = os.stat(CATALOG_PATH)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    if _state['catalog'] is not None and signature in (None, _state['signature']):
+        return _state['catalog']
+    with _lock:
+        if _state['catalog'] is not None and signature == _state['signature']:
+            return _state['catalog']
+        try:
+            catalog = load_catalog(CATALOG_PATH)
+        except (OSError, ValueError) as e:
+            if _state['catalog'] is None:
+                raise
+            logger.warning(f"Fiyat kataloğu yeniden yüklenemedi ({CATALOG_PATH}): {e}. {_state['catalog'].version} kullanılmaya devam ediliyor.")
+            _state['signature'] = signature # Aynı hatalı dosya her çağrıda tekrar okunmasın
+            return _state['catalog']
+        if _state['catalog'] is not None and catalog.version != _state['catalog'].version:
+            logger.info(f"Fiyat kataloğu yeniden yüklendi: {_state['catalog'].version} -> {catalog.version}")
+        _state['catalog'] = catalog
+        _state['signature'] = signature
+        return catalog
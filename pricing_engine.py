@@ -0,0 +1,432 @@
+# ==============================================================================
+# Toplu Fiyatlandırma Motoru (Streamlit'siz)
+# ==============================================================================
+# calculate_costs_detailed() fonksiyonunun vektörel karşılığıdır. Binlerce proje
+# konfigürasyonunu (DataFrame veya kolon dizileri) tek geçişte fiyatlandırır;
+# tek tek Python sözlükleri üzerinde döngü kurmaya gerek kalmaz. Seçenek ve paket
+# kalemleri app.py'deki maliyet grafiğiyle aynı tablolardan (cost_items) üretilir.
+
+import numpy as np
+import pandas as pd
+
+import cost_items
+import money
+from price_catalog import get_catalog
+
+# Çelik profil tipleri ve girdi kolon adları (calculate_costs_detailed ile aynı sırada)
+PROFILE_COUNT_COLUMNS = {
+    "100x100x3": "profile_100x100_count",
+    "100x50x3": "profile_100x50_count",
+    "40x60x2": "profile_40x60_count",
+    "50x50x2": "profile_50x50_count",
+    "120x60x5mm": "profile_120x60x5mm_count",
+    "HEA160": "profile_HEA160_count",
+}
+
+STANDARD_WELDING = 'Standard Welding (160€/m²)'
+
+# Eksik kolonlar için varsayılan değerler (Streamlit oturum varsayılanlarıyla aynı)
+INPUT_DEFAULTS = {
+    'structure_type': 'Light Steel',
+    'welding_type': STANDARD_WELDING,
+    'facade_sandwich_panel_option': False,
+    'profit_rate': 0.20,
+    **{column: 0 for column in PROFILE_COUNT_COLUMNS.values()},
+    **cost_items.OPTION_INPUT_DEFAULTS,
+}
+
+# Varsayılan değerin tipi -> kolon dizisi tipi (kar oranı ayrıca çözülür)
+COLUMN_DTYPES = {bool: bool, int: np.int64, float: float, str: str}
+
+LINE_ITEM_COLUMNS = ['project', 'Item', 'Quantity', 'Unit Price (€)', 'Total (€)']
+
+# Oturum girdisi adı (session_state anahtarı) -> fiyatlandırma kolonu (adı farklı olanlar)
+INPUT_COLUMN_ALIASES = {'width_val': 'width', 'length_val': 'length', 'height_val': 'height'}
+
+
+def _profit_rate_value(value):
+    """Kar oranını ('20%', 0.20) demeti veya doğrudan sayı olarak kabul eder."""
+    if isinstance(value, (tuple, list)):
+        return float(value[1])
+    return float(value)
+
+
+def inputs_frame(inputs_list, index=None):
+    """Oturum girdisi sözlüklerini (session_state anahtarları) price_projects() kolonlarına çevirir."""
+    columns = {**INPUT_COLUMN_ALIASES, **{name: name for name in INPUT_DEFAULTS}}
+    return pd.DataFrame({column: [inputs[key] for inputs in inputs_list] for key, column in columns.items()}, index=index)
+
+
+def _column_arrays(projects):
+    """DataFrame veya kolon sözlüğünü eşit uzunlukta NumPy dizilerine dönüştürür."""
+    if isinstance(projects, pd.DataFrame):
+        columns = {name: projects[name].to_numpy() for name in projects.columns}
+    else:
+        columns = {name: np.asarray(values) for name, values in projects.items()}
+
+    for required in ('width', 'length', 'height'):
+        if required not in columns:
+            raise ValueError(f"Toplu fiyatlandırma için '{required}' kolonu zorunludur.")
+    n_projects = len(columns['width'])
+
+    arrays = {
+        'width': columns['width'].astype(float),
+        'length': columns['length'].astype(float),
+        'height': columns['height'].astype(float),
+    }
+    for name, default in INPUT_DEFAULTS.items():
+        values = columns.get(name)
+        if values is None:
+            values = np.full(n_projects, default, dtype=object)
+        arrays[name] = values
+
+    arrays['profit_rate'] = np.fromiter(
+        (_profit_rate_value(v) for v in arrays['profit_rate']), dtype=float, count=n_projects
+    )
+    for name, default in INPUT_DEFAULTS.items():
+        if name != 'profit_rate':
+            arrays[name] = arrays[name].astype(COLUMN_DTYPES[type(default)])
+    return arrays, n_projects
+
+
+def calculate_areas_batch(width, length, height):
+    """calculate_area() fonksiyonunun dizi karşılığı: zemin, duvar ve çatı alanları."""
+    width = np.asarray(width, dtype=float)
+    length = np.asarray(length, dtype=float)
+    height = np.asarray(height, dtype=float)
+    floor_area = width * length
+    wall_area = np.ceil(2 * (width + length) * height)
+    return {"floor": floor_area, "wall": wall_area, "roof": floor_area}
+
+
+def _line_item_slots(arrays, areas, n_projects, catalog, with_labels=True):
+    """Her maliyet kalemi için (maske, kalem adı, miktar, birim fiyat, toplam kuruş) dizilerini üretir.
+
+    Kalemler calculate_costs_detailed() içindeki ekleme sırasıyla döndürülür; kalem
+    toplamları tekil hesaplamayla aynı money.to_cents kuralıyla kuruşa çevrilir.
+    with_labels=False ise yalnızca toplamlar gerektiğinden miktar metinleri ve
+    kaynak kalem adları üretilmez (None olur); metin biçimlendirme en pahalı adımdır.
+    """
+    def label(fmt, values):
+        return np.char.mod(fmt, values) if with_labels else None
+
+    def constant_label(text):
+        return np.full(n_projects, text, dtype=object) if with_labels else None
+
+    def cost_slot(mask, item, quantity, unit_price, amount):
+        unit_price = np.broadcast_to(np.asarray(unit_price, dtype=float), (n_projects,))
+        return (mask, item, quantity, unit_price, money.to_cents_array(np.broadcast_to(amount, (n_projects,))))
+
+    def info_slot(mask, item):
+        return (mask, item, constant_label('N/A'), np.zeros(n_projects), np.zeros(n_projects, dtype=np.int64))
+
+    prices = catalog.prices
+    material_info = catalog.material_info
+    floor_area = areas['floor']
+    wall_area = areas['wall']
+    roof_area = areas['roof']
+    floor_qty = label('%.2f m²', floor_area)
+    is_light = arrays['structure_type'] == 'Light Steel'
+
+    profile_counts = np.column_stack([arrays[c] for c in PROFILE_COUNT_COLUMNS.values()])
+    has_manual_profiles = is_light & profile_counts.any(axis=1)
+    uses_auto_profiles = is_light & ~has_manual_profiles
+
+    slots = []
+
+    # --- Yapısal Maliyetler (Hafif Çelik, manuel profiller) ---
+    for idx, p_type in enumerate(PROFILE_COUNT_COLUMNS):
+        counts = profile_counts[:, idx]
+        cost_per_piece = catalog.steel_profiles.get(p_type, 0.0)
+        slots.append((
+            has_manual_profiles & (counts > 0),
+            f"{material_info['steel_skeleton_info']} ({p_type})",
+            label('%d adet', counts),
+            np.full(n_projects, cost_per_piece),
+            money.to_cents_array(counts * cost_per_piece),
+        ))
+
+    # --- Yapısal Maliyetler (Hafif Çelik, otomatik profiller) ---
+    for p_type, ratio in (("100x100x3", 12 / 27.0), ("50x50x2", 6 / 27.0)):
+        auto_counts = np.ceil(floor_area * ratio).astype(np.int64)
+        cost_per_piece = catalog.steel_profiles[p_type]
+        slots.append((
+            uses_auto_profiles & (auto_counts > 0),
+            f"{material_info['steel_skeleton_info']} ({p_type}) (Auto)",
+            label('%d adet', auto_counts),
+            np.full(n_projects, cost_per_piece),
+            money.to_cents_array(auto_counts * cost_per_piece),
+        ))
+
+    # --- Ağır Çelik ---
+    slots.append((
+        ~is_light,
+        'Heavy Steel Structure',
+        floor_qty,
+        np.full(n_projects, prices['heavy_steel_m2']),
+        money.to_cents_array(floor_area * prices['heavy_steel_m2']),
+    ))
+
+    # Koruyucu boya (her zaman dahil)
+    slots.append((
+        np.ones(n_projects, dtype=bool),
+        material_info['protective_automotive_paint_info'],
+        np.full(n_projects, 'N/A', dtype=object),
+        np.zeros(n_projects),
+        np.zeros(n_projects, dtype=np.int64),
+    ))
+
+    # Kaynak işçiliği
+    is_standard_welding = arrays['welding_type'] == STANDARD_WELDING
+    welding_price = np.where(is_standard_welding, prices['welding_labor_m2_standard'], prices['welding_labor_m2_trmontaj'])
+    welding_labels = pd.Series(arrays['welding_type']).str.split(' ').str[0].to_numpy() if with_labels else None
+    slots.append((
+        np.ones(n_projects, dtype=bool),
+        np.char.add(np.char.add("Steel Welding Labor (", welding_labels.astype(str)), ")") if with_labels else None,
+        floor_qty,
+        welding_price,
+        money.to_cents_array(floor_area * welding_price),
+    ))
+
+    # Bağlantı elemanları
+    slots.append((
+        np.ones(n_projects, dtype=bool),
+        'Connection Elements',
+        floor_qty,
+        np.full(n_projects, prices['connection_element_m2']),
+        money.to_cents_array(floor_area * prices['connection_element_m2']),
+    ))
+
+    # --- Duvarlar ve Çatı ---
+    has_sandwich = arrays['facade_sandwich_panel_option']
+    sandwich_area = wall_area + roof_area
+    sandwich_qty = label('%.2f m²', sandwich_area)
+    slots.append((
+        has_sandwich,
+        material_info['60mm_eps_sandwich_panel_info'],
+        sandwich_qty,
+        np.full(n_projects, prices['sandwich_panel_m2']),
+        money.to_cents_array(sandwich_area * prices['sandwich_panel_m2']),
+    ))
+    slots.append((
+        has_sandwich,
+        'Panel Assembly Labor',
+        sandwich_qty,
+        np.full(n_projects, prices['panel_assembly_labor_m2']),
+        money.to_cents_array(sandwich_area * prices['panel_assembly_labor_m2']),
+    ))
+
+    # --- İç Duvarlar ---
+    wall_qty = label('%.2f m²', wall_area)
+    board_m2_price = prices['gypsum_board_white_per_unit_price'] / catalog.gypsum_board_unit_area_m2
+    labor_m2_price = prices['plasterboard_labor_m2_avg']
+    for option, item, board_area in (
+        ('plasterboard_interior_option', 'Interior Plasterboard (White)', wall_area),
+        ('plasterboard_all_option', 'Interior & Exterior Plasterboard (White)', wall_area * 2),
+    ):
+        board_qty = label('%.2f m²', board_area)
+        slots.append(cost_slot(arrays[option], item, board_qty, board_m2_price, board_area * board_m2_price))
+        slots.append(cost_slot(arrays[option], 'Plasterboard Labor', board_qty, labor_m2_price, board_area * labor_m2_price))
+        slots.append(info_slot(arrays[option], material_info['satin_plaster_paint_info']))
+    osb_pieces = np.ceil(wall_area / catalog.osb_panel_area_m2).astype(np.int64)
+    slots.append(cost_slot(arrays['osb_inner_wall_option'], 'OSB Inner Wall Material', label('%d adet', osb_pieces),
+                           prices['osb_piece'], osb_pieces * prices['osb_piece']))
+
+    # --- Yalıtım ---
+    insulation_type = arrays['insulation_material_type']
+    slots.append(cost_slot(arrays['insulation_wall'] & (insulation_type == 'Stone Wool'), "Wall Insulation (Stone Wool)",
+                           wall_qty, prices['otb_stone_wool_price'], wall_area * prices['otb_stone_wool_price']))
+    packets = np.ceil(wall_area / catalog.glass_wool_m2_per_packet).astype(np.int64)
+    slots.append(cost_slot(arrays['insulation_wall'] & (insulation_type == 'Glass Wool'), "Wall Insulation (Glass Wool)",
+                           label('%d paket', packets), prices['glass_wool_5cm_packet_price'], packets * prices['glass_wool_5cm_packet_price']))
+    slots.append(cost_slot(arrays['insulation_floor'], 'Floor Insulation', floor_qty,
+                           prices['insulation_per_m2'], floor_area * prices['insulation_per_m2']))
+
+    # --- Dış Cephe Kaplaması ---
+    cladding_area = arrays['exterior_cladding_m2_val']
+    has_cladding = arrays['exterior_cladding_m2_option'] & (cladding_area > 0)
+    cladding_qty = label('%.2f m²', cladding_area)
+    green_m2_price = prices['gypsum_board_green_per_unit_price'] / catalog.gypsum_board_unit_area_m2
+    slots.append(cost_slot(has_cladding, material_info['knauf_aquapanel_gypsum_board_info'] + ' (Cladding)', cladding_qty,
+                           green_m2_price, cladding_area * green_m2_price))
+    slots.append(cost_slot(has_cladding, 'Exterior Cladding Labor', cladding_qty, prices['exterior_cladding_labor_price_per_m2'],
+                           cladding_area * prices['exterior_cladding_labor_price_per_m2']))
+    slots.append(info_slot(has_cladding, material_info['eps_styrofoam_info']))
+    slots.append(info_slot(has_cladding, material_info['knauf_mineralplus_insulation_info']))
+    wood_area = arrays['exterior_wood_cladding_m2_val']
+    slots.append(cost_slot(arrays['exterior_wood_cladding_m2_option'] & (wood_area > 0), material_info['exterior_wood_cladding_lambiri_info'],
+                           label('%.2f m²', wood_area), prices['exterior_wood_cladding_m2_price'], wood_area * prices['exterior_wood_cladding_m2_price']))
+
+    # --- Zemin Kaplaması ---
+    for input_name, item, price_key, quantity_format in cost_items.FLOOR_MATERIAL_LINES:
+        quantity = arrays[input_name]
+        slots.append(cost_slot(arrays['insulation_floor'] & (quantity > 0), item, label(quantity_format, quantity),
+                               prices[price_key], quantity * prices[price_key]))
+    for option, input_name, info_key, price_key in cost_items.FLOOR_OPTION_LINES:
+        area = arrays[input_name]
+        slots.append(cost_slot(arrays[option] & (area > 0), material_info[info_key], label('%.2f m²', area),
+                               prices[price_key], area * prices[price_key]))
+
+    # --- Kapı ve Pencereler ---
+    total_pieces = np.zeros(n_projects, dtype=np.int64)
+    for count_input, size_input, item, price_key, always_listed in cost_items.OPENING_LINES:
+        count = arrays[count_input]
+        total_pieces = total_pieces + count
+        sized_item = np.char.add(np.char.add(f"{item} (", arrays[size_input]), ")") if with_labels else None
+        slots.append(cost_slot((count > 0) | always_listed, sized_item, label('%d adet', count),
+                               prices[price_key], count * prices[price_key]))
+    assembly_price = prices['door_window_assembly_labor_piece']
+    slots.append(cost_slot(np.ones(n_projects, dtype=bool), 'Door/Window Assembly Labor', label('%d adet', total_pieces),
+                           assembly_price, total_pieces * assembly_price))
+
+    # --- Mutfak ve Banyo ---
+    kitchen_choice = arrays['kitchen_choice']
+    for choice, (item, price_key) in cost_items.KITCHEN_LINES.items():
+        slots.append(cost_slot(kitchen_choice == choice, item, constant_label('1 adet'), prices[price_key], prices[price_key]))
+    has_kitchen = np.isin(kitchen_choice, list(cost_items.KITCHEN_LINES))
+    for info_key in cost_items.KITCHEN_INFO_KEYS:
+        slots.append(info_slot(has_kitchen, material_info[info_key]))
+    shower_wc = arrays['shower_wc']
+    slots.append(cost_slot(shower_wc, 'Shower/WC Installation', constant_label('1 adet'),
+                           prices['shower_wc_installation_piece'], prices['shower_wc_installation_piece']))
+    slots.append(info_slot(shower_wc, material_info['fully_functional_bathroom_fixtures_info']))
+    ceramic_area = arrays['wc_ceramic_area']
+    ceramic_price = prices['wc_ceramic_m2_material'] + prices['wc_ceramic_m2_labor']
+    slots.append(cost_slot(shower_wc & arrays['wc_ceramic'] & (ceramic_area > 0), 'WC Ceramic Material & Labor',
+                           label('%.2f m²', ceramic_area), ceramic_price, ceramic_area * ceramic_price))
+
+    # --- Tesisat ve Isıtma ---
+    for option, item, price_key in cost_items.INSTALLATION_LINES:
+        slots.append(cost_slot(arrays[option], item, floor_qty, prices[price_key], floor_area * prices[price_key]))
+
+    # --- Nakliye ---
+    slots.append(cost_slot(arrays['transportation'], 'Transportation', constant_label('1 adet'),
+                           prices['transportation'], prices['transportation']))
+    trailer_price = arrays['wheeled_trailer_price']
+    slots.append(cost_slot(arrays['wheeled_trailer'], 'Wheeled Trailer', constant_label('1 adet'), trailer_price, trailer_price))
+
+    # --- Paket Donanımları ---
+    for option, item, price_key, quantity_input, quantity_format in cost_items.FURNISHING_LINES:
+        unit_price = prices.get(price_key, 0.0)
+        if quantity_input is None:
+            slots.append(cost_slot(arrays[option], item, constant_label('1 adet'), unit_price, unit_price))
+        else:
+            quantity = arrays[quantity_input]
+            slots.append(cost_slot(arrays[option] & (quantity > 0), item, label(quantity_format, quantity),
+                                   unit_price, quantity * unit_price))
+    return slots
+
+
+def _financial_summary(material_cents, profit_rates, catalog):
+    """calculate_costs_detailed() içindeki finansal hesapları int64 kuruş dizileri üzerinde yapar; euro döndürür."""
+    fire_cents = money.multiply_array(material_cents, catalog.fire_rate)
+    profit_cents = money.multiply_array(material_cents, profit_rates)
+    overhead_cents = money.to_cents(catalog.monthly_accounting_expenses) + money.to_cents(catalog.monthly_office_rent)
+    no_vat_cents = material_cents + profit_cents + fire_cents + overhead_cents
+    vat_cents = money.multiply_array(no_vat_cents, catalog.vat_rate)
+    return {
+        'total_material_cost': money.from_cents_array(material_cents),
+        'fire_cost': money.from_cents_array(fire_cents),
+        'profit_amount': money.from_cents_array(profit_cents),
+        'total_overhead_cost': money.from_cents_array(np.full(len(material_cents), overhead_cents)),
+        'total_cost_no_vat': money.from_cents_array(no_vat_cents),
+        'vat_amount': money.from_cents_array(vat_cents),
+        'final_sales_price': money.from_cents_array(no_vat_cents + vat_cents),
+    }
+
+
+def price_projects(projects, include_line_items=True, catalog=None):
+    """
+    Çok sayıda projeyi tek vektörel geçişte fiyatlandırır.
+
+    `projects` bir DataFrame veya kolon adı -> dizi sözlüğüdür. Kolon adları
+    calculate_costs_detailed() girdileriyle aynıdır (width, length, height,
+    structure_type, welding_type, profile_*_count, facade_sandwich_panel_option,
+    profit_rate ve cost_items.OPTION_INPUT_DEFAULTS'taki seçenek girdileri).
+    Eksik kolonlar için INPUT_DEFAULTS kullanılır. catalog
+    verilmezse geçerli fiyat kataloğu kullanılır.
+
+    {'summary': DataFrame, 'line_items': DataFrame veya None, 'catalog_version': str}
+    döndürür. 'summary' her proje için bir satır içerir; 'line_items' uzun
+    formatta olup 'project' kolonu girdideki satır sırasını gösterir.
+    """
+    catalog = catalog or get_catalog()
+    arrays, n_projects = _column_arrays(projects)
+    areas = calculate_areas_batch(arrays['width'], arrays['length'], arrays['height'])
+    slots = _line_item_slots(arrays, areas, n_projects, catalog, with_labels=include_line_items)
+
+    # Kalem toplamları tam sayı kuruş olarak biriktirilir (sıradan bağımsız, kesin)
+    material_cents = np.zeros(n_projects, dtype=np.int64)
+    for mask, _, _, _, totals in slots:
+        material_cents += np.where(mask, totals, 0)
+
+    summary = pd.DataFrame({
+        'floor_area': areas['floor'],
+        'wall_area': areas['wall'],
+        'roof_area': areas['roof'],
+        **_financial_summary(material_cents, arrays['profit_rate'], catalog),
+    })
+    if isinstance(projects, pd.DataFrame):
+        summary.index = projects.index
+
+    line_items = None
+    if include_line_items:
+        frames = []
+        for slot_order, (mask, item, quantity, unit_price, totals) in enumerate(slots):
+            rows = np.flatnonzero(mask)
+            if rows.size == 0:
+                continue
+            frames.append(pd.DataFrame({
+                'project': rows,
+                '_slot': slot_order,
+                'Item': item[rows] if isinstance(item, np.ndarray) else item,
+                'Quantity': quantity[rows],
+                'Unit Price (€)': unit_price[rows],
+                'Total (€)': money.from_cents_array(totals[rows]),
+            }))
+        if frames:
+            line_items = (pd.concat(frames, ignore_index=True)
+                          .sort_values(['project', '_slot'], kind='stable')
+                          .drop(columns='_slot')
+                          .reset_index(drop=True))
+        else:
+            line_items = pd.DataFrame(columns=LINE_ITEM_COLUMNS)
+    return {'summary': summary, 'line_items': line_items, 'catalog_version': catalog.version}
+
+
+# --- Fiyat Yüzeyi Taraması ---
+SWEEP_DIMENSIONS = ('width', 'length', 'height', 'profit_rate')
+MAX_SWEEP_SCENARIOS = 50000 # Tek taramada değerlendirilecek en fazla senaryo
+
+
+def price_sweep(widths, lengths, heights, profit_rates, base=None, catalog=None):
+    """
+    Genişlik, uzunluk, yükseklik ve kar oranı değerlerinin tüm kombinasyonlarını tek
+    vektörel geçişte fiyatlandırır. `base` diğer kolonların (structure_type,
+    welding_type, profile_*_count...) tüm senaryolarda kullanılacak değerleridir.
+
+    {'grid': DataFrame, 'catalog_version': str} döndürür; 'grid' her senaryo için
+    bir satır (boyutlar, kar oranı, alan, KDV hariç ve KDV dahil fiyat) içerir.
+    """
+    axes = [np.unique(np.asarray(values, dtype=float)) for values in (widths, lengths, heights, profit_rates)]
+    n_scenarios = int(np.prod([axis.size for axis in axes]))
+    if n_scenarios == 0:
+        raise ValueError("Tarama için her eksende en az bir değer gerekir.")
+    if n_scenarios > MAX_SWEEP_SCENARIOS:
+        raise ValueError(f"Tarama {n_scenarios} senaryo içeriyor; en fazla {MAX_SWEEP_SCENARIOS} desteklenir.")
+
+    grids = np.meshgrid(*axes, indexing='ij')
+    columns = {name: grid.ravel() for name, grid in zip(SWEEP_DIMENSIONS, grids)}
+    for name, value in (base or {}).items():
+        if name not in columns and name in INPUT_DEFAULTS:
+            columns[name] = np.full(n_scenarios, value, dtype=object)
+
+    priced = price_projects(columns, include_line_items=False, catalog=catalog)
+    summary = priced['summary']
+    grid = pd.DataFrame({
+        **{name: columns[name] for name in SWEEP_DIMENSIONS},
+        'floor_area': summary['floor_area'].to_numpy(),
+        'total_cost_no_vat': summary['total_cost_no_vat'].to_numpy(),
+        'final_sales_price': summary['final_sales_price'].to_numpy(),
+    })
+    return {'grid': grid, 'catalog_version': priced['catalog_version']}
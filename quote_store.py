@@ -0,0 +1,201 @@
+# ==============================================================================
+# Kalıcı Teklif Deposu (SQLite)
+# ==============================================================================
+# Her hesaplama; form girdileri, fiyat kataloğu sürümü, maliyet kalemleri,
+# toplamlar ve üretilen PDF'lerle (SHA-256 özeti ve baytları) birlikte yerel bir
+# SQLite dosyasına yazılır. Müşteri adı, tarih, paket ve nihai fiyat indekslidir;
+# böylece eski bir teklif hesaplama ve PDF üretimi tekrarlanmadan açılıp
+# indirilebilir. Tutarlar indeks ve karşılaştırma için tam sayı kuruş olarak da
+# saklanır.
+#
+# Modül Streamlit'e bağımlı değildir. Bağlantı süreç başına tektir ve PDF'ler arka
+# plan iş parçacıklarından yazıldığı için bir kilitle korunur; WAL kipi aynı
+# dosyayı kullanan diğer süreçlerin okumasını engellemez.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import money
+
+QUOTE_STORE_PATH = os.environ.get(
+    "QUOTE_STORE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quotes.sqlite3")
+)
+SEARCH_LIMIT = 200 # Tek aramada döndürülen en fazla teklif
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    quote_label TEXT NOT NULL,
+    customer_name TEXT NOT NULL,
+    customer_key TEXT NOT NULL,
+    package TEXT NOT NULL,
+    pdf_language TEXT NOT NULL,
+    catalog_version TEXT NOT NULL,
+    final_price_cents INTEGER NOT NULL,
+    total_cents INTEGER NOT NULL,
+    inputs_json TEXT NOT NULL,
+    quote_json TEXT NOT NULL,
+    totals_json TEXT NOT NULL,
+    line_items_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_quotes_customer ON quotes (customer_key);
+CREATE INDEX IF NOT EXISTS idx_quotes_created ON quotes (created_at);
+CREATE INDEX IF NOT EXISTS idx_quotes_package ON quotes (package, created_at);
+CREATE INDEX IF NOT EXISTS idx_quotes_final_price ON quotes (final_price_cents);
+CREATE TABLE IF NOT EXISTS quote_pdfs (
+    quote_id INTEGER NOT NULL REFERENCES quotes (id) ON DELETE CASCADE,
+    document TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    pdf BLOB NOT NULL,
+    PRIMARY KEY (quote_id, document)
+);
+"""
+
+# Teklif sözlüğünden saklanan alanlar (PDF'leri yeniden üretmeye yeter)
+QUOTE_FIELDS = ('project_details', 'customer_info', 'notes', 'house_price', 'house_price_no_vat', 'solar_price', 'areas')
+_SUMMARY_COLUMNS = ('id', 'created_at', 'quote_label', 'customer_name', 'package', 'pdf_language',
+                    'catalog_version', 'final_price_cents', 'total_cents')
+
+_state = {'connection': None, 'path': None}
+_lock = threading.Lock()
+
+
+def _json_default(value):
+    """JSON'a doğrudan çevrilemeyen değerleri (NumPy sayıları, datetime vb.) dönüştürür."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def customer_key(name):
+    """Müşteri adı aramalarında kullanılan, büyük/küçük harf duyarsız anahtar."""
+    return ' '.join(str(name).split()).casefold()
+
+
+def _connection():
+    """Süreç genelindeki bağlantıyı (ilk kullanımda şemayı kurarak) döndürür; _lock altında çağrılır."""
+    if _state['connection'] is None or _state['path'] != QUOTE_STORE_PATH:
+        connection = sqlite3.connect(QUOTE_STORE_PATH, check_same_thread=False, timeout=10)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.executescript(_SCHEMA)
+        _state['connection'] = connection
+        _state['path'] = QUOTE_STORE_PATH
+    return _state['connection']
+
+
+def save_quote(inputs, quote, quote_label, pdf_language):
+    """
+    Hesaplamayı depoya yazar ve teklif kimliğini (int) döndürür. `inputs` formun
+    session_state girdileri, `quote` app.build_quote() sonucudur.
+    """
+    cost_results = quote['cost_results']
+    totals = {key: value for key, value in cost_results.items() if key != 'costs_df'}
+    row = {
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'quote_label': quote_label,
+        'customer_name': quote['customer_info']['name'],
+        'customer_key': customer_key(quote['customer_info']['name']),
+        'package': inputs.get('aether_package_choice', 'None'),
+        'pdf_language': pdf_language,
+        'catalog_version': quote['catalog_version'],
+        'final_price_cents': money.to_cents(cost_results['final_sales_price']),
+        'total_cents': money.to_cents(quote['house_price'] + quote['solar_price']),
+        'inputs_json': _dumps(inputs),
+        'quote_json': _dumps({field: quote[field] for field in QUOTE_FIELDS}),
+        'totals_json': _dumps(totals),
+        'line_items_json': _dumps(cost_results['costs_df'].to_dict(orient='records')),
+    }
+    columns = ', '.join(row)
+    placeholders = ', '.join(f":{column}" for column in row)
+    with _lock:
+        connection = _connection()
+        with connection:
+            cursor = connection.execute(f"INSERT INTO quotes ({columns}) VALUES ({placeholders})", row)
+        return cursor.lastrowid
+
+
+def save_pdf(quote_id, document, pdf_bytes):
+    """Teklifin üretilen PDF'ini (özeti ve boyutuyla) kaydeder; aynı belge varsa üzerine yazar."""
+    with _lock:
+        connection = _connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO quote_pdfs (quote_id, document, sha256, size_bytes, created_at, pdf) VALUES (?, ?, ?, ?, ?, ?)",
+                (quote_id, document, hashlib.sha256(pdf_bytes).hexdigest(), len(pdf_bytes),
+                 datetime.now().strftime('%Y-%m-%d %H:%M:%S'), sqlite3.Binary(pdf_bytes)),
+            )
+
+
+def search_quotes(customer=None, package=None, date_from=None, date_to=None, min_price=None, max_price=None, limit=SEARCH_LIMIT):
+    """
+    Filtrelere uyan teklifleri en yeniden eskiye özet sözlükler olarak döndürür.
+    customer müşteri adının başıyla eşleşir (büyük/küçük harf duyarsız); tarihler
+    datetime.date, fiyatlar KDV dahil nihai fiyat (euro) sınırlarıdır. Her kayıt
+    'documents' (kayıtlı PDF belge türleri) alanını da içerir.
+    """
+    conditions, params = [], []
+    if customer and customer_key(customer):
+        prefix = customer_key(customer)
+        conditions.append("customer_key >= ? AND customer_key < ?") # Önek araması indeksi kullanır (LIKE kullanmaz)
+        params += [prefix, prefix + '\U0010ffff']
+    if package:
+        conditions.append("package = ?")
+        params.append(package)
+    if date_from:
+        conditions.append("created_at >= ?")
+        params.append(date_from.strftime('%Y-%m-%d'))
+    if date_to:
+        conditions.append("created_at < ?") # Bitiş günü dahil
+        params.append((date_to + timedelta(days=1)).strftime('%Y-%m-%d'))
+    if min_price is not None:
+        conditions.append("final_price_cents >= ?")
+        params.append(money.to_cents(min_price))
+    if max_price is not None:
+        conditions.append("final_price_cents <= ?")
+        params.append(money.to_cents(max_price))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = (
+        f"SELECT {', '.join(_SUMMARY_COLUMNS)}, "
+        "(SELECT group_concat(document, ',') FROM quote_pdfs WHERE quote_pdfs.quote_id = quotes.id) AS documents "
+        f"FROM quotes {where} ORDER BY created_at DESC, id DESC LIMIT ?"
+    )
+    with _lock:
+        rows = _connection().execute(query, [*params, limit]).fetchall()
+    return [{**dict(row), 'documents': row['documents'].split(',') if row['documents'] else []} for row in rows]
+
+
+def load_quote(quote_id):
+    """
+    Kayıtlı teklifi döndürür: özet alanlar ile 'inputs', 'quote', 'totals',
+    'line_items' (kayıt listesi) ve 'pdfs' ({belge: PDF baytları}). Yoksa None.
+    """
+    with _lock:
+        connection = _connection()
+        row = connection.execute("SELECT * FROM quotes WHERE id = ?", (quote_id,)).fetchone()
+        if row is None:
+            return None
+        pdfs = {document: pdf for document, pdf in connection.execute(
+            "SELECT document, pdf FROM quote_pdfs WHERE quote_id = ?", (quote_id,)
+        )}
+    record = {column: row[column] for column in _SUMMARY_COLUMNS}
+    record.update(
+        inputs=json.loads(row['inputs_json']),
+        quote=json.loads(row['quote_json']),
+        totals=json.loads(row['totals_json']),
+        line_items=json.loads(row['line_items_json']),
+        pdfs=pdfs,
+    )
+    return record
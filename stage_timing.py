@@ -0,0 +1,86 @@
+# ==============================================================================
+# Aşama Süre Ölçümü (Hafif Zamanlama Aralıkları)
+# ==============================================================================
+# Teklif hesaplama ve PDF üretiminin hangi aşamada zaman harcadığını ölçer.
+# begin()/end() (veya trace()) ile bir kayıt açılır; bu iş parçacığında çalışan
+# span() blokları ve lap() işaretleri süreleri bu kayda aşama adıyla ekler.
+# Açık kayıt yoksa span() ve lap() hiçbir şey ölçmez, bu yüzden CLI ve
+# kıyaslama betiklerinde ek maliyet yok denecek kadar azdır.
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__) # Handler ve seviye giriş noktalarında (app, bulk_quotes, benchmark_pdfs) ayarlanır
+
+_local = threading.local() # Her iş parçacığının açık kaydı (PDF'ler ayrı iş parçacıklarında üretilir)
+
+
+def begin(label, **fields):
+    """Bu iş parçacığında yeni bir zamanlama kaydı açar ve döndürür."""
+    record = {'label': label, **fields, 'stages': {}, 'total_ms': 0.0}
+    record['_parent'] = getattr(_local, 'record', None)
+    record['_started'] = record['_lap'] = time.perf_counter()
+    _local.record = record
+    return record
+
+
+def end(record):
+    """Kaydı kapatır, toplam süreyi yazar ve önceki kaydı yeniden etkinleştirir."""
+    record['total_ms'] = round((time.perf_counter() - record.pop('_started')) * 1000, 2)
+    record.pop('_lap', None)
+    _local.record = record.pop('_parent')
+    return record
+
+
+@contextmanager
+def trace(label, **fields):
+    """begin()/end() çiftinin bağlam yöneticisi biçimi."""
+    record = begin(label, **fields)
+    try:
+        yield record
+    finally:
+        end(record)
+
+
+def _add(record, name, started):
+    now = time.perf_counter()
+    record['stages'][name] = round(record['stages'].get(name, 0.0) + (now - started) * 1000, 2)
+    record['_lap'] = now
+
+
+@contextmanager
+def span(name):
+    """Blok süresini açık kayda `name` aşaması olarak ekler (aynı ad tekrar edilirse toplanır)."""
+    record = getattr(_local, 'record', None)
+    if record is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _add(record, name, started)
+
+
+def lap(name):
+    """Kaydın başlangıcından veya son aşamadan bu yana geçen süreyi `name` aşaması olarak ekler."""
+    record = getattr(_local, 'record', None)
+    if record is not None:
+        _add(record, name, record['_lap'])
+
+
+def add_stages(stages):
+    """Başka bir süreçte ölçülmüş aşama sürelerini açık kayda ekler (aynı adlar toplanır)."""
+    record = getattr(_local, 'record', None)
+    if record is not None:
+        for name, ms in stages.items():
+            record['stages'][name] = round(record['stages'].get(name, 0.0) + ms, 2)
+
+
+def log_record(record):
+    """Kaydı tek satırlık JSON olarak loglar."""
+    payload = {key: value for key, value in record.items() if not key.startswith('_')}
+    logger.info(json.dumps(payload, ensure_ascii=False, default=str))
@@ -0,0 +1,38 @@
+import pytest
+
+import money
+
+
+@pytest.mark.parametrize('cents, rounding, expected', [
+    (73690.00000000001, money.CEIL, 73690), # Çarpım gürültüsü yukarı yuvarlanmaz
+    (73689.99999999999, money.CEIL, 73690),
+    (100.2, money.CEIL, 101),
+    (100.5, money.CEIL, 101),
+    (-100.2, money.CEIL, -100),
+    (100.5, money.HALF_EVEN, 100),
+    (101.5, money.HALF_EVEN, 102),
+    (100.2, money.HALF_EVEN, 100),
+    (100.7, money.HALF_EVEN, 101),
+    (0.0, money.CEIL, 0),
+])
+def test_cents_from_float(cents, rounding, expected):
+    result = money.cents_from_float(cents, rounding)
+    assert result == expected
+    assert isinstance(result, int)
+
+
+def test_cents_from_float_unknown_policy():
+    with pytest.raises(ValueError):
+        money.cents_from_float(100.2, 'floor')
+
+
+def test_percentage_of_whole_euros_is_exact():
+    # 14738.00 * %5 = 736.90 (gürültü nedeniyle 736.91 olmamalı)
+    assert money.multiply(money.to_cents(14738.00), 0.05) == 73690
+    assert money.round_euros(14738.00 * 0.05) == 736.9
+
+
+def test_array_matches_scalar():
+    values = [73690.00000000001, 73689.99999999999, 100.2, 100.5, 101.5, -100.2, 0.0, 12345.4999999]
+    for rounding in (money.CEIL, money.HALF_EVEN):
+        assert money.cents_from_float_array(values, rounding).tolist() == [money.cents_from_float(v, rounding) for v in values]
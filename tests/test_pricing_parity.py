@@ -0,0 +1,58 @@
+# Toplu fiyatlandırma motoru (pricing_engine) ile tekil hesap (app.build_quote ->
+# calculate_costs_detailed) aynı girdilerde kuruşu kuruşuna aynı sonucu vermelidir.
+import random
+
+import pandas as pd
+import pytest
+
+import cost_items
+import pricing_engine
+
+app = pytest.importorskip('app')
+
+SUMMARY_KEYS = ('total_material_cost', 'fire_cost', 'profit_amount', 'total_cost_no_vat', 'vat_amount', 'final_sales_price')
+
+
+def _random_inputs(rng, defaults):
+    """Varsayılanlardan yola çıkarak ölçüleri ve tüm seçenek kalemlerini rastgele seçer."""
+    inputs = dict(defaults)
+    inputs.update(
+        width_val=round(rng.uniform(2, 20), 2),
+        length_val=round(rng.uniform(2, 20), 2),
+        height_val=round(rng.uniform(2.2, 4), 2),
+        structure_type=rng.choice(['Light Steel', 'Heavy Steel']),
+        facade_sandwich_panel_option=rng.random() < 0.5,
+    )
+    for key, default in cost_items.OPTION_INPUT_DEFAULTS.items():
+        if isinstance(default, bool):
+            inputs[key] = rng.random() < 0.5
+        elif isinstance(default, int):
+            inputs[key] = rng.choice([0, rng.randint(0, 9)])
+        elif isinstance(default, float):
+            inputs[key] = rng.choice([0.0, round(rng.uniform(0, 80), 2)])
+    inputs['insulation_material_type'] = rng.choice(['Stone Wool', 'Glass Wool'])
+    inputs['kitchen_choice'] = rng.choice(['No Kitchen', *cost_items.KITCHEN_LINES])
+    inputs['window_size_val'] = rng.choice(['100x100 cm', '120x150 cm'])
+    return inputs
+
+
+@pytest.fixture(scope='module')
+def inputs_list():
+    rng = random.Random(7)
+    defaults = app.SESSION_STATE_DEFAULTS
+    packages = [{**defaults, **app.package_updates(package), 'aether_package_choice': package}
+                for package in ['None', *app.AETHER_PACKAGE_PRESETS]]
+    return packages + [_random_inputs(rng, defaults) for _ in range(150)]
+
+
+def test_price_projects_matches_build_quote(inputs_list):
+    priced = pricing_engine.price_projects(pricing_engine.inputs_frame(inputs_list))
+    totals_only = pricing_engine.price_projects(pricing_engine.inputs_frame(inputs_list), include_line_items=False)
+    line_items = priced['line_items']
+    for i, inputs in enumerate(inputs_list):
+        reference = app.build_quote(inputs)['cost_results']
+        for key in SUMMARY_KEYS:
+            assert priced['summary'].iloc[i][key] == reference[key], (i, key)
+            assert totals_only['summary'].iloc[i][key] == reference[key], (i, key)
+        project_lines = line_items[line_items['project'] == i].drop(columns='project').reset_index(drop=True)
+        pd.testing.assert_frame_equal(project_lines, reference['costs_df'].drop(columns='Category'), check_dtype=False)